@@ -0,0 +1 @@
+"""Performance benchmarks for the mobile and PWA frameworks."""
@@ -0,0 +1,148 @@
+"""Measure action-span overhead and check the exported Chrome trace.
+
+1. Per-call cost of the span wrapper, for a sync (mobile) and an async
+   (PWA) method that do nothing, against the unwrapped method.
+2. The element-cache bench's flow (home -> search -> article) through
+   the real page objects against the fake WebDriver server, untraced and
+   traced. The trace file is read back: span count, nesting of waits
+   under actions, and the actions taking the most time.
+
+Without ``ACTION_TRACE_FILE`` nothing is wrapped; the run checks that the
+page-object methods are the original functions then.
+
+Usage:
+    python -m benchmarks.bench_action_trace --calls 200000 --flows 20
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.bench_element_cache import flow
+from benchmarks.fake_webdriver import FakeWebDriverServer
+
+
+class Page:
+    """Stand-in page object whose actions return at once."""
+
+    def click(self, locator):
+        return None
+
+    async def fill(self, selector, text):
+        return None
+
+
+def per_call_ns(call, calls: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter_ns() - started) / calls
+
+
+async def per_call_async_ns(call, calls: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter_ns() - started) / calls
+
+
+def overhead(calls: int) -> float:
+    """Print the wrapper cost per call; return the sync one in nanoseconds."""
+    from mobile.src.utils.action_trace import ActionTrace as MobileTrace
+    from pwa.src.utils.action_trace import ActionTrace as PwaTrace
+
+    page, locator = Page(), ("id", "org.wikipedia:id/search_container")
+    plain = per_call_ns(lambda: page.click(locator), calls)
+    traced_click = MobileTrace._wrap(Page.click, "Page.click")
+    traced = per_call_ns(lambda: traced_click(page, locator), calls)
+    MobileTrace.spans.clear()
+    sync_cost = traced - plain
+    print(f"sync  (mobile) {plain:6.0f}ns plain  {traced:6.0f}ns traced  +{sync_cost / 1000:.2f}us per action")
+
+    traced_fill = PwaTrace._wrap(Page.fill, "Page.fill")
+    plain = asyncio.run(per_call_async_ns(lambda: page.fill("#search", "x"), calls))
+    traced = asyncio.run(per_call_async_ns(lambda: traced_fill(page, "#search", "x"), calls))
+    PwaTrace.spans.clear()
+    print(f"async (pwa)    {plain:6.0f}ns plain  {traced:6.0f}ns traced  +{(traced - plain) / 1000:.2f}us per action")
+    return sync_cost
+
+
+def flows(server: FakeWebDriverServer, count: int) -> float:
+    """Run ``count`` search-and-read flows; return seconds per flow."""
+    from mobile.src.utils.action_trace import ActionTrace
+
+    driver = server.connect()
+    try:
+        started = time.perf_counter()
+        for index in range(count):
+            ActionTrace.test_id = f"bench_action_trace.py::test_search[{index}]"
+            flow(server, driver)
+        return (time.perf_counter() - started) / count
+    finally:
+        driver.quit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000, help="calls per overhead measurement")
+    parser.add_argument("--flows", type=int, default=20, help="mobile flows per mode")
+    args = parser.parse_args()
+
+    from mobile.config.settings import settings
+    from mobile.src.base.base_page import BasePage
+    from mobile.src.utils.action_trace import ActionTrace
+
+    settings.log_level = "WARNING"
+    span_ns = overhead(args.calls)
+
+    original = BasePage.__dict__["click"]
+    assert not ActionTrace.enabled() and BasePage.click is original
+    print("ACTION_TRACE_FILE unset: page-object methods are the originals")
+
+    trace_file = Path(tempfile.mkdtemp(prefix="bench_action_trace_")) / "action_trace.json"
+    with FakeWebDriverServer() as server:
+        untraced = flows(server, args.flows)
+        settings.action_trace_file = str(trace_file)
+        ActionTrace.install()
+        traced = flows(server, args.flows)
+        spans = len(ActionTrace.spans)
+        ActionTrace.close()
+        settings.action_trace_file = ""
+    assert BasePage.click is original
+    # The flow-time difference is within run-to-run noise; report the wrapper cost instead
+    per_flow = spans / args.flows
+    print(
+        f"\nmobile flow: {untraced * 1000:.2f}ms untraced, {traced * 1000:.2f}ms traced, "
+        f"{per_flow:.0f} spans per flow = {per_flow * span_ns / 1000:.0f}us of wrapper time "
+        f"({per_flow * span_ns / 1e9 / traced:.2%})"
+    )
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    spans_out = [event for event in events if event["ph"] == "X"]
+    lanes = {event["tid"] for event in spans_out}
+    nested = sum(
+        any(
+            parent["tid"] == event["tid"] and parent["cat"] == "action"
+            and parent["ts"] <= event["ts"] and event["ts"] + event["dur"] <= parent["ts"] + parent["dur"]
+            for parent in spans_out
+        )
+        for event in spans_out if event["cat"] == "wait"
+    )
+    waits = sum(event["cat"] == "wait" for event in spans_out)
+    print(
+        f"{trace_file.name}: {trace_file.stat().st_size // 1024} KB, {len(spans_out)} spans in {len(lanes)} test rows, "
+        f"{nested} of {waits} waits nested in an action"
+    )
+    total = defaultdict(float)
+    for event in spans_out:
+        total[event["name"]] += event["dur"]
+    for name, micros in sorted(total.items(), key=lambda item: -item[1])[:5]:
+        print(f"  {name:<40} {micros / 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare cold-cache navigation against the route-level asset cache.
+
+Runs the same sequence of simulated tests with ``BROWSER_REUSE`` enabled
+(fresh context per test), once with a cold HTTP cache in every context and
+once with ``ASSET_CACHE`` serving scripts and styles from disk. The local
+stand-in site adds latency to every response and pads its script bundle,
+like a remote PWA.
+
+Usage:
+    python -m benchmarks.bench_asset_cache --tests 20 --latency-ms 80
+    python -m benchmarks.bench_asset_cache --url https://demo.swapy.dev
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from benchmarks.local_site import APP_JS, LocalSite
+from pwa.config.settings import settings
+from pwa.src.browser.asset_cache import AssetCache
+from pwa.src.browser.browser_manager import BrowserManager
+
+
+async def run_suite(tests: int, asset_cache: bool) -> List[float]:
+    """Run a simulated suite and return per-test durations.
+
+    Args:
+        tests: Number of simulated tests.
+        asset_cache: Whether to serve static assets from the disk cache.
+
+    Returns:
+        Per-test wall time in seconds, including setup and teardown.
+    """
+    settings.browser_reuse = True
+    settings.asset_cache = asset_cache
+    durations = []
+    manager = BrowserManager()
+    try:
+        for _ in range(tests):
+            started = time.perf_counter()
+            page = await manager.init_browser()
+            await page.locator("h1").first.text_content()
+            await manager.close_browser()
+            durations.append(time.perf_counter() - started)
+        if asset_cache:
+            print(AssetCache.totals.summary())
+    finally:
+        await BrowserManager.shutdown()
+        BrowserManager.reset_singleton()
+    return durations
+
+
+def report(label: str, durations: List[float]) -> None:
+    """Print summary line for one mode."""
+    total = sum(durations)
+    print(
+        f"{label:<12} total={total:8.2f}s  per_test={total / len(durations) * 1000:8.1f}ms  "
+        f"first={durations[0] * 1000:8.1f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    site = None
+    if args.url:
+        settings.pwa_base_url = args.url
+    else:
+        site = LocalSite(latency_ms=args.latency_ms).start()
+        padding = "/*" + "x" * (args.bundle_kb * 1024) + "*/\n"
+        site.add_route("/static/app.js", (padding + APP_JS).encode(), "application/javascript")
+        settings.pwa_base_url = site.url
+    try:
+        cold = await run_suite(args.tests, asset_cache=False)
+        cached = await run_suite(args.tests, asset_cache=True)
+    finally:
+        if site:
+            site.stop()
+
+    print(f"{args.tests} tests against {settings.pwa_base_url} ({settings.browser_type})")
+    report("cold cache", cold)
+    report("asset cache", cached)
+    print(f"speedup: {sum(cold) / sum(cached):.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=20, help="number of simulated tests")
+    parser.add_argument("--latency-ms", type=int, default=80, help="added latency per response")
+    parser.add_argument("--bundle-kb", type=int, default=512, help="script bundle size")
+    parser.add_argument("--url", default="", help="site to open instead of the local stand-in")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
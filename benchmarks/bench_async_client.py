@@ -0,0 +1,215 @@
+"""Drive many Appium sessions from one process: Selenium threads vs. the asyncio client.
+
+Each session runs ``--flows`` short search flows through the page-object
+API (wait, click, send keys, text, attribute, page source, swipe,
+screenshot) against the fake WebDriver server:
+
+* ``threads``: one Selenium/Appium ``WebDriver`` and ``BasePage`` per
+  session, each in its own thread.
+* ``async``: ``AsyncBasePage`` on ``AsyncWebDriver`` sessions, all on one
+  event loop and one pooled ``AsyncAppiumClient``.
+
+Every flow checks the text it read. Reported per session count: wall
+time, flows per second and the most client threads the process had. Before
+that, the async client's errors are checked to match the Selenium
+exceptions (missing element, wait timeout, ended session), the async page
+objects run the element-cache bench's home -> search -> article flow, and
+the import cost of both stacks is measured in fresh interpreters.
+
+Usage:
+    python -m benchmarks.bench_async_client --sessions 1 8 32 --flows 5 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+
+SEARCH_BOX = ("id", "org.wikipedia:id/search_container")
+SEARCH_INPUT = ("id", "org.wikipedia:id/search_src_text")
+RESULT_TITLE = ("id", "org.wikipedia:id/page_list_item_title")
+CAPABILITIES = {"platformName": "Android", "automationName": "UiAutomator2"}
+
+
+def client_threads() -> int:
+    """Threads of this process, not counting the fake server's request threads."""
+    return sum("process_request_thread" not in thread.name for thread in threading.enumerate())
+
+
+def sync_flow(page) -> str:
+    """One search flow through ``BasePage``; returns the result title."""
+    page.wait.wait_for_element_visible(SEARCH_BOX)
+    page.click(SEARCH_BOX)
+    page.send_keys(SEARCH_INPUT, "Python")
+    title = page.get_text(RESULT_TITLE)
+    page.get_attribute(RESULT_TITLE, "enabled")
+    page.snapshot()
+    page.driver.swipe(540, 1000, 540, 400, 500)
+    page.driver.get_screenshot_as_base64()
+    return title
+
+
+async def async_flow(page) -> str:
+    """The same flow through ``AsyncBasePage``."""
+    await page.wait.wait_for_element_visible(SEARCH_BOX)
+    await page.click(SEARCH_BOX)
+    await page.send_keys(SEARCH_INPUT, "Python")
+    title = await page.get_text(RESULT_TITLE)
+    await page.get_attribute(RESULT_TITLE, "enabled")
+    await page.snapshot()
+    await page.swipe(540, 1000, 540, 400, 500)
+    await page.driver.get_screenshot_as_base64()
+    return title
+
+
+def run_threads(server: FakeWebDriverServer, sessions: int, flows: int) -> Tuple[float, int]:
+    """Run the flows with one Selenium session per thread; return seconds and peak threads."""
+    from mobile.src.base.base_page import BasePage
+
+    peak = [client_threads()]
+
+    def session() -> None:
+        driver = server.connect()
+        try:
+            page = BasePage(driver)
+            for _ in range(flows):
+                assert sync_flow(page) == RESULT_TITLE[1]
+                peak[0] = max(peak[0], client_threads())
+        finally:
+            driver.quit()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        for future in [pool.submit(session) for _ in range(sessions)]:
+            future.result()
+    return time.perf_counter() - started, peak[0]
+
+
+async def run_async(server: FakeWebDriverServer, sessions: int, flows: int) -> Tuple[float, int]:
+    """Run the flows with all sessions on one event loop; return seconds and peak threads."""
+    from mobile.src.base.async_base_page import AsyncBasePage
+    from mobile.src.driver.async_client import AsyncAppiumClient
+
+    peak = [client_threads()]
+
+    async def session(client: AsyncAppiumClient) -> None:
+        async with client.session(CAPABILITIES, server.url) as driver:
+            page = AsyncBasePage(driver)
+            for _ in range(flows):
+                assert await async_flow(page) == RESULT_TITLE[1]
+                peak[0] = max(peak[0], client_threads())
+
+    started = time.perf_counter()
+    async with AsyncAppiumClient() as client:
+        await asyncio.gather(*(session(client) for _ in range(sessions)))
+    return time.perf_counter() - started, peak[0]
+
+
+async def check_errors(server: FakeWebDriverServer) -> None:
+    """Verify the async client raises what the Selenium client raises."""
+    from selenium.common.exceptions import InvalidSessionIdException, NoSuchElementException, TimeoutException
+
+    from mobile.src.base.async_base_page import AsyncBasePage
+    from mobile.src.driver.async_client import AsyncAppiumClient
+
+    async with AsyncAppiumClient() as client:
+        driver = await client.new_session(CAPABILITIES, server.url)
+        page = AsyncBasePage(driver)
+        expectations = (
+            (driver.find_element("id", "missing"), NoSuchElementException),
+            (page.wait.wait_for_element_visible(("id", "missing"), timeout=0.2), TimeoutException),
+        )
+        for call, expected in expectations:
+            try:
+                await call
+                raise AssertionError(f"{expected.__name__} not raised")
+            except expected:
+                pass
+        assert not await page.is_element_displayed(("id", "missing"))
+        server.kill_sessions()
+        try:
+            await driver.page_source()
+            raise AssertionError("InvalidSessionIdException not raised")
+        except InvalidSessionIdException:
+            pass
+
+
+async def check_page_objects(server: FakeWebDriverServer) -> None:
+    """Run the home -> search -> article flow through the async page objects."""
+    from benchmarks.bench_element_cache import ARTICLE, HOME, SEARCH, SEARCH_SOURCE
+    from mobile.src.driver.async_client import AsyncAppiumClient
+    from mobile.src.pages.async_article_page import AsyncArticlePage
+    from mobile.src.pages.async_home_page import AsyncHomePage
+    from mobile.src.pages.async_search_page import AsyncSearchPage
+
+    async with AsyncAppiumClient() as client:
+        async with client.session(CAPABILITIES, server.url) as driver:
+            server.show_screen(HOME)
+            home = AsyncHomePage(driver)
+            await home.wait_for_page_load()
+            assert await home.is_search_box_visible()
+            await home.click_search_box()
+
+            server.show_screen(SEARCH, source=SEARCH_SOURCE)
+            search = AsyncSearchPage(driver)
+            await search.wait_for_page_load()
+            await search.enter_search_query("Python")
+            await search.wait_for_search_results()
+            assert await search.get_search_results_count() == 3
+            assert await search.get_first_result_title() == "Result 0"
+            assert not await search.is_no_results_displayed()
+            await search.click_first_result()
+
+            server.show_screen(ARTICLE)
+            article = AsyncArticlePage(driver)
+            await article.wait_for_page_load()
+            assert await article.is_article_content_visible()
+            await article.click_save_button()
+            await article.click_back_button()
+
+
+def import_ms(module: str) -> float:
+    """Import time of a module in a fresh interpreter, in milliseconds."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    return float(subprocess.check_output([sys.executable, "-c", code])) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 8, 32], help="concurrent sessions")
+    parser.add_argument("--flows", type=int, default=5, help="flows per session")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    from mobile.config.settings import settings
+
+    settings.log_level = "WARNING"
+    with FakeWebDriverServer(latency_ms=args.latency_ms) as server:
+        asyncio.run(check_page_objects(server))
+        print("async page objects run the home -> search -> article flow")
+        server.show_screen({value: 0.0 for _, value in (SEARCH_BOX, SEARCH_INPUT, RESULT_TITLE)})
+        asyncio.run(check_errors(server))
+        print("async client errors match the Selenium exceptions")
+        sync_ms, async_ms = import_ms("mobile.src.base.base_page"), import_ms("mobile.src.base.async_base_page")
+        print(f"import: BasePage stack {sync_ms:.0f}ms, AsyncBasePage stack {async_ms:.0f}ms")
+
+        print(f"\n{args.flows} flows per session, {args.latency_ms}ms per request")
+        for sessions in args.sessions:
+            results: List[str] = []
+            for label, seconds, threads in (
+                ("threads", *run_threads(server, sessions, args.flows)),
+                ("async", *asyncio.run(run_async(server, sessions, args.flows))),
+            ):
+                flows_per_s = sessions * args.flows / seconds
+                results.append(f"{label} {seconds:6.2f}s {flows_per_s:6.1f} flows/s {threads:3d} threads")
+            print(f"sessions={sessions:<3} " + "  |  ".join(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare per-test browser launch against a session-scoped browser.
+
+Runs the same sequence of simulated tests through ``BrowserManager`` three
+times: launching a browser per test (the default), with ``BROWSER_REUSE``
+enabled (fresh context per test), and with a pre-warmed context pool
+(``CONTEXT_POOL_SIZE``) that refills in the background while tests run.
+
+Usage:
+    python -m benchmarks.bench_browser_reuse --tests 20 --pool-size 2
+    python -m benchmarks.bench_browser_reuse --url https://demo.swapy.dev
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from benchmarks.local_site import LocalSite
+from pwa.config.settings import settings
+from pwa.src.browser.browser_manager import BrowserManager
+
+
+async def run_suite(
+    tests: int, reuse: bool, pool_size: int = 0, body_ms: int = 0
+) -> List[float]:
+    """Run a simulated suite and return per-test durations.
+
+    Args:
+        tests: Number of simulated tests.
+        reuse: Whether to keep the browser between tests.
+        pool_size: Number of pre-warmed contexts (0 disables the pool).
+        body_ms: Simulated test body duration in milliseconds.
+
+    Returns:
+        Per-test wall time in seconds, including setup and teardown.
+    """
+    settings.browser_reuse = reuse
+    settings.context_pool_size = pool_size
+    durations = []
+    manager = BrowserManager()
+    try:
+        for _ in range(tests):
+            started = time.perf_counter()
+            page = await manager.init_browser()
+            await page.locator("h1").first.text_content()
+            await asyncio.sleep(body_ms / 1000)
+            await manager.close_browser()
+            durations.append(time.perf_counter() - started)
+        if BrowserManager._context_pool is not None:
+            print(BrowserManager._context_pool.metrics.summary())
+    finally:
+        await BrowserManager.shutdown()
+        BrowserManager.reset_singleton()
+    return durations
+
+
+def report(label: str, durations: List[float]) -> None:
+    """Print summary line for one mode."""
+    total = sum(durations)
+    print(
+        f"{label:<18} total={total:8.2f}s  per_test={total / len(durations) * 1000:8.1f}ms  "
+        f"first={durations[0] * 1000:8.1f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    site = None
+    if args.url:
+        settings.pwa_base_url = args.url
+    else:
+        site = LocalSite().start()
+        settings.pwa_base_url = site.url
+    try:
+        per_test = await run_suite(args.tests, reuse=False, body_ms=args.body_ms)
+        reused = await run_suite(args.tests, reuse=True, body_ms=args.body_ms)
+        pooled = await run_suite(
+            args.tests, reuse=True, pool_size=args.pool_size, body_ms=args.body_ms
+        )
+    finally:
+        if site:
+            site.stop()
+
+    print(f"{args.tests} tests against {settings.pwa_base_url} ({settings.browser_type})")
+    report("per-test launch", per_test)
+    report("session browser", reused)
+    report("context pool", pooled)
+    print(f"speedup (session browser): {sum(per_test) / sum(reused):.2f}x")
+    print(f"speedup (context pool):    {sum(per_test) / sum(pooled):.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=20, help="number of simulated tests")
+    parser.add_argument("--pool-size", type=int, default=2, help="pre-warmed contexts")
+    parser.add_argument("--body-ms", type=int, default=200, help="simulated test body time")
+    parser.add_argument("--url", default="", help="site to open instead of the local stand-in")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Measure per-command client overhead and reset handling of Appium connections.
+
+Sends ``find element``, ``text`` and ``displayed`` commands to the fake
+WebDriver server (no added latency, so the numbers are client and HTTP
+overhead) through:
+
+* ``no-keepalive``: a new TCP connection per command.
+* ``default``: the Appium client's own keep-alive connection.
+* ``metered``: ``MeteredAppiumConnection``, keep-alive pool, retries and
+  per-command histograms.
+
+Then the server drops every ``--drop-every``-th request without answering,
+as a reset connection would, and the failed commands per client are
+counted. The metered client re-sends dropped GETs (``text``,
+``displayed``); a dropped POST (``find element``) may already have run,
+so it fails as on the default client. The metered client's histogram is
+printed at the end.
+
+Usage:
+    python -m benchmarks.bench_command_executor --commands 600 --drop-every 20
+"""
+
+import argparse
+import time
+from typing import Tuple
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from mobile.src.driver.command_timings import CommandTimings
+
+
+def run(server: FakeWebDriverServer, executor, commands: int, drop_every: int = 0) -> Tuple[float, int]:
+    """Send ``commands`` commands in a new session; return microseconds per command and failures."""
+    from selenium.common.exceptions import WebDriverException
+    from urllib3.exceptions import HTTPError
+
+    driver = server.connect(executor)
+    server.drop_every = drop_every
+    failures = 0
+    started = time.perf_counter()
+    try:
+        for _ in range(commands // 3):
+            try:
+                element = driver.find_element("id", "search_container")
+                element.text
+                element.is_displayed()
+            except (WebDriverException, HTTPError, ConnectionError):
+                failures += 1
+        elapsed = time.perf_counter() - started
+    finally:
+        server.drop_every = 0
+        driver.quit()
+    return elapsed / (commands // 3 * 3) * 1e6, failures
+
+
+def main() -> None:
+    from appium.webdriver.appium_connection import AppiumConnection
+
+    from mobile.src.driver.command_executor import MeteredAppiumConnection
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=600, help="commands per client")
+    parser.add_argument("--drop-every", type=int, default=20, help="dropped request interval")
+    args = parser.parse_args()
+
+    clients = {
+        "no-keepalive": lambda url: AppiumConnection(url, keep_alive=False),
+        "default": lambda url: None,
+        "metered": MeteredAppiumConnection,
+    }
+    with FakeWebDriverServer() as server:
+        server.show_screen({"search_container": 0.0})
+        print(f"{args.commands} commands per client, no added latency")
+        for label, make in clients.items():
+            per_command, _ = run(server, make(server.url), args.commands)
+            print(f"{label:<13} {per_command:7.0f}us per command")
+
+        print(f"\nserver drops every {args.drop_every}th request")
+        for label in ("default", "metered"):
+            dropped = server.dropped
+            _, failures = run(server, clients[label](server.url), args.commands, args.drop_every)
+            print(f"{label:<13} {failures:4d} failed of {args.commands // 3} flows, {server.dropped - dropped} drops")
+
+    print("\nmetered client, whole benchmark:")
+    print(CommandTimings.run.table())
+
+
+if __name__ == "__main__":
+    main()
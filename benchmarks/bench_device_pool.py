@@ -0,0 +1,166 @@
+"""Measure mobile test throughput as devices are added to the device pool.
+
+Starts one fake WebDriver server per device and writes a device
+inventory for them. For each pool size, as many worker processes as
+devices (like ``pytest -n <devices>``) lease a device through
+``DevicePool`` and run short Wikipedia tests (``--tests`` per device)
+from a shared queue with session reuse. Reported per pool size: tests per second, scaling relative
+to one device, and the most sessions any device had open at once (1 means
+leases were exclusive).
+
+A final check kills a worker while it holds a lease and verifies that
+the device can be leased again at once.
+
+Usage:
+    python -m benchmarks.bench_device_pool --devices 1 2 4 --tests 8
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import yaml
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+
+
+def configure(inventory: str, lock_dir: str, worker: int) -> None:
+    """Point a worker process at the inventory, as ``.env`` and xdist would."""
+    from mobile.config.settings import settings
+
+    os.environ["PYTEST_XDIST_WORKER"] = f"gw{worker}"
+    settings.device_pool_file = inventory
+    settings.device_lock_dir = lock_dir
+    settings.session_reuse = True
+    settings.log_level = "WARNING"
+
+
+def worker(inventory: str, lock_dir: str, index: int, start, tests, results) -> None:
+    """Run tests from the queue on one leased device; report (start, end, count)."""
+    import queue
+
+    configure(inventory, lock_dir, index)
+    from mobile.src.driver.driver_factory import DriverFactory
+    from mobile.src.driver.driver_manager import DriverManager
+    from mobile.src.pages.home_page import HomePage
+
+    # Imports done; all workers start together
+    start.wait()
+    started, done = time.time(), 0
+    try:
+        while True:
+            try:
+                tests.get_nowait()
+            except queue.Empty:
+                break
+            manager = DriverManager()
+            driver = manager.init_driver()
+            try:
+                home = HomePage(driver)
+                home.wait_for_page_load()
+                home.click_search_box()
+            finally:
+                manager.close_driver()
+                DriverManager.reset_singleton()
+            done += 1
+    finally:
+        DriverFactory.shutdown()
+        results.put((started, time.time(), done))
+
+
+def crash_while_leased(inventory: str, lock_dir: str) -> None:
+    """Lease a device and die without releasing it."""
+    configure(inventory, lock_dir, 0)
+    from mobile.src.driver.device_pool import DevicePool
+
+    DevicePool.acquire()
+    os._exit(1)
+
+
+def write_inventory(directory: Path, servers: List[FakeWebDriverServer]) -> str:
+    """Device inventory for the given fake servers."""
+    path = directory / "devices.yaml"
+    devices = [{"name": f"emulator-{5554 + 2 * i}", "appium_url": s.url} for i, s in enumerate(servers)]
+    path.write_text(yaml.safe_dump({"devices": devices}))
+    return str(path)
+
+
+def run(servers: List[FakeWebDriverServer], directory: Path, tests: int) -> Tuple[float, int]:
+    """Run ``tests`` tests with one worker per server; return tests/s and peak sessions per device."""
+    from benchmarks.bench_element_cache import HOME
+
+    context = multiprocessing.get_context("spawn")
+    inventory = write_inventory(directory, servers)
+    lock_dir = str(directory / f"locks-{len(servers)}")
+    for server in servers:
+        server.show_screen(HOME)
+        server.peak_sessions = 0
+    start, queue, results = context.Barrier(len(servers)), context.Queue(), context.Queue()
+    for test in range(tests):
+        queue.put(test)
+    processes = [
+        context.Process(target=worker, args=(inventory, lock_dir, i, start, queue, results))
+        for i in range(len(servers))
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    wall = max(end for _, end, _ in reports) - min(start for start, _, _ in reports)
+    assert sum(done for _, _, done in reports) == tests
+    return tests / wall, max(server.peak_sessions for server in servers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 2, 4], help="pool sizes")
+    parser.add_argument("--tests", type=int, default=8, help="tests per device")
+    parser.add_argument("--session-ms", type=int, default=1000, help="session creation cost")
+    parser.add_argument("--launch-ms", type=int, default=300, help="app launch cost")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp(prefix="bench_device_pool_"))
+    servers = [
+        FakeWebDriverServer(
+            latency_ms=args.latency_ms, session_ms=args.session_ms, launch_ms=args.launch_ms
+        ).start()
+        for _ in range(max(args.devices))
+    ]
+    try:
+        print(f"{args.tests} tests per device, session reuse, {args.latency_ms}ms per request")
+        baseline = None
+        for devices in args.devices:
+            throughput, peak = run(servers[:devices], directory, args.tests * devices)
+            baseline = baseline or throughput / devices
+            print(
+                f"devices={devices:<3} tests/s={throughput:6.2f}  scaling={throughput / baseline:4.2f}x "
+                f"(ideal {devices}x)  peak sessions per device={peak}"
+            )
+
+        inventory = write_inventory(directory, servers[:1])
+        lock_dir = str(directory / "locks-crash")
+        context = multiprocessing.get_context("spawn")
+        process = context.Process(target=crash_while_leased, args=(inventory, lock_dir))
+        process.start()
+        process.join()
+        configure(inventory, lock_dir, 0)
+        from mobile.src.driver.device_pool import DevicePool
+
+        started = time.perf_counter()
+        DevicePool.acquire(timeout=5)
+        DevicePool.release()
+        elapsed = time.perf_counter() - started
+        print(f"lease holder crashed (exit {process.exitcode}), device leased again in {elapsed * 1000:.1f}ms")
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
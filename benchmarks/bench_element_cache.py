@@ -0,0 +1,110 @@
+"""Count Appium round trips of a Wikipedia flow with and without the element cache.
+
+Drives the real page objects (home -> search -> article -> back) against
+the fake WebDriver server, which switches screens (and activities) where
+the app would. Elements are present immediately, so the numbers isolate
+lookups: ``requests`` is the total of Appium commands per flow and
+``find`` the ``find_element`` calls among them.
+
+Usage:
+    python -m benchmarks.bench_element_cache --flows 5 --latency-ms 20
+"""
+
+import argparse
+import time
+from typing import Dict, Tuple
+
+from benchmarks.bench_snapshot import hierarchy
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from mobile.config.settings import settings
+from mobile.src.base.element_cache import ElementCache
+from mobile.src.pages.article_page import ArticlePage
+from mobile.src.pages.home_page import HomePage
+from mobile.src.pages.search_page import SearchPage
+
+
+def screen(*locators: tuple) -> Dict[str, float]:
+    """Scripted screen on which the given locators are present at once."""
+    return {value: 0.0 for _, value in locators}
+
+
+HOME = screen(HomePage.SEARCH_BOX, HomePage.MENU_BUTTON)
+SEARCH = screen(
+    SearchPage.SEARCH_INPUT, SearchPage.SEARCH_RESULTS, SearchPage.RESULT_TITLE,
+    SearchPage.RESULT_DESCRIPTION, SearchPage.CLEAR_SEARCH_BUTTON,
+)
+# Result list read by the snapshot-based search page methods
+SEARCH_SOURCE = hierarchy(3)
+ARTICLE = screen(
+    ArticlePage.ARTICLE_TITLE, ArticlePage.ARTICLE_CONTENT, ArticlePage.SAVE_BUTTON,
+    ArticlePage.BACK_BUTTON,
+)
+
+
+def flow(server: FakeWebDriverServer, driver) -> None:
+    """One search-and-read flow, as the Wikipedia tests perform it."""
+    server.show_screen(HOME, activity=".main.MainActivity")
+    home = HomePage(driver)
+    home.wait_for_page_load()
+    assert home.is_search_box_visible()
+    home.click_search_box()
+
+    server.show_screen(SEARCH, activity=".search.SearchActivity", source=SEARCH_SOURCE)
+    search = SearchPage(driver)
+    search.wait_for_page_load()
+    search.enter_search_query("Python")
+    search.wait_for_search_results()
+    assert search.get_search_results_count() == 3
+    assert search.get_first_result_title() == "Result 0"
+    assert search.is_element_displayed(SearchPage.RESULT_DESCRIPTION)
+    assert not search.is_no_results_displayed()
+    search.get_attribute(SearchPage.RESULT_TITLE, "enabled")
+    search.click_first_result()
+
+    server.show_screen(ARTICLE, activity=".page.PageActivity")
+    article = ArticlePage(driver)
+    article.wait_for_page_load()
+    article.get_article_title()
+    assert article.is_article_content_visible()
+    article.click_save_button()
+    article.get_article_title()
+    assert article.is_article_content_visible()
+    article.click_back_button()
+
+
+def run(server: FakeWebDriverServer, flows: int, cache: bool) -> Tuple[float, float, float]:
+    """Run flows in a fresh session; return requests, finds and seconds per flow."""
+    settings.element_cache = cache
+    driver = server.connect()
+    server.commands.clear()
+    started = time.perf_counter()
+    try:
+        for _ in range(flows):
+            flow(server, driver)
+    finally:
+        elapsed = time.perf_counter() - started
+        ElementCache.release(driver)
+        driver.quit()
+    requests = sum(server.commands.values()) - server.commands["deleteSession"]
+    return requests / flows, server.commands["findElement"] / flows, elapsed / flows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flows", type=int, default=5, help="flows per mode")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    with FakeWebDriverServer(latency_ms=args.latency_ms) as server:
+        uncached = run(server, args.flows, cache=False)
+        cached = run(server, args.flows, cache=True)
+
+    print(f"{args.flows} flows per mode, {args.latency_ms}ms per request")
+    for label, (requests, finds, seconds) in (("no cache", uncached), ("cache", cached)):
+        print(f"{label:<9} requests={requests:5.1f}  find={finds:5.1f}  per_flow={seconds * 1000:7.1f}ms")
+    print(f"round trips saved: {(1 - cached[0] / uncached[0]) * 100:.0f}%")
+    print(ElementCache.totals.summary())
+
+
+if __name__ == "__main__":
+    main()
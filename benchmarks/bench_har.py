@@ -0,0 +1,97 @@
+"""Compare live navigation against HAR replay.
+
+Runs the same sequence of simulated tests three times with ``BROWSER_REUSE``
+enabled: against the live site, while recording a suite HAR
+(``HAR_MODE=record``), and replaying that HAR with the site stopped
+(``HAR_MODE=replay``), which shows the network latency removed. The local
+stand-in site adds latency to every response, like a remote PWA.
+
+Usage:
+    python -m benchmarks.bench_har --tests 20 --latency-ms 80
+    python -m benchmarks.bench_har --url https://demo.swapy.dev
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import List
+
+from benchmarks.local_site import LocalSite
+from pwa.config.settings import settings
+from pwa.src.browser.browser_manager import BrowserManager
+from pwa.src.browser.har_archive import HarArchive
+
+
+async def run_suite(tests: int, har_mode: str) -> List[float]:
+    """Run a simulated suite and return per-test durations.
+
+    Args:
+        tests: Number of simulated tests.
+        har_mode: "record", "replay" or "" for live traffic.
+
+    Returns:
+        Per-test wall time in seconds, including setup and teardown.
+    """
+    settings.browser_reuse = True
+    settings.har_mode = har_mode
+    durations = []
+    manager = BrowserManager()
+    try:
+        for _ in range(tests):
+            started = time.perf_counter()
+            page = await manager.init_browser()
+            await page.locator("h1").first.text_content()
+            await manager.close_browser()
+            durations.append(time.perf_counter() - started)
+    finally:
+        await BrowserManager.shutdown()
+        BrowserManager.reset_singleton()
+    return durations
+
+
+def report(label: str, durations: List[float]) -> None:
+    """Print summary line for one mode."""
+    total = sum(durations)
+    print(
+        f"{label:<8} total={total:8.2f}s  per_test={total / len(durations) * 1000:8.1f}ms  "
+        f"first={durations[0] * 1000:8.1f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    settings.har_dir = tempfile.mkdtemp(prefix="bench_har_")
+    settings.har_scope = "suite"
+    site = None
+    if args.url:
+        settings.pwa_base_url = args.url
+    else:
+        site = LocalSite(latency_ms=args.latency_ms).start()
+        settings.pwa_base_url = site.url
+    try:
+        live = await run_suite(args.tests, har_mode="")
+        recorded = await run_suite(args.tests, har_mode="record")
+        HarArchive.merge_parts()
+    finally:
+        if site:
+            site.stop()
+    replayed = await run_suite(args.tests, har_mode="replay")
+
+    print(f"{args.tests} tests against {settings.pwa_base_url} ({settings.browser_type})")
+    report("live", live)
+    report("record", recorded)
+    report("replay", replayed)
+    print(f"latency removed per test: {(sum(live) - sum(replayed)) / args.tests * 1000:.1f}ms")
+    print(f"speedup (replay): {sum(live) / sum(replayed):.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=20, help="number of simulated tests")
+    parser.add_argument("--latency-ms", type=int, default=80, help="added latency per response")
+    parser.add_argument("--url", default="", help="site to open instead of the local stand-in")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
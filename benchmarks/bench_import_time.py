@@ -0,0 +1,124 @@
+"""Measure import cost of framework modules with ``python -X importtime``.
+
+Each target is imported in a fresh interpreter. The report shows the
+cumulative import time of the target, how many modules it loaded, whether
+it pulled in a browser/driver stack (Playwright, Appium, Selenium) and the
+modules with the highest self time. ``--collect`` also times
+``pytest --collect-only`` for the given test directories.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time pwa.src.utils.assertions --top 10
+    python -m benchmarks.bench_import_time --collect pwa/tests mobile/tests
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+DEFAULT_TARGETS = (
+    "pwa.config.settings",
+    "pwa.src.utils",
+    "pwa.src.utils.assertions",
+    "pwa.src.models.product_model",
+    "pwa.src.pages.home_page",
+    "pwa.src.browser.browser_factory",
+    "mobile.config.settings",
+    "mobile.src.utils",
+    "mobile.src.utils.assertions",
+    "mobile.src.models.search_model",
+    "mobile.src.driver.driver_factory",
+)
+
+HEAVY_PACKAGES = ("playwright", "appium", "selenium")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+@dataclass
+class ImportProfile:
+    """Parsed ``-X importtime`` output of one interpreter run."""
+
+    wall: float
+    self_us: Dict[str, int] = field(default_factory=dict)
+    cumulative_us: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def heavy(self) -> List[str]:
+        """Browser/driver packages that were imported."""
+        return [name for name in HEAVY_PACKAGES if name in self.cumulative_us]
+
+    def top(self, count: int) -> List[str]:
+        """Modules with the highest self time."""
+        ranked = sorted(self.self_us.items(), key=lambda item: item[1], reverse=True)
+        return [f"{name} {us / 1000:.1f}ms" for name, us in ranked[:count]]
+
+
+def profile(args: Sequence[str]) -> ImportProfile:
+    """Run the interpreter with ``-X importtime`` and parse its report.
+
+    Args:
+        args: Interpreter arguments after ``-X importtime``.
+
+    Returns:
+        Parsed profile.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+    )
+    report = ImportProfile(wall=time.perf_counter() - started)
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            name = match.group(4)
+            report.self_us[name] = int(match.group(1))
+            report.cumulative_us[name] = int(match.group(2))
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "failed", file=sys.stderr)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="modules to import")
+    parser.add_argument("--top", type=int, default=3, help="slowest modules to list per target")
+    parser.add_argument(
+        "--collect", nargs="*", default=None, metavar="PATH",
+        help="also time 'pytest --collect-only' for these test paths",
+    )
+    args = parser.parse_args()
+
+    print(f"{'target':<36} {'import':>9} {'modules':>8}  heavy")
+    for target in args.targets:
+        report = profile(["-c", f"import {target}"])
+        cumulative = report.cumulative_us.get(target, 0) / 1000
+        print(
+            f"{target:<36} {cumulative:7.1f}ms {len(report.cumulative_us):>8}  "
+            f"{','.join(report.heavy) or '-'}"
+        )
+        if args.top:
+            print(f"{'':<4}slowest: {', '.join(report.top(args.top))}")
+
+    for path in args.collect or []:
+        # -s: importtime writes to stderr, which pytest would otherwise capture.
+        # An empty ini keeps collection independent of the project's pytest config.
+        report = profile([
+            "-m", "pytest", "--collect-only", "-q", "-s", "-p", "no:cacheprovider",
+            "-c", os.devnull, "--rootdir", ".", path,
+        ])
+        print(
+            f"collect-only {path:<23} {report.wall * 1000:7.1f}ms {len(report.cumulative_us):>8}  "
+            f"{','.join(report.heavy) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
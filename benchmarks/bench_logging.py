@@ -0,0 +1,124 @@
+"""Measure logging overhead per ``BasePage.click``/``fill`` call.
+
+Drives ``BasePage`` against a fake page whose actions return immediately,
+so the time per call is the framework's own overhead. Three modes are
+compared:
+
+* ``off``: the page logger is above INFO, records are dropped early.
+* ``sync``: the previous setup, console and rotating file handlers attached
+  to the logger, formatting and writing on the calling thread.
+* ``queue``: the shared ``QueueHandler``/``QueueListener`` pipeline; the
+  caller only enqueues. ``drain`` is the time the listener needed to write
+  the backlog after the loop finished.
+
+Console output goes to ``os.devnull`` and log files to a temporary
+directory that is removed afterwards.
+
+Usage:
+    python -m benchmarks.bench_logging --calls 20000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List
+
+
+class FakePage:
+    """Stand-in for a Playwright page whose actions cost nothing."""
+
+    def on(self, event: str, handler) -> None:
+        return None
+
+    def locator(self, selector: str) -> None:
+        return None
+
+    async def click(self, selector: str) -> None:
+        return None
+
+    async def fill(self, selector: str, text: str) -> None:
+        return None
+
+
+def legacy_handlers(log_dir: Path) -> List[logging.Handler]:
+    """Console and file handlers as ``get_logger`` attached them to every logger."""
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    file_handler = RotatingFileHandler(
+        log_dir / "sync.log", maxBytes=10 * 1024 * 1024, backupCount=5
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    return [console_handler, file_handler]
+
+
+async def drive(page, calls: int) -> float:
+    """Run ``calls`` click/fill pairs and return the time per call in seconds."""
+    started = time.perf_counter()
+    for index in range(calls):
+        await page.click("#search-button")
+        await page.fill("#search-input", f"query {index}")
+    return (time.perf_counter() - started) / (calls * 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000, help="click/fill pairs per mode")
+    args = parser.parse_args()
+
+    log_dir = Path(tempfile.mkdtemp(prefix="bench_logging_"))
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        from common import logging_pipeline
+        from pwa.src.utils import logger as log_module
+
+        logging_pipeline.LOGS_DIR = log_dir
+        from pwa.src.base.base_page import BasePage, logger as page_logger
+
+        package_logger = logging.getLogger("pwa")
+        queue_handler = log_module.get_logger("pwa").handlers[0]
+        page = BasePage(FakePage())
+        results = {}
+
+        page_logger.setLevel(logging.WARNING)
+        results["off"] = asyncio.run(drive(page, args.calls))
+        page_logger.setLevel(logging.INFO)
+
+        package_logger.removeHandler(queue_handler)
+        handlers = legacy_handlers(log_dir)
+        for handler in handlers:
+            page_logger.addHandler(handler)
+        results["sync"] = asyncio.run(drive(page, args.calls))
+        for handler in handlers:
+            page_logger.removeHandler(handler)
+            handler.close()
+        package_logger.addHandler(queue_handler)
+
+        results["queue"] = asyncio.run(drive(page, args.calls))
+        started = time.perf_counter()
+        log_module.shutdown_logging()
+        drain = time.perf_counter() - started
+    shutil.rmtree(log_dir, ignore_errors=True)
+
+    print(f"{args.calls * 2} calls per mode")
+    for mode, per_call in results.items():
+        overhead = per_call - results["off"]
+        print(f"{mode:<6} per_call={per_call * 1e6:7.2f}us  logging={overhead * 1e6:7.2f}us")
+    print(f"drain  {drain * 1000:.1f}ms (listener thread, after the loop)")
+
+
+if __name__ == "__main__":
+    main()
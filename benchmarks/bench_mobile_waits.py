@@ -0,0 +1,88 @@
+"""Compare mobile wait strategies against a fake Appium server.
+
+Each round shows a screen whose element appears after a scripted delay and
+waits for it to be visible with every ``WAIT_STRATEGY``:
+
+* ``fixed``: Selenium's ``WebDriverWait`` polling every 0.5s.
+* ``adaptive-cold``: backoff polling without wait history.
+* ``adaptive-warm``: backoff polling shaped by the history learned in
+  the cold pass (a later run of the same suite).
+* ``server``: one implicit-wait ``find_element``, Appium waits server-side.
+
+Reported per strategy: mean time past the appearance (``overshoot``) and
+mean requests per wait (Appium round trips).
+
+Usage:
+    python -m benchmarks.bench_mobile_waits --rounds 5 --latency-ms 20
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from mobile.config.settings import settings
+from mobile.src.base.adaptive_wait import WaitHistory
+from mobile.src.base.wait_handler import WaitHandler
+
+# Scripted appearance delays in seconds, from a fast toast to a slow feed load
+DELAYS = {"toast": 0.05, "search_results": 0.2, "article_header": 0.6, "feed": 1.5}
+
+
+def run(server: FakeWebDriverServer, driver, rounds: int) -> Tuple[float, float]:
+    """Wait for every scripted element ``rounds`` times.
+
+    Returns:
+        Mean overshoot in seconds and mean requests per wait.
+    """
+    from selenium.webdriver.common.by import By
+
+    wait = WaitHandler(driver)
+    overshoots: List[float] = []
+    requests = 0
+    for _ in range(rounds):
+        for value, delay in DELAYS.items():
+            server.show_screen({value: delay})
+            before = sum(server.commands.values())
+            started = time.monotonic()
+            wait.wait_for_element_visible((By.ID, value), timeout=10)
+            overshoots.append(time.monotonic() - started - delay)
+            requests += sum(server.commands.values()) - before
+    return statistics.mean(overshoots), requests / len(overshoots)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="waits per element and strategy")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    history_dir = tempfile.mkdtemp(prefix="bench_mobile_waits_")
+    settings.wait_history_file = str(Path(history_dir) / "wait_history.json")
+    results: Dict[str, Tuple[float, float]] = {}
+    with FakeWebDriverServer(latency_ms=args.latency_ms) as server:
+        driver = server.connect()
+        try:
+            for label, strategy in (
+                ("fixed", "fixed"),
+                ("adaptive-cold", "adaptive"),
+                ("adaptive-warm", "adaptive"),
+                ("server", "server"),
+            ):
+                settings.wait_strategy = strategy
+                results[label] = run(server, driver, args.rounds)
+                if label == "adaptive-cold":
+                    WaitHistory.save()
+        finally:
+            driver.quit()
+
+    print(f"{len(DELAYS)} elements x {args.rounds} rounds, {args.latency_ms}ms per request")
+    for label, (overshoot, requests) in results.items():
+        print(f"{label:<14} overshoot={overshoot * 1000:7.1f}ms  requests/wait={requests:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare ``networkidle`` against app-aware readiness on a local page.
+
+Two local pages render a product grid from a fetched API response:
+
+* ``static``: the grid is the only request after load.
+* ``polling``: the page also polls an endpoint every 300ms, like a PWA
+  checking for updates; ``networkidle`` never settles there and times out.
+
+Each page is opened ``--rounds`` times and the time from the load event to
+"ready" is measured with ``wait_for_load_state("networkidle")`` and with
+``BasePage.wait_until_ready`` (network quiet plus "grid visible"), with
+the polling endpoint in ``READINESS_IGNORE_URLS``.
+
+Usage:
+    python -m benchmarks.bench_readiness --rounds 10 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, List, Optional
+
+from benchmarks.local_site import LocalSite
+from pwa.config.settings import settings
+from pwa.src.base.base_page import BasePage
+from pwa.src.browser.browser_manager import BrowserManager
+
+READY_PAGE = """<!DOCTYPE html>
+<html>
+<body>
+  <div class="products-grid" hidden></div>
+  <script>
+    fetch("/api/products").then(r => r.json()).then(products => {
+      const grid = document.querySelector(".products-grid");
+      grid.textContent = products.join(", ");
+      grid.hidden = false;
+    });
+    if (location.search.includes("poll")) {
+      setInterval(() => fetch("/api/poll"), 300);
+    }
+  </script>
+</body>
+</html>
+"""
+
+
+class GridPage(BasePage):
+    """Page object of the benchmark page."""
+
+    PRODUCTS_GRID = ".products-grid"
+
+    def ready_conditions(self) -> List[Awaitable[Any]]:
+        return [self.wait.wait_for_selector_visible(self.PRODUCTS_GRID)]
+
+
+async def measure(page, url: str, mode: str, rounds: int, timeout: int) -> List[Optional[float]]:
+    """Return seconds from load to ready per round, None on timeout."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    results: List[Optional[float]] = []
+    for _ in range(rounds):
+        await page.goto(url, wait_until="load")
+        started = time.perf_counter()
+        try:
+            if mode == "networkidle":
+                await page.wait_for_load_state("networkidle", timeout=timeout)
+            else:
+                await GridPage(page).wait_until_ready(timeout=timeout)
+            results.append(time.perf_counter() - started)
+        except PlaywrightTimeoutError:
+            results.append(None)
+    return results
+
+
+def report(label: str, results: List[Optional[float]]) -> None:
+    """Print summary line for one page and mode."""
+    done = [seconds for seconds in results if seconds is not None]
+    timeouts = len(results) - len(done)
+    median = f"{statistics.median(done) * 1000:7.1f}ms" if done else "      -  "
+    print(f"{label:<24} median={median}  timeouts={timeouts}/{len(results)}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    site = LocalSite(latency_ms=args.latency_ms)
+    site.add_route("/ready", READY_PAGE.encode())
+    site.add_route("/api/products", b'["Laptop", "Phone"]', "application/json")
+    site.add_route("/api/poll", b"{}", "application/json")
+    site.start()
+    settings.pwa_base_url = f"{site.url}/ready"
+    settings.readiness_ignore_urls = "*/api/poll*"
+    manager = BrowserManager()
+    try:
+        page = await manager.init_browser()
+        for name, url in (("static", f"{site.url}/ready"), ("polling", f"{site.url}/ready?poll")):
+            for mode in ("networkidle", "readiness"):
+                results = await measure(page, url, mode, args.rounds, args.timeout)
+                report(f"{name}/{mode}", results)
+    finally:
+        await manager.close_browser()
+        await BrowserManager.shutdown()
+        site.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10, help="page loads per page and mode")
+    parser.add_argument("--latency-ms", type=int, default=50, help="added latency per response")
+    parser.add_argument("--timeout", type=int, default=5000, help="readiness timeout in ms")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measure per-test time with the next Appium session pre-warmed in the background.
+
+Each test acquires a driver through ``DriverManager`` as ``BaseTest``
+does, opens the home screen and taps search. It then spends ``--test-ms``
+in its body and ``--teardown-ms`` in teardown (artifacts, reports) after the
+driver is handed back. A new session costs ``--session-ms`` plus
+``--launch-ms`` on the fake server. Modes, all without session reuse:
+
+* ``off``: every test creates its session when it starts.
+* ``per-device=1``: the next session starts once the current one is quit,
+  so it overlaps teardown. The device never has two sessions.
+* ``per-device=2``: the next session starts as soon as a test has its
+  driver, so it overlaps the whole test.
+
+Reported per mode: time per test, creation time hidden and waited for,
+and the most sessions the device had at once. A last run keeps the next
+test waiting longer than ``SESSION_PREWARM_TTL`` and checks the unused
+session is quit.
+
+Usage:
+    python -m benchmarks.bench_session_prewarm --tests 6 --session-ms 1500 --launch-ms 500
+"""
+
+import argparse
+import time
+from urllib.parse import urlparse
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from mobile.config.settings import settings
+from mobile.src.driver.driver_factory import DriverFactory
+from mobile.src.driver.driver_manager import DriverManager
+from mobile.src.driver.session_prewarmer import PrewarmStats, SessionPrewarmer
+from mobile.src.pages.home_page import HomePage
+
+
+def run_test(last: bool, test_s: float, teardown_s: float) -> None:
+    """One short test: driver setup, home screen, body time, handing back, teardown."""
+    SessionPrewarmer.expect_next(not last)
+    manager = DriverManager()
+    driver = manager.init_driver()
+    try:
+        home = HomePage(driver)
+        home.wait_for_page_load()
+        home.click_search_box()
+        time.sleep(test_s)
+    finally:
+        manager.close_driver()
+        DriverManager.reset_singleton()
+    time.sleep(teardown_s)
+
+
+def run(tests: int, prewarm: bool, per_device: int, test_s: float, teardown_s: float) -> PrewarmStats:
+    """Run ``tests`` tests; return the pre-warming statistics."""
+    settings.session_prewarm = prewarm
+    settings.session_prewarm_per_device = per_device
+    for index in range(tests):
+        run_test(index == tests - 1, test_s, teardown_s)
+    stats = SessionPrewarmer.close()
+    DriverFactory.shutdown()
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=6, help="tests per mode")
+    parser.add_argument("--session-ms", type=int, default=1500, help="session creation cost")
+    parser.add_argument("--launch-ms", type=int, default=500, help="app launch cost")
+    parser.add_argument("--test-ms", type=int, default=2000, help="test body time")
+    parser.add_argument("--teardown-ms", type=int, default=500, help="teardown time after the driver is handed back")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    test_s, teardown_s = args.test_ms / 1000, args.teardown_ms / 1000
+    settings.session_reuse = False
+    with FakeWebDriverServer(
+        latency_ms=args.latency_ms, session_ms=args.session_ms, launch_ms=args.launch_ms
+    ) as server:
+        address = urlparse(server.url)
+        settings.appium_host, settings.appium_port = address.hostname, address.port
+        server.show_screen({value: 0.0 for _, value in (HomePage.SEARCH_BOX, HomePage.MENU_BUTTON)})
+        print(
+            f"{args.tests} tests per mode, session {args.session_ms}ms + launch {args.launch_ms}ms, "
+            f"body {args.test_ms}ms, teardown {args.teardown_ms}ms"
+        )
+        baseline = None
+        for label, prewarm, per_device in (("off", False, 1), ("per-device=1", True, 1), ("per-device=2", True, 2)):
+            server.peak_sessions = 0
+            started = time.perf_counter()
+            stats = run(args.tests, prewarm, per_device, test_s, teardown_s)
+            per_test = (time.perf_counter() - started) / args.tests
+            baseline = baseline or per_test
+            print(
+                f"{label:<13} per_test={per_test * 1000:7.1f}ms  hidden={stats.hidden_seconds:5.2f}s  "
+                f"waited={stats.waited_seconds:5.2f}s  used={stats.used}  discarded={stats.discarded}  "
+                f"peak sessions={server.peak_sessions}  speedup={baseline / per_test:4.2f}x"
+            )
+
+        settings.session_prewarm, settings.session_prewarm_per_device = True, 1
+        ttl, settings.session_prewarm_ttl = settings.session_prewarm_ttl, 0.5
+        run_test(False, 0, 0)
+        time.sleep((args.session_ms + args.launch_ms) / 1000 + 1)
+        run_test(True, 0, 0)
+        stats = SessionPrewarmer.close()
+        DriverFactory.shutdown()
+        settings.session_prewarm_ttl = ttl
+        print(f"next test after the TTL: {stats.discarded} discarded, {stats.used} used")
+
+
+if __name__ == "__main__":
+    main()
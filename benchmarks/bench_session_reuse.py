@@ -0,0 +1,84 @@
+"""Measure per-test driver overhead with and without Appium session reuse.
+
+Runs a short Wikipedia test (open home, tap search) repeatedly through
+``DriverManager``, as ``BaseTest`` does, against the fake WebDriver
+server. A new session costs ``--session-ms`` (UiAutomator2 server start)
+plus ``--launch-ms`` (app launch); reuse only pays the app reset. Modes:
+
+* ``per-test``: a new session per test (``SESSION_REUSE=false``).
+* ``restart``/``clear``: one session, app terminated and activated
+  (and its data cleared) between tests.
+* ``recovery``: ``restart``, but the server drops all sessions halfway;
+  the health check replaces the session once.
+
+Usage:
+    python -m benchmarks.bench_session_reuse --tests 5 --session-ms 1500 --launch-ms 500
+"""
+
+import argparse
+import time
+from urllib.parse import urlparse
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from mobile.config.settings import settings
+from mobile.src.driver.driver_factory import DriverFactory, SessionStats
+from mobile.src.driver.driver_manager import DriverManager
+from mobile.src.pages.home_page import HomePage
+
+
+def run(server: FakeWebDriverServer, tests: int, reuse: bool, reset: str, kill_at: int = -1) -> SessionStats:
+    """Run ``tests`` short tests; return the session statistics."""
+    settings.session_reuse = reuse
+    settings.session_reset = reset
+    server.show_screen({value: 0.0 for _, value in (HomePage.SEARCH_BOX, HomePage.MENU_BUTTON)})
+    for index in range(tests):
+        if index == kill_at:
+            server.kill_sessions()
+        manager = DriverManager()
+        driver = manager.init_driver()
+        try:
+            home = HomePage(driver)
+            home.wait_for_page_load()
+            home.click_search_box()
+        finally:
+            manager.close_driver()
+            DriverManager.reset_singleton()
+    return DriverFactory.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=5, help="tests per mode")
+    parser.add_argument("--session-ms", type=int, default=1500, help="session creation cost")
+    parser.add_argument("--launch-ms", type=int, default=500, help="app launch cost")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    with FakeWebDriverServer(
+        latency_ms=args.latency_ms, session_ms=args.session_ms, launch_ms=args.launch_ms
+    ) as server:
+        address = urlparse(server.url)
+        settings.appium_host, settings.appium_port = address.hostname, address.port
+        print(
+            f"{args.tests} tests per mode, session {args.session_ms}ms + launch {args.launch_ms}ms, "
+            f"{args.latency_ms}ms per request"
+        )
+        baseline = None
+        for label, reuse, reset, kill_at in (
+            ("per-test", False, "restart", -1),
+            ("restart", True, "restart", -1),
+            ("clear", True, "clear", -1),
+            ("recovery", True, "restart", args.tests // 2),
+        ):
+            started = time.perf_counter()
+            stats = run(server, args.tests, reuse, reset, kill_at)
+            per_test = (time.perf_counter() - started) / args.tests
+            baseline = baseline or per_test
+            print(
+                f"{label:<9} per_test={per_test * 1000:7.1f}ms  setup={stats.setup_seconds / args.tests * 1000:7.1f}ms  "
+                f"sessions={stats.created}  unhealthy={stats.unhealthy}  speedup={baseline / per_test:4.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
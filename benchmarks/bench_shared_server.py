@@ -0,0 +1,150 @@
+"""Compare per-worker browsers against one shared browser server.
+
+Spawns ``--workers`` processes, each opening ``--pages`` fresh contexts
+through ``BrowserFactory``, first with a browser per worker and then with
+all workers connected to one ``BrowserServer``. Reports mean worker startup
+time (until the browser is usable), peak RSS of the whole process tree and
+page throughput. RSS sampling reads ``/proc`` and is Linux-only.
+
+Usage:
+    python -m benchmarks.bench_shared_server --workers 8 --pages 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.local_site import LocalSite
+from pwa.config.settings import settings
+from pwa.src.browser.browser_factory import BrowserFactory
+from pwa.src.browser.browser_server import BrowserServer
+
+
+def tree_rss(root_pid: int) -> int:
+    """Sum resident memory of a process and all its descendants.
+
+    Args:
+        root_pid: Pid at the top of the tree.
+
+    Returns:
+        Total RSS in bytes (0 where /proc is unavailable).
+    """
+    children: Dict[int, List[int]] = {}
+    for entry in Path("/proc").glob("[0-9]*"):
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total += int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return total
+
+
+async def worker(url: str, pages: int) -> Dict[str, float]:
+    """Body of one benchmark worker process."""
+    started = time.perf_counter()
+    browser = await BrowserFactory.create_browser()
+    startup = time.perf_counter() - started
+    for _ in range(pages):
+        context = await BrowserFactory.create_context(browser)
+        page = await BrowserFactory.create_page(context)
+        await page.goto(url)
+        await BrowserFactory.close_context(context)
+    await BrowserFactory.close_browser()
+    return {"startup": startup, "total": time.perf_counter() - started}
+
+
+def run_mode(args: argparse.Namespace, url: str, endpoint: str = "") -> Dict[str, float]:
+    """Run all workers in one mode and collect measurements."""
+    env = dict(os.environ, BROWSER_WS_ENDPOINT=endpoint)
+    command = [
+        sys.executable, "-m", "benchmarks.bench_shared_server",
+        "--worker", "--url", url, "--pages", str(args.pages),
+    ]
+    peak_rss, done = 0, threading.Event()
+
+    def sample() -> None:
+        nonlocal peak_rss
+        while not done.is_set():
+            peak_rss = max(peak_rss, tree_rss(os.getpid()))
+            time.sleep(0.2)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    started = time.perf_counter()
+    procs = [
+        subprocess.Popen(command, env=env, stdout=subprocess.PIPE, text=True)
+        for _ in range(args.workers)
+    ]
+    results = [json.loads(proc.communicate()[0].strip().splitlines()[-1]) for proc in procs]
+    wall = time.perf_counter() - started
+    done.set()
+    sampler.join()
+
+    return {
+        "startup": sum(r["startup"] for r in results) / len(results),
+        "rss": peak_rss,
+        "throughput": args.workers * args.pages / wall,
+        "wall": wall,
+    }
+
+
+def report(label: str, result: Dict[str, float]) -> None:
+    """Print summary line for one mode."""
+    print(
+        f"{label:<14} startup={result['startup'] * 1000:8.1f}ms  "
+        f"peak_rss={result['rss'] / 2**20:8.1f}MiB  "
+        f"throughput={result['throughput']:6.1f} pages/s  wall={result['wall']:6.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes")
+    parser.add_argument("--pages", type=int, default=10, help="contexts opened per worker")
+    parser.add_argument("--url", default="", help="site to open instead of the local stand-in")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(asyncio.run(worker(args.url, args.pages))))
+        return
+
+    site = None if args.url else LocalSite().start()
+    url = args.url or site.url
+    try:
+        per_worker = run_mode(args, url)
+        server = BrowserServer(settings.browser_type, Path(".bench_ws_endpoint")).start()
+        try:
+            shared = run_mode(args, url, endpoint=server.ws_endpoint)
+        finally:
+            server.stop()
+    finally:
+        if site:
+            site.stop()
+
+    print(f"{args.workers} workers x {args.pages} pages against {url} ({settings.browser_type})")
+    report("per-worker", per_worker)
+    report("shared server", shared)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare per-element queries with one page snapshot for reading a result list.
+
+Reads title and description of every search result on a scripted screen
+of the fake WebDriver server, two ways:
+
+* ``per-element``: ``find_elements`` for the items, then a child lookup
+  and a ``text`` call per field and item (1 + 4n round trips).
+* ``snapshot``: ``SearchPage.get_search_results``, one ``page_source``
+  call parsed and queried locally.
+
+Usage:
+    python -m benchmarks.bench_snapshot --items 10 50 200 --latency-ms 20
+"""
+
+import argparse
+import time
+from typing import List, Tuple
+from xml.sax.saxutils import quoteattr
+
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from mobile.src.models.search_model import Article
+from mobile.src.pages.search_page import SearchPage
+
+PACKAGE = "org.wikipedia"
+
+
+def node(tag: str, resource_id: str = "", text: str = "", children: str = "") -> str:
+    """One UiAutomator2-style hierarchy node."""
+    attributes = (
+        f'index="0" package="{PACKAGE}" class="{tag}" text={quoteattr(text)} '
+        f'resource-id="{resource_id}" checkable="false" checked="false" clickable="true" '
+        f'enabled="true" focusable="true" focused="false" scrollable="false" '
+        f'selected="false" bounds="[0,0][1080,200]" displayed="true"'
+    )
+    return f"<{tag} {attributes}>{children}</{tag}>"
+
+
+def hierarchy(items: int) -> str:
+    """Page source of a search screen with ``items`` results."""
+    rows = "".join(
+        node(
+            "android.widget.LinearLayout", f"{PACKAGE}:id/page_list_item_container",
+            children=node("android.widget.TextView", f"{PACKAGE}:id/page_list_item_title", f"Result {i}")
+            + node("android.widget.TextView", f"{PACKAGE}:id/page_list_item_description", f"Description {i}"),
+        )
+        for i in range(items)
+    )
+    recycler = node("androidx.recyclerview.widget.RecyclerView", f"{PACKAGE}:id/search_results_list", children=rows)
+    return f'<?xml version="1.0" encoding="UTF-8"?><hierarchy rotation="0">{recycler}</hierarchy>'
+
+
+def per_element(page: SearchPage) -> List[Article]:
+    """Read the results the way page objects did before snapshots."""
+    results = []
+    for item in page.find_elements(SearchPage.SEARCH_RESULTS):
+        results.append(Article(
+            title=item.find_element(*SearchPage.RESULT_TITLE).text,
+            description=item.find_element(*SearchPage.RESULT_DESCRIPTION).text,
+        ))
+    return results
+
+
+def run(server: FakeWebDriverServer, page: SearchPage, items: int, rounds: int) -> Tuple[Tuple[float, float], ...]:
+    """Read ``items`` results both ways; return (requests, seconds) per read for each."""
+    server.show_screen(
+        {value: 0.0 for _, value in (SearchPage.SEARCH_RESULTS, SearchPage.RESULT_TITLE, SearchPage.RESULT_DESCRIPTION)},
+        counts={SearchPage.SEARCH_RESULTS[1]: items},
+        source=hierarchy(items),
+    )
+    measured = []
+    for read in (per_element, SearchPage.get_search_results):
+        server.commands.clear()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            assert len(read(page)) == items
+        measured.append((sum(server.commands.values()) / rounds, (time.perf_counter() - started) / rounds))
+    return tuple(measured)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 50, 200], help="result list sizes")
+    parser.add_argument("--rounds", type=int, default=3, help="reads per size and mode")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per request")
+    args = parser.parse_args()
+
+    with FakeWebDriverServer(latency_ms=args.latency_ms) as server:
+        driver = server.connect()
+        try:
+            page = SearchPage(driver)
+            print(f"{args.latency_ms}ms per request, {args.rounds} reads per size")
+            for items in args.items:
+                (slow_requests, slow), (fast_requests, fast) = run(server, page, items, args.rounds)
+                print(
+                    f"items={items:<4} per-element: {slow_requests:5.0f} req {slow * 1000:8.1f}ms   "
+                    f"snapshot: {fast_requests:3.0f} req {fast * 1000:7.1f}ms   speedup={slow / fast:5.1f}x"
+                )
+        finally:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare text-wait latency: ``wait_for_function`` polling vs. MutationObserver.
+
+Opens a local page whose ``#status`` text changes a random delay after
+``trigger`` is called, and measures how long after the change each wait
+returns:
+
+* ``legacy``: the previous ``wait_for_text``, a locator wait followed by
+  ``page.wait_for_function`` with a ``document.querySelector`` string,
+  re-evaluated on every animation frame.
+* ``observer``: ``WaitHandler.wait_for_text``, a ``MutationObserver`` that
+  resolves on the mutation that makes the text appear.
+
+The page records ``performance.now()`` when it changes the text and the
+elapsed time is read right after the wait returns, so both modes include
+the same single ``evaluate`` round trip.
+
+Usage:
+    python -m benchmarks.bench_waits --rounds 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+from typing import List
+
+from benchmarks.local_site import LocalSite
+from pwa.config.settings import settings
+from pwa.src.base.wait_handler import WaitHandler
+from pwa.src.browser.browser_manager import BrowserManager
+
+WAITS_PAGE = """<!DOCTYPE html>
+<html>
+<body>
+  <div id="status">Loading</div>
+  <script>
+    window.changedAt = 0;
+    window.trigger = function (delay) {
+      document.getElementById("status").textContent = "Loading";
+      setTimeout(function () {
+        document.getElementById("status").textContent = "Saved";
+        window.changedAt = performance.now();
+      }, delay);
+    };
+  </script>
+</body>
+</html>
+"""
+
+
+async def legacy_wait_for_text(page, selector: str, text: str, timeout: int) -> None:
+    """The previous ``WaitHandler.wait_for_text`` implementation."""
+    await page.locator(selector).wait_for(timeout=timeout)
+    await page.wait_for_function(
+        f"() => document.querySelector('{selector}').textContent.includes('{text}')",
+        timeout=timeout
+    )
+
+
+async def measure(page, wait, rounds: int, mode: str) -> List[float]:
+    """Return the delay between the text change and the wait returning, in ms."""
+    latencies = []
+    for _ in range(rounds):
+        await page.evaluate("delay => window.trigger(delay)", random.randint(20, 80))
+        if mode == "legacy":
+            await legacy_wait_for_text(page, "#status", "Saved", 5000)
+        else:
+            await wait.wait_for_text("#status", "Saved", timeout=5000)
+        latency = await page.evaluate("() => performance.now() - window.changedAt")
+        latencies.append(latency)
+    return latencies
+
+
+def report(label: str, latencies: List[float]) -> None:
+    """Print summary line for one mode."""
+    ordered = sorted(latencies)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    print(
+        f"{label:<9} median={statistics.median(ordered):6.2f}ms  "
+        f"p95={p95:6.2f}ms  max={ordered[-1]:6.2f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    site = LocalSite()
+    site.add_route("/waits", WAITS_PAGE.encode())
+    site.start()
+    settings.pwa_base_url = site.url
+    manager = BrowserManager()
+    try:
+        page = await manager.init_browser()
+        await page.goto(f"{site.url}/waits")
+        wait = WaitHandler(page)
+        # Warm up both paths before measuring
+        await measure(page, wait, 3, "legacy")
+        await measure(page, wait, 3, "observer")
+        legacy = await measure(page, wait, args.rounds, "legacy")
+        observer = await measure(page, wait, args.rounds, "observer")
+    finally:
+        await manager.close_browser()
+        await BrowserManager.shutdown()
+        site.stop()
+
+    print(f"{args.rounds} text changes per mode ({settings.browser_type}, headless={settings.browser_headless})")
+    report("legacy", legacy)
+    report("observer", observer)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50, help="text changes per mode")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
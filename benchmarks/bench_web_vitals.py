@@ -0,0 +1,112 @@
+"""Measure the cost of web vitals collection and show the per-page tables.
+
+A local page renders a product grid from a fetched API response, shifts
+its layout when the grid appears, and runs a ``--task-ms`` busy loop when
+"Sort" is clicked. Each round loads the page and waits until it is ready
+through ``BasePage.wait_until_ready``, then clicks "Sort" inside
+``WebVitals.measure``. Rounds run without and with ``WEB_VITALS``. Reported:
+median load-to-ready time per mode (the difference is the collection
+cost), and the session's percentile tables with the budget check of the
+sort action.
+
+Usage:
+    python -m benchmarks.bench_web_vitals --rounds 10 --task-ms 250
+"""
+
+import argparse
+import asyncio
+import statistics
+from typing import Any, Awaitable, List
+
+from benchmarks.local_site import LocalSite
+from pwa.config.settings import settings
+from pwa.src.base.base_page import BasePage
+from pwa.src.browser.browser_manager import BrowserManager
+from pwa.src.browser.web_vitals import WebVitals
+from pwa.src.utils.assertions import CustomAssertions
+
+VITALS_PAGE = """<!DOCTYPE html>
+<html>
+<body>
+  <h1>Products</h1>
+  <div class="products-grid" hidden></div>
+  <button class="sort">Sort</button>
+  <p>Footer text pushed down when the grid appears</p>
+  <script>
+    fetch("/api/products").then(r => r.json()).then(products => {
+      const grid = document.querySelector(".products-grid");
+      grid.innerHTML = products.map(p => `<div style="height:80px">${p}</div>`).join("");
+      grid.hidden = false;
+    });
+    document.querySelector(".sort").addEventListener("click", () => {
+      const end = performance.now() + TASK_MS;
+      while (performance.now() < end) {}
+    });
+  </script>
+</body>
+</html>
+"""
+
+
+class GridPage(BasePage):
+    """Page object of the benchmark page."""
+
+    PRODUCTS_GRID = ".products-grid"
+    SORT_BUTTON = ".sort"
+
+    def ready_conditions(self) -> List[Awaitable[Any]]:
+        return [self.wait.wait_for_selector_visible(self.PRODUCTS_GRID)]
+
+
+async def run(url: str, rounds: int, vitals: bool) -> List[float]:
+    """Load the page ``rounds`` times in fresh contexts; return seconds from load to ready."""
+    settings.web_vitals = vitals
+    results: List[float] = []
+    for _ in range(rounds):
+        manager = BrowserManager()
+        page = await manager.init_browser()
+        try:
+            await page.goto(url, wait_until="load")
+            grid = GridPage(page)
+            results.append(await grid.wait_until_ready())
+            if vitals:
+                async with WebVitals.measure(page, "GridPage.sort") as window:
+                    await grid.click(GridPage.SORT_BUTTON)
+                try:
+                    CustomAssertions.assert_no_long_task(window, max_ms=200)
+                except AssertionError as e:
+                    print(f"  budget: {e}")
+                await WebVitals.finish(page)
+        finally:
+            await manager.close_browser()
+            BrowserManager.reset_singleton()
+    return results
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    site = LocalSite(latency_ms=args.latency_ms)
+    site.add_route("/vitals", VITALS_PAGE.replace("TASK_MS", str(args.task_ms)).encode())
+    site.add_route("/api/products", b'["Laptop", "Phone", "Tablet"]', "application/json")
+    site.start()
+    settings.pwa_base_url = f"{site.url}/vitals"
+    settings.browser_reuse = True
+    try:
+        for label, vitals in (("without vitals", False), ("with vitals", True)):
+            results = await run(f"{site.url}/vitals", args.rounds, vitals)
+            print(f"{label:<16} load to ready median={statistics.median(results) * 1000:7.1f}ms")
+        print(WebVitals.totals.summary(WebVitals.budgets()))
+    finally:
+        await BrowserManager.shutdown()
+        site.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10, help="page loads per mode")
+    parser.add_argument("--task-ms", type=int, default=250, help="long task run by the sort click")
+    parser.add_argument("--latency-ms", type=int, default=20, help="added latency per response")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""Local fake of an Appium server with scripted element-appearance delays."""
+
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Match, NamedTuple, Optional, Pattern, Set, Tuple
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# App-management extensions, run through "mobile: <command>"
+_APP_COMMANDS = ("activateApp", "terminateApp", "queryAppState", "clearApp", "deepLink")
+
+# 1x1 PNG returned by the screenshot command
+_SCREENSHOT = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+_SESSION_PATH = re.compile(r"^/session/(?P<session>[^/]+)(?P<rest>/.*)?$")
+
+# (method, route under /session/<id>) -> handler method; None matches any method
+_SESSION_ROUTES: List[Tuple[Optional[str], Pattern[str], str]] = [
+    ("DELETE", re.compile(r"^$"), "_delete_session"),
+    (None, re.compile(r"^/timeouts$"), "_timeouts"),
+    (None, re.compile(r"^/appium/settings$"), "_settings"),
+    (None, re.compile(r"^/source$"), "_source"),
+    (None, re.compile(r"^(?:/element/(?P<parent>[^/]+))?/(?P<command>elements?)$"), "_find_elements"),
+    (None, re.compile(r"^/element/(?P<id>[^/]+)/(?P<command>\w+)(?:/(?P<name>[\w-]+))?$"), "_element_command"),
+    (None, re.compile(r"^/actions$"), "_actions"),
+    (None, re.compile(r"^/screenshot$"), "_screenshot"),
+    (None, re.compile(r"^/execute"), "_execute"),
+]
+
+_STALE_ELEMENT = (404, {
+    "error": "stale element reference",
+    "message": "Element is no longer attached to the screen",
+    "stacktrace": "",
+})
+
+
+class _Request(NamedTuple):
+    """A session command, as passed to its route handler."""
+
+    method: str
+    match: Match[str]
+    body: Dict[str, Any]
+    session: str
+
+
+def _unknown_command(method: str, route: str) -> Tuple[int, Any]:
+    return 404, {"error": "unknown command", "message": f"{method} {route}", "stacktrace": ""}
+
+
+class _Server(ThreadingHTTPServer):
+    # Many clients may connect at once (asyncio client, device pool workers)
+    request_queue_size = 128
+
+
+class FakeWebDriverServer:
+    """Serve the W3C WebDriver commands the framework's waits use.
+
+    Elements are addressed by locator value; each one appears a scripted
+    delay after ``show_screen`` was called, optionally repeated (list items)
+    and with a scripted ``page_source``; references to elements of an
+    earlier screen are reported stale. Every response is held back by
+    ``latency_ms`` to mimic the round trip to a real Appium server and
+    device, and ``commands`` counts the requests per command. Creating a
+    session costs ``session_ms`` plus ``launch_ms`` (UiAutomator2 server
+    start and app launch), activating the app ``launch_ms``;
+    ``peak_sessions`` is the most sessions that were open at once. Implicit
+    waits are honoured: ``find element`` blocks server-side until the
+    element appears or the window ends.
+
+    Example:
+        with FakeWebDriverServer(latency_ms=20) as server:
+            server.show_screen({"search_container": 0.3})
+            driver = server.connect()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: int = 0,
+        session_ms: int = 0,
+        launch_ms: int = 0,
+    ) -> None:
+        """Initialize FakeWebDriverServer.
+
+        Args:
+            host: Interface to bind.
+            port: Port to bind, 0 picks a free port.
+            latency_ms: Delay added to every response.
+            session_ms: Extra time to create a session.
+            launch_ms: Time to launch the app.
+        """
+        self.latency_ms = latency_ms
+        self.session_ms = session_ms
+        self.launch_ms = launch_ms
+        self.app_state = 1
+        self.peak_sessions = 0
+        # Drop every n-th request without answering, like a reset connection (0: never)
+        self.drop_every = 0
+        self.dropped = 0
+        self._requests = 0
+        self.commands: Counter = Counter()
+        self.settings: Dict[str, Any] = {"waitForIdleTimeout": 10000}
+        self.activity = ".MainActivity"
+        self.source = "<hierarchy/>"
+        self._appear_at: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._elements: Dict[str, str] = {}
+        self._screen = 0
+        self._sessions: Set[str] = set()
+        self._implicit_wait = 0.0
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def show_screen(
+        self,
+        delays: Dict[str, float],
+        activity: Optional[str] = None,
+        counts: Optional[Dict[str, int]] = None,
+        source: Optional[str] = None,
+    ) -> None:
+        """Switch to a new screen whose elements appear after the given delays.
+
+        Args:
+            delays: Seconds until each element (by locator value) is present.
+            activity: Activity reported for the screen; unchanged if None.
+            counts: Number of matches per locator value (default 1); also
+                applies to lookups within an element.
+            source: XML returned by ``page_source``; unchanged if None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._appear_at = {value: now + delay for value, delay in delays.items()}
+            self._counts = dict(counts or {})
+            self._elements = {}
+            self._screen += 1
+            if activity is not None:
+                self.activity = activity
+            if source is not None:
+                self.source = source
+
+    def kill_sessions(self) -> None:
+        """Forget all sessions, as after an Appium server or device restart."""
+        with self._lock:
+            self._sessions.clear()
+
+    def connect(self, command_executor: Any = None):
+        """Open an Appium client session against this server.
+
+        Args:
+            command_executor: Connection to use instead of the URL.
+        """
+        from appium import webdriver
+        from appium.options.common.base import AppiumOptions
+
+        options = AppiumOptions()
+        options.load_capabilities({"platformName": "Android", "appium:automationName": "UiAutomator2"})
+        return webdriver.Remote(
+            command_executor=command_executor or self.url, options=options, direct_connection=False
+        )
+
+    def start(self) -> "FakeWebDriverServer":
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeWebDriverServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _find(self, value: str, parent: str = "") -> List[str]:
+        """Element ids for a locator value, waiting up to the implicit wait."""
+        deadline = time.monotonic() + self._implicit_wait
+        while True:
+            with self._lock:
+                appear_at = self._appear_at.get(value)
+                count = self._counts.get(value, 1)
+            now = time.monotonic()
+            if appear_at is not None and now >= appear_at:
+                # Within a list item, a child locator matches once
+                count = 1 if parent else count
+                ids = [
+                    uuid.uuid5(uuid.NAMESPACE_OID, f"{self._screen}:{parent}:{value}:{index}").hex
+                    for index in range(count)
+                ]
+                with self._lock:
+                    for index, element_id in enumerate(ids):
+                        self._elements[element_id] = f"{value} {index + 1}" if count > 1 else value
+                return ids
+            if now >= deadline:
+                return []
+            wake = deadline if appear_at is None else min(deadline, appear_at)
+            time.sleep(max(wake - now, 0.001))
+
+    def _dispatch(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        """Run one command and return HTTP status and ``value``."""
+        if method == "POST" and path == "/session":
+            return self._new_session()
+        if path == "/status":
+            return 200, {"ready": True, "message": "fake"}
+        match = _SESSION_PATH.match(path)
+        if not match:
+            return 404, {"error": "unknown command", "message": path, "stacktrace": ""}
+        rest = match.group("rest") or ""
+        if match.group("session") not in self._sessions:
+            return 404, {"error": "invalid session id", "message": "Session does not exist", "stacktrace": ""}
+        for route_method, route, handler in _SESSION_ROUTES:
+            route_match = route.match(rest)
+            if route_match and route_method in (None, method):
+                return getattr(self, handler)(_Request(method, route_match, body, match.group("session")))
+        return _unknown_command(method, rest)
+
+    def _new_session(self) -> Tuple[int, Any]:
+        self.commands["newSession"] += 1
+        time.sleep((self.session_ms + self.launch_ms) / 1000)
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions.add(session_id)
+            self.peak_sessions = max(self.peak_sessions, len(self._sessions))
+        self.app_state = 4
+        return 200, {"sessionId": session_id, "capabilities": {"platformName": "Android"}}
+
+    def _delete_session(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["deleteSession"] += 1
+        with self._lock:
+            self._sessions.discard(request.session)
+        return 200, None
+
+    def _timeouts(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["setTimeouts"] += 1
+        if "implicit" in request.body:
+            self._implicit_wait = request.body["implicit"] / 1000
+        return 200, None
+
+    def _settings(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["settings"] += 1
+        if request.method == "POST":
+            self.settings.update(request.body.get("settings", {}))
+            return 200, None
+        return 200, dict(self.settings)
+
+    def _source(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["pageSource"] += 1
+        return 200, self.source
+
+    def _find_elements(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["findElement"] += 1
+        parent = request.match.group("parent") or ""
+        if parent and parent not in self._elements:
+            return _STALE_ELEMENT
+        ids = self._find(request.body.get("value", ""), parent)
+        if request.match.group("command") == "elements":
+            return 200, [{ELEMENT_KEY: element_id} for element_id in ids]
+        if not ids:
+            return 404, {
+                "error": "no such element",
+                "message": f"No element found for {request.body.get('value')}",
+                "stacktrace": "",
+            }
+        return 200, {ELEMENT_KEY: ids[0]}
+
+    def _element_command(self, request: _Request) -> Tuple[int, Any]:
+        command = request.match.group("command")
+        self.commands[command] += 1
+        if request.match.group("id") not in self._elements:
+            return _STALE_ELEMENT
+        if command in ("displayed", "enabled"):
+            return 200, True
+        if command == "text":
+            return 200, self._elements.get(request.match.group("id"), "")
+        if command in ("click", "clear", "value"):
+            return 200, None
+        if command == "attribute":
+            return 200, "true" if request.match.group("name") in ("displayed", "enabled") else None
+        return _unknown_command(request.method, request.match.group(0))
+
+    def _actions(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["actions"] += 1
+        return 200, None
+
+    def _screenshot(self, request: _Request) -> Tuple[int, Any]:
+        self.commands["screenshot"] += 1
+        return 200, _SCREENSHOT
+
+    def _execute(self, request: _Request) -> Tuple[int, Any]:
+        script = request.body.get("script", "")
+        if script == "mobile: getCurrentActivity":
+            self.commands["currentActivity"] += 1
+            return 200, self.activity
+        if script[len("mobile: "):] in _APP_COMMANDS:
+            return 200, self._app_command(script[len("mobile: "):])
+        self.commands["executeScript"] += 1
+        return 200, True
+
+    def _app_command(self, command: str) -> Any:
+        """Run an app-management extension; returns the command's ``value``."""
+        self.commands[command] += 1
+        if command == "queryAppState":
+            return self.app_state
+        if command == "activateApp":
+            if self.app_state != 4:
+                time.sleep(self.launch_ms / 1000)
+            self.app_state = 4
+        elif command == "terminateApp":
+            self.app_state = 1
+        return True
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; avoid delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def _handle(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else {}
+                with server._lock:
+                    server._requests += 1
+                    drop = server.drop_every and server._requests % server.drop_every == 0
+                    server.dropped += bool(drop)
+                if drop:
+                    self.close_connection = True
+                    return
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                path = self.path.split("?", 1)[0].rstrip("/")
+                status, value = server._dispatch(method, path, body)
+                payload = json.dumps({"value": value}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._handle("GET")
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._handle("POST")
+
+            def do_DELETE(self) -> None:  # noqa: N802
+                self._handle("DELETE")
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
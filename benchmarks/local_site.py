@@ -0,0 +1,128 @@
+"""Local stand-in for the PWA demo used by browser benchmarks."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+HOME_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Local PWA</title>
+  <link rel="stylesheet" href="/static/app.css">
+</head>
+<body>
+  <nav><a href="/cart">Cart</a></nav>
+  <h1>Products</h1>
+  <div class="products-grid">
+    <div class="product-item product-card">
+      <span class="product-name product-title">Laptop</span>
+      <span class="product-price">1299.99</span>
+      <button data-action="add-to-cart">Add to Cart</button>
+    </div>
+    <div class="product-item product-card">
+      <span class="product-name product-title">Phone</span>
+      <span class="product-price">799.99</span>
+      <button data-action="add-to-cart">Add to Cart</button>
+    </div>
+  </div>
+  <script src="/static/app.js"></script>
+</body>
+</html>
+"""
+
+APP_CSS = "body { font-family: sans-serif; } .product-item { padding: 8px; }\n"
+
+APP_JS = """
+document.querySelectorAll("button[data-action='add-to-cart']").forEach(function (button) {
+  button.addEventListener("click", function () {
+    var count = parseInt(localStorage.getItem("cart") || "0", 10) + 1;
+    localStorage.setItem("cart", String(count));
+  });
+});
+"""
+
+
+class LocalSite:
+    """Serve a small static PWA-like site on localhost in a background thread.
+
+    Example:
+        with LocalSite() as site:
+            await page.goto(site.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0) -> None:
+        """Initialize LocalSite.
+
+        Args:
+            host: Interface to bind.
+            port: Port to bind, 0 picks a free port.
+            latency_ms: Delay added to every response, to mimic a remote site.
+        """
+        self.latency_ms = latency_ms
+        self.routes: Dict[str, Tuple[str, bytes]] = {
+            "/": ("text/html", HOME_PAGE.encode()),
+            "/cart": ("text/html", b"<html><body><h1>Cart</h1></body></html>"),
+            "/static/app.css": ("text/css", APP_CSS.encode()),
+            "/static/app.js": ("application/javascript", APP_JS.encode()),
+        }
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running site."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_route(self, path: str, body: bytes, content_type: str = "text/html") -> None:
+        """Register or replace a static route.
+
+        Args:
+            path: URL path, e.g. ``/products``.
+            body: Response body.
+            content_type: Response content type.
+        """
+        self.routes[path] = (content_type, body)
+
+    def start(self) -> "LocalSite":
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalSite":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _make_handler(self) -> type:
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                path = self.path.split("?", 1)[0]
+                if path not in site.routes:
+                    self.send_error(404)
+                    return
+                content_type, body = site.routes[path]
+                if site.latency_ms:
+                    time.sleep(site.latency_ms / 1000)
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "max-age=3600")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
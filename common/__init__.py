@@ -0,0 +1 @@
+"""Helpers shared by the mobile and PWA frameworks."""
@@ -0,0 +1,38 @@
+"""Lazy package exports shared by the mobile and PWA packages."""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[List[str], Callable[[str], Any], Callable[[], List[str]]]:
+    """Build ``__all__``, ``__getattr__`` and ``__dir__`` for a package.
+
+    Each exported name is imported from its submodule on first access and
+    cached in the package namespace, so importing the package itself stays
+    cheap.
+
+    Args:
+        package: Name of the package (its ``__name__``).
+        exports: Exported name mapped to the submodule that defines it.
+
+    Returns:
+        ``(__all__, __getattr__, __dir__)`` for the package to assign.
+    """
+    names = list(exports)
+
+    def __getattr__(name: str) -> Any:
+        """Import the submodule defining ``name`` on first access."""
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(f".{exports[name]}", package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        """List public names, including ones not imported yet."""
+        return sorted(set(vars(sys.modules[package])) | set(names))
+
+    return names, __getattr__, __dir__
@@ -0,0 +1,222 @@
+"""Queued logging pipeline shared by the mobile and PWA loggers.
+
+Records go through one queue per process: callers only enqueue them, and a
+listener thread formats them and writes the console and file output. Each
+framework's ``get_logger`` wraps :func:`configure_pipeline` with its own log
+level, file format and filters.
+"""
+
+import atexit
+import copy
+import heapq
+import logging
+import os
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Logs directory, created when the first record is written
+LOGS_DIR = Path("logs")
+LOG_FILE_NAME = "test_execution.log"
+
+# Argument types that cannot change between the log call and formatting
+_IMMUTABLE_ARG_TYPES = (str, bytes, int, float, bool, type(None))
+
+# File records start with "YYYY-mm-dd HH:MM:SS.mmm"; other lines continue the record above
+_RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3} ")
+
+
+class _DeferredFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates its file (and directory) on first emit."""
+
+    def __init__(self, filename: Path, **kwargs) -> None:
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+class _LazyQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread.
+
+    The stock ``QueueHandler`` formats every record on the calling thread.
+    Records whose arguments are immutable scalars are queued as they are and
+    rendered by the listener; anything else is rendered now, since it could
+    change before the listener gets to it. Once the listener is stopped,
+    records are handled synchronously so late messages are not lost.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy the record, rendering the message only if its arguments are mutable.
+
+        Args:
+            record: Log record being handled.
+
+        Returns:
+            Record to put on the queue.
+        """
+        record = copy.copy(record)
+        args = record.args
+        # A single dict argument is stored as the args mapping itself
+        if args and not (
+            isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue the record, or handle it directly once the listener is stopped."""
+        if _listener is None:
+            for handler in _handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        super().enqueue(record)
+
+
+_queue_handler: Optional[_LazyQueueHandler] = None
+_listener: Optional[QueueListener] = None
+_handlers: List[logging.Handler] = []
+
+
+def log_file_path() -> Path:
+    """File this process writes to.
+
+    Returns:
+        ``test_execution.log``, or ``test_execution.<worker>.log`` inside an
+        xdist worker so workers never write to the same file.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        return LOGS_DIR / f"test_execution.{worker}.log"
+    return LOGS_DIR / LOG_FILE_NAME
+
+
+def configure_pipeline(
+    console_level: str,
+    file_format: str,
+    filters: Sequence[logging.Filter] = (),
+) -> QueueHandler:
+    """Create the shared queue handler and start its listener thread.
+
+    Only the first call configures the pipeline; later calls return the
+    handler it created.
+
+    Args:
+        console_level: Level of the console handler.
+        file_format: Format string of the log file.
+        filters: Filters run on the calling thread before a record is queued.
+
+    Returns:
+        Queue handler to attach to a package logger.
+    """
+    global _queue_handler, _listener, _handlers
+
+    if _queue_handler is not None:
+        return _queue_handler
+
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    console_handler.setFormatter(console_formatter)
+
+    # File handler
+    file_handler = _DeferredFileHandler(
+        log_file_path(),
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S"))
+
+    _handlers = [console_handler, file_handler]
+    _queue_handler = _LazyQueueHandler(queue.SimpleQueue())
+    for record_filter in filters:
+        _queue_handler.addFilter(record_filter)
+    _listener = QueueListener(_queue_handler.queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """Drain the queue, stop the listener thread and close the log files.
+
+    Safe to call more than once. Records logged afterwards are written
+    synchronously.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in _handlers:
+        handler.flush()
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+
+
+def _read_records(path: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(timestamp, text)`` for each record of a log file.
+
+    Lines that do not start with a timestamp (tracebacks, multi-line
+    messages) belong to the record above them.
+    """
+    timestamp = ""
+    lines: List[str] = []
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if _RECORD_START.match(line):
+                if lines:
+                    yield timestamp, "".join(lines)
+                timestamp, lines = line[:23], [line]
+            else:
+                lines.append(line)
+    if lines:
+        yield timestamp, "".join(lines)
+
+
+def merge_worker_logs() -> Optional[Path]:
+    """Append the log files of xdist workers to the main log, in time order.
+
+    Call it on the controller after all workers have finished. Each worker's
+    files (including rotated backups) are already in time order, so they are
+    merged record by record and removed afterwards.
+
+    Returns:
+        Path of the main log file, or None if no worker logs were found.
+    """
+    worker_files: Dict[str, List[Tuple[int, Path]]] = {}
+    for path in LOGS_DIR.glob("test_execution.gw*.log*"):
+        worker, _, backup = path.name[len("test_execution."):].partition(".log")
+        worker_files.setdefault(worker, []).append((int(backup.lstrip(".") or 0), path))
+    if not worker_files:
+        return None
+
+    shutdown_logging()
+    # Oldest rotated backup has the highest suffix
+    sources = [
+        [path for _, path in sorted(files, reverse=True)]
+        for files in worker_files.values()
+    ]
+    streams = [
+        (record for path in paths for record in _read_records(path))
+        for paths in sources
+    ]
+    main_log = LOGS_DIR / LOG_FILE_NAME
+    with open(main_log, "a", encoding="utf-8") as out:
+        for _, text in heapq.merge(*streams, key=lambda record: record[0]):
+            out.write(text)
+    for paths in sources:
+        for path in paths:
+            path.unlink(missing_ok=True)
+    return main_log
@@ -1,17 +1,24 @@
 """Appium-specific configuration and capabilities."""
 
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 from .settings import settings
 
+if TYPE_CHECKING:
+    from mobile.src.driver.device_pool import Device
+
 
 class AppiumConfig:
     """Appium driver capabilities and configuration."""
 
     @staticmethod
-    def get_android_capabilities() -> Dict[str, Any]:
+    def get_android_capabilities(device: Optional["Device"] = None) -> Dict[str, Any]:
         """Get Android desired capabilities for Appium.
 
+        Args:
+            device: Leased pool device whose name, UDID and ports override
+                the ``ANDROID_*`` settings.
+
         Returns:
             Dictionary with Android desired capabilities.
         """
@@ -28,6 +35,8 @@ class AppiumConfig:
             "newCommandTimeout": settings.appium_timeout * 1000,
             "connectHardwareKeyboard": False,
         }
+        if device is not None:
+            capabilities.update(device.appium_capabilities())
         return capabilities
 
     @staticmethod
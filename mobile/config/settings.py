@@ -2,7 +2,8 @@
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
 
 from dotenv import load_dotenv
 
@@ -18,11 +19,67 @@ class Settings:
         self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
         self.report_dir: str = os.getenv("REPORT_DIR", "reports")
         self.screenshot_on_failure: bool = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+        # Chrome trace-event JSON of page-object action and wait spans (empty: not traced)
+        self.action_trace_file: str = os.getenv("ACTION_TRACE_FILE", "")
+
+        # Artifact writer: screenshots are encoded and written on background threads
+        self.screenshot_format: str = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+        self.screenshot_quality: int = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+        self.artifact_writer_threads: int = int(os.getenv("ARTIFACT_WRITER_THREADS", "2"))
+        self.artifact_writer_max_pending: int = int(os.getenv("ARTIFACT_WRITER_MAX_PENDING", "32"))
+
+        # Failure capture (with SCREENSHOT_ON_FAILURE): device screen recording, fetched on failure
+        self.failure_recording: bool = os.getenv("FAILURE_RECORDING", "true").lower() == "true"
+        self.failure_recording_seconds: int = int(os.getenv("FAILURE_RECORDING_SECONDS", "60"))
+        self.failure_recording_bit_rate: int = int(os.getenv("FAILURE_RECORDING_BIT_RATE", "1000000"))
+        self.failure_buffer_screenshots: int = int(os.getenv("FAILURE_BUFFER_SCREENSHOTS", "10"))
+        self.failure_buffer_mb: float = float(os.getenv("FAILURE_BUFFER_MB", "16"))
+
+        # Waits: "adaptive" (client polls with backoff, learned per-locator timing),
+        # "server" (Appium waits in find_element via implicit wait) or "fixed" (0.5s polls)
+        self.wait_strategy: str = os.getenv("WAIT_STRATEGY", "adaptive").lower()
+        self.wait_poll_initial: float = float(os.getenv("WAIT_POLL_INITIAL", "0.05"))
+        self.wait_poll_backoff: float = float(os.getenv("WAIT_POLL_BACKOFF", "1.5"))
+        self.wait_poll_max: float = float(os.getenv("WAIT_POLL_MAX", "0.5"))
+        self.wait_history_file: str = os.getenv("WAIT_HISTORY_FILE", ".cache/wait_history.json")
+        # UiAutomator2 waitForIdleTimeout in ms set on new sessions (empty keeps the driver default)
+        idle_timeout = os.getenv("UIA2_WAIT_FOR_IDLE_TIMEOUT", "")
+        self.uia2_wait_for_idle_timeout: Optional[int] = int(idle_timeout) if idle_timeout else None
+
+        # Reuse resolved elements on the same screen instead of re-finding them
+        self.element_cache: bool = os.getenv("ELEMENT_CACHE", "false").lower() == "true"
+
+        # Locator profiling: per-locator lookup latency plus the page source of the screen
+        # each locator first matched on, input for mobile.src.utils.locator_optimizer
+        self.locator_profile: bool = os.getenv("LOCATOR_PROFILE", "false").lower() == "true"
+        self.locator_profile_file: str = os.getenv("LOCATOR_PROFILE_FILE", "reports/locator_profile.json")
+        self.locator_snapshot_dir: str = os.getenv("LOCATOR_SNAPSHOT_DIR", ".cache/locator_snapshots")
+
+        # Session reuse: keep one Appium session per worker and reset the app between tests.
+        # SESSION_RESET: "restart" (terminate/activate), "clear" (also clear app data) or
+        # "deeplink" (open SESSION_HOME_DEEPLINK without restarting)
+        self.session_reuse: bool = os.getenv("SESSION_REUSE", "false").lower() == "true"
+        self.session_reset: str = os.getenv("SESSION_RESET", "restart").lower()
+        self.session_home_deeplink: str = os.getenv("SESSION_HOME_DEEPLINK", "")
+        # Start a new session after this many tests (0: never)
+        self.session_max_tests: int = int(os.getenv("SESSION_MAX_TESTS", "0"))
+        # Start the next test's new session in the background; sessions this worker may have
+        # open or starting per device (1: after the current one quits), seconds an unused one is kept
+        self.session_prewarm: bool = os.getenv("SESSION_PREWARM", "false").lower() == "true"
+        self.session_prewarm_per_device: int = int(os.getenv("SESSION_PREWARM_PER_DEVICE", "1"))
+        self.session_prewarm_ttl: float = float(os.getenv("SESSION_PREWARM_TTL", "20"))
 
         # Appium settings
         self.appium_host: str = os.getenv("APPIUM_HOST", "localhost")
         self.appium_port: int = int(os.getenv("APPIUM_PORT", "4723"))
         self.appium_timeout: int = int(os.getenv("APPIUM_TIMEOUT", "30"))
+        # HTTP client: persistent connections per Appium server, retries on connection
+        # errors (and resets of GET/DELETE only), and per-command timing histograms
+        self.appium_pool_maxsize: int = int(os.getenv("APPIUM_POOL_MAXSIZE", "4"))
+        self.appium_http_retries: int = int(os.getenv("APPIUM_HTTP_RETRIES", "2"))
+        self.command_timings_file: str = os.getenv("COMMAND_TIMINGS_FILE", "")
+        # Asyncio client: connections shared by all sessions of one process
+        self.async_pool_limit: int = int(os.getenv("ASYNC_POOL_LIMIT", "64"))
 
         # Android settings
         self.android_platform_version: str = os.getenv("ANDROID_PLATFORM_VERSION", "12")
@@ -31,11 +88,42 @@ class Settings:
         self.android_activity_name: str = os.getenv("ANDROID_ACTIVITY_NAME", "org.wikipedia.main.MainActivity")
         self.android_auto_grant_permissions: bool = os.getenv("ANDROID_AUTO_GRANT_PERMISSIONS", "true").lower() == "true"
 
+        # Device pool: YAML inventory of Appium servers and devices (empty: the single device above).
+        # Each worker leases one device exclusively; ports missing from the inventory are
+        # assigned from the bases plus the device's position
+        self.device_pool_file: str = os.getenv("DEVICE_POOL_FILE", "")
+        self.device_lock_dir: str = os.getenv("DEVICE_LOCK_DIR", ".cache/device_locks")
+        self.device_lease_timeout: int = int(os.getenv("DEVICE_LEASE_TIMEOUT", "600"))
+        self.device_system_port_base: int = int(os.getenv("DEVICE_SYSTEM_PORT_BASE", "8200"))
+        self.device_chromedriver_port_base: int = int(os.getenv("DEVICE_CHROMEDRIVER_PORT_BASE", "9515"))
+
     @property
     def appium_url(self) -> str:
         """Get Appium server URL."""
         return f"http://{self.appium_host}:{self.appium_port}"
 
 
-# Global settings instance
-settings = Settings()
+if TYPE_CHECKING:
+    # Created on first access by the module __getattr__ below
+    settings: Settings
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load settings once per process.
+
+    Returns:
+        Shared Settings instance.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global ``settings`` instance on first access.
+
+    Keeps ``load_dotenv()`` out of import time; ``from ... import settings``
+    still works and always returns the same instance.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,20 @@
 """Base classes for mobile testing framework."""
-from .base_page import BasePage
-from .base_test import BaseTest
-from .wait_handler import WaitHandler
 
-__all__ = ["BasePage", "BaseTest", "WaitHandler"]
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .async_base_page import AsyncBasePage
+    from .async_wait_handler import AsyncWaitHandler
+    from .base_page import BasePage
+    from .base_test import BaseTest
+    from .wait_handler import WaitHandler
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncBasePage": "async_base_page",
+    "AsyncWaitHandler": "async_wait_handler",
+    "BasePage": "base_page",
+    "BaseTest": "base_test",
+    "WaitHandler": "wait_handler",
+})
@@ -0,0 +1,229 @@
+"""Adaptive polling for mobile waits, with per-locator timing learned across runs."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Literal, Optional, TypeVar, Union
+
+from mobile.config.settings import settings
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Weight of the newest sample in the per-locator moving average
+HISTORY_SMOOTHING = 0.3
+
+# First poll is scheduled this early relative to the typical appearance time
+HISTORY_LEAD = 0.8
+
+
+@dataclass
+class WaitStats:
+    """Counters of waits and the polls (Appium round trips) they cost."""
+
+    waits: int = 0
+    polls: int = 0
+    timeouts: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        per_wait = self.polls / self.waits if self.waits else 0.0
+        return (
+            f"Waits: {self.waits} ({self.timeouts} timed out), {self.polls} polls "
+            f"({per_wait:.1f} per wait), {self.seconds:.2f}s waited"
+        )
+
+
+class WaitHistory:
+    """Typical appearance time per locator, persisted between runs.
+
+    Stored as an exponential moving average in ``WAIT_HISTORY_FILE``. Saving
+    re-reads the file and replaces it atomically, so xdist workers sharing
+    it do not corrupt each other's entries.
+    """
+
+    _entries: Optional[Dict[str, Dict[str, float]]] = None
+    _dirty = False
+    _lock = threading.Lock()
+
+    @staticmethod
+    def key(locator: tuple, condition: str = "") -> str:
+        """History key of a ``(By, value)`` locator and the awaited condition.
+
+        Args:
+            locator: Tuple of (By, value).
+            condition: Condition name, e.g. ``visibility_of_element_located``.
+        """
+        return f"{condition}:{locator[0]}={locator[1]}"
+
+    @classmethod
+    def _load(cls) -> Dict[str, Dict[str, float]]:
+        if cls._entries is None:
+            cls._entries = cls._read(Path(settings.wait_history_file))
+        return cls._entries
+
+    @staticmethod
+    def _read(path: Path) -> Dict[str, Dict[str, float]]:
+        try:
+            entries: Dict[str, Dict[str, float]] = json.loads(path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable wait history %s: %s", path, e)
+            return {}
+        return entries
+
+    @classmethod
+    def typical(cls, key: str) -> Optional[float]:
+        """Typical seconds until the locator's condition held, if known."""
+        with cls._lock:
+            entry = cls._load().get(key)
+        return entry["seconds"] if entry else None
+
+    @classmethod
+    def record(cls, key: str, seconds: float) -> None:
+        """Add a successful wait to the locator's moving average.
+
+        Args:
+            key: History key of the locator.
+            seconds: Time until the condition held.
+        """
+        with cls._lock:
+            entries = cls._load()
+            entry = entries.get(key)
+            if entry is None:
+                entries[key] = {"seconds": seconds, "samples": 1}
+            else:
+                entry["seconds"] += HISTORY_SMOOTHING * (seconds - entry["seconds"])
+                entry["samples"] += 1
+            cls._dirty = True
+
+    @classmethod
+    def save(cls) -> None:
+        """Merge the learned timings into ``WAIT_HISTORY_FILE``."""
+        with cls._lock:
+            if not cls._dirty or cls._entries is None:
+                return
+            path = Path(settings.wait_history_file)
+            merged = cls._read(path)
+            merged.update(cls._entries)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".wait_history.")
+            with os.fdopen(fd, "w") as f:
+                json.dump(merged, f, indent=1, sort_keys=True)
+            os.replace(tmp, path)
+            cls._dirty = False
+        logger.debug("Saved wait history for %d locators to %s", len(merged), path)
+
+
+class AdaptiveWait:
+    """Drop-in for ``WebDriverWait.until`` with adaptive poll intervals.
+
+    Every poll is an HTTP round trip to Appium. Instead of a fixed 0.5s
+    interval, the first poll is immediate and the interval then grows from
+    ``WAIT_POLL_INITIAL`` by ``WAIT_POLL_BACKOFF`` up to ``WAIT_POLL_MAX``:
+    fast screens are detected within tens of milliseconds, slow ones do not
+    flood the server. When the locator's typical appearance time is known
+    from ``WaitHistory``, polls before it are skipped.
+    """
+
+    totals = WaitStats()
+
+    def __init__(self, driver: WebDriver, timeout: float) -> None:
+        """Initialize AdaptiveWait.
+
+        Args:
+            driver: Appium WebDriver instance.
+            timeout: Maximum wait time in seconds.
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    @staticmethod
+    def intervals(typical: Optional[float] = None) -> Iterator[float]:
+        """Yield the sleeps between polls.
+
+        Args:
+            typical: Typical appearance time in seconds, if known.
+        """
+        interval = settings.wait_poll_initial
+        if typical is not None and typical > interval:
+            yield typical * HISTORY_LEAD
+        while True:
+            yield interval
+            interval = min(interval * settings.wait_poll_backoff, settings.wait_poll_max)
+
+    def until(
+        self, condition: Callable[[WebDriver], Union[Literal[False], T]], key: Optional[str] = None, message: str = ""
+    ) -> T:
+        """Poll ``condition`` until it returns a truthy value.
+
+        Args:
+            condition: Called with the driver, e.g. a Selenium expected condition.
+            key: ``WaitHistory`` key of the awaited locator; its typical time
+                shapes the schedule and successful waits update it.
+            message: Message for the timeout exception.
+
+        Returns:
+            The truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the condition does not hold within the timeout.
+        """
+        from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+        started = time.monotonic()
+        deadline = started + self.timeout
+        intervals = self.intervals(WaitHistory.typical(key) if key else None)
+        stats = AdaptiveWait.totals
+        stats.waits += 1
+        # Start of the last poll that saw the condition false
+        last_miss: Optional[float] = None
+        try:
+            while True:
+                stats.polls += 1
+                poll_started = time.monotonic() - started
+                try:
+                    value = condition(self.driver)
+                    if value:
+                        if key:
+                            # The condition came true between the last miss and this poll
+                            appeared = 0.0 if last_miss is None else (last_miss + poll_started) / 2
+                            WaitHistory.record(key, appeared)
+                        return value
+                except NoSuchElementException:
+                    pass
+                last_miss = poll_started
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    stats.timeouts += 1
+                    raise TimeoutException(message)
+                time.sleep(min(next(intervals), remaining))
+        finally:
+            stats.seconds += time.monotonic() - started
+
+    @classmethod
+    def close(cls) -> WaitStats:
+        """Save the wait history and log session totals.
+
+        Returns:
+            Session totals.
+        """
+        WaitHistory.save()
+        totals = cls.totals
+        if totals.waits:
+            logger.info(totals.summary())
+        cls.totals = WaitStats()
+        return totals
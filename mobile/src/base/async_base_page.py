@@ -0,0 +1,183 @@
+"""Base Page Object class for pages driven by the asyncio Appium client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+from mobile.config.settings import settings
+from mobile.src.base.async_wait_handler import AsyncWaitHandler
+from mobile.src.base.page_snapshot import PageSnapshot
+from mobile.src.utils.logger import get_logger
+from mobile.src.utils.screenshot import AsyncScreenshotHandler
+
+if TYPE_CHECKING:
+    from mobile.src.driver.async_client import AsyncWebDriver, AsyncWebElement
+
+logger = get_logger(__name__)
+
+
+class AsyncBasePage:
+    """``BasePage`` for an ``AsyncWebDriver``: same methods, as coroutines.
+
+    Page objects keep their ``(By, value)`` locators and method names; only
+    the calls are awaited. Many pages on different sessions can then run
+    concurrently in one event loop::
+
+        class AsyncHomePage(AsyncBasePage):
+            SEARCH_BOX = HomePage.SEARCH_BOX
+
+            async def wait_for_page_load(self) -> None:
+                await self.wait.wait_for_element_visible(self.SEARCH_BOX, timeout=15)
+
+    The per-screen element cache is not used: every action looks its
+    element up again.
+    """
+
+    def __init__(self, driver: AsyncWebDriver) -> None:
+        """Initialize AsyncBasePage.
+
+        Args:
+            driver: Async Appium session.
+        """
+        self.driver = driver
+        self.wait = AsyncWaitHandler(driver)
+        self.screenshot = AsyncScreenshotHandler(driver)
+        logger.debug("Initializing page: %s", self.__class__.__name__)
+
+    async def find_element(self, locator: tuple) -> AsyncWebElement:
+        """Find single element by locator.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            Element if found.
+        """
+        logger.debug("Finding element: %s", locator)
+        return await self.driver.find_element(*locator)
+
+    async def find_elements(self, locator: tuple) -> List[AsyncWebElement]:
+        """Find multiple elements by locator.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            List of elements.
+        """
+        logger.debug("Finding elements: %s", locator)
+        return await self.driver.find_elements(*locator)
+
+    async def click(self, locator: tuple) -> None:
+        """Click element.
+
+        Args:
+            locator: Tuple of (By, value).
+        """
+        logger.info("Clicking element: %s", locator)
+        element = await self.wait.wait_for_element_clickable(locator)
+        await element.click()
+
+    async def send_keys(self, locator: tuple, text: str) -> None:
+        """Send text to element.
+
+        Args:
+            locator: Tuple of (By, value).
+            text: Text to send.
+        """
+        logger.info("Sending keys to element %s: %s", locator, text)
+        element = await self.wait.wait_for_element_visible(locator)
+        await element.clear()
+        await element.send_keys(text)
+
+    async def get_text(self, locator: tuple) -> str:
+        """Get text from element.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            Text content of element.
+        """
+        logger.info("Getting text from element: %s", locator)
+        element = await self.wait.wait_for_element_visible(locator)
+        text = await element.text()
+        logger.debug("Element text: %s", text)
+        return text
+
+    async def is_element_displayed(self, locator: tuple) -> bool:
+        """Check if element is displayed.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            True if element is displayed, False otherwise.
+        """
+        try:
+            is_displayed = await (await self.find_element(locator)).is_displayed()
+            logger.debug("Element %s displayed: %s", locator, is_displayed)
+            return is_displayed
+        except Exception as e:
+            logger.debug("Element %s not displayed: %s", locator, e)
+            return False
+
+    async def is_element_enabled(self, locator: tuple) -> bool:
+        """Check if element is enabled.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            True if element is enabled, False otherwise.
+        """
+        try:
+            is_enabled = await (await self.find_element(locator)).is_enabled()
+            logger.debug("Element %s enabled: %s", locator, is_enabled)
+            return is_enabled
+        except Exception as e:
+            logger.debug("Element %s not enabled: %s", locator, e)
+            return False
+
+    async def get_attribute(self, locator: tuple, attribute: str) -> Optional[str]:
+        """Get element attribute value.
+
+        Args:
+            locator: Tuple of (By, value).
+            attribute: Attribute name.
+
+        Returns:
+            Attribute value or None.
+        """
+        logger.debug("Getting attribute '%s' from element %s", attribute, locator)
+        return await (await self.find_element(locator)).get_attribute(attribute)
+
+    async def swipe(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: int = 500) -> None:
+        """Swipe between two screen points.
+
+        Args:
+            start_x: Start x coordinate.
+            start_y: Start y coordinate.
+            end_x: End x coordinate.
+            end_y: End y coordinate.
+            duration: Swipe duration in milliseconds.
+        """
+        logger.debug("Swiping from (%d, %d) to (%d, %d)", start_x, start_y, end_x, end_y)
+        await self.driver.swipe(start_x, start_y, end_x, end_y, duration)
+
+    async def snapshot(self) -> PageSnapshot:
+        """Capture the screen hierarchy for read-only checks (one round trip).
+
+        Returns:
+            Parsed snapshot of the current screen.
+        """
+        logger.debug("Taking page snapshot on %s", self.__class__.__name__)
+        return PageSnapshot(await self.driver.page_source(), settings.android_package_name)
+
+    async def wait_for_page_load(self) -> None:
+        """Wait for page to load. Override in subclasses.
+
+        This method should be overridden in page object subclasses
+        to verify page-specific elements are visible.
+        """
+        logger.debug("Waiting for %s to load", self.__class__.__name__)
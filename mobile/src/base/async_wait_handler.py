@@ -0,0 +1,240 @@
+"""Wait strategies for page objects driven by the asyncio client."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterator, Optional, Tuple, TypeVar
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from mobile.config.settings import settings
+from mobile.src.base.adaptive_wait import AdaptiveWait, WaitHistory
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from mobile.src.driver.async_client import AsyncWebDriver, AsyncWebElement
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Returns a falsy value (e.g. None) while the condition does not hold
+AsyncCondition = Callable[["AsyncWebDriver"], Awaitable[Optional[T]]]
+
+
+class AsyncWaitHandler:
+    """``WaitHandler`` for an ``AsyncWebDriver``: same methods, as coroutines.
+
+    Honours ``WAIT_STRATEGY`` like the synchronous handler: adaptive polls
+    shaped by ``WaitHistory`` (shared with synchronous runs, under the same
+    condition names), an implicit-wait ``find_element`` first for
+    ``server``, or fixed 0.5s polls. Waiting yields to the event loop, so
+    other sessions keep running meanwhile.
+    """
+
+    DEFAULT_TIMEOUT = 10
+    DEFAULT_POLL_FREQUENCY = 0.5
+
+    def __init__(self, driver: AsyncWebDriver, timeout: int = DEFAULT_TIMEOUT) -> None:
+        """Initialize AsyncWaitHandler.
+
+        Args:
+            driver: Async Appium session.
+            timeout: Maximum wait time in seconds.
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    async def wait_for_element_visible(
+        self, locator: tuple, timeout: Optional[int] = None
+    ) -> AsyncWebElement:
+        """Wait for element to be visible.
+
+        Args:
+            locator: Tuple of (By, value) for element locator.
+            timeout: Optional timeout override.
+
+        Returns:
+            Element when it becomes visible.
+
+        Raises:
+            TimeoutException: If element not visible within timeout.
+        """
+        actual_timeout = timeout or self.timeout
+        logger.debug("Waiting for element %s to be visible (timeout: %ss)", locator, actual_timeout)
+
+        async def visibility_of_element_located(driver: AsyncWebDriver) -> Optional[AsyncWebElement]:
+            element = await driver.find_element(*locator)
+            return element if await element.is_displayed() else None
+
+        return await self._until(visibility_of_element_located, actual_timeout, locator)
+
+    async def wait_for_element_clickable(
+        self, locator: tuple, timeout: Optional[int] = None
+    ) -> AsyncWebElement:
+        """Wait for element to be clickable.
+
+        Args:
+            locator: Tuple of (By, value) for element locator.
+            timeout: Optional timeout override.
+
+        Returns:
+            Element when it becomes clickable.
+        """
+        actual_timeout = timeout or self.timeout
+        logger.debug("Waiting for element %s to be clickable (timeout: %ss)", locator, actual_timeout)
+
+        async def element_to_be_clickable(driver: AsyncWebDriver) -> Optional[AsyncWebElement]:
+            element = await driver.find_element(*locator)
+            return element if await element.is_displayed() and await element.is_enabled() else None
+
+        return await self._until(element_to_be_clickable, actual_timeout, locator)
+
+    async def wait_for_element_presence(
+        self, locator: tuple, timeout: Optional[int] = None
+    ) -> AsyncWebElement:
+        """Wait for element to be present in the hierarchy.
+
+        Args:
+            locator: Tuple of (By, value) for element locator.
+            timeout: Optional timeout override.
+
+        Returns:
+            Element when it is present.
+        """
+        actual_timeout = timeout or self.timeout
+        logger.debug("Waiting for element %s to be present (timeout: %ss)", locator, actual_timeout)
+
+        async def presence_of_element_located(driver: AsyncWebDriver) -> AsyncWebElement:
+            return await driver.find_element(*locator)
+
+        return await self._until(presence_of_element_located, actual_timeout, locator)
+
+    async def wait_for_text_in_element(
+        self, locator: tuple, text: str, timeout: Optional[int] = None
+    ) -> bool:
+        """Wait for text to appear in element.
+
+        Args:
+            locator: Tuple of (By, value) for element locator.
+            text: Text to wait for.
+            timeout: Optional timeout override.
+
+        Returns:
+            True when text is found in element.
+        """
+        actual_timeout = timeout or self.timeout
+        logger.debug("Waiting for text '%s' in element %s", text, locator)
+
+        async def text_to_be_present_in_element(driver: AsyncWebDriver) -> bool:
+            element = await driver.find_element(*locator)
+            return text in (await element.text() or "")
+
+        return await self._until(text_to_be_present_in_element, actual_timeout, locator)
+
+    async def wait_for_condition(self, condition: AsyncCondition[T], timeout: Optional[int] = None) -> T:
+        """Wait for custom condition to be true.
+
+        Args:
+            condition: Coroutine function called with the driver; done when
+                it returns a truthy value.
+            timeout: Optional timeout override.
+
+        Returns:
+            Result of the condition.
+        """
+        actual_timeout = timeout or self.timeout
+        logger.debug("Waiting for custom condition (timeout: %ss)", actual_timeout)
+        return await self._until(condition, actual_timeout)
+
+    async def find_with_implicit_wait(self, locator: tuple, timeout: float) -> AsyncWebElement:
+        """Find an element, letting Appium wait for it server-side.
+
+        Args:
+            locator: Tuple of (By, value) for element locator.
+            timeout: Implicit-wait window in seconds.
+
+        Returns:
+            Element once it is present.
+
+        Raises:
+            NoSuchElementException: If the element did not appear in time.
+        """
+        await self.driver.implicitly_wait(timeout)
+        try:
+            return await self.driver.find_element(*locator)
+        finally:
+            await self.driver.implicitly_wait(0)
+
+    async def _until(
+        self, condition: AsyncCondition[T], timeout: float, locator: Optional[tuple] = None
+    ) -> T:
+        """Poll a condition with the configured ``WAIT_STRATEGY``.
+
+        Args:
+            condition: Called with the driver until it returns a truthy value.
+            timeout: Maximum wait time in seconds.
+            locator: Locator the condition is about, if any.
+
+        Returns:
+            Truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the condition does not hold within the timeout.
+        """
+        started = time.monotonic()
+        intervals, key = await self._schedule(condition, timeout, locator)
+        deadline = started + timeout
+        stats = AdaptiveWait.totals
+        stats.waits += 1
+        # Start of the last poll that saw the condition false
+        last_miss: Optional[float] = None
+        try:
+            while True:
+                stats.polls += 1
+                poll_started = time.monotonic() - started
+                try:
+                    value = await condition(self.driver)
+                    if value:
+                        if key:
+                            appeared = 0.0 if last_miss is None else (last_miss + poll_started) / 2
+                            WaitHistory.record(key, appeared)
+                        return value
+                except (NoSuchElementException, StaleElementReferenceException):
+                    pass
+                last_miss = poll_started
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    stats.timeouts += 1
+                    raise TimeoutException(f"{condition.__name__} not met for {locator} in {timeout}s")
+                await asyncio.sleep(min(next(intervals), remaining))
+        finally:
+            stats.seconds += time.monotonic() - started
+
+    async def _schedule(
+        self, condition: AsyncCondition[T], timeout: float, locator: Optional[tuple]
+    ) -> Tuple[Iterator[float], Optional[str]]:
+        """Poll intervals and ``WaitHistory`` key for the configured ``WAIT_STRATEGY``.
+
+        With ``server`` Appium first waits for the locator itself (implicit
+        wait); the polls then only check the condition.
+
+        Returns:
+            Intervals between polls, and the history key (None when the
+            wait is not about a locator or the strategy is ``fixed``).
+        """
+        if settings.wait_strategy == "fixed":
+            return itertools.repeat(self.DEFAULT_POLL_FREQUENCY), None
+        if locator is not None and settings.wait_strategy == "server":
+            try:
+                await self.find_with_implicit_wait(locator, timeout)
+            except NoSuchElementException:
+                pass
+        key = WaitHistory.key(locator, condition.__name__) if locator is not None else None
+        return AdaptiveWait.intervals(WaitHistory.typical(key) if key else None), key
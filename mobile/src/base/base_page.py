@@ -1,23 +1,42 @@
 """Base Page Object class for all mobile pages."""
 
-from typing import Optional, List
-from selenium.webdriver.common.by import By
-from appium.webdriver.webdriver import WebDriver
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Callable, Optional, List, TypeVar
+
+from mobile.config.settings import settings
+from mobile.src.base.element_cache import ElementCache
+from mobile.src.base.page_snapshot import PageSnapshot
 from mobile.src.base.wait_handler import WaitHandler
+from mobile.src.utils.action_trace import ActionTrace
 from mobile.src.utils.logger import get_logger
 from mobile.src.utils.screenshot import ScreenshotHandler
 
+if TYPE_CHECKING:
+    from appium import webdriver
+    from selenium.webdriver.common.by import By
+    from appium.webdriver.webdriver import WebDriver
+
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class BasePage:
     """Base class for all page objects in mobile testing framework.
 
     Provides common functionality for page interaction, element location,
     waiting, and logging.
+
+    With ``ELEMENT_CACHE=true`` the element a locator resolved to is reused
+    for later actions on the same screen (see ``ElementCache``).
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Overrides such as wait_for_page_load get their own action spans
+        ActionTrace.register(cls)
+
     def __init__(self, driver: WebDriver) -> None:
         """Initialize BasePage.
 
@@ -27,7 +46,8 @@ class BasePage:
         self.driver = driver
         self.wait = WaitHandler(driver)
         self.screenshot = ScreenshotHandler(driver)
-        logger.debug(f"Initializing page: {self.__class__.__name__}")
+        self.elements = ElementCache.for_driver(driver)
+        logger.debug("Initializing page: %s", self.__class__.__name__)
 
     def find_element(self, locator: tuple) -> webdriver.WebElement:
         """Find single element by locator.
@@ -38,7 +58,7 @@ class BasePage:
         Returns:
             WebElement if found.
         """
-        logger.debug(f"Finding element: {locator}")
+        logger.debug("Finding element: %s", locator)
         return self.driver.find_element(*locator)
 
     def find_elements(self, locator: tuple) -> List[webdriver.WebElement]:
@@ -50,7 +70,7 @@ class BasePage:
         Returns:
             List of WebElements.
         """
-        logger.debug(f"Finding elements: {locator}")
+        logger.debug("Finding elements: %s", locator)
         return self.driver.find_elements(*locator)
 
     def click(self, locator: tuple) -> None:
@@ -59,9 +79,12 @@ class BasePage:
         Args:
             locator: Tuple of (By, value).
         """
-        logger.info(f"Clicking element: {locator}")
-        element = self.wait.wait_for_element_clickable(locator)
-        element.click()
+        logger.info("Clicking element: %s", locator)
+        self._on_element(
+            locator, lambda element: element.click(), self.wait.wait_for_element_clickable,
+            lambda element: element.is_displayed() and element.is_enabled(),
+        )
+        self.screen_may_change()
 
     def send_keys(self, locator: tuple, text: str) -> None:
         """Send text to element.
@@ -70,10 +93,17 @@ class BasePage:
             locator: Tuple of (By, value).
             text: Text to send.
         """
-        logger.info(f"Sending keys to element {locator}: {text}")
-        element = self.wait.wait_for_element_visible(locator)
-        element.clear()
-        element.send_keys(text)
+        logger.info("Sending keys to element %s: %s", locator, text)
+
+        def type_text(element: webdriver.WebElement) -> None:
+            element.clear()
+            element.send_keys(text)
+
+        self._on_element(
+            locator, type_text, self.wait.wait_for_element_visible, lambda element: element.is_displayed()
+        )
+        # Typing can change the screen, e.g. search suggestions replace the results
+        self.screen_may_change()
 
     def get_text(self, locator: tuple) -> str:
         """Get text from element.
@@ -84,10 +114,12 @@ class BasePage:
         Returns:
             Text content of element.
         """
-        logger.info(f"Getting text from element: {locator}")
-        element = self.wait.wait_for_element_visible(locator)
-        text = element.text
-        logger.debug(f"Element text: {text}")
+        logger.info("Getting text from element: %s", locator)
+        text = self._on_element(
+            locator, lambda element: element.text, self.wait.wait_for_element_visible,
+            lambda element: element.is_displayed(),
+        )
+        logger.debug("Element text: %s", text)
         return text
 
     def is_element_displayed(self, locator: tuple) -> bool:
@@ -100,12 +132,13 @@ class BasePage:
             True if element is displayed, False otherwise.
         """
         try:
-            element = self.find_element(locator)
-            is_displayed = element.is_displayed()
-            logger.debug(f"Element {locator} displayed: {is_displayed}")
+            is_displayed = self._on_element(
+                locator, lambda element: element.is_displayed(), self.find_element
+            )
+            logger.debug("Element %s displayed: %s", locator, is_displayed)
             return is_displayed
         except Exception as e:
-            logger.debug(f"Element {locator} not displayed: {str(e)}")
+            logger.debug("Element %s not displayed: %s", locator, e)
             return False
 
     def is_element_enabled(self, locator: tuple) -> bool:
@@ -118,12 +151,13 @@ class BasePage:
             True if element is enabled, False otherwise.
         """
         try:
-            element = self.find_element(locator)
-            is_enabled = element.is_enabled()
-            logger.debug(f"Element {locator} enabled: {is_enabled}")
+            is_enabled = self._on_element(
+                locator, lambda element: element.is_enabled(), self.find_element
+            )
+            logger.debug("Element %s enabled: %s", locator, is_enabled)
             return is_enabled
         except Exception as e:
-            logger.debug(f"Element {locator} not enabled: {str(e)}")
+            logger.debug("Element %s not enabled: %s", locator, e)
             return False
 
     def scroll_to_element(self, locator: tuple) -> None:
@@ -132,7 +166,7 @@ class BasePage:
         Args:
             locator: Tuple of (By, value).
         """
-        logger.info(f"Scrolling to element: {locator}")
+        logger.info("Scrolling to element: %s", locator)
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
 
@@ -146,9 +180,66 @@ class BasePage:
         Returns:
             Attribute value or None.
         """
-        logger.debug(f"Getting attribute '{attribute}' from element {locator}")
-        element = self.find_element(locator)
-        return element.get_attribute(attribute)
+        logger.debug("Getting attribute '%s' from element %s", attribute, locator)
+
+        def read(element: webdriver.WebElement) -> Optional[str]:
+            value = element.get_attribute(attribute)
+            # Appium types JSON-valued attributes as dicts; callers get text
+            return None if value is None else str(value)
+
+        return self._on_element(locator, read, self.find_element)
+
+    def snapshot(self) -> PageSnapshot:
+        """Capture the screen hierarchy for read-only checks (one round trip).
+
+        Prefer it over per-element queries when reading many elements or
+        attributes; see ``PageSnapshot``.
+
+        Returns:
+            Parsed snapshot of the current screen.
+        """
+        logger.debug("Taking page snapshot on %s", self.__class__.__name__)
+        return PageSnapshot.capture(self.driver, settings.android_package_name)
+
+    def screen_may_change(self) -> None:
+        """Tell the element cache that the last action may have navigated."""
+        if self.elements is not None:
+            self.elements.screen_may_change()
+
+    def _on_element(
+        self,
+        locator: tuple,
+        action: Callable[[webdriver.WebElement], T],
+        resolve: Callable[[tuple], webdriver.WebElement],
+        ready: Optional[Callable[[webdriver.WebElement], bool]] = None,
+    ) -> T:
+        """Run an action on the element of a locator, from the cache if possible.
+
+        Args:
+            locator: Tuple of (By, value).
+            action: Called with the element.
+            resolve: Finds (or waits for) the element on a cache miss.
+            ready: What ``resolve`` waits for (e.g. ``is_displayed``), checked
+                on a cached element; if it does not hold, the element is
+                resolved again as on a miss.
+
+        Returns:
+            Result of the action.
+        """
+        if self.elements is None:
+            return action(resolve(locator))
+        from selenium.common.exceptions import StaleElementReferenceException
+
+        element = self.elements.get(locator)
+        if element is not None:
+            try:
+                if ready is None or ready(element):
+                    return action(element)
+            except StaleElementReferenceException:
+                self.elements.discard_stale(locator)
+        element = resolve(locator)
+        self.elements.put(locator, element)
+        return action(element)
 
     def wait_for_page_load(self) -> None:
         """Wait for page to load. Override in subclasses.
@@ -156,4 +247,4 @@ class BasePage:
         This method should be overridden in page object subclasses
         to verify page-specific elements are visible.
         """
-        logger.debug(f"Waiting for {self.__class__.__name__} to load")
+        logger.debug("Waiting for %s to load", self.__class__.__name__)
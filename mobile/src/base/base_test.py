@@ -1,13 +1,22 @@
 """Base Test class for all mobile tests."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
-from appium.webdriver.webdriver import WebDriver
 
+from mobile.src.driver.command_timings import CommandTimings
 from mobile.src.driver.driver_manager import DriverManager
+from mobile.src.utils.artifact_writer import ArtifactWriter
+from mobile.src.utils.failure_capture import FailureCapture
 from mobile.src.utils.logger import get_logger
 from mobile.src.utils.screenshot import ScreenshotHandler
 from mobile.config.settings import settings
 
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
 logger = get_logger(__name__)
 
 
@@ -18,9 +27,10 @@ class BaseTest:
     """
 
     @pytest.fixture(autouse=True)
-    def setup_and_teardown(self) -> None:
+    def setup_and_teardown(self, request: pytest.FixtureRequest) -> None:
         """Setup and teardown for each test."""
         # Setup
+        CommandTimings.start_test()
         logger.info(f"\n{'='*60}")
         logger.info(f"Starting test: {self.__class__.__name__}")
         logger.info(f"{'='*60}")
@@ -28,6 +38,8 @@ class BaseTest:
         self.driver_manager = DriverManager()
         self.driver: WebDriver = self.driver_manager.init_driver()
         self.screenshot = ScreenshotHandler(self.driver)
+        self.failure_capture = FailureCapture(self.driver)
+        self.failure_capture.start()
 
         yield
 
@@ -36,13 +48,24 @@ class BaseTest:
         logger.info(f"Finishing test: {self.__class__.__name__}")
         logger.info(f"{'='*60}\n")
 
+        # A failed test's screenshots and recording are fetched before the driver quits
+        self.failure_capture.finish()
         self.driver_manager.close_driver()
+        # Screenshots kept writing while the driver quit
+        ArtifactWriter.flush()
+        CommandTimings.finish_test(request.node.nodeid)
 
     def take_screenshot(self, name: str = "screenshot") -> None:
         """Take screenshot during test.
 
+        With ``SCREENSHOT_ON_FAILURE`` the image is kept in memory and only
+        written if the test fails.
+
         Args:
             name: Name for screenshot file.
         """
         logger.info(f"Taking screenshot: {name}")
-        self.screenshot.take_screenshot(name)
+        if self.failure_capture.enabled:
+            self.failure_capture.add_screenshot(name, self.driver.get_screenshot_as_base64())
+        else:
+            self.screenshot.take_screenshot(name)
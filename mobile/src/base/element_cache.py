@@ -0,0 +1,174 @@
+"""Per-screen cache of resolved element references for mobile page objects."""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+
+from mobile.config.settings import settings
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from appium import webdriver
+    from appium.webdriver.webdriver import WebDriver
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Element cache counters; every hit is a ``find_element`` round trip saved."""
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    invalidations: int = 0
+
+    def add(self, other: "CacheStats") -> None:
+        """Accumulate counters of another stats object."""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.stale += other.stale
+        self.invalidations += other.invalidations
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        return (
+            f"Element cache: {self.hits}/{lookups} hits ({rate:.0f}%), {self.misses} misses, "
+            f"{self.stale} stale re-resolved, {self.invalidations} screen changes"
+        )
+
+
+class ElementCache:
+    """Remembers the WebElement (id) each locator resolved to on the current screen.
+
+    Enabled with ``ELEMENT_CACHE=true``; one cache per driver, shared by
+    all page objects. A cached element is used directly, and a
+    ``StaleElementReferenceException`` makes the caller re-resolve it.
+
+    Actions that can navigate (clicks, typing) mark the screen as
+    possibly changed. The next lookup then compares the screen fingerprint
+    (current activity) once and drops every entry if it differs.
+    """
+
+    _caches: "weakref.WeakKeyDictionary[WebDriver, ElementCache]" = weakref.WeakKeyDictionary()
+    totals = CacheStats()
+
+    def __init__(self, driver: WebDriver) -> None:
+        """Initialize ElementCache.
+
+        Args:
+            driver: Appium WebDriver instance.
+        """
+        self.driver = driver
+        self.stats = CacheStats()
+        self._elements: Dict[tuple, webdriver.WebElement] = {}
+        self._fingerprint: Optional[str] = None
+        self._verify = True
+
+    @classmethod
+    def for_driver(cls, driver: WebDriver) -> Optional["ElementCache"]:
+        """Get the driver's cache.
+
+        Args:
+            driver: Appium WebDriver instance.
+
+        Returns:
+            The cache, or None if ``ELEMENT_CACHE`` is disabled.
+        """
+        if not settings.element_cache:
+            return None
+        cache = cls._caches.get(driver)
+        if cache is None:
+            cache = cls._caches[driver] = cls(driver)
+        return cache
+
+    def fingerprint(self) -> str:
+        """Identify the current screen (one Appium round trip)."""
+        return self.driver.current_activity or ""
+
+    def get(self, locator: tuple) -> Optional[webdriver.WebElement]:
+        """Look up the element a locator resolved to on this screen.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            Cached element, or None on a miss.
+        """
+        self._check_screen()
+        element = self._elements.get(locator)
+        if element is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return element
+
+    def put(self, locator: tuple, element: webdriver.WebElement) -> None:
+        """Remember the element a locator resolved to.
+
+        Args:
+            locator: Tuple of (By, value).
+            element: Resolved element.
+        """
+        self._check_screen()
+        self._elements[locator] = element
+
+    def discard_stale(self, locator: tuple) -> None:
+        """Forget an element the server reported as stale.
+
+        Args:
+            locator: Tuple of (By, value).
+        """
+        self._elements.pop(locator, None)
+        self.stats.stale += 1
+        logger.debug("Stale cached element for %s, re-resolving", locator)
+
+    def _check_screen(self) -> None:
+        """Drop all entries if the screen changed since the last navigation-prone action."""
+        if not self._verify:
+            return
+        self._verify = False
+        fingerprint = self.fingerprint()
+        if fingerprint != self._fingerprint:
+            if self._elements:
+                self.invalidate()
+            self._fingerprint = fingerprint
+
+    def screen_may_change(self) -> None:
+        """Check the screen fingerprint before the next lookup."""
+        self._verify = True
+
+    def invalidate(self) -> None:
+        """Drop all entries, e.g. after navigating."""
+        self._elements.clear()
+        self.stats.invalidations += 1
+
+    @classmethod
+    def release(cls, driver: WebDriver) -> None:
+        """Drop the driver's cache and add its counters to the session totals.
+
+        Args:
+            driver: Appium WebDriver instance about to quit.
+        """
+        cache = cls._caches.pop(driver, None)
+        if cache is not None:
+            cls.totals.add(cache.stats)
+
+    @classmethod
+    def close(cls) -> CacheStats:
+        """Log session totals and reset them.
+
+        Returns:
+            Session totals.
+        """
+        for driver in list(cls._caches):
+            cls.release(driver)
+        totals = cls.totals
+        if totals.hits or totals.misses:
+            logger.info(totals.summary())
+        cls.totals = CacheStats()
+        return totals
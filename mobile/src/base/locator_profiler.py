@@ -0,0 +1,268 @@
+"""Per-locator lookup latency, recorded from the driver's element lookups."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, cast
+
+from mobile.config.settings import settings
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
+logger = get_logger(__name__)
+
+# Latency samples kept per locator; older ones are dropped
+MAX_SAMPLES = 200
+
+# Slowest locators listed in the session log
+REPORT_TOP = 5
+
+
+@dataclass
+class LocatorTiming:
+    """Lookup latencies of one locator; failed lookups are only counted."""
+
+    lookups: int = 0
+    failures: int = 0
+    samples: List[float] = field(default_factory=list)
+
+    def add(self, seconds: float, found: bool) -> None:
+        """Record one lookup.
+
+        Args:
+            seconds: Round-trip time of the lookup.
+            found: Whether it matched; misses include implicit-wait time.
+        """
+        self.lookups += 1
+        if not found:
+            self.failures += 1
+            return
+        self.samples.append(seconds)
+        del self.samples[:-MAX_SAMPLES]
+
+    def merge(self, other: "LocatorTiming") -> None:
+        """Accumulate another timing of the same locator."""
+        self.lookups += other.lookups
+        self.failures += other.failures
+        self.samples.extend(other.samples)
+        del self.samples[:-MAX_SAMPLES]
+
+    def percentile(self, fraction: float) -> float:
+        """Latency below which ``fraction`` of the successful lookups fall."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+    @property
+    def median(self) -> float:
+        """Median latency of successful lookups in seconds."""
+        return self.percentile(0.5)
+
+
+class LocatorProfiler:
+    """Times every ``find_element``/``find_elements`` call per locator.
+
+    Enabled with ``LOCATOR_PROFILE=true``: ``attach`` wraps a driver in a
+    ``ProfiledDriver``, so page objects, waits and expected conditions are
+    all measured. The first time a locator matches, the page source is
+    saved to ``LOCATOR_SNAPSHOT_DIR`` (one file per distinct screen) for
+    ``locator_optimizer`` to verify replacement locators against.
+
+    At session end the timings are merged into ``LOCATOR_PROFILE_FILE``
+    and the slowest locators are logged. Lookups under an implicit wait
+    (``WAIT_STRATEGY=server``) include device-side waiting; profile with
+    ``adaptive`` or ``fixed`` for pure lookup cost.
+    """
+
+    _timings: Dict[tuple, LocatorTiming] = {}
+    _captured: Set[tuple] = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, driver: WebDriver) -> WebDriver:
+        """Time the driver's element lookups (no-op unless ``LOCATOR_PROFILE``).
+
+        Args:
+            driver: Appium WebDriver instance.
+
+        Returns:
+            A ``ProfiledDriver`` to use instead of ``driver``, or ``driver``
+            itself when profiling is off.
+        """
+        if not settings.locator_profile or isinstance(driver, ProfiledDriver):
+            return driver
+        logger.info("Locator profiling enabled")
+        return cast("WebDriver", ProfiledDriver(driver))
+
+    @classmethod
+    def timed_find(cls, driver: WebDriver, find: Callable[[str, Any], Any], by: str, value: Any) -> Any:
+        """Run one lookup of ``driver`` and record its latency.
+
+        Args:
+            driver: Driver the lookup runs on; its page source is captured
+                the first time the locator matches.
+            find: ``driver.find_element`` or ``driver.find_elements``.
+            by: Locator strategy.
+            value: Locator value.
+
+        Returns:
+            Result of the lookup.
+        """
+        from selenium.common.exceptions import NoSuchElementException
+
+        started = time.perf_counter()
+        try:
+            result = find(by, value)
+        except NoSuchElementException:
+            cls.record((by, value), time.perf_counter() - started, found=False)
+            raise
+        cls.record((by, value), time.perf_counter() - started, found=bool(result))
+        if result:
+            cls._capture(driver, (by, value))
+        return result
+
+    @classmethod
+    def record(cls, locator: tuple, seconds: float, found: bool = True) -> None:
+        """Add one lookup of a locator.
+
+        Args:
+            locator: Tuple of (By, value).
+            seconds: Round-trip time of the lookup.
+            found: Whether it matched.
+        """
+        with cls._lock:
+            cls._timings.setdefault(locator, LocatorTiming()).add(seconds, found)
+
+    @classmethod
+    def _capture(cls, driver: WebDriver, locator: tuple) -> None:
+        """Save the screen a locator first matched on."""
+        with cls._lock:
+            if not settings.locator_snapshot_dir or locator in cls._captured:
+                return
+            cls._captured.add(locator)
+        try:
+            source = driver.page_source
+        except Exception as e:
+            logger.debug("Could not capture page source for %s: %s", locator, e)
+            return
+        directory = Path(settings.locator_snapshot_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+        path = directory / f"{digest}.xml"
+        if not path.exists():
+            path.write_text(source, encoding="utf-8")
+            logger.debug("Saved page source for %s to %s", locator, path)
+
+    @staticmethod
+    def key(locator: tuple) -> str:
+        """Profile-file key of a locator, ``"<by>=<value>"``."""
+        return f"{locator[0]}={locator[1]}"
+
+    @staticmethod
+    def read(path: Path) -> Dict[tuple, LocatorTiming]:
+        """Load timings from a profile file.
+
+        Args:
+            path: ``LOCATOR_PROFILE_FILE`` of an earlier run.
+
+        Returns:
+            Timing per ``(By, value)`` locator; empty if the file is missing.
+        """
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable locator profile %s: %s", path, e)
+            return {}
+        timings = {}
+        for key, entry in data.items():
+            by, _, value = key.partition("=")
+            timings[(by, value)] = LocatorTiming(entry["lookups"], entry["failures"], entry["samples"])
+        return timings
+
+    @classmethod
+    def report(cls, timings: Optional[Dict[tuple, LocatorTiming]] = None) -> str:
+        """The slowest locators, one per line.
+
+        Args:
+            timings: Timings to report; defaults to the current session's.
+        """
+        with cls._lock:
+            timings = dict(cls._timings if timings is None else timings)
+        slowest = sorted(timings.items(), key=lambda item: item[1].median, reverse=True)
+        lines = [f"Locator profile: {len(slowest)} locators, slowest by median lookup:"]
+        for locator, timing in slowest[:REPORT_TOP]:
+            lines.append(
+                f"  {timing.median * 1000:7.1f}ms median, {timing.percentile(0.95) * 1000:7.1f}ms p95, "
+                f"{timing.lookups} lookups ({timing.failures} missed)  {cls.key(locator)}"
+            )
+        return "\n".join(lines)
+
+    @classmethod
+    def close(cls) -> Dict[tuple, LocatorTiming]:
+        """Merge session timings into ``LOCATOR_PROFILE_FILE`` and log the slowest.
+
+        Returns:
+            Timings of this session.
+        """
+        with cls._lock:
+            timings, cls._timings = cls._timings, {}
+            cls._captured = set()
+        if not timings:
+            return timings
+        path = Path(settings.locator_profile_file)
+        merged = cls.read(path)
+        for locator, timing in timings.items():
+            merged.setdefault(locator, LocatorTiming()).merge(timing)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".locator_profile.")
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {cls.key(locator): vars(timing) for locator, timing in merged.items()},
+                f, indent=1, sort_keys=True,
+            )
+        os.replace(tmp, path)
+        logger.info(cls.report(timings))
+        logger.info("Locator profile saved to %s", path)
+        return timings
+
+
+class ProfiledDriver:
+    """Driver proxy that times ``find_element``/``find_elements`` per locator.
+
+    Every other attribute is read from and written to the wrapped driver,
+    so the proxy can be used wherever the driver is.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        """Initialize ProfiledDriver.
+
+        Args:
+            driver: Appium WebDriver instance to wrap.
+        """
+        object.__setattr__(self, "wrapped_driver", driver)
+
+    def find_element(self, by: str = "id", value: Any = None) -> Any:
+        """Timed ``WebDriver.find_element``."""
+        return LocatorProfiler.timed_find(self.wrapped_driver, self.wrapped_driver.find_element, by, value)
+
+    def find_elements(self, by: str = "id", value: Any = None) -> Any:
+        """Timed ``WebDriver.find_elements``."""
+        return LocatorProfiler.timed_find(self.wrapped_driver, self.wrapped_driver.find_elements, by, value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped_driver, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.wrapped_driver, name, value)
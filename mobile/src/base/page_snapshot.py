@@ -0,0 +1,246 @@
+"""One-round-trip snapshots of the screen hierarchy, queried locally."""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
+logger = get_logger(__name__)
+
+# Locator strategies (By / AppiumBy values) a snapshot can evaluate
+SNAPSHOT_STRATEGIES = ("id", "xpath", "accessibility id", "class name", "-android uiautomator")
+
+# UiSelector methods a snapshot can evaluate: attribute and comparison
+UI_SELECTOR_METHODS = {
+    "className": ("class", "equals"),
+    "resourceId": ("resource-id", "equals"),
+    "text": ("text", "equals"),
+    "textContains": ("text", "contains"),
+    "textStartsWith": ("text", "startswith"),
+    "description": ("content-desc", "equals"),
+    "descriptionContains": ("content-desc", "contains"),
+    "descriptionStartsWith": ("content-desc", "startswith"),
+}
+
+_UI_SELECTOR = re.compile(r'^\s*new UiSelector\(\)((?:\.\w+\("(?:[^"\\]|\\.)*"\))*)\s*;?\s*$')
+_UI_SELECTOR_CALL = re.compile(r'\.(\w+)\("((?:[^"\\]|\\.)*)"\)')
+
+
+@dataclass(frozen=True)
+class SnapshotElement:
+    """Read-only view of one node of a page-source snapshot."""
+
+    tag: str
+    attributes: Dict[str, str]
+    _node: Any = field(repr=False, compare=False)
+    _snapshot: "PageSnapshot" = field(repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """The node's ``text`` attribute."""
+        return self.attributes.get("text", "")
+
+    @property
+    def resource_id(self) -> str:
+        """The node's ``resource-id``."""
+        return self.attributes.get("resource-id", "")
+
+    @property
+    def content_desc(self) -> str:
+        """The node's ``content-desc`` (accessibility id)."""
+        return self.attributes.get("content-desc", "")
+
+    @property
+    def displayed(self) -> bool:
+        """Whether UiAutomator2 reported the node as displayed."""
+        return self.attributes.get("displayed", "true") == "true"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the node is enabled."""
+        return self.attributes.get("enabled", "true") == "true"
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Get a raw attribute value, like ``WebElement.get_attribute``."""
+        return self.attributes.get(name)
+
+    def find_all(self, locator: tuple) -> List["SnapshotElement"]:
+        """Evaluate a locator within this node's subtree."""
+        return self._snapshot._find_all(locator, self._node)
+
+    def find(self, locator: tuple) -> Optional["SnapshotElement"]:
+        """First match of a locator within this node's subtree, or None."""
+        matches = self.find_all(locator)
+        return matches[0] if matches else None
+
+
+class PageSnapshot:
+    """The screen's hierarchy, fetched with one ``page_source`` call.
+
+    Read-only checks over many elements (result lists, table of contents)
+    otherwise cost one Appium round trip per element and attribute. A
+    snapshot answers them locally: ID, accessibility id, class name and
+    XPath locators are evaluated against the parsed XML. lxml is used when
+    installed (full XPath 1.0); the standard library parser covers ID,
+    accessibility id, class name and the ElementTree XPath subset.
+
+    A snapshot does not change when the screen does; take a new one after
+    interacting.
+
+    Example:
+        snapshot = page.snapshot()
+        titles = snapshot.texts(SearchPage.RESULT_TITLE)
+    """
+
+    def __init__(self, source: str, app_package: str = "") -> None:
+        """Parse a page source.
+
+        Args:
+            source: XML returned by ``driver.page_source``.
+            app_package: Package prefixed to bare resource ids, as
+                UiAutomator2 does for ``By.ID``.
+        """
+        self.app_package = app_package
+        self.lxml = importlib.util.find_spec("lxml") is not None
+        data = source.encode("utf-8")
+        if self.lxml:
+            from lxml import etree
+
+            self.root = etree.fromstring(data, etree.XMLParser(huge_tree=True))
+        else:
+            from xml.etree import ElementTree
+
+            self.root = ElementTree.fromstring(data)
+
+    @classmethod
+    def capture(cls, driver: WebDriver, app_package: str = "") -> "PageSnapshot":
+        """Fetch and parse the current screen's page source (one round trip).
+
+        Args:
+            driver: Appium WebDriver instance.
+            app_package: Package prefixed to bare resource ids.
+
+        Returns:
+            Parsed snapshot.
+        """
+        started = time.perf_counter()
+        source = driver.page_source
+        fetched = time.perf_counter()
+        snapshot = cls(source, app_package)
+        logger.debug(
+            "Page snapshot: %d KB fetched in %.0fms, parsed in %.0fms",
+            len(source) // 1024, (fetched - started) * 1000, (time.perf_counter() - fetched) * 1000,
+        )
+        return snapshot
+
+    def find_all(self, locator: tuple) -> List[SnapshotElement]:
+        """Evaluate a locator against the whole snapshot.
+
+        Args:
+            locator: Tuple of (By, value).
+
+        Returns:
+            Matching elements in document order.
+
+        Raises:
+            ValueError: If the strategy or XPath cannot be evaluated locally.
+        """
+        return self._find_all(locator, self.root)
+
+    def find(self, locator: tuple) -> Optional[SnapshotElement]:
+        """First match of a locator, or None."""
+        matches = self.find_all(locator)
+        return matches[0] if matches else None
+
+    def count(self, locator: tuple) -> int:
+        """Number of elements matching a locator."""
+        return len(self.find_all(locator))
+
+    def exists(self, locator: tuple) -> bool:
+        """Whether any element matches a locator."""
+        return bool(self.find_all(locator))
+
+    def is_displayed(self, locator: tuple) -> bool:
+        """Whether the first match of a locator is displayed."""
+        element = self.find(locator)
+        return element is not None and element.displayed
+
+    def texts(self, locator: tuple) -> List[str]:
+        """``text`` of every element matching a locator."""
+        return [element.text for element in self.find_all(locator)]
+
+    def _find_all(self, locator: tuple, node: Any) -> List[SnapshotElement]:
+        by, value = locator
+        if by == "xpath":
+            nodes = self._xpath(value, node)
+        elif by == "id":
+            resource_id = value if ":" in value or not self.app_package else f"{self.app_package}:id/{value}"
+            nodes = [n for n in node.iter() if n.get("resource-id") == resource_id]
+        elif by == "accessibility id":
+            nodes = [n for n in node.iter() if n.get("content-desc") == value]
+        elif by == "class name":
+            nodes = [n for n in node.iter() if n.tag == value or n.get("class") == value]
+        elif by == "-android uiautomator":
+            conditions = self._ui_selector(value)
+            nodes = [n for n in node.iter() if all(self._matches(n, *c) for c in conditions)]
+        else:
+            raise ValueError(
+                f"Strategy '{by}' cannot be evaluated on a snapshot. Supported: {', '.join(SNAPSHOT_STRATEGIES)}"
+            )
+        # Relative lookups exclude the context node itself, like find_elements on an element
+        return [self._wrap(n) for n in nodes if n is not node or node is self.root]
+
+    def _xpath(self, expression: str, node: Any) -> List[Any]:
+        if self.lxml:
+            if node is not self.root and expression.startswith("//"):
+                # Scope to the subtree, as WebElement.find_elements does
+                expression = "." + expression
+            result = node.xpath(expression)
+            return [n for n in result if hasattr(n, "tag")] if isinstance(result, list) else []
+        try:
+            matches: List[Any] = node.findall("." + expression if expression.startswith("/") else expression)
+            return matches
+        except SyntaxError as e:
+            raise ValueError(
+                f"XPath '{expression}' needs lxml to be evaluated on a snapshot: {e}"
+            ) from e
+
+    @staticmethod
+    def _ui_selector(selector: str) -> List[tuple]:
+        match = _UI_SELECTOR.match(selector)
+        if not match:
+            raise ValueError(f"UiSelector '{selector}' cannot be evaluated on a snapshot")
+        conditions = []
+        for method, argument in _UI_SELECTOR_CALL.findall(match.group(1)):
+            if method not in UI_SELECTOR_METHODS:
+                raise ValueError(
+                    f"UiSelector method '{method}' cannot be evaluated on a snapshot. "
+                    f"Supported: {', '.join(UI_SELECTOR_METHODS)}"
+                )
+            attribute, comparison = UI_SELECTOR_METHODS[method]
+            conditions.append((attribute, comparison, re.sub(r"\\(.)", r"\1", argument)))
+        return conditions
+
+    @staticmethod
+    def _matches(node: Any, attribute: str, comparison: str, expected: str) -> bool:
+        actual: Optional[str] = node.get(attribute)
+        if actual is None and attribute == "class":
+            actual = node.tag
+        if actual is None:
+            return False
+        if comparison == "contains":
+            return expected in actual
+        if comparison == "startswith":
+            return actual.startswith(expected)
+        return actual == expected
+
+    def _wrap(self, node: Any) -> SnapshotElement:
+        return SnapshotElement(node.tag, dict(node.attrib), node, self)
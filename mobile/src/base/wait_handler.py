@@ -1,12 +1,20 @@
 """Wait strategies and handlers for element interactions."""
 
-from typing import Callable, TypeVar, Optional
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Literal, TypeVar, Optional, Union, cast
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from appium import webdriver
 from appium.webdriver.webdriver import WebDriver
 
+from mobile.config.settings import settings
+from mobile.src.base.adaptive_wait import AdaptiveWait, WaitHistory
+from mobile.src.base.element_cache import ElementCache
 from mobile.src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,7 +23,16 @@ T = TypeVar("T")
 
 
 class WaitHandler:
-    """Handles wait strategies and synchronization for mobile tests."""
+    """Handles wait strategies and synchronization for mobile tests.
+
+    ``WAIT_STRATEGY`` selects how waits poll Appium:
+
+    * ``adaptive`` (default): ``AdaptiveWait``, short polls with backoff,
+      shaped by each locator's typical appearance time.
+    * ``server``: one ``find_element`` under an implicit-wait window, so
+      Appium waits on the device side, then adaptive polls for the state.
+    * ``fixed``: Selenium's ``WebDriverWait`` with a 0.5s poll.
+    """
 
     DEFAULT_TIMEOUT = 10
     DEFAULT_POLL_FREQUENCY = 0.5
@@ -29,7 +46,7 @@ class WaitHandler:
         """
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout, self.DEFAULT_POLL_FREQUENCY)
+        self.elements = ElementCache.for_driver(driver)
 
     def wait_for_element_visible(
         self, locator: tuple, timeout: Optional[int] = None
@@ -47,9 +64,8 @@ class WaitHandler:
             TimeoutException: If element not visible within timeout.
         """
         actual_timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, actual_timeout)
-        logger.debug(f"Waiting for element {locator} to be visible (timeout: {actual_timeout}s)")
-        return wait.until(EC.visibility_of_element_located(locator))
+        logger.debug("Waiting for element %s to be visible (timeout: %ss)", locator, actual_timeout)
+        return self._element_until(EC.visibility_of_element_located(locator), actual_timeout, locator)
 
     def wait_for_element_clickable(
         self, locator: tuple, timeout: Optional[int] = None
@@ -64,9 +80,8 @@ class WaitHandler:
             WebElement when it becomes clickable.
         """
         actual_timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, actual_timeout)
-        logger.debug(f"Waiting for element {locator} to be clickable (timeout: {actual_timeout}s)")
-        return wait.until(EC.element_to_be_clickable(locator))
+        logger.debug("Waiting for element %s to be clickable (timeout: %ss)", locator, actual_timeout)
+        return self._element_until(EC.element_to_be_clickable(locator), actual_timeout, locator)
 
     def wait_for_element_presence(
         self, locator: tuple, timeout: Optional[int] = None
@@ -81,9 +96,8 @@ class WaitHandler:
             WebElement when it is present in DOM.
         """
         actual_timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, actual_timeout)
-        logger.debug(f"Waiting for element {locator} to be present (timeout: {actual_timeout}s)")
-        return wait.until(EC.presence_of_element_located(locator))
+        logger.debug("Waiting for element %s to be present (timeout: %ss)", locator, actual_timeout)
+        return self._element_until(EC.presence_of_element_located(locator), actual_timeout, locator)
 
     def wait_for_text_in_element(
         self, locator: tuple, text: str, timeout: Optional[int] = None
@@ -99,9 +113,8 @@ class WaitHandler:
             True when text is found in element.
         """
         actual_timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, actual_timeout)
-        logger.debug(f"Waiting for text '{text}' in element {locator}")
-        return wait.until(EC.text_to_be_present_in_element(locator, text))
+        logger.debug("Waiting for text '%s' in element %s", text, locator)
+        return self._until(EC.text_to_be_present_in_element(locator, text), actual_timeout, locator)
 
     def wait_for_condition(
         self, condition: Callable[..., T], timeout: Optional[int] = None
@@ -116,6 +129,92 @@ class WaitHandler:
             Result of the condition callable.
         """
         actual_timeout = timeout or self.timeout
-        wait = WebDriverWait(self.driver, actual_timeout)
-        logger.debug(f"Waiting for custom condition (timeout: {actual_timeout}s)")
-        return wait.until(condition)
+        logger.debug("Waiting for custom condition (timeout: %ss)", actual_timeout)
+        return self._until(condition, actual_timeout)
+
+    def find_with_implicit_wait(self, locator: tuple, timeout: float) -> webdriver.WebElement:
+        """Find an element, letting Appium wait for it server-side.
+
+        Sets an implicit-wait window for this one ``find_element``: the
+        server retries on the device and answers once the element exists,
+        instead of the client polling over HTTP.
+
+        Args:
+            locator: Tuple of (By, value) for element locator.
+            timeout: Implicit-wait window in seconds.
+
+        Returns:
+            WebElement once it is present.
+
+        Raises:
+            NoSuchElementException: If the element did not appear in time.
+        """
+        self.driver.implicitly_wait(timeout)
+        try:
+            return self.driver.find_element(*locator)
+        finally:
+            self.driver.implicitly_wait(0)
+
+    @contextmanager
+    def idle_timeout(self, milliseconds: int) -> Iterator[None]:
+        """Temporarily change UiAutomator2's ``waitForIdleTimeout``.
+
+        UiAutomator2 waits up to this long for the app to go idle before
+        every lookup and action. Screens with endless animations never go
+        idle, so each command on them pays the full timeout; lower it there.
+
+        Args:
+            milliseconds: Idle timeout to use inside the block.
+        """
+        previous = self.driver.get_settings().get("waitForIdleTimeout")
+        self.driver.update_settings({"waitForIdleTimeout": milliseconds})
+        try:
+            yield
+        finally:
+            if previous is not None:
+                self.driver.update_settings({"waitForIdleTimeout": previous})
+
+    def _element_until(
+        self,
+        condition: Callable[[RemoteWebDriver], Union[Literal[False], WebElement]],
+        timeout: float,
+        locator: tuple,
+    ) -> webdriver.WebElement:
+        """``_until`` for conditions that return the element."""
+        # An Appium session hands out Appium WebElements
+        return cast(webdriver.WebElement, self._until(condition, timeout, locator))
+
+    def _until(
+        self,
+        condition: Callable[[RemoteWebDriver], Union[Literal[False], T]],
+        timeout: float,
+        locator: Optional[tuple] = None,
+    ) -> T:
+        """Wait for a condition with the configured ``WAIT_STRATEGY``.
+
+        Args:
+            condition: Called with the driver until it returns a truthy value.
+            timeout: Maximum wait time in seconds.
+            locator: Locator the condition is about, if any.
+
+        Returns:
+            Truthy value returned by the condition.
+        """
+        if settings.wait_strategy == "fixed":
+            result = WebDriverWait(self.driver, timeout, self.DEFAULT_POLL_FREQUENCY).until(condition)
+        else:
+            started = time.monotonic()
+            if locator is not None and settings.wait_strategy == "server":
+                try:
+                    self.find_with_implicit_wait(locator, timeout)
+                except NoSuchElementException:
+                    pass
+            remaining = max(timeout - (time.monotonic() - started), 0)
+            # Expected conditions are closures named after their factory
+            name = getattr(condition, "__qualname__", "").split(".")[0]
+            key = WaitHistory.key(locator, name) if locator is not None else None
+            result = AdaptiveWait(self.driver, remaining).until(condition, key)
+        # The awaited element is what the page object will act on next
+        if self.elements is not None and locator is not None and isinstance(result, webdriver.WebElement):
+            self.elements.put(locator, result)
+        return result
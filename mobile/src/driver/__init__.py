@@ -1,5 +1,16 @@
 """Driver management module for Appium."""
-from .driver_factory import DriverFactory
-from .driver_manager import DriverManager
 
-__all__ = ["DriverFactory", "DriverManager"]
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .async_client import AsyncAppiumClient
+    from .driver_factory import DriverFactory
+    from .driver_manager import DriverManager
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "AsyncAppiumClient": "async_client",
+    "DriverFactory": "driver_factory",
+    "DriverManager": "driver_manager",
+})
@@ -0,0 +1,391 @@
+"""Asyncio-native W3C WebDriver client for the commands the page objects use."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+from selenium.common import exceptions
+
+from mobile.config.settings import settings
+from mobile.src.driver.command_timings import CommandTimings
+from mobile.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# As in command_executor (not imported, it would load the Appium client): only these are re-sent
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+
+# Starting a session may install and launch the app; Selenium's client allows the same
+NEW_SESSION_READ_TIMEOUT = 120
+
+# W3C key holding an element reference in responses and arguments
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Capabilities sent without the "appium:" vendor prefix
+W3C_CAPABILITIES = (
+    "browserName", "browserVersion", "platformName", "acceptInsecureCerts",
+    "pageLoadStrategy", "proxy", "setWindowRect", "timeouts", "unhandledPromptBehavior",
+)
+
+# W3C error codes and the Selenium exceptions the synchronous client raises for them
+_ERRORS = {
+    "no such element": exceptions.NoSuchElementException,
+    "stale element reference": exceptions.StaleElementReferenceException,
+    "invalid session id": exceptions.InvalidSessionIdException,
+    "element not interactable": exceptions.ElementNotInteractableException,
+    "element click intercepted": exceptions.ElementClickInterceptedException,
+    "invalid selector": exceptions.InvalidSelectorException,
+    "invalid argument": exceptions.InvalidArgumentException,
+    "timeout": exceptions.TimeoutException,
+    "session not created": exceptions.SessionNotCreatedException,
+    "unknown command": exceptions.UnknownMethodException,
+}
+
+
+class AsyncAppiumClient:
+    """One pooled HTTP session shared by any number of Appium sessions.
+
+    The synchronous stack needs a process (or thread) and a Selenium
+    ``WebDriver`` per device. Here every ``AsyncWebDriver`` of the process
+    sends its commands through a single ``aiohttp.ClientSession`` holding
+    up to ``ASYNC_POOL_LIMIT`` keep-alive connections, so one event loop
+    drives many devices or sessions concurrently. Connection failures are
+    retried like ``MeteredAppiumConnection`` does (``APPIUM_HTTP_RETRIES``)
+    and every command is recorded in ``CommandTimings``. A response that
+    does not arrive within ``APPIUM_TIMEOUT`` (plus the session's implicit
+    wait) fails instead of hanging the session.
+
+    Only the commands ``AsyncBasePage`` and ``AsyncWaitHandler`` need are
+    implemented; use the Selenium driver for anything else.
+
+    Example:
+        async with AsyncAppiumClient() as client:
+            async with client.session(capabilities, url) as driver:
+                await AsyncHomePage(driver).wait_for_page_load()
+    """
+
+    def __init__(self, pool_limit: Optional[int] = None) -> None:
+        """Initialize AsyncAppiumClient.
+
+        Args:
+            pool_limit: Connections shared by all sessions; defaults to
+                ``ASYNC_POOL_LIMIT``.
+        """
+        self.pool_limit = pool_limit or settings.async_pool_limit
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncAppiumClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        """The shared HTTP session, created in the running event loop on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_limit, limit_per_host=0),
+                timeout=aiohttp.ClientTimeout(
+                    total=None, connect=settings.appium_timeout, sock_read=settings.appium_timeout
+                ),
+                headers={"Accept": "application/json"},
+            )
+        return self._http
+
+    async def new_session(self, capabilities: Dict[str, Any], url: Optional[str] = None) -> "AsyncWebDriver":
+        """Start an Appium session.
+
+        Args:
+            capabilities: Capabilities, e.g. ``AppiumConfig.get_android_capabilities()``;
+                non-W3C names get the ``appium:`` prefix.
+            url: Appium server URL; defaults to ``APPIUM_HOST``/``APPIUM_PORT``.
+
+        Returns:
+            Driver for the new session.
+        """
+        url = (url or f"http://{settings.appium_host}:{settings.appium_port}").rstrip("/")
+        always_match = {
+            name if ":" in name or name in W3C_CAPABILITIES else f"appium:{name}": value
+            for name, value in capabilities.items()
+        }
+        started = time.perf_counter()
+        value = await self.command(
+            "newSession", "POST", f"{url}/session",
+            {"capabilities": {"alwaysMatch": always_match, "firstMatch": [{}]}},
+            read_timeout=NEW_SESSION_READ_TIMEOUT,
+        )
+        logger.info(
+            "Async session %s started in %.1fs", value["sessionId"], time.perf_counter() - started
+        )
+        return AsyncWebDriver(self, f"{url}/session/{value['sessionId']}", value["sessionId"])
+
+    @asynccontextmanager
+    async def session(
+        self, capabilities: Dict[str, Any], url: Optional[str] = None
+    ) -> AsyncIterator["AsyncWebDriver"]:
+        """Start a session for the duration of a block, then quit it.
+
+        Args:
+            capabilities: Session capabilities.
+            url: Appium server URL.
+
+        Yields:
+            Driver for the session.
+        """
+        driver = await self.new_session(capabilities, url)
+        try:
+            yield driver
+        finally:
+            await driver.quit()
+
+    async def command(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]] = None,
+        read_timeout: Optional[float] = None,
+    ) -> Any:
+        """Send one WebDriver command and return its ``value``.
+
+        Args:
+            name: Command name for ``CommandTimings``, e.g. ``findElement``.
+            method: HTTP method.
+            url: Full command URL.
+            body: JSON body of POST commands.
+            read_timeout: Seconds to wait for the response; defaults to
+                ``APPIUM_TIMEOUT``.
+
+        Returns:
+            The ``value`` of the response.
+
+        Raises:
+            WebDriverException: Or the matching subclass, for W3C error responses.
+        """
+        data = json.dumps(body if body is not None else {}).encode() if method == "POST" else None
+        # Passing timeout=None would drop the session's timeouts; leave it out instead
+        options: Dict[str, Any] = {}
+        if read_timeout is not None:
+            options["timeout"] = aiohttp.ClientTimeout(
+                total=None, connect=settings.appium_timeout, sock_read=read_timeout
+            )
+        received = 0
+        started = time.perf_counter()
+        ok = False
+        try:
+            for attempt in range(settings.appium_http_retries + 1):
+                try:
+                    async with self.http.request(
+                        method, url, data=data,
+                        headers={"Content-Type": "application/json;charset=UTF-8"} if data else None,
+                        **options,
+                    ) as response:
+                        payload = await response.read()
+                        status = response.status
+                    break
+                except aiohttp.ClientConnectionError as e:
+                    # Same policy as the sync client: a POST that may have been sent is not repeated
+                    sent = not isinstance(e, aiohttp.ClientConnectorError)
+                    if attempt == settings.appium_http_retries or (sent and method not in IDEMPOTENT_METHODS):
+                        raise
+                    await asyncio.sleep(0.05 * 2 ** attempt)
+            received = len(payload)
+            result = json.loads(payload) if payload else {}
+            value = result.get("value") if isinstance(result, dict) else result
+            if status >= 400:
+                error = value if isinstance(value, dict) else {}
+                raise _ERRORS.get(error.get("error", ""), exceptions.WebDriverException)(
+                    error.get("message", f"HTTP {status}"), stacktrace=error.get("stacktrace")
+                )
+            ok = True
+            return value
+        finally:
+            CommandTimings.record(name, time.perf_counter() - started, ok, len(data or b""), received)
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+
+class AsyncWebDriver:
+    """One Appium session driven through an ``AsyncAppiumClient``.
+
+    Method names follow the Selenium/Appium driver, as coroutines.
+    ``page_source`` is a method here rather than a property.
+    """
+
+    def __init__(self, client: AsyncAppiumClient, url: str, session_id: str) -> None:
+        """Initialize AsyncWebDriver.
+
+        Args:
+            client: Client whose HTTP session carries the commands.
+            url: Session URL, ``<server>/session/<id>``.
+            session_id: Appium session id.
+        """
+        self.client = client
+        self.url = url
+        self.session_id = session_id
+        # Implicit wait in seconds; find commands may take that long server-side
+        self.implicit_wait = 0.0
+
+    async def execute(self, name: str, method: str, path: str = "", body: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a command for this session.
+
+        Args:
+            name: Command name for ``CommandTimings``.
+            method: HTTP method.
+            path: Path below the session URL, e.g. ``/element``.
+            body: JSON body of POST commands.
+
+        Returns:
+            The ``value`` of the response.
+        """
+        read_timeout = settings.appium_timeout + self.implicit_wait if self.implicit_wait else None
+        return await self.client.command(name, method, self.url + path, body, read_timeout)
+
+    async def find_element(self, by: str, value: str) -> "AsyncWebElement":
+        """Find the first element matching a locator.
+
+        Raises:
+            NoSuchElementException: If nothing matches.
+        """
+        result = await self.execute("findElement", "POST", "/element", {"using": by, "value": value})
+        return AsyncWebElement(self, result[ELEMENT_KEY])
+
+    async def find_elements(self, by: str, value: str) -> List["AsyncWebElement"]:
+        """Find all elements matching a locator."""
+        result = await self.execute("findElements", "POST", "/elements", {"using": by, "value": value})
+        return [AsyncWebElement(self, item[ELEMENT_KEY]) for item in result]
+
+    async def page_source(self) -> str:
+        """XML hierarchy of the current screen."""
+        source: str = await self.execute("getPageSource", "GET", "/source")
+        return source
+
+    async def swipe(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: int = 0) -> None:
+        """Swipe from one point to another, as ``WebDriver.swipe`` does.
+
+        Args:
+            start_x: Start x coordinate.
+            start_y: Start y coordinate.
+            end_x: End x coordinate.
+            end_y: End y coordinate.
+            duration: Swipe duration in milliseconds.
+        """
+        actions = [
+            {"type": "pointerMove", "duration": 0, "x": start_x, "y": start_y},
+            {"type": "pointerDown", "button": 0},
+            {"type": "pause", "duration": 250 if duration <= 0 else 0},
+            {"type": "pointerMove", "duration": max(duration, 0), "x": end_x, "y": end_y},
+            {"type": "pointerUp", "button": 0},
+        ]
+        await self.execute(
+            "w3cActions", "POST", "/actions",
+            {"actions": [{
+                "type": "pointer", "id": "touch", "parameters": {"pointerType": "touch"}, "actions": actions,
+            }]},
+        )
+
+    async def get_screenshot_as_base64(self) -> str:
+        """Screenshot of the screen as base64-encoded PNG."""
+        screenshot: str = await self.execute("screenshot", "GET", "/screenshot")
+        return screenshot
+
+    async def get_screenshot_as_png(self) -> bytes:
+        """Screenshot of the screen as PNG bytes."""
+        return base64.b64decode(await self.get_screenshot_as_base64())
+
+    async def implicitly_wait(self, seconds: float) -> None:
+        """Set how long ``find_element`` waits server-side for a match."""
+        await self.execute("setTimeouts", "POST", "/timeouts", {"implicit": int(seconds * 1000)})
+        self.implicit_wait = seconds
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        """Run a script or ``mobile:`` extension command."""
+        return await self.execute("executeScript", "POST", "/execute/sync", {"script": script, "args": list(args)})
+
+    async def quit(self) -> None:
+        """End the session; failures are logged, not raised."""
+        try:
+            await self.execute("quit", "DELETE")
+        except (exceptions.WebDriverException, aiohttp.ClientError) as e:
+            logger.warning("Failed to quit async session %s: %s", self.session_id, e)
+
+
+class AsyncWebElement:
+    """Element reference of an ``AsyncWebDriver`` session.
+
+    Selenium's ``text`` property is the ``text()`` coroutine here.
+    """
+
+    def __init__(self, driver: AsyncWebDriver, element_id: str) -> None:
+        """Initialize AsyncWebElement.
+
+        Args:
+            driver: Session the element belongs to.
+            element_id: W3C element reference.
+        """
+        self.driver = driver
+        self.id = element_id
+
+    def _path(self, command: str = "") -> str:
+        return f"/element/{self.id}{command}"
+
+    async def click(self) -> None:
+        """Tap the element."""
+        await self.driver.execute("clickElement", "POST", self._path("/click"))
+
+    async def clear(self) -> None:
+        """Clear an editable element."""
+        await self.driver.execute("clearElement", "POST", self._path("/clear"))
+
+    async def send_keys(self, text: str) -> None:
+        """Type text into the element."""
+        await self.driver.execute(
+            "sendKeysToElement", "POST", self._path("/value"), {"text": text, "value": list(text)}
+        )
+
+    async def text(self) -> str:
+        """Visible text of the element."""
+        text: str = await self.driver.execute("getElementText", "GET", self._path("/text"))
+        return text
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        """Value of an element attribute, e.g. ``content-desc`` or ``checked``."""
+        value: Optional[str] = await self.driver.execute(
+            "getElementAttribute", "GET", self._path(f"/attribute/{name}")
+        )
+        return value
+
+    async def is_displayed(self) -> bool:
+        """Whether the element is visible."""
+        displayed: bool = await self.driver.execute("isElementDisplayed", "GET", self._path("/displayed"))
+        return displayed
+
+    async def is_enabled(self) -> bool:
+        """Whether the element is enabled."""
+        enabled: bool = await self.driver.execute("isElementEnabled", "GET", self._path("/enabled"))
+        return enabled
+
+    async def find_element(self, by: str, value: str) -> "AsyncWebElement":
+        """Find the first matching descendant."""
+        result = await self.driver.execute(
+            "findChildElement", "POST", self._path("/element"), {"using": by, "value": value}
+        )
+        return AsyncWebElement(self.driver, result[ELEMENT_KEY])
+
+    async def find_elements(self, by: str, value: str) -> List["AsyncWebElement"]:
+        """Find all matching descendants."""
+        result = await self.driver.execute(
+            "findChildElements", "POST", self._path("/elements"), {"using": by, "value": value}
+        )
+        return [AsyncWebElement(self.driver, item[ELEMENT_KEY]) for item in result]
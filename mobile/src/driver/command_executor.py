@@ -0,0 +1,119 @@
+"""Keep-alive Appium command executor recording per-command timings."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+import urllib3
+from appium.webdriver.appium_connection import AppiumConnection
+
+from mobile.config.settings import settings
+from mobile.src.driver.command_timings import CommandTimings
+
+if TYPE_CHECKING:
+    from urllib3 import BaseHTTPResponse
+    from urllib3._base_connection import _TYPE_BODY
+    from urllib3._request_methods import _TYPE_FIELDS
+
+# Commands safe to re-send after the request went out; a repeated POST could tap or type twice
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+
+
+class _MeteredPoolManager(urllib3.PoolManager):
+    """Pool manager remembering the body sizes of the calling thread's last request."""
+
+    def __init__(self, last: threading.local, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._last = last
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[_TYPE_BODY] = None,
+        fields: Optional[_TYPE_FIELDS] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        json: Optional[Any] = None,
+        **urlopen_kw: Any,
+    ) -> BaseHTTPResponse:
+        # Selenium sends the command as one encoded body
+        self._last.sent = len(body) if isinstance(body, (bytes, str)) else 0
+        self._last.received = 0
+        response = super().request(
+            method, url, body=body, fields=fields, headers=headers, json=json, **urlopen_kw
+        )
+        self._last.received = len(response.data or b"")
+        return response
+
+
+class MeteredAppiumConnection(AppiumConnection):
+    """``AppiumConnection`` with a tuned keep-alive pool, retries and timing.
+
+    * One pool of up to ``APPIUM_POOL_MAXSIZE`` persistent connections per
+      server, so commands never pay a TCP handshake. The pool does not block;
+      threads beyond the limit get a connection that is closed after use.
+    * Failures to connect are retried up to ``APPIUM_HTTP_RETRIES`` times
+      with a short backoff. Read errors (a connection reset or timed out
+      after the request was sent) are only retried for GET and DELETE: the
+      server may already have run a POST such as a click or
+      ``sendKeysToElement``, and re-sending it would tap or type twice.
+      Pooled connections the server or an adb forward dropped while idle
+      are replaced by urllib3 before reuse.
+    * Every command's name, outcome, latency and body sizes go to
+      ``CommandTimings``.
+    """
+
+    def __init__(self, remote_server_addr: str, ignore_proxy: Optional[bool] = False) -> None:
+        """Initialize MeteredAppiumConnection.
+
+        Args:
+            remote_server_addr: Appium server URL.
+            ignore_proxy: Ignore ``HTTP(S)_PROXY`` settings.
+        """
+        self._last = threading.local()
+        retries = settings.appium_http_retries
+        super().__init__(
+            remote_server_addr,
+            keep_alive=True,
+            ignore_proxy=ignore_proxy,
+            init_args_for_pool_manager={
+                "maxsize": settings.appium_pool_maxsize,
+                "block": False,
+                "retries": urllib3.Retry(
+                    total=None, connect=retries, read=retries, status=0, other=0, redirect=5,
+                    allowed_methods=IDEMPOTENT_METHODS, backoff_factor=0.05, raise_on_status=False,
+                ),
+            },
+        )
+
+    def _get_connection_manager(self) -> urllib3.PoolManager:
+        manager = super()._get_connection_manager()
+        if isinstance(manager, urllib3.ProxyManager):
+            return manager
+        # Same pool arguments, plus the byte accounting
+        return _MeteredPoolManager(self._last, **manager.connection_pool_kw)
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a command, recording its latency and traffic.
+
+        Args:
+            command: WebDriver command name, e.g. ``findElement``.
+            params: Command parameters.
+
+        Returns:
+            The server's parsed response.
+        """
+        self._last.sent = self._last.received = 0
+        started = time.perf_counter()
+        ok = False
+        try:
+            response: Dict[str, Any] = super().execute(command, params)
+            status = response.get("status", 0) if isinstance(response, dict) else 0
+            ok = not isinstance(status, int) or status < 400
+            return response
+        finally:
+            CommandTimings.record(
+                command, time.perf_counter() - started, ok, self._last.sent, self._last.received
+            )
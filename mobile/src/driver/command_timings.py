@@ -0,0 +1,181 @@
+"""Per-command latency histograms of the Appium client, per test and per run."""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from mobile.config.settings import settings
+from mobile.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, float("inf"))
+
+
+@dataclass
+class CommandStats:
+    """Latency histogram and traffic of one WebDriver command."""
+
+    count: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_MS))
+
+    def add(self, seconds: float, ok: bool, sent: int, received: int) -> None:
+        """Record one command.
+
+        Args:
+            seconds: Round-trip time.
+            ok: False for HTTP error responses and connection failures.
+            sent: Request body bytes.
+            received: Response body bytes.
+        """
+        self.count += 1
+        self.errors += not ok
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bytes_sent += sent
+        self.bytes_received += received
+        milliseconds = seconds * 1000
+        self.buckets[next(i for i, bound in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= bound)] += 1
+
+    def merge(self, other: "CommandStats") -> None:
+        """Accumulate another histogram of the same command."""
+        self.count += other.count
+        self.errors += other.errors
+        self.seconds += other.seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound in ms of the bucket holding the given fraction of commands."""
+        threshold, seen = self.count * fraction, 0
+        for bound, hits in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += hits
+            if hits and seen >= threshold:
+                return min(bound, self.max_seconds * 1000)
+        return 0.0
+
+
+class CommandHistogram:
+    """``CommandStats`` per command name."""
+
+    def __init__(self) -> None:
+        """Initialize CommandHistogram."""
+        self.commands: Dict[str, CommandStats] = {}
+
+    def add(self, command: str, seconds: float, ok: bool, sent: int, received: int) -> None:
+        """Record one command; see ``CommandStats.add``."""
+        self.commands.setdefault(command, CommandStats()).add(seconds, ok, sent, received)
+
+    def merge(self, other: "CommandHistogram") -> None:
+        """Accumulate another histogram."""
+        for command, stats in other.commands.items():
+            self.commands.setdefault(command, CommandStats()).merge(stats)
+
+    @property
+    def total(self) -> CommandStats:
+        """All commands combined."""
+        total = CommandStats()
+        for stats in self.commands.values():
+            total.merge(stats)
+        return total
+
+    def table(self) -> str:
+        """Per-command table, most total time first."""
+        lines = [f"{'command':<28}{'count':>7}{'err':>5}{'total s':>9}{'mean ms':>9}{'p95 ms':>9}{'KB in':>8}"]
+        for command, stats in sorted(self.commands.items(), key=lambda item: -item[1].seconds):
+            lines.append(
+                f"{command:<28}{stats.count:>7}{stats.errors:>5}{stats.seconds:>9.2f}"
+                f"{stats.seconds / stats.count * 1000:>9.1f}{stats.percentile(0.95):>9.0f}"
+                f"{stats.bytes_received / 1024:>8.0f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, with the bucket bounds."""
+        return {
+            "buckets_ms": [str(bound) for bound in LATENCY_BUCKETS_MS],
+            "commands": {command: vars(stats) for command, stats in self.commands.items()},
+        }
+
+
+class CommandTimings:
+    """Per-test and per-run command histograms of this process.
+
+    Every ``MeteredAppiumConnection`` records into both. ``BaseTest`` starts
+    and finishes a test; with ``COMMAND_TIMINGS_FILE`` set, each test and
+    finally the run are appended to it as JSON lines, and the run table
+    is logged at session end.
+    """
+
+    run = CommandHistogram()
+    test = CommandHistogram()
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, command: str, seconds: float, ok: bool, sent: int, received: int) -> None:
+        """Record one command in the test and run histograms."""
+        with cls._lock:
+            cls.run.add(command, seconds, ok, sent, received)
+            cls.test.add(command, seconds, ok, sent, received)
+
+    @classmethod
+    def start_test(cls) -> None:
+        """Start a new per-test histogram."""
+        with cls._lock:
+            cls.test = CommandHistogram()
+
+    @classmethod
+    def finish_test(cls, name: str) -> CommandHistogram:
+        """Close the test's histogram and dump it.
+
+        Args:
+            name: Test node id.
+
+        Returns:
+            The test's histogram.
+        """
+        with cls._lock:
+            histogram, cls.test = cls.test, CommandHistogram()
+        total = histogram.total
+        if total.count:
+            logger.debug(
+                "%s: %d Appium commands, %.2fs, %d errors", name, total.count, total.seconds, total.errors
+            )
+            cls._dump({"test": name, **histogram.to_dict()})
+        return histogram
+
+    @classmethod
+    def close(cls) -> CommandHistogram:
+        """Log and dump the run's histogram, then reset it.
+
+        Returns:
+            The run's histogram.
+        """
+        with cls._lock:
+            histogram, cls.run = cls.run, CommandHistogram()
+        if histogram.commands:
+            logger.info("Appium commands:\n%s", histogram.table())
+            cls._dump({"run": True, **histogram.to_dict()})
+        return histogram
+
+    @staticmethod
+    def _dump(record: Dict[str, Any]) -> None:
+        if not settings.command_timings_file:
+            return
+        path = Path(settings.command_timings_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One write per line, so appends of xdist workers do not interleave
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
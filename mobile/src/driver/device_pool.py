@@ -0,0 +1,225 @@
+"""Exclusive leasing of devices from an inventory, shared by all worker processes."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional
+
+from mobile.config.settings import settings
+from mobile.src.utils.logger import get_logger
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = get_logger(__name__)
+
+# Seconds between attempts while every device is leased
+LEASE_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class Device:
+    """One inventory entry: a device and the Appium server driving it.
+
+    ``system_port`` and ``chromedriver_port`` must differ between devices
+    behind the same Appium server; when 0, ``DevicePool`` assigns them from
+    ``DEVICE_SYSTEM_PORT_BASE``/``DEVICE_CHROMEDRIVER_PORT_BASE`` plus the
+    device's position in the inventory.
+    """
+
+    name: str
+    appium_url: str
+    udid: str = ""
+    platform_version: str = ""
+    system_port: int = 0
+    chromedriver_port: int = 0
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+
+    def appium_capabilities(self) -> Dict[str, Any]:
+        """Capabilities selecting this device, merged over the defaults."""
+        capabilities: Dict[str, Any] = {
+            "deviceName": self.name,
+            "systemPort": self.system_port,
+            "chromedriverPort": self.chromedriver_port,
+        }
+        if self.udid:
+            capabilities["udid"] = self.udid
+        if self.platform_version:
+            capabilities["platformVersion"] = self.platform_version
+        capabilities.update(self.capabilities)
+        return capabilities
+
+
+@dataclass
+class DeviceLease:
+    """A device held exclusively by this process until ``release``."""
+
+    device: Device
+    lock_file: IO[str]
+    acquired_at: float = field(default_factory=time.monotonic)
+
+    def release(self) -> None:
+        """Give the device back to the pool."""
+        _unlock(self.lock_file)
+        self.lock_file.close()
+
+
+class DevicePool:
+    """Hands each worker process its own device from ``DEVICE_POOL_FILE``.
+
+    The inventory is a YAML file with a ``devices`` list (see
+    ``mobile/config/devices.example.yaml``). A lease is an exclusive OS
+    file lock on ``<DEVICE_LOCK_DIR>/<device>.lock``: it needs no
+    coordinator process, works across xdist workers and separate pytest
+    runs, and the OS releases it when a worker exits or crashes. A process
+    keeps its lease until ``release`` (at session end), so with session
+    reuse a worker stays on one device.
+
+    Without ``DEVICE_POOL_FILE`` there is no pool and the single device of
+    ``ANDROID_DEVICE_NAME``/``APPIUM_HOST`` is used.
+    """
+
+    _lease: Optional[DeviceLease] = None
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether a device inventory is configured."""
+        return bool(settings.device_pool_file)
+
+    @staticmethod
+    def load(path: Optional[str] = None) -> List[Device]:
+        """Read the device inventory and assign missing ports.
+
+        Args:
+            path: Inventory file; defaults to ``DEVICE_POOL_FILE``.
+
+        Returns:
+            Devices in inventory order.
+
+        Raises:
+            ValueError: If the inventory has no devices or duplicate names.
+        """
+        import yaml
+
+        path = path or settings.device_pool_file
+        with open(path, "r") as f:
+            entries = (yaml.safe_load(f) or {}).get("devices") or []
+        devices = []
+        for index, entry in enumerate(entries):
+            device = Device(**entry)
+            device.system_port = device.system_port or settings.device_system_port_base + index
+            device.chromedriver_port = (
+                device.chromedriver_port or settings.device_chromedriver_port_base + index
+            )
+            devices.append(device)
+        names = [device.name for device in devices]
+        if not devices or len(set(names)) != len(names):
+            raise ValueError(f"Device inventory {path} needs at least one device and unique names")
+        return devices
+
+    @classmethod
+    def acquire(cls, timeout: Optional[float] = None) -> Device:
+        """Lease a free device, waiting while all are in use.
+
+        Returns the device this process already holds, if any.
+
+        Args:
+            timeout: Seconds to wait; defaults to ``DEVICE_LEASE_TIMEOUT``.
+
+        Returns:
+            The leased device.
+
+        Raises:
+            TimeoutError: If no device became free in time.
+        """
+        if cls._lease is not None:
+            return cls._lease.device
+        devices = cls.load()
+        lock_dir = Path(settings.device_lock_dir)
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        timeout = settings.device_lease_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        # Start at a different device per worker, so workers rarely contend for one lock
+        offset = _worker_index() % len(devices)
+        while True:
+            for device in devices[offset:] + devices[:offset]:
+                lease = cls._try_lease(device, lock_dir)
+                if lease is not None:
+                    cls._lease = lease
+                    logger.info(
+                        "Leased device %s (%s, systemPort %d)",
+                        device.name, device.appium_url, device.system_port,
+                    )
+                    return device
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"All {len(devices)} devices stayed leased for {timeout}s")
+            time.sleep(LEASE_POLL_INTERVAL)
+
+    @staticmethod
+    def _try_lease(device: Device, lock_dir: Path) -> Optional[DeviceLease]:
+        path = lock_dir / (re.sub(r"[^\w.-]", "_", device.name) + ".lock")
+        lock_file = open(path, "a+")
+        if not _try_lock(lock_file):
+            lock_file.close()
+            return None
+        # Holder details for whoever inspects a busy lock
+        lock_file.seek(0)
+        lock_file.truncate()
+        json.dump({"pid": os.getpid(), "worker": os.getenv("PYTEST_XDIST_WORKER", "")}, lock_file)
+        lock_file.flush()
+        return DeviceLease(device, lock_file)
+
+    @classmethod
+    def current(cls) -> Optional[Device]:
+        """The device leased by this process, if any."""
+        return cls._lease.device if cls._lease is not None else None
+
+    @classmethod
+    def release(cls) -> None:
+        """Give this process's device back to the pool."""
+        lease, cls._lease = cls._lease, None
+        if lease is not None:
+            lease.release()
+            logger.info(
+                "Released device %s after %.0fs", lease.device.name, time.monotonic() - lease.acquired_at
+            )
+
+
+def _worker_index() -> int:
+    """Number of the xdist worker (``gw3`` -> 3), 0 outside xdist."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    return int(worker[2:]) if worker[2:].isdigit() else 0
+
+
+def _try_lock(lock_file: IO[str]) -> bool:
+    """Take an exclusive, non-blocking lock on an open file."""
+    try:
+        if sys.platform == "win32":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(lock_file: IO[str]) -> None:
+    if sys.platform == "win32":
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+# A worker that exits without DriverFactory.shutdown() still hands its device back
+atexit.register(DevicePool.release)
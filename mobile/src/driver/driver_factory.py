@@ -1,27 +1,78 @@
 """Factory for creating and managing Appium driver instances."""
 
-from typing import Optional
+from __future__ import annotations
 
-from appium import webdriver
-from appium.webdriver.appium_service import AppiumService
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 
 from mobile.config.appium_config import AppiumConfig
 from mobile.config.settings import settings
+from mobile.src.base.locator_profiler import LocatorProfiler
+from mobile.src.driver.device_pool import Device, DevicePool
+from mobile.src.driver.session_prewarmer import SessionPrewarmer
 from mobile.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from appium import webdriver
+    from appium.webdriver.appium_service import AppiumService
+
 logger = get_logger(__name__)
 
+# query_app_state() of an app running in the foreground
+APP_RUNNING_IN_FOREGROUND = 4
+
+# How long a reset waits for the app to reach the foreground, in seconds
+APP_FOREGROUND_TIMEOUT = 10
+
+
+@dataclass
+class SessionStats:
+    """Session reuse counters and the time tests spent acquiring a driver."""
+
+    created: int = 0
+    reused: int = 0
+    unhealthy: int = 0
+    setup_seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        acquired = self.created + self.reused
+        per_test = self.setup_seconds / acquired if acquired else 0.0
+        return (
+            f"Appium sessions: {self.created} created, {self.reused} reused, "
+            f"{self.unhealthy} replaced as unhealthy, {per_test:.2f}s setup per test"
+        )
+
 
 class DriverFactory:
-    """Factory class for creating Appium driver instances."""
+    """Factory class for creating Appium driver instances.
+
+    With ``SESSION_REUSE=true``, ``acquire_driver`` keeps the worker's
+    session across tests and resets the app instead of starting a new
+    UiAutomator2 session per test (``SESSION_RESET``):
+
+    * ``restart``: terminate and activate the app.
+    * ``clear``: terminate, clear the app data (``pm clear``) and activate.
+    * ``deeplink``: open ``SESSION_HOME_DEEPLINK`` without restarting.
+
+    Before reuse the session gets a health check; a session that fails
+    it, or whose reset does not bring the app to the foreground, is
+    replaced by a new one.
+    """
 
     _appium_service: Optional[AppiumService] = None
     _driver: Optional[webdriver.WebDriver] = None
+    _tests_on_session = 0
+    stats = SessionStats()
 
     @classmethod
     def create_driver(cls) -> webdriver.WebDriver:
         """Create and return Appium driver.
 
+        Takes the session ``SessionPrewarmer`` started in the background,
+        if there is one for the device.
+
         Returns:
             Appium WebDriver instance.
 
@@ -33,15 +84,13 @@ class DriverFactory:
             return cls._driver
 
         try:
-            logger.info(f"Creating Appium driver connecting to {settings.appium_url}")
-
-            capabilities = AppiumConfig.get_android_capabilities()
-            logger.debug(f"Android capabilities: {capabilities}")
-
-            cls._driver = webdriver.Remote(
-                command_executor=settings.appium_url,
-                desired_capabilities=capabilities,
-            )
+            device = DevicePool.acquire() if DevicePool.enabled() else None
+            driver = SessionPrewarmer.take(cls._device_key(device))
+            if driver is None:
+                driver = cls._start_session(device)
+            cls._driver = LocatorProfiler.attach(driver)
+            cls._tests_on_session = 0
+            cls.stats.created += 1
 
             logger.info("Appium driver created successfully")
             return cls._driver
@@ -50,6 +99,191 @@ class DriverFactory:
             logger.error(f"Failed to create Appium driver: {str(e)}")
             raise
 
+    @staticmethod
+    def _start_session(device: Optional[Device]) -> webdriver.WebDriver:
+        """Start a new Appium session; also run on the pre-warming thread.
+
+        Args:
+            device: Leased pool device, or None for the configured device.
+
+        Returns:
+            Appium WebDriver instance.
+        """
+        appium_url = device.appium_url if device is not None else settings.appium_url
+        logger.info(f"Creating Appium driver connecting to {appium_url}")
+
+        capabilities = AppiumConfig.get_android_capabilities(device)
+        logger.debug(f"Android capabilities: {capabilities}")
+
+        # Deferred so importing the framework does not load Appium/Selenium
+        from appium import webdriver
+        from appium.options.common.base import AppiumOptions
+
+        from mobile.src.driver.command_executor import MeteredAppiumConnection
+
+        options = AppiumOptions()
+        options.load_capabilities(capabilities)
+        driver = webdriver.Remote(command_executor=MeteredAppiumConnection(appium_url), options=options)
+        if settings.uia2_wait_for_idle_timeout is not None:
+            driver.update_settings({"waitForIdleTimeout": settings.uia2_wait_for_idle_timeout})
+        return driver
+
+    @staticmethod
+    def _device_key(device: Optional[Device]) -> str:
+        """Identify a device for the pre-warmer's per-device limit."""
+        if device is not None:
+            return f"{device.name}@{device.appium_url}"
+        return f"{settings.android_device_name}@{settings.appium_url}"
+
+    @classmethod
+    def prewarm_next(cls) -> bool:
+        """Start the next test's session in the background if it will need a new one.
+
+        With ``SESSION_REUSE`` that is only when the current session has
+        reached ``SESSION_MAX_TESTS``.
+
+        Returns:
+            True if a session is being pre-warmed.
+        """
+        if not SessionPrewarmer.enabled():
+            return False
+        if (
+            cls._driver is not None
+            and settings.session_reuse
+            and not (settings.session_max_tests and cls._tests_on_session + 1 >= settings.session_max_tests)
+        ):
+            return False
+        device = DevicePool.current() if DevicePool.enabled() else None
+        return SessionPrewarmer.start(
+            cls._device_key(device),
+            active=1 if cls._driver is not None else 0,
+            create=lambda: cls._start_session(device),
+        )
+
+    @classmethod
+    def acquire_driver(cls) -> webdriver.WebDriver:
+        """Get a driver for the next test.
+
+        Without ``SESSION_REUSE`` this is ``create_driver``. With it, the
+        current session is health-checked and its app reset; a new session
+        is created if there is none, it is unhealthy or it reached
+        ``SESSION_MAX_TESTS``.
+
+        Returns:
+            Appium WebDriver instance with the app on its start screen.
+        """
+        started = time.perf_counter()
+        try:
+            if not settings.session_reuse or cls._driver is None:
+                driver = cls.create_driver()
+            elif settings.session_max_tests and cls._tests_on_session >= settings.session_max_tests:
+                logger.info("Session served %d tests, starting a new one", cls._tests_on_session)
+                cls.quit_driver()
+                driver = cls.create_driver()
+            elif cls.is_healthy(cls._driver) and cls.reset_app(cls._driver):
+                cls.stats.reused += 1
+                logger.info("Reusing Appium session %s", cls._driver.session_id)
+                driver = cls._driver
+            else:
+                cls.stats.unhealthy += 1
+                logger.warning("Appium session unhealthy, starting a new one")
+                cls.quit_driver()
+                driver = cls.create_driver()
+        finally:
+            cls.stats.setup_seconds += time.perf_counter() - started
+        cls.prewarm_next()
+        return driver
+
+    @classmethod
+    def release_driver(cls) -> None:
+        """Hand back the test's driver: kept with ``SESSION_REUSE``, quit otherwise.
+
+        After a quit, the next test's session may start pre-warming.
+        """
+        if settings.session_reuse and cls._driver is not None:
+            cls._tests_on_session += 1
+            # A session that will not be reused makes room for the pre-warmed one now
+            if not (
+                SessionPrewarmer.enabled()
+                and settings.session_max_tests
+                and cls._tests_on_session >= settings.session_max_tests
+            ):
+                return
+        cls.quit_driver()
+        cls.prewarm_next()
+
+    @staticmethod
+    def is_healthy(driver: webdriver.WebDriver) -> bool:
+        """Check that a session still answers commands (one round trip).
+
+        Args:
+            driver: Appium WebDriver instance.
+
+        Returns:
+            False if the session is gone or the server does not respond.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            driver.query_app_state(settings.android_package_name)
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Session health check failed: {e.msg}")
+            return False
+
+    @staticmethod
+    def reset_app(driver: webdriver.WebDriver) -> bool:
+        """Bring the app back to its start screen according to ``SESSION_RESET``.
+
+        Args:
+            driver: Appium WebDriver instance.
+
+        Returns:
+            True once the app is in the foreground; False if the reset failed.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        package = settings.android_package_name
+        mode = settings.session_reset
+        try:
+            if mode == "deeplink" and settings.session_home_deeplink:
+                driver.execute_script(
+                    "mobile: deepLink", {"url": settings.session_home_deeplink, "package": package}
+                )
+            else:
+                if mode == "deeplink":
+                    logger.warning("SESSION_HOME_DEEPLINK is not set, restarting the app instead")
+                driver.terminate_app(package)
+                if mode == "clear":
+                    driver.execute_script("mobile: clearApp", {"appId": package})
+                driver.activate_app(package)
+            deadline = time.monotonic() + APP_FOREGROUND_TIMEOUT
+            while driver.query_app_state(package) != APP_RUNNING_IN_FOREGROUND:
+                if time.monotonic() >= deadline:
+                    logger.warning(f"App {package} not in the foreground after reset")
+                    return False
+                time.sleep(0.1)
+            return True
+        except WebDriverException as e:
+            logger.warning(f"App reset ({mode}) failed: {e.msg}")
+            return False
+
+    @classmethod
+    def shutdown(cls) -> SessionStats:
+        """Quit a kept session, release the leased device and log the session statistics.
+
+        Returns:
+            Statistics of this worker's sessions.
+        """
+        cls.quit_driver()
+        SessionPrewarmer.close()
+        DevicePool.release()
+        stats = cls.stats
+        if stats.created:
+            logger.info(stats.summary())
+        cls.stats = SessionStats()
+        return stats
+
     @classmethod
     def quit_driver(cls) -> None:
         """Quit and close Appium driver.
@@ -88,6 +322,8 @@ class DriverFactory:
         """
         try:
             logger.info("Starting Appium service")
+            from appium.webdriver.appium_service import AppiumService
+
             cls._appium_service = AppiumService()
             cls._appium_service.start()
             logger.info("Appium service started successfully")
@@ -1,12 +1,16 @@
 """Manager for Appium driver lifecycle."""
 
-from typing import Optional
+from __future__ import annotations
 
-from appium import webdriver
+from typing import TYPE_CHECKING, Optional
 
+from mobile.src.base.element_cache import ElementCache
 from mobile.src.driver.driver_factory import DriverFactory
 from mobile.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from appium import webdriver
+
 logger = get_logger(__name__)
 
 
@@ -29,7 +33,7 @@ class DriverManager:
             Appium WebDriver instance.
         """
         logger.info("Initializing driver for test")
-        self._driver = DriverFactory.create_driver()
+        self._driver = DriverFactory.acquire_driver()
         return self._driver
 
     def get_driver(self) -> webdriver.WebDriver:
@@ -46,9 +50,11 @@ class DriverManager:
         return self._driver
 
     def close_driver(self) -> None:
-        """Close driver after test."""
+        """Close driver after test (kept for the next test with ``SESSION_REUSE``)."""
         logger.info("Closing driver after test")
-        DriverFactory.quit_driver()
+        if self._driver is not None:
+            ElementCache.release(self._driver)
+        DriverFactory.release_driver()
         self._driver = None
 
     def reset(self) -> None:
@@ -56,6 +62,7 @@ class DriverManager:
         logger.info("Resetting driver state")
         if self._driver:
             try:
+                ElementCache.release(self._driver)
                 self._driver.reset()
                 logger.info("Driver reset successfully")
             except Exception as e:
@@ -0,0 +1,215 @@
+"""Background creation of the next Appium session while the current test runs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Optional
+
+from mobile.config.settings import settings
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from appium import webdriver
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PrewarmStats:
+    """Pre-created sessions and the creation time they kept off the test path."""
+
+    started: int = 0
+    used: int = 0
+    discarded: int = 0
+    failed: int = 0
+    creation_seconds: float = 0.0
+    hidden_seconds: float = 0.0
+    waited_seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"Pre-warmed sessions: {self.started} started, {self.used} used, "
+            f"{self.discarded} discarded unused, {self.failed} failed; "
+            f"{self.hidden_seconds:.1f}s of {self.creation_seconds:.1f}s creation hidden, "
+            f"{self.waited_seconds:.1f}s waited for unfinished ones"
+        )
+
+
+@dataclass
+class PendingSession:
+    """A session being created, or created and not yet taken."""
+
+    device: str
+    future: "Future[webdriver.WebDriver]"
+    started_at: float = field(default_factory=time.monotonic)
+    ready_at: Optional[float] = None
+    expiry: Optional[threading.Timer] = None
+
+
+class SessionPrewarmer:
+    """Creates the next test's Appium session on a background thread.
+
+    A new UiAutomator2 session takes seconds, and without reuse every test
+    waits for one. ``DriverFactory`` asks the prewarmer to start the next
+    session as soon as the device allows, and takes it instead of creating
+    one in the next ``acquire_driver``. ``SESSION_PREWARM_PER_DEVICE`` caps
+    the sessions this worker has open or starting on its device:
+
+    * ``1``: the next session starts when the current one is quit, hiding
+      test teardown and the gap to the next test's setup. UiAutomator2 runs
+      one session per device, so this is the setting for real devices.
+    * ``2``: the next session starts when a test acquires its driver, hiding
+      the whole test, for drivers that allow concurrent sessions.
+
+    A pre-created session not taken within ``SESSION_PREWARM_TTL`` seconds
+    is quit (keep it below Appium's ``newCommandTimeout``), as is one left
+    at session end. Sessions are only started while another test follows
+    on this worker (see ``expect_next``).
+    """
+
+    stats = PrewarmStats()
+    _pending: Optional[PendingSession] = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _expect_next = True
+    _lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether ``SESSION_PREWARM`` is on."""
+        return settings.session_prewarm
+
+    @classmethod
+    def expect_next(cls, more: bool) -> None:
+        """Tell the prewarmer whether another test will need a session.
+
+        Args:
+            more: False during the worker's last test, so no session is
+                started that would only be discarded.
+        """
+        cls._expect_next = more
+
+    @classmethod
+    def start(cls, device: str, active: int, create: Callable[[], webdriver.WebDriver]) -> bool:
+        """Start creating the next session unless the device is at its limit.
+
+        Args:
+            device: Key of the device the session is for (its Appium URL and name).
+            active: Sessions of this worker already open on the device.
+            create: Creates a session; called on the background thread.
+
+        Returns:
+            True if a session is now being created.
+        """
+        with cls._lock:
+            if (
+                not cls.enabled()
+                or not cls._expect_next
+                or cls._pending is not None
+                or active + 1 > settings.session_prewarm_per_device
+            ):
+                return False
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-prewarm")
+            pending = PendingSession(device, cls._executor.submit(create))
+            cls._pending = pending
+            cls.stats.started += 1
+        pending.future.add_done_callback(lambda _: cls._ready(pending))
+        logger.info("Pre-warming the next Appium session on %s", device)
+        return True
+
+    @classmethod
+    def _ready(cls, pending: PendingSession) -> None:
+        """Record a finished creation and schedule its expiry."""
+        pending.ready_at = time.monotonic()
+        if pending.future.exception() is not None:
+            return
+        cls.stats.creation_seconds += pending.ready_at - pending.started_at
+        pending.expiry = threading.Timer(settings.session_prewarm_ttl, cls._expire, args=(pending,))
+        pending.expiry.daemon = True
+        pending.expiry.start()
+
+    @classmethod
+    def _expire(cls, pending: PendingSession) -> None:
+        """Quit a pre-created session nobody took in time."""
+        with cls._lock:
+            if cls._pending is not pending:
+                return
+            cls._pending = None
+        logger.info("Pre-warmed session unused for %ss, quitting it", settings.session_prewarm_ttl)
+        cls._quit(pending)
+
+    @classmethod
+    def take(cls, device: str) -> Optional[webdriver.WebDriver]:
+        """Hand over the pre-created session, waiting if it is still starting.
+
+        Args:
+            device: Device the caller needs a session on.
+
+        Returns:
+            The session, or None if there is none for the device or its
+            creation failed.
+        """
+        with cls._lock:
+            pending, cls._pending = cls._pending, None
+        if pending is None:
+            return None
+        if pending.device != device:
+            cls._quit(pending)
+            return None
+        if pending.expiry is not None:
+            pending.expiry.cancel()
+        waited_from = time.monotonic()
+        try:
+            driver = pending.future.result()
+        except Exception as e:
+            cls.stats.failed += 1
+            logger.warning("Pre-warming a session failed, creating one now: %s", e)
+            return None
+        waited = time.monotonic() - waited_from
+        cls.stats.used += 1
+        cls.stats.waited_seconds += waited
+        # Ready before it was needed: all of it; still starting: the part already done
+        cls.stats.hidden_seconds += (pending.ready_at or time.monotonic()) - pending.started_at - waited
+        logger.info("Using pre-warmed Appium session %s (waited %.2fs)", driver.session_id, waited)
+        return driver
+
+    @classmethod
+    def _quit(cls, pending: PendingSession) -> None:
+        """Quit a pre-created session, waiting for it to finish starting."""
+        if pending.expiry is not None:
+            pending.expiry.cancel()
+        try:
+            driver = pending.future.result()
+        except Exception:
+            cls.stats.failed += 1
+            return
+        cls.stats.discarded += 1
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting unused pre-warmed session: %s", e)
+
+    @classmethod
+    def close(cls) -> PrewarmStats:
+        """Quit a session nobody took, stop the thread and log the statistics.
+
+        Returns:
+            Statistics of this worker's pre-warmed sessions.
+        """
+        with cls._lock:
+            pending, cls._pending = cls._pending, None
+        if pending is not None:
+            cls._quit(pending)
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+        stats = cls.stats
+        if stats.started:
+            logger.info(stats.summary())
+        cls.stats = PrewarmStats()
+        cls._expect_next = True
+        return stats
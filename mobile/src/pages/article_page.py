@@ -1,8 +1,11 @@
 """Article page object for Wikipedia mobile app."""
 
+from typing import List
+
 from selenium.webdriver.common.by import By
 
 from mobile.src.base.base_page import BasePage
+from mobile.src.models.search_model import Article
 from mobile.src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -44,6 +47,25 @@ class ArticlePage(BasePage):
         """
         return self.is_element_displayed(self.ARTICLE_CONTENT)
 
+    def get_article(self) -> Article:
+        """Read the article's title with one page snapshot.
+
+        Returns:
+            Article with its title.
+        """
+        title = self.snapshot().find(self.ARTICLE_TITLE)
+        return Article(title=title.text if title else "")
+
+    def get_table_of_contents(self) -> List[str]:
+        """Read the table of contents entries with one page snapshot.
+
+        Returns:
+            Section titles currently in the hierarchy.
+        """
+        sections = self.snapshot().texts(self.TABLE_OF_CONTENTS)
+        logger.info(f"Table of contents has {len(sections)} entries")
+        return sections
+
     def click_save_button(self) -> None:
         """Click save article button."""
         logger.info("Clicking save article button")
@@ -0,0 +1,96 @@
+"""Article page object for Wikipedia mobile app, driven by the asyncio client."""
+
+from typing import List
+
+from mobile.src.base.async_base_page import AsyncBasePage
+from mobile.src.models.search_model import Article
+from mobile.src.pages.article_page import ArticlePage
+from mobile.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncArticlePage(AsyncBasePage):
+    """``ArticlePage`` for an ``AsyncWebDriver``; locators are shared with it."""
+
+    # Locators
+    ARTICLE_TITLE = ArticlePage.ARTICLE_TITLE
+    ARTICLE_CONTENT = ArticlePage.ARTICLE_CONTENT
+    SAVE_BUTTON = ArticlePage.SAVE_BUTTON
+    SHARE_BUTTON = ArticlePage.SHARE_BUTTON
+    LANGUAGE_BUTTON = ArticlePage.LANGUAGE_BUTTON
+    BACK_BUTTON = ArticlePage.BACK_BUTTON
+    SEARCH_BUTTON = ArticlePage.SEARCH_BUTTON
+    TABLE_OF_CONTENTS = ArticlePage.TABLE_OF_CONTENTS
+
+    async def wait_for_page_load(self) -> None:
+        """Wait for article page to load."""
+        logger.info("Waiting for article page to load")
+        await self.wait.wait_for_element_visible(self.ARTICLE_TITLE, timeout=15)
+        logger.info("Article page loaded")
+
+    async def get_article_title(self) -> str:
+        """Get title of current article.
+
+        Returns:
+            Article title text.
+        """
+        logger.info("Getting article title")
+        return await self.get_text(self.ARTICLE_TITLE)
+
+    async def is_article_content_visible(self) -> bool:
+        """Check if article content is visible.
+
+        Returns:
+            True if article content is displayed.
+        """
+        return await self.is_element_displayed(self.ARTICLE_CONTENT)
+
+    async def get_article(self) -> Article:
+        """Read the article's title with one page snapshot.
+
+        Returns:
+            Article with its title.
+        """
+        title = (await self.snapshot()).find(self.ARTICLE_TITLE)
+        return Article(title=title.text if title else "")
+
+    async def get_table_of_contents(self) -> List[str]:
+        """Read the table of contents entries with one page snapshot.
+
+        Returns:
+            Section titles currently in the hierarchy.
+        """
+        sections = (await self.snapshot()).texts(self.TABLE_OF_CONTENTS)
+        logger.info("Table of contents has %d entries", len(sections))
+        return sections
+
+    async def click_save_button(self) -> None:
+        """Click save article button."""
+        logger.info("Clicking save article button")
+        await self.click(self.SAVE_BUTTON)
+
+    async def click_share_button(self) -> None:
+        """Click share article button."""
+        logger.info("Clicking share button")
+        await self.click(self.SHARE_BUTTON)
+
+    async def click_language_button(self) -> None:
+        """Click language selection button."""
+        logger.info("Clicking language button")
+        await self.click(self.LANGUAGE_BUTTON)
+
+    async def click_back_button(self) -> None:
+        """Click back button to return to previous page."""
+        logger.info("Clicking back button")
+        await self.click(self.BACK_BUTTON)
+
+    async def scroll_down(self) -> None:
+        """Scroll down article page."""
+        logger.info("Scrolling down article")
+        await self.swipe(540, 1000, 540, 400, 500)
+
+    async def scroll_up(self) -> None:
+        """Scroll up article page."""
+        logger.info("Scrolling up article")
+        await self.swipe(540, 400, 540, 1000, 500)
@@ -0,0 +1,54 @@
+"""Home page object for Wikipedia mobile app, driven by the asyncio client."""
+
+from mobile.src.base.async_base_page import AsyncBasePage
+from mobile.src.pages.home_page import HomePage
+from mobile.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncHomePage(AsyncBasePage):
+    """``HomePage`` for an ``AsyncWebDriver``; locators are shared with it."""
+
+    # Locators
+    SEARCH_BOX = HomePage.SEARCH_BOX
+    MENU_BUTTON = HomePage.MENU_BUTTON
+    SETTINGS_BUTTON = HomePage.SETTINGS_BUTTON
+    LANGUAGE_BUTTON = HomePage.LANGUAGE_BUTTON
+    HISTORY_LINK = HomePage.HISTORY_LINK
+    SAVED_LINK = HomePage.SAVED_LINK
+
+    async def wait_for_page_load(self) -> None:
+        """Wait for home page to fully load."""
+        logger.info("Waiting for home page to load")
+        await self.wait.wait_for_element_visible(self.SEARCH_BOX, timeout=15)
+        logger.info("Home page loaded successfully")
+
+    async def click_search_box(self) -> None:
+        """Click on search box to open search."""
+        logger.info("Clicking search box")
+        await self.click(self.SEARCH_BOX)
+
+    async def is_search_box_visible(self) -> bool:
+        """Check if search box is visible."""
+        return await self.is_element_displayed(self.SEARCH_BOX)
+
+    async def click_menu_button(self) -> None:
+        """Click overflow menu button."""
+        logger.info("Clicking menu button")
+        await self.click(self.MENU_BUTTON)
+
+    async def click_language_button(self) -> None:
+        """Click language selection button."""
+        logger.info("Clicking language button")
+        await self.click(self.LANGUAGE_BUTTON)
+
+    async def click_history_tab(self) -> None:
+        """Click history tab."""
+        logger.info("Clicking history tab")
+        await self.click(self.HISTORY_LINK)
+
+    async def click_saved_tab(self) -> None:
+        """Click saved articles tab."""
+        logger.info("Clicking saved tab")
+        await self.click(self.SAVED_LINK)
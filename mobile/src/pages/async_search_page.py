@@ -0,0 +1,109 @@
+"""Search page object for Wikipedia mobile app, driven by the asyncio client."""
+
+from typing import List
+
+from mobile.src.base.async_base_page import AsyncBasePage
+from mobile.src.models.search_model import Article
+from mobile.src.pages.search_page import SearchPage
+from mobile.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncSearchPage(AsyncBasePage):
+    """``SearchPage`` for an ``AsyncWebDriver``; locators are shared with it."""
+
+    # Locators
+    SEARCH_INPUT = SearchPage.SEARCH_INPUT
+    SEARCH_RESULTS = SearchPage.SEARCH_RESULTS
+    RESULT_TITLE = SearchPage.RESULT_TITLE
+    RESULT_DESCRIPTION = SearchPage.RESULT_DESCRIPTION
+    NO_RESULTS_TEXT = SearchPage.NO_RESULTS_TEXT
+    CLEAR_SEARCH_BUTTON = SearchPage.CLEAR_SEARCH_BUTTON
+
+    async def wait_for_page_load(self) -> None:
+        """Wait for search page to load."""
+        logger.info("Waiting for search page to load")
+        await self.wait.wait_for_element_visible(self.SEARCH_INPUT, timeout=10)
+        logger.info("Search page loaded")
+
+    async def enter_search_query(self, query: str) -> None:
+        """Enter search query in search box.
+
+        Args:
+            query: Search query string.
+        """
+        logger.info("Entering search query: %s", query)
+        await self.send_keys(self.SEARCH_INPUT, query)
+
+    async def wait_for_search_results(self, timeout: int = 10) -> None:
+        """Wait for search results to appear.
+
+        Args:
+            timeout: Maximum wait time in seconds.
+        """
+        logger.info("Waiting for search results (timeout: %ss)", timeout)
+        await self.wait.wait_for_element_visible(self.SEARCH_RESULTS, timeout=timeout)
+
+    async def get_search_results_count(self) -> int:
+        """Get number of search results displayed, from one page snapshot.
+
+        Returns:
+            Number of search results.
+        """
+        count = (await self.snapshot()).count(self.SEARCH_RESULTS)
+        logger.info("Search results count: %d", count)
+        return count
+
+    async def get_first_result_title(self) -> str:
+        """Get title of first search result, from one page snapshot.
+
+        Waits for the results list before taking the snapshot.
+
+        Returns:
+            Title of first search result, or an empty string if it has none.
+
+        Raises:
+            TimeoutException: If no search result becomes visible.
+        """
+        logger.info("Getting first search result title")
+        await self.wait.wait_for_element_visible(self.SEARCH_RESULTS)
+        title = (await self.snapshot()).find(self.RESULT_TITLE)
+        return title.text if title else ""
+
+    async def get_search_results(self) -> List[Article]:
+        """Read all visible search results with one page snapshot.
+
+        Returns:
+            Articles with title and description, in display order.
+        """
+        snapshot = await self.snapshot()
+        results = []
+        for item in snapshot.find_all(self.SEARCH_RESULTS):
+            title = item.find(self.RESULT_TITLE)
+            description = item.find(self.RESULT_DESCRIPTION)
+            results.append(Article(
+                title=title.text if title else "",
+                description=description.text if description else None,
+            ))
+        logger.info("Read %d search results from snapshot", len(results))
+        return results
+
+    async def click_first_result(self) -> None:
+        """Click first search result."""
+        logger.info("Clicking first search result")
+        first_result = (await self.find_elements(self.SEARCH_RESULTS))[0]
+        await first_result.click()
+
+    async def is_no_results_displayed(self) -> bool:
+        """Check if no results message is displayed.
+
+        Returns:
+            True if no results message is visible.
+        """
+        return await self.is_element_displayed(self.NO_RESULTS_TEXT)
+
+    async def clear_search(self) -> None:
+        """Clear search box."""
+        logger.info("Clearing search")
+        await self.click(self.CLEAR_SEARCH_BUTTON)
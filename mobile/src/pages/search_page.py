@@ -4,6 +4,7 @@ from typing import List
 from selenium.webdriver.common.by import By
 
 from mobile.src.base.base_page import BasePage
+from mobile.src.models.search_model import Article
 from mobile.src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,29 +46,55 @@ class SearchPage(BasePage):
         self.wait.wait_for_element_visible(self.SEARCH_RESULTS, timeout=timeout)
 
     def get_search_results_count(self) -> int:
-        """Get number of search results displayed.
+        """Get number of search results displayed, from one page snapshot.
 
         Returns:
             Number of search results.
         """
-        results = self.find_elements(self.SEARCH_RESULTS)
-        logger.info(f"Search results count: {len(results)}")
-        return len(results)
+        count = self.snapshot().count(self.SEARCH_RESULTS)
+        logger.info(f"Search results count: {count}")
+        return count
 
     def get_first_result_title(self) -> str:
-        """Get title of first search result.
+        """Get title of first search result, from one page snapshot.
+
+        Waits for the results list before taking the snapshot.
 
         Returns:
-            Title of first search result.
+            Title of first search result, or an empty string if it has none.
+
+        Raises:
+            TimeoutException: If no search result becomes visible.
         """
         logger.info("Getting first search result title")
-        return self.get_text(self.RESULT_TITLE)
+        self.wait.wait_for_element_visible(self.SEARCH_RESULTS)
+        title = self.snapshot().find(self.RESULT_TITLE)
+        return title.text if title else ""
+
+    def get_search_results(self) -> List[Article]:
+        """Read all visible search results with one page snapshot.
+
+        Returns:
+            Articles with title and description, in display order.
+        """
+        snapshot = self.snapshot()
+        results = []
+        for item in snapshot.find_all(self.SEARCH_RESULTS):
+            title = item.find(self.RESULT_TITLE)
+            description = item.find(self.RESULT_DESCRIPTION)
+            results.append(Article(
+                title=title.text if title else "",
+                description=description.text if description else None,
+            ))
+        logger.info(f"Read {len(results)} search results from snapshot")
+        return results
 
     def click_first_result(self) -> None:
         """Click first search result."""
         logger.info("Clicking first search result")
         first_result = self.find_elements(self.SEARCH_RESULTS)[0]
         first_result.click()
+        self.screen_may_change()
 
     def is_no_results_displayed(self) -> bool:
         """Check if no results message is displayed.
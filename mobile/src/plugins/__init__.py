@@ -0,0 +1,12 @@
+"""Pytest plugins for mobile testing framework."""
+
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .failure_capture import FailureCapturePlugin
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "FailureCapturePlugin": "failure_capture",
+})
@@ -1,6 +1,18 @@
 """Utilities module for mobile testing framework."""
-from .logger import get_logger
-from .assertions import CustomAssertions
-from .screenshot import ScreenshotHandler
 
-__all__ = ["get_logger", "CustomAssertions", "ScreenshotHandler"]
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .logger import get_logger
+    from .assertions import CustomAssertions
+    from .screenshot import ScreenshotHandler
+    from .artifact_writer import ArtifactWriter
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "get_logger": "logger",
+    "CustomAssertions": "assertions",
+    "ScreenshotHandler": "screenshot",
+    "ArtifactWriter": "artifact_writer",
+})
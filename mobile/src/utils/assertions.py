@@ -1,10 +1,14 @@
 """Custom assertions for mobile tests."""
 
-from typing import Any, Optional
-from appium.webdriver.webdriver import WebDriver
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
 
 from mobile.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
 logger = get_logger(__name__)
 
 
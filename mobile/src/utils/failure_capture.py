@@ -0,0 +1,182 @@
+"""In-memory capture of a test's screenshots and screen recording, written only if the test fails."""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Deque, Optional, Tuple, Union
+
+from mobile.config.settings import settings
+from mobile.src.utils.artifact_writer import ArtifactWriter
+from mobile.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
+logger = get_logger(__name__)
+
+
+class CaptureBuffer:
+    """Ring buffer of named binary items, capped by count and total size.
+
+    Appending beyond either cap evicts the oldest items.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int) -> None:
+        """Initialize CaptureBuffer.
+
+        Args:
+            max_items: Maximum number of items kept.
+            max_bytes: Maximum total size of the kept items.
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evicted = 0
+        self._items: Deque[Tuple[str, Union[bytes, str]]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, name: str, data: Union[bytes, str]) -> None:
+        """Add an item, evicting the oldest ones to stay within the caps.
+
+        Args:
+            name: Item name, used for the file name when written.
+            data: Raw or base64-encoded bytes.
+        """
+        if self.max_items <= 0 or len(data) > self.max_bytes:
+            self.evicted += 1
+            return
+        self._items.append((name, data))
+        self.size += len(data)
+        while len(self._items) > self.max_items or self.size > self.max_bytes:
+            _, dropped = self._items.popleft()
+            self.size -= len(dropped)
+            self.evicted += 1
+
+    def drain(self) -> Tuple[Tuple[str, Union[bytes, str]], ...]:
+        """Return all items, oldest first, and empty the buffer."""
+        items = tuple(self._items)
+        self._items.clear()
+        self.size = 0
+        return items
+
+
+class FailureCapture:
+    """Keeps a test's recent visual state off disk and writes it on failure.
+
+    With ``SCREENSHOT_ON_FAILURE=true``:
+
+    * ``take_screenshot`` images (base64, as the driver returns them) go to
+      a ring buffer instead of disk;
+    * the device records the screen (``start_recording_screen``,
+      ``FAILURE_RECORDING``); the video stays on the device, capped by
+      ``FAILURE_RECORDING_SECONDS`` and ``FAILURE_RECORDING_BIT_RATE``;
+    * when the test fails (reported by ``FailureCapturePlugin``),
+      ``finish`` takes a final screenshot, fetches the recording and hands
+      everything to the ``ArtifactWriter``. Passing tests write nothing;
+      their recording is stopped and discarded, so none keeps running
+      after the last test.
+
+    ``FAILURE_BUFFER_SCREENSHOTS`` and ``FAILURE_BUFFER_MB`` cap the memory
+    held per test.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        """Initialize FailureCapture.
+
+        Args:
+            driver: Appium WebDriver instance of the test.
+        """
+        self.driver = driver
+        self.enabled = settings.screenshot_on_failure
+        max_bytes = int(settings.failure_buffer_mb * 1024 * 1024)
+        self.screenshots = CaptureBuffer(settings.failure_buffer_screenshots, max_bytes)
+        self.failed_phase: Optional[str] = None
+        self.test_id = ""
+        self._recording = False
+
+    def start(self) -> None:
+        """Start recording the screen, if enabled and supported by the device."""
+        if not (self.enabled and settings.failure_recording):
+            return
+        try:
+            self.driver.start_recording_screen(
+                timeLimit=settings.failure_recording_seconds,
+                bitRate=settings.failure_recording_bit_rate,
+                forcedRestart=True,
+            )
+            self._recording = True
+        except Exception as e:
+            logger.warning("Screen recording not available: %s", e)
+
+    def add_screenshot(self, name: str, data: str) -> None:
+        """Keep a screenshot in memory until the test's outcome is known.
+
+        Args:
+            name: Screenshot name.
+            data: Base64-encoded PNG.
+        """
+        self.screenshots.append(name, data)
+
+    def mark_failed(self, when: str, test_id: str) -> None:
+        """Record that a test phase failed.
+
+        Args:
+            when: Failed phase ("setup" or "call").
+            test_id: Pytest node id, names the artifact directory.
+        """
+        if self.failed_phase is None:
+            self.failed_phase = when
+            self.test_id = test_id
+
+    def finish(self) -> Optional[Path]:
+        """Write the screenshots and recording if the test failed.
+
+        Returns:
+            Directory the artifacts were queued to, or None if nothing was written.
+        """
+        if self.failed_phase is None or not self.enabled:
+            self.screenshots.drain()
+            try:
+                self._stop_recording()
+            except Exception as e:
+                logger.debug("Could not stop screen recording: %s", e)
+            return None
+
+        name = re.sub(r"[^\w.-]+", "_", self.test_id).strip("_")
+        directory = Path(settings.report_dir) / "failures" / name
+        try:
+            ArtifactWriter.submit_image(self.driver.get_screenshot_as_base64(), directory, "failure")
+        except Exception as e:
+            logger.warning("Failed to take failure screenshot: %s", e)
+        screenshots = self.screenshots.drain()
+        for name, data in screenshots:
+            ArtifactWriter.submit_image(data, directory, name)
+        recording = None
+        try:
+            video = self._stop_recording()
+            if video:
+                recording = ArtifactWriter.submit_file(video, directory, "recording", ".mp4")
+        except Exception as e:
+            logger.warning("Failed to fetch screen recording: %s", e)
+        logger.info(
+            "Test failed in %s: failure screenshot, %d screenshots%s queued to %s",
+            self.failed_phase, len(screenshots), " and recording" if recording else "", directory,
+        )
+        return directory
+
+    def _stop_recording(self) -> Optional[str]:
+        """Stop the screen recording, if one is running.
+
+        Returns:
+            Base64-encoded video, or None if nothing was recorded.
+        """
+        if not self._recording:
+            return None
+        self._recording = False
+        video = self.driver.stop_recording_screen()
+        # Appium sends base64 text; the client annotates it as bytes
+        return video.decode() if isinstance(video, bytes) else video
@@ -0,0 +1,325 @@
+"""Propose faster equivalents of page-object locators, verified on page snapshots.
+
+Generic XPath makes UiAutomator2 serialize the whole hierarchy for every
+lookup. Most XPath locators in page objects only select on class,
+resource id, text or content description, which ``By.ID``, accessibility
+id or a combined ``UiSelector`` express natively. For every such locator
+a replacement is proposed and evaluated against page sources captured
+with ``LOCATOR_PROFILE=true``: it is verified only if it matches exactly
+the same nodes as the original on every snapshot, and at least one
+snapshot contains a match. ``--apply`` rewrites verified locators in the
+page-object source.
+
+Usage:
+    LOCATOR_PROFILE=true pytest mobile/tests
+    python -m mobile.src.utils.locator_optimizer
+    python -m mobile.src.utils.locator_optimizer --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import pkgutil
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from mobile.config.settings import settings
+from mobile.src.base.base_page import BasePage
+from mobile.src.base.locator_profiler import LocatorProfiler, LocatorTiming
+from mobile.src.base.page_snapshot import PageSnapshot
+from mobile.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Locator strategies as By/AppiumBy values, and their source spelling for --apply
+STRATEGY_SOURCE = {
+    "id": "By.ID",
+    "accessibility id": "AppiumBy.ACCESSIBILITY_ID",
+    "-android uiautomator": "AppiumBy.ANDROID_UIAUTOMATOR",
+}
+
+APPIUM_BY_IMPORT = "from appium.webdriver.common.appiumby import AppiumBy"
+
+# XPath attribute -> UiSelector method per comparison
+_UI_SELECTOR_METHODS = {
+    ("resource-id", "equals"): "resourceId",
+    ("text", "equals"): "text",
+    ("text", "contains"): "textContains",
+    ("text", "starts-with"): "textStartsWith",
+    ("content-desc", "equals"): "description",
+    ("content-desc", "contains"): "descriptionContains",
+    ("content-desc", "starts-with"): "descriptionStartsWith",
+}
+
+_XPATH = re.compile(r"^//(?P<cls>[\w.$]+|\*)(?P<predicates>(?:\[[^\[\]]+\])*)$")
+_PREDICATE = re.compile(r"\[([^\[\]]+)\]")
+_EQUALS = re.compile(r"""^@(?P<attr>[\w-]+)\s*=\s*(?P<q>['"])(?P<value>(?:(?!(?P=q)).)*)(?P=q)$""")
+_FUNCTION = re.compile(
+    r"""^(?P<fn>contains|starts-with)\(\s*@(?P<attr>[\w-]+)\s*,\s*(?P<q>['"])(?P<value>(?:(?!(?P=q)).)*)(?P=q)\s*\)$"""
+)
+
+
+@dataclass(frozen=True)
+class LocatorRef:
+    """A locator constant of a page-object class."""
+
+    owner: str
+    name: str
+    locator: tuple
+    path: Path
+
+    @property
+    def qualname(self) -> str:
+        """``Class.ATTRIBUTE`` of the locator."""
+        return f"{self.owner}.{self.name}"
+
+
+@dataclass
+class Proposal:
+    """Replacement proposed for one locator and how it fared on the snapshots."""
+
+    ref: LocatorRef
+    candidate: Optional[tuple]
+    status: str
+    detail: str = ""
+    timing: Optional[LocatorTiming] = None
+
+
+def scan_page_objects(package: str = "mobile.src.pages") -> List[LocatorRef]:
+    """Collect the ``(By, value)`` class attributes of all page objects in a package.
+
+    Args:
+        package: Dotted package whose modules define ``BasePage`` subclasses.
+
+    Returns:
+        Locators in module and definition order.
+    """
+    refs = []
+    root = importlib.import_module(package)
+    for info in pkgutil.iter_modules(root.__path__):
+        module = importlib.import_module(f"{package}.{info.name}")
+        for owner, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__ or not issubclass(cls, BasePage):
+                continue
+            for name, value in vars(cls).items():
+                if name.isupper() and _is_locator(value):
+                    refs.append(LocatorRef(owner, name, value, Path(inspect.getfile(module))))
+    return refs
+
+
+def _is_locator(value: object) -> bool:
+    return (
+        isinstance(value, tuple) and len(value) == 2
+        and all(isinstance(part, str) for part in value)
+    )
+
+
+def candidates(locator: tuple) -> List[tuple]:
+    """Faster locators that may select the same elements, preferred first.
+
+    Only ``//Class[...]`` XPath with ``@attr='value'``, ``contains()`` and
+    ``starts-with()`` predicates on resource id, text and content
+    description is translated; anything else (axes, indexes, ``or``) is left
+    alone.
+
+    Args:
+        locator: Tuple of (By, value).
+
+    Returns:
+        ID or accessibility id if one attribute decides the match, then the
+        equivalent combined ``UiSelector``; empty if there is none.
+    """
+    by, value = locator
+    match = _XPATH.match(value) if by == "xpath" else None
+    terms = _predicate_terms(match.group("predicates")) if match else None
+    if not terms:
+        return []
+    assert match is not None
+
+    proposals = []
+    if len(terms) == 1 and terms[0][1] == "equals":
+        attr, _, expected = terms[0]
+        if attr == "resource-id":
+            proposals.append(("id", expected))
+        elif attr == "content-desc":
+            proposals.append(("accessibility id", expected))
+    selector = "new UiSelector()"
+    if match.group("cls") != "*":
+        selector += f'.className("{match.group("cls")}")'
+    for attr, op, expected in terms:
+        escaped = expected.replace("\\", "\\\\").replace('"', '\\"')
+        selector += f'.{_UI_SELECTOR_METHODS[(attr, op)]}("{escaped}")'
+    proposals.append(("-android uiautomator", selector))
+    return proposals
+
+
+def _predicate_terms(predicates: str) -> Optional[List[Tuple[str, str, str]]]:
+    """Parse ``[...]`` predicates into (attribute, comparison, value) terms.
+
+    Returns:
+        The terms, or None if any term has no ``UiSelector`` equivalent.
+    """
+    terms = []
+    for predicate in _PREDICATE.findall(predicates):
+        for term in re.split(r"\s+and\s+", predicate.strip()):
+            equals, function = _EQUALS.match(term), _FUNCTION.match(term)
+            if equals:
+                terms.append((equals.group("attr"), "equals", equals.group("value")))
+            elif function:
+                terms.append((function.group("attr"), function.group("fn"), function.group("value")))
+            else:
+                return None
+    if any((attr, op) not in _UI_SELECTOR_METHODS for attr, op, _ in terms):
+        return None
+    return terms
+
+
+def verify(original: tuple, candidate: tuple, snapshots: Sequence[PageSnapshot]) -> Tuple[str, str]:
+    """Check that a candidate selects the same nodes as the original on every snapshot.
+
+    Args:
+        original: Current locator.
+        candidate: Proposed replacement.
+        snapshots: Page sources captured during test runs.
+
+    Returns:
+        Status (``verified``, ``mismatch`` or ``unverified``) and detail.
+    """
+    matched = 0
+    for snapshot in snapshots:
+        try:
+            expected = [(e.tag, e.attributes) for e in snapshot.find_all(original)]
+            actual = [(e.tag, e.attributes) for e in snapshot.find_all(candidate)]
+        except ValueError as e:
+            return "unverified", str(e)
+        if expected != actual:
+            return "mismatch", f"{len(actual)} matches instead of {len(expected)} on a snapshot"
+        matched += bool(expected)
+    if not matched:
+        return "unverified", "no snapshot contains a match"
+    return "verified", f"same nodes on {len(snapshots)} snapshots ({matched} with matches)"
+
+
+def optimize(
+    refs: Sequence[LocatorRef],
+    snapshots: Sequence[PageSnapshot],
+    timings: Optional[Dict[tuple, LocatorTiming]] = None,
+) -> List[Proposal]:
+    """Propose a replacement for every locator that has one.
+
+    The first verified candidate wins; if none verifies, the first
+    candidate is reported with its status.
+
+    Args:
+        refs: Page-object locators.
+        snapshots: Page sources to verify against.
+        timings: Measured lookup latency per locator, if profiled.
+
+    Returns:
+        One proposal per locator, slowest measured first.
+    """
+    timings = timings or {}
+    proposals = []
+    for ref in refs:
+        timing = timings.get(tuple(ref.locator))
+        options = candidates(ref.locator)
+        if not options:
+            detail = "already native" if ref.locator[0] != "xpath" else "no native equivalent"
+            proposals.append(Proposal(ref, None, "kept", detail, timing))
+            continue
+        checked = [
+            Proposal(ref, option, *verify(ref.locator, option, snapshots), timing=timing)
+            for option in options
+        ]
+        proposals.append(next((p for p in checked if p.status == "verified"), checked[0]))
+    return sorted(proposals, key=lambda p: p.timing.median if p.timing else 0.0, reverse=True)
+
+
+def apply(proposals: Sequence[Proposal]) -> List[Proposal]:
+    """Rewrite verified locators in the page-object source files.
+
+    Args:
+        proposals: Result of ``optimize``.
+
+    Returns:
+        The proposals that were applied.
+    """
+    applied = []
+    for proposal in proposals:
+        if proposal.status != "verified" or proposal.candidate is None:
+            continue
+        ref, (by, value) = proposal.ref, proposal.candidate
+        source = ref.path.read_text()
+        pattern = re.compile(
+            rf"^(?P<head>\s*{ref.name}\s*=\s*)\(By\.XPATH,\s*(?P<q>['\"]){re.escape(ref.locator[1])}(?P=q)\)",
+            re.MULTILINE,
+        )
+        if len(pattern.findall(source)) != 1:
+            logger.warning("Skipping %s: definition not found exactly once in %s", ref.qualname, ref.path)
+            continue
+        replacement = f"({STRATEGY_SOURCE[by]}, {_literal(value)})"
+        source = pattern.sub(lambda m: m.group("head") + replacement, source)
+        if "AppiumBy." in replacement and APPIUM_BY_IMPORT not in source:
+            source = source.replace(
+                "from selenium.webdriver.common.by import By\n",
+                f"{APPIUM_BY_IMPORT}\nfrom selenium.webdriver.common.by import By\n",
+                1,
+            )
+        ref.path.write_text(source)
+        applied.append(proposal)
+        logger.info("Rewrote %s to %s", ref.qualname, replacement)
+    return applied
+
+
+def _literal(value: str) -> str:
+    """Python string literal in the page objects' quoting style."""
+    if '"' not in value:
+        return f'"{value}"'
+    return repr(value)
+
+
+def load_snapshots(directory: Path, app_package: str = "") -> List[PageSnapshot]:
+    """Parse every ``*.xml`` page source in a directory.
+
+    Args:
+        directory: ``LOCATOR_SNAPSHOT_DIR`` of a profiled run.
+        app_package: Package prefixed to bare resource ids.
+    """
+    return [
+        PageSnapshot(path.read_text(encoding="utf-8"), app_package)
+        for path in sorted(directory.glob("*.xml"))
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--package", default="mobile.src.pages", help="package with page objects")
+    parser.add_argument("--snapshots", default=settings.locator_snapshot_dir, help="directory of page sources")
+    parser.add_argument("--profile", default=settings.locator_profile_file, help="locator profile JSON")
+    parser.add_argument("--apply", action="store_true", help="rewrite verified locators in place")
+    args = parser.parse_args(argv)
+
+    snapshots = load_snapshots(Path(args.snapshots), settings.android_package_name)
+    proposals = optimize(
+        scan_page_objects(args.package), snapshots, LocatorProfiler.read(Path(args.profile))
+    )
+    print(f"{len(proposals)} locators, {len(snapshots)} snapshots from {args.snapshots}")
+    for proposal in proposals:
+        timing = proposal.timing
+        measured = f"{timing.median * 1000:7.1f}ms x{timing.lookups:<4}" if timing else f"{'-':>9}{'':<6}"
+        print(f"{measured}  {proposal.ref.qualname:<32} {proposal.status:<10} {proposal.ref.locator[0]}")
+        if proposal.candidate:
+            print(f"{'':<17}-> {proposal.candidate[0]}: {proposal.candidate[1]}")
+            print(f"{'':<17}   {proposal.detail}")
+    if args.apply:
+        applied = apply(proposals)
+        print(f"Applied {len(applied)} verified replacements")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
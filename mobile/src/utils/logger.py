@@ -1,20 +1,26 @@
 """Logging configuration and utilities."""
 
-import os
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
 
+from common.logging_pipeline import (
+    configure_pipeline,
+    log_file_path,
+    merge_worker_logs,
+    shutdown_logging,
+)
 from mobile.config.settings import settings
 
-# Create logs directory
-LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
+_FILE_FORMAT = (
+    "%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+)
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get configured logger instance.
 
+    Records go through one shared queue: the caller only enqueues them, and a
+    listener thread formats them and writes the console and file output.
+
     Args:
         name: Logger name (typically __name__).
 
@@ -24,34 +30,10 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(settings.log_level)
 
-    # Skip if handlers already configured
-    if logger.handlers:
-        return logger
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(settings.log_level)
-    console_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(console_formatter)
-
-    # File handler
-    log_file = LOGS_DIR / "test_execution.log"
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_handler.setFormatter(file_formatter)
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # The queue handler sits on the top-level package logger; module loggers propagate to it
+    package_logger = logging.getLogger(name.split(".")[0])
+    handler = configure_pipeline(settings.log_level, _FILE_FORMAT)
+    if handler not in package_logger.handlers:
+        package_logger.addHandler(handler)
 
     return logger
@@ -1,13 +1,20 @@
 """Screenshot capture and management utilities."""
 
-from pathlib import Path
-from datetime import datetime
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-from appium.webdriver.webdriver import WebDriver
+from pathlib import Path
 
 from mobile.config.settings import settings
+from mobile.src.utils.artifact_writer import ArtifactWriter
 from mobile.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
+    from mobile.src.driver.async_client import AsyncWebDriver
+
 logger = get_logger(__name__)
 
 
@@ -25,22 +32,55 @@ class ScreenshotHandler:
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
 
     def take_screenshot(self, name: str = "screenshot") -> str:
-        """Take and save screenshot.
+        """Capture a screenshot and queue it for writing.
+
+        Only the capture happens here; encoding and the disk write run on
+        the ``ArtifactWriter`` threads.
 
         Args:
             name: Name for screenshot file (without extension).
 
         Returns:
-            Path to saved screenshot file.
+            Path of the screenshot file, written by the time the test's
+            teardown has flushed the writer.
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = self.screenshot_dir / filename
-
-            self.driver.save_screenshot(str(filepath))
-            logger.info(f"Screenshot saved: {filepath}")
+            data = self.driver.get_screenshot_as_base64()
+            filepath = ArtifactWriter.submit_image(data, self.screenshot_dir, name)
+            logger.info("Screenshot queued: %s", filepath)
             return str(filepath)
         except Exception as e:
             logger.error(f"Failed to take screenshot: {str(e)}")
             raise
+
+
+class AsyncScreenshotHandler:
+    """Screenshot capture for an ``AsyncWebDriver``; the capture is awaited."""
+
+    def __init__(self, driver: AsyncWebDriver) -> None:
+        """Initialize AsyncScreenshotHandler.
+
+        Args:
+            driver: Async Appium session.
+        """
+        self.driver = driver
+        self.screenshot_dir = Path(settings.report_dir) / "screenshots"
+        self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+
+    async def take_screenshot(self, name: str = "screenshot") -> str:
+        """Capture a screenshot and queue it for writing.
+
+        Args:
+            name: Name for screenshot file (without extension).
+
+        Returns:
+            Path of the screenshot file, written once the writer is flushed.
+        """
+        try:
+            data = await self.driver.get_screenshot_as_base64()
+            filepath = ArtifactWriter.submit_image(data, self.screenshot_dir, name)
+            logger.info("Screenshot queued: %s", filepath)
+            return str(filepath)
+        except Exception as e:
+            logger.error("Failed to take screenshot: %s", e)
+            raise
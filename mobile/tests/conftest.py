@@ -4,20 +4,55 @@ import pytest
 import yaml
 from pathlib import Path
 
+from mobile.src.base.adaptive_wait import AdaptiveWait
+from mobile.src.base.element_cache import ElementCache
+from mobile.src.base.locator_profiler import LocatorProfiler
+from mobile.src.driver.command_timings import CommandTimings
 from mobile.src.driver.driver_factory import DriverFactory
 from mobile.src.driver.driver_manager import DriverManager
-from mobile.src.utils.logger import get_logger
+from mobile.src.driver.session_prewarmer import SessionPrewarmer
+from mobile.src.plugins.failure_capture import FailureCapturePlugin
+from mobile.src.utils.action_trace import ActionTrace
+from mobile.src.utils.artifact_writer import ArtifactWriter
+from mobile.src.utils.logger import get_logger, merge_worker_logs, shutdown_logging
 from mobile.config.settings import settings
 
 logger = get_logger(__name__)
 
 # Register markers
 def pytest_configure(config):
-    """Register custom pytest markers."""
+    """Register custom pytest markers and plugins."""
     config.addinivalue_line("markers", "smoke: smoke tests")
     config.addinivalue_line("markers", "regression: regression tests")
     config.addinivalue_line("markers", "integration: integration tests")
     config.addinivalue_line("markers", "slow: slow tests")
+    config.pluginmanager.register(FailureCapturePlugin(), "mobile-failure-capture")
+    if ActionTrace.enabled():
+        ActionTrace.install()
+
+
+def pytest_runtest_protocol(item, nextitem):
+    """Tag action spans with the test, and tell the session pre-warmer whether another follows."""
+    ActionTrace.test_id = item.nodeid
+    SessionPrewarmer.expect_next(nextitem is not None)
+
+
+def pytest_unconfigure(config):
+    """Quit a reused session, save wait history, profiles, timings and traces, flush artifacts and logs.
+
+    Worker logs are merged by the controller process.
+    """
+    DriverFactory.shutdown()
+    CommandTimings.close()
+    AdaptiveWait.close()
+    ElementCache.close()
+    LocatorProfiler.close()
+    ActionTrace.close()
+    ArtifactWriter.close()
+    shutdown_logging()
+    if not hasattr(config, "workerinput"):
+        ActionTrace.merge_worker_traces()
+        merge_worker_logs()
 
 
 @pytest.fixture(scope="session")
@@ -44,10 +79,11 @@ def driver():
         Configured Appium WebDriver.
     """
     logger.info("Creating driver fixture")
-    driver = DriverFactory.create_driver()
+    driver = DriverFactory.acquire_driver()
     yield driver
     logger.info("Closing driver fixture")
-    DriverFactory.quit_driver()
+    ElementCache.release(driver)
+    DriverFactory.release_driver()
     DriverManager.reset_singleton()
 
 
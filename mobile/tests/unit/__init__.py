@@ -0,0 +1 @@
+"""Offline unit tests: no device or Appium server needed."""
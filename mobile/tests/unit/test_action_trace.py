@@ -0,0 +1,55 @@
+"""Unit tests for action spans of page-object subclasses."""
+
+import pytest
+
+from mobile.config.settings import settings
+from mobile.src.base.base_page import BasePage
+from mobile.src.utils.action_trace import ActionTrace
+
+
+class LoadedPage(BasePage):
+    """Defined before tracing is installed."""
+
+    def wait_for_page_load(self) -> None:
+        self.click(("id", "org.wikipedia:id/search_container"))
+
+    def click(self, locator: tuple) -> None:
+        pass
+
+
+ORIGINAL = LoadedPage.__dict__["wait_for_page_load"]
+
+
+@pytest.fixture
+def trace(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "action_trace_file", str(tmp_path / "action_trace.json"))
+    ActionTrace.install()
+    yield ActionTrace.spans
+    ActionTrace.uninstall()
+    ActionTrace.spans.clear()
+
+
+def test_overrides_are_traced(trace):
+    class LatePage(BasePage):
+        """Defined after tracing is installed."""
+
+        def wait_for_page_load(self) -> None:
+            pass
+
+    LoadedPage.__new__(LoadedPage).wait_for_page_load()
+    LatePage.__new__(LatePage).wait_for_page_load()
+
+    # The nested click ends first
+    assert [(span[2], span[5]) for span in trace] == [
+        ("LoadedPage.click", ("id", "org.wikipedia:id/search_container")),
+        ("LoadedPage.wait_for_page_load", None),
+        ("LatePage.wait_for_page_load", None),
+    ]
+
+
+def test_uninstall_restores_overrides(trace):
+    assert LoadedPage.wait_for_page_load is not ORIGINAL
+
+    ActionTrace.uninstall()
+
+    assert LoadedPage.wait_for_page_load is ORIGINAL
@@ -0,0 +1,45 @@
+"""Unit tests for the persisted wait history."""
+
+import json
+
+import pytest
+
+from mobile.config.settings import settings
+from mobile.src.base.adaptive_wait import HISTORY_SMOOTHING, WaitHistory
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    path = tmp_path / "wait_history.json"
+    monkeypatch.setattr(settings, "wait_history_file", str(path))
+    monkeypatch.setattr(WaitHistory, "_entries", None)
+    monkeypatch.setattr(WaitHistory, "_dirty", False)
+    return path
+
+
+def test_record_keeps_moving_average(history_file):
+    key = WaitHistory.key(("id", "org.wikipedia:id/search_container"), "visibility_of_element_located")
+
+    WaitHistory.record(key, 1.0)
+    WaitHistory.record(key, 2.0)
+
+    assert WaitHistory.typical(key) == pytest.approx(1.0 + HISTORY_SMOOTHING)
+    assert WaitHistory.typical("unknown") is None
+
+
+def test_save_merges_entries_of_other_workers(history_file):
+    WaitHistory.record("mine", 0.5)
+    history_file.write_text(json.dumps({"theirs": {"seconds": 2.0, "samples": 3}}))
+
+    WaitHistory.save()
+
+    assert json.loads(history_file.read_text()) == {
+        "mine": {"seconds": 0.5, "samples": 1},
+        "theirs": {"seconds": 2.0, "samples": 3},
+    }
+
+
+def test_unreadable_history_is_ignored(history_file):
+    history_file.write_text("{not json")
+
+    assert WaitHistory.typical("mine") is None
@@ -0,0 +1,87 @@
+"""Unit tests for BasePage actions on cached elements."""
+
+from mobile.src.base.base_page import BasePage
+
+SEARCH_INPUT = ("id", "org.wikipedia:id/search_src_text")
+
+
+class FakeElement:
+    """Element that records what was typed into it."""
+
+    def __init__(self, displayed: bool) -> None:
+        self.displayed = displayed
+        self.typed = None
+
+    def is_displayed(self) -> bool:
+        return self.displayed
+
+    def clear(self) -> None:
+        self.typed = ""
+
+    def send_keys(self, text: str) -> None:
+        self.typed = text
+
+
+class FakeCache:
+    """Element cache holding one element."""
+
+    def __init__(self, element: FakeElement) -> None:
+        self.element = element
+        self.screen_changes = 0
+
+    def get(self, locator: tuple) -> FakeElement:
+        return self.element
+
+    def put(self, locator: tuple, element: FakeElement) -> None:
+        self.element = element
+
+    def screen_may_change(self) -> None:
+        self.screen_changes += 1
+
+
+class FakeWait:
+    """Wait handler that resolves to a visible element."""
+
+    def __init__(self) -> None:
+        self.resolved = FakeElement(displayed=True)
+        self.calls = 0
+
+    def wait_for_element_visible(self, locator: tuple) -> FakeElement:
+        self.calls += 1
+        return self.resolved
+
+
+def page_with(cached: FakeElement) -> BasePage:
+    page = BasePage.__new__(BasePage)
+    page.elements = FakeCache(cached)
+    page.wait = FakeWait()
+    return page
+
+
+def test_send_keys_uses_displayed_cached_element():
+    cached = FakeElement(displayed=True)
+    page = page_with(cached)
+
+    page.send_keys(SEARCH_INPUT, "Python")
+
+    assert cached.typed == "Python"
+    assert page.wait.calls == 0
+
+
+def test_send_keys_waits_when_cached_element_is_hidden():
+    hidden = FakeElement(displayed=False)
+    page = page_with(hidden)
+
+    page.send_keys(SEARCH_INPUT, "Python")
+
+    assert hidden.typed is None
+    assert page.wait.resolved.typed == "Python"
+    assert page.elements.element is page.wait.resolved
+
+
+def test_send_keys_marks_screen_as_changed():
+    page = page_with(FakeElement(displayed=True))
+
+    page.send_keys(SEARCH_INPUT, "Python")
+
+    assert page.elements.screen_changes == 1
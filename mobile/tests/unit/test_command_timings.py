@@ -0,0 +1,30 @@
+"""Unit tests for command latency histograms."""
+
+from mobile.src.driver.command_timings import CommandStats
+
+
+def test_percentile_is_upper_bound_of_bucket():
+    stats = CommandStats()
+    for milliseconds in [3] * 90 + [150] * 9 + [700]:
+        stats.add(milliseconds / 1000, ok=True, sent=0, received=0)
+
+    assert stats.percentile(0.5) == 5
+    assert stats.percentile(0.95) == 200
+    # The last bucket is capped by the slowest command
+    assert stats.percentile(1.0) == 700
+
+
+def test_percentile_of_empty_stats():
+    assert CommandStats().percentile(0.5) == 0.0
+
+
+def test_merge_adds_buckets():
+    fast, slow = CommandStats(), CommandStats()
+    fast.add(0.001, ok=True, sent=10, received=20)
+    slow.add(0.3, ok=False, sent=10, received=0)
+
+    fast.merge(slow)
+
+    assert (fast.count, fast.errors, fast.bytes_sent) == (2, 1, 20)
+    assert fast.percentile(0.5) == 1
+    assert fast.percentile(1.0) == 300
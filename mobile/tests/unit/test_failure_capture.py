@@ -0,0 +1,61 @@
+"""Unit tests for the device screen recording of failure capture."""
+
+import pytest
+
+from mobile.config.settings import settings
+from mobile.src.utils.artifact_writer import ArtifactWriter
+from mobile.src.utils.failure_capture import FailureCapture
+
+
+class FakeDriver:
+    """Driver whose screen recording runs until it is stopped."""
+
+    def __init__(self) -> None:
+        self.recording = False
+
+    def start_recording_screen(self, **options) -> None:
+        self.recording = True
+
+    def stop_recording_screen(self) -> str:
+        self.recording = False
+        return "AAAA"
+
+    def get_screenshot_as_base64(self) -> str:
+        return "iVBORw0KGgo="
+
+
+@pytest.fixture
+def queued(monkeypatch, tmp_path):
+    """Record artifacts handed to the writer instead of writing them."""
+    monkeypatch.setattr(settings, "screenshot_on_failure", True)
+    monkeypatch.setattr(settings, "failure_recording", True)
+    monkeypatch.setattr(settings, "report_dir", str(tmp_path))
+    files = []
+    monkeypatch.setattr(ArtifactWriter, "submit_image", lambda data, directory, name: files.append(name))
+    monkeypatch.setattr(
+        ArtifactWriter, "submit_file", lambda data, directory, name, extension: files.append(name + extension)
+    )
+    return files
+
+
+def test_passing_test_stops_and_discards_recording(queued):
+    driver = FakeDriver()
+    capture = FailureCapture(driver)
+    capture.start()
+
+    assert capture.finish() is None
+    assert not driver.recording
+    assert queued == []
+
+
+def test_failing_test_queues_recording(queued):
+    driver = FakeDriver()
+    capture = FailureCapture(driver)
+    capture.start()
+    capture.add_screenshot("search", "iVBORw0KGgo=")
+
+    capture.mark_failed("call", "tests/test_search.py::test_search")
+
+    assert capture.finish() is not None
+    assert not driver.recording
+    assert queued == ["failure", "search", "recording.mp4"]
@@ -0,0 +1,74 @@
+"""Unit tests for locator candidates and their verification on snapshots."""
+
+from mobile.src.base.page_snapshot import PageSnapshot
+from mobile.src.utils.locator_optimizer import candidates, verify
+
+SOURCE = """<hierarchy>
+  <android.widget.FrameLayout resource-id="org.wikipedia:id/search_container">
+    <android.widget.TextView resource-id="org.wikipedia:id/page_list_item_title" text="Python" />
+    <android.widget.TextView resource-id="org.wikipedia:id/page_list_item_title" text="Python (genus)" />
+    <android.widget.ImageView content-desc="Navigate up" />
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+TITLE_XPATH = ("xpath", "//*[@resource-id='org.wikipedia:id/page_list_item_title']")
+
+
+class TestCandidates:
+    """XPath translation into native strategies."""
+
+    def test_single_resource_id_prefers_id(self):
+        assert candidates(TITLE_XPATH) == [
+            ("id", "org.wikipedia:id/page_list_item_title"),
+            ("-android uiautomator", 'new UiSelector().resourceId("org.wikipedia:id/page_list_item_title")'),
+        ]
+
+    def test_single_content_desc_prefers_accessibility_id(self):
+        assert candidates(("xpath", "//*[@content-desc='Navigate up']"))[0] == ("accessibility id", "Navigate up")
+
+    def test_combined_predicates_become_one_ui_selector(self):
+        locator = ("xpath", "//android.widget.TextView[contains(@text, 'Py') and @resource-id=\"x\"][starts-with(@content-desc, 'a\"b')]")
+
+        assert candidates(locator) == [(
+            "-android uiautomator",
+            'new UiSelector().className("android.widget.TextView").textContains("Py")'
+            '.resourceId("x").descriptionStartsWith("a\\"b")',
+        )]
+
+    def test_untranslatable_locators_have_no_candidates(self):
+        for locator in [
+            ("id", "org.wikipedia:id/search_container"),
+            ("xpath", "//*"),
+            ("xpath", "//*[@index='1']"),
+            ("xpath", "//*[@text='a' or @text='b']"),
+            ("xpath", "//android.widget.FrameLayout/android.widget.TextView"),
+            ("xpath", "(//*[@text='Python'])[1]"),
+        ]:
+            assert candidates(locator) == [], locator
+
+
+class TestVerify:
+    """Candidates must select the same nodes as the original."""
+
+    def test_same_nodes_are_verified(self):
+        snapshots = [PageSnapshot(SOURCE)]
+
+        status, _ = verify(TITLE_XPATH, candidates(TITLE_XPATH)[0], snapshots)
+
+        assert status == "verified"
+
+    def test_different_nodes_are_a_mismatch(self):
+        snapshots = [PageSnapshot(SOURCE)]
+
+        status, detail = verify(TITLE_XPATH, ("accessibility id", "Navigate up"), snapshots)
+
+        assert status == "mismatch"
+        assert "1 matches instead of 2" in detail
+
+    def test_no_match_on_any_snapshot_is_unverified(self):
+        snapshots = [PageSnapshot(SOURCE)]
+        locator = ("xpath", "//*[@resource-id='org.wikipedia:id/missing']")
+
+        status, _ = verify(locator, candidates(locator)[0], snapshots)
+
+        assert status == "unverified"
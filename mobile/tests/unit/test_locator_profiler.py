@@ -0,0 +1,64 @@
+"""Unit tests for the locator-profiling driver proxy."""
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from mobile.config.settings import settings
+from mobile.src.base.locator_profiler import LocatorProfiler, ProfiledDriver
+
+RESULT_TITLE = ("id", "org.wikipedia:id/page_list_item_title")
+MISSING = ("id", "org.wikipedia:id/missing")
+
+
+class FakeDriver:
+    """Driver that finds one element, except for the missing locator."""
+
+    session_id = "fake"
+
+    def find_element(self, by, value):
+        if (by, value) == MISSING:
+            raise NoSuchElementException(value)
+        return object()
+
+    def find_elements(self, by, value):
+        return [] if (by, value) == MISSING else [object(), object()]
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    """Profile lookups without capturing page sources."""
+    monkeypatch.setattr(settings, "locator_profile", True)
+    monkeypatch.setattr(settings, "locator_snapshot_dir", "")
+    monkeypatch.setattr(LocatorProfiler, "_timings", {})
+
+
+def test_attach_is_noop_when_profiling_is_off(monkeypatch):
+    monkeypatch.setattr(settings, "locator_profile", False)
+    driver = FakeDriver()
+
+    assert LocatorProfiler.attach(driver) is driver
+
+
+def test_proxy_times_lookups(profiling):
+    driver = LocatorProfiler.attach(FakeDriver())
+
+    driver.find_element(*RESULT_TITLE)
+    assert len(driver.find_elements(*RESULT_TITLE)) == 2
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(*MISSING)
+
+    timing = LocatorProfiler._timings[RESULT_TITLE]
+    assert (timing.lookups, timing.failures, len(timing.samples)) == (2, 0, 2)
+    assert LocatorProfiler._timings[MISSING].failures == 1
+
+
+def test_proxy_delegates_to_the_driver(profiling):
+    raw = FakeDriver()
+    driver = LocatorProfiler.attach(raw)
+
+    driver.custom_flag = True
+
+    assert isinstance(driver, ProfiledDriver)
+    assert driver.session_id == "fake"
+    assert raw.custom_flag is True
+    assert LocatorProfiler.attach(driver) is driver
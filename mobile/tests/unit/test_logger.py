@@ -0,0 +1,37 @@
+"""Unit tests for merging xdist worker logs."""
+
+from common import logging_pipeline
+from mobile.src.utils import logger
+
+
+def test_merge_worker_logs_in_time_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_pipeline, "LOGS_DIR", tmp_path)
+    (tmp_path / "test_execution.log").write_text("2026-01-01 10:00:00.000 - controller\n")
+    # gw0 rotated once: the backup holds its older records
+    (tmp_path / "test_execution.gw0.log.1").write_text("2026-01-01 10:00:01.000 - gw0 first\n")
+    (tmp_path / "test_execution.gw0.log").write_text(
+        "2026-01-01 10:00:04.000 - gw0 failed\nTraceback (most recent call last):\n  boom\n"
+    )
+    (tmp_path / "test_execution.gw1.log").write_text(
+        "2026-01-01 10:00:02.000 - gw1 first\n2026-01-01 10:00:05.000 - gw1 last\n"
+    )
+
+    main_log = logger.merge_worker_logs()
+
+    assert main_log == tmp_path / "test_execution.log"
+    assert main_log.read_text().splitlines() == [
+        "2026-01-01 10:00:00.000 - controller",
+        "2026-01-01 10:00:01.000 - gw0 first",
+        "2026-01-01 10:00:02.000 - gw1 first",
+        "2026-01-01 10:00:04.000 - gw0 failed",
+        "Traceback (most recent call last):",
+        "  boom",
+        "2026-01-01 10:00:05.000 - gw1 last",
+    ]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["test_execution.log"]
+
+
+def test_merge_worker_logs_without_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_pipeline, "LOGS_DIR", tmp_path)
+
+    assert logger.merge_worker_logs() is None
@@ -0,0 +1,36 @@
+"""Unit tests for UiSelector evaluation on page snapshots."""
+
+import pytest
+
+from mobile.src.base.page_snapshot import PageSnapshot
+
+SOURCE = """<hierarchy>
+  <android.widget.TextView text="Python" resource-id="org.wikipedia:id/title" />
+  <android.widget.TextView text='Say "hi"' resource-id="org.wikipedia:id/title" />
+  <android.widget.Button text="Python" content-desc="Search Python" />
+</hierarchy>"""
+
+
+def test_ui_selector_conditions():
+    conditions = PageSnapshot._ui_selector(
+        'new UiSelector().className("android.widget.TextView").textContains("Say \\"hi\\"");'
+    )
+
+    assert conditions == [("class", "equals", "android.widget.TextView"), ("text", "contains", 'Say "hi"')]
+
+
+@pytest.mark.parametrize("selector", [
+    'new UiSelector().index("1")',
+    'new UiScrollable(new UiSelector()).scrollIntoView(new UiSelector().text("a"))',
+])
+def test_ui_selector_unsupported(selector):
+    with pytest.raises(ValueError):
+        PageSnapshot._ui_selector(selector)
+
+
+def test_ui_selector_lookup():
+    snapshot = PageSnapshot(SOURCE, "org.wikipedia")
+
+    assert snapshot.texts(("-android uiautomator", 'new UiSelector().text("Python")')) == ["Python", "Python"]
+    assert snapshot.count(("-android uiautomator", 'new UiSelector().className("android.widget.Button")')) == 1
+    assert snapshot.count(("id", "title")) == 2
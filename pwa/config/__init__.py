@@ -1,5 +1,5 @@
 """Configuration module for PWA testing framework."""
 from .settings import Settings
-from .browser_config import BrowserConfig
+from .browser_config import BlockingPolicy, BrowserConfig
 
-__all__ = ["Settings", "BrowserConfig"]
+__all__ = ["Settings", "BlockingPolicy", "BrowserConfig"]
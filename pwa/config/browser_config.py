@@ -1,12 +1,72 @@
 """Playwright-specific configuration and capabilities."""
 
-from typing import Dict, Any
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
 from pwa.config.settings import settings
 
+ANALYTICS_URL_GLOBS = (
+    "*://*google-analytics.com/*",
+    "*://*googletagmanager.com/*",
+    "*://*doubleclick.net/*",
+    "*://*connect.facebook.net/*",
+    "*://*hotjar.com/*",
+    "*://*segment.io/*",
+)
+
+
+@dataclass(frozen=True)
+class BlockingPolicy:
+    """Which requests a context should abort instead of fetching.
+
+    Attributes:
+        resource_types: Playwright resource types to block (image, font, ...).
+        url_globs: fnmatch-style patterns matched against the full URL.
+        allowed_domains: If set, block every host outside these domains
+            (subdomains included).
+    """
+
+    resource_types: FrozenSet[str] = frozenset()
+    url_globs: Tuple[str, ...] = ()
+    allowed_domains: Tuple[str, ...] = ()
+
+    def blocks(self, url: str, resource_type: str) -> bool:
+        """Check whether a request is blocked by this policy.
+
+        Args:
+            url: Request URL.
+            resource_type: Playwright resource type of the request.
+
+        Returns:
+            True if the request should be aborted.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            return False
+        if resource_type in self.resource_types:
+            return True
+        if any(fnmatch(url, pattern) for pattern in self.url_globs):
+            return True
+        if self.allowed_domains:
+            host = parts.hostname or ""
+            return not any(
+                host == domain or host.endswith("." + domain) for domain in self.allowed_domains
+            )
+        return False
+
 
 class BrowserConfig:
     """Playwright browser configuration."""
 
+    # Named request-blocking policies; "third_party" is built from PWA_BASE_URL
+    BLOCKING_POLICIES: Dict[str, BlockingPolicy] = {
+        "none": BlockingPolicy(),
+        "media": BlockingPolicy(resource_types=frozenset({"image", "media", "font"})),
+        "analytics": BlockingPolicy(url_globs=ANALYTICS_URL_GLOBS),
+    }
+
     @staticmethod
     def get_browser_options() -> Dict[str, Any]:
         """Get browser launch options for Playwright.
@@ -36,14 +96,68 @@ class BrowserConfig:
         }
         return options
 
+    @staticmethod
+    def get_har_record_options(har_path: str) -> Dict[str, Any]:
+        """Get context options that record all traffic into a HAR file.
+
+        Args:
+            har_path: File the HAR is written to when the context closes.
+
+        Returns:
+            Dictionary with HAR recording options.
+        """
+        return {
+            "record_har_path": har_path,
+            "record_har_mode": "full",
+            "record_har_content": "embed",
+        }
+
+    @classmethod
+    def get_blocking_policy(cls, name: Optional[str] = None) -> Optional[BlockingPolicy]:
+        """Get a named request-blocking policy.
+
+        Built-in policies: ``none``, ``media`` (images, video, fonts),
+        ``analytics`` (known trackers), ``third_party`` (every host but the
+        one of ``PWA_BASE_URL``) and ``lean`` (all of the above).
+
+        Args:
+            name: Policy name. Defaults to ``BLOCKING_POLICY``.
+
+        Returns:
+            Policy, or None when nothing should be blocked.
+
+        Raises:
+            ValueError: If the policy name is unknown.
+        """
+        name = name or settings.blocking_policy or "none"
+        app_host = urlsplit(settings.pwa_base_url).hostname or ""
+        if name == "third_party":
+            policy = BlockingPolicy(allowed_domains=(app_host,))
+        elif name == "lean":
+            media = cls.BLOCKING_POLICIES["media"]
+            policy = BlockingPolicy(
+                resource_types=media.resource_types,
+                url_globs=ANALYTICS_URL_GLOBS,
+                allowed_domains=(app_host,),
+            )
+        elif name in cls.BLOCKING_POLICIES:
+            policy = cls.BLOCKING_POLICIES[name]
+        else:
+            known = sorted([*cls.BLOCKING_POLICIES, "third_party", "lean"])
+            raise ValueError(f"Unknown blocking policy '{name}'. Known: {known}")
+        return None if policy == BlockingPolicy() else policy
+
     @staticmethod
     def get_navigation_options() -> Dict[str, Any]:
         """Get page navigation options.
 
+        Readiness beyond the load event is checked by
+        ``BasePage.wait_until_ready``, not ``networkidle``.
+
         Returns:
             Dictionary with navigation options.
         """
         return {
-            "wait_until": "networkidle",
+            "wait_until": "load",
             "timeout": settings.playwright_timeout,
         }
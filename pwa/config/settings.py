@@ -1,6 +1,9 @@
 """Configuration settings loader for PWA testing framework."""
 
 import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
 from dotenv import load_dotenv
 
 
@@ -15,12 +18,61 @@ class Settings:
         self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
         self.report_dir: str = os.getenv("REPORT_DIR", "reports")
         self.screenshot_on_failure: bool = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+        # Chrome trace-event JSON of page-object action and wait spans (empty: not traced)
+        self.action_trace_file: str = os.getenv("ACTION_TRACE_FILE", "")
+
+        # Artifact writer: screenshots are encoded and written on background threads
+        self.screenshot_format: str = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+        self.screenshot_quality: int = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+        self.artifact_writer_threads: int = int(os.getenv("ARTIFACT_WRITER_THREADS", "2"))
+        self.artifact_writer_max_pending: int = int(os.getenv("ARTIFACT_WRITER_MAX_PENDING", "32"))
+
+        # Failure capture (with SCREENSHOT_ON_FAILURE): CDP screencast frames kept in memory
+        self.failure_screencast: bool = os.getenv("FAILURE_SCREENCAST", "false").lower() == "true"
+        self.failure_screencast_quality: int = int(os.getenv("FAILURE_SCREENCAST_QUALITY", "50"))
+        self.failure_buffer_frames: int = int(os.getenv("FAILURE_BUFFER_FRAMES", "30"))
+        self.failure_buffer_screenshots: int = int(os.getenv("FAILURE_BUFFER_SCREENSHOTS", "10"))
+        self.failure_buffer_mb: float = float(os.getenv("FAILURE_BUFFER_MB", "16"))
 
         # PWA settings
         self.pwa_base_url: str = os.getenv("PWA_BASE_URL", "https://demo.swapy.dev")
+        self.pwa_app_build: str = os.getenv("PWA_APP_BUILD", "")
         self.browser_type: str = os.getenv("BROWSER_TYPE", "chromium")
         self.browser_headless: bool = os.getenv("BROWSER_HEADLESS", "true").lower() == "true"
         self.browser_slowmo: int = int(os.getenv("BROWSER_SLOWMO", "0"))
+        self.browser_reuse: bool = os.getenv("BROWSER_REUSE", "false").lower() == "true"
+        self.browser_shared_server: bool = os.getenv("BROWSER_SHARED_SERVER", "false").lower() == "true"
+        self.browser_ws_endpoint: str = os.getenv("BROWSER_WS_ENDPOINT", "")
+        self.asset_cache: bool = os.getenv("ASSET_CACHE", "false").lower() == "true"
+        self.blocking_policy: str = os.getenv("BLOCKING_POLICY", "")
+
+        # HAR record/replay: mode is "record", "replay" or empty, scope "suite" or "test"
+        self.har_mode: str = os.getenv("HAR_MODE", "").lower()
+        self.har_scope: str = os.getenv("HAR_SCOPE", "suite").lower()
+        self.har_dir: str = os.getenv("HAR_DIR", "har")
+        self.har_not_found: str = os.getenv("HAR_NOT_FOUND", "abort").lower()
+
+        # Context pool settings (pooling implies browser reuse)
+        self.context_pool_size: int = int(os.getenv("CONTEXT_POOL_SIZE", "0"))
+        self.context_pool_max_age: float = float(os.getenv("CONTEXT_POOL_MAX_AGE", "300"))
+        if self.context_pool_size > 0:
+            self.browser_reuse = True
+
+        # Concurrent tests per event loop (tests share one browser, so this implies reuse)
+        self.test_concurrency: int = int(os.getenv("TEST_CONCURRENCY", "1"))
+        if self.test_concurrency > 1:
+            self.browser_reuse = True
+
+        # Readiness (replaces networkidle): quiet window of tracked requests, and
+        # comma-separated URL globs that are not tracked (analytics are always ignored)
+        self.readiness_quiet_ms: int = int(os.getenv("READINESS_QUIET_MS", "100"))
+        self.readiness_ignore_urls: str = os.getenv("READINESS_IGNORE_URLS", "")
+
+        # Web vitals observers in every context, and default budgets as metric=limit pairs
+        self.web_vitals: bool = os.getenv("WEB_VITALS", "false").lower() == "true"
+        self.web_vitals_budgets: str = os.getenv(
+            "WEB_VITALS_BUDGETS", "lcp_ms=2500,cls=0.1,inp_ms=200,max_long_task_ms=200"
+        )
 
         # Playwright settings
         self.playwright_timeout: int = int(os.getenv("PLAYWRIGHT_TIMEOUT", "30000"))
@@ -28,5 +80,27 @@ class Settings:
         self.viewport_height: int = int(os.getenv("PLAYWRIGHT_VIEWPORT_HEIGHT", "720"))
 
 
-# Global settings instance
-settings = Settings()
+if TYPE_CHECKING:
+    # Created on first access by the module __getattr__ below
+    settings: Settings
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load settings once per process.
+
+    Returns:
+        Shared Settings instance.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global ``settings`` instance on first access.
+
+    Keeps ``load_dotenv()`` out of import time; ``from ... import settings``
+    still works and always returns the same instance.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,16 @@
 """Base classes for PWA testing framework."""
-from .base_page import BasePage
-from .base_test import BaseTest
-from .wait_handler import WaitHandler
 
-__all__ = ["BasePage", "BaseTest", "WaitHandler"]
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_page import BasePage
+    from .base_test import BaseTest
+    from .wait_handler import WaitHandler
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "BasePage": "base_page",
+    "BaseTest": "base_test",
+    "WaitHandler": "wait_handler",
+})
@@ -1,12 +1,20 @@
 """Base Page Object class for all PWA pages."""
 
-from typing import Optional, List
-from playwright.async_api import Page, Locator
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Optional, List
 
 from pwa.src.base.wait_handler import WaitHandler
+from pwa.src.browser.readiness import NetworkTracker
+from pwa.src.browser.web_vitals import PageVitals, WebVitals
+from pwa.src.utils.action_trace import ActionTrace
 from pwa.src.utils.logger import get_logger
 from pwa.src.utils.screenshot import ScreenshotHandler
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Locator
+
 logger = get_logger(__name__)
 
 
@@ -15,8 +23,18 @@ class BasePage:
 
     Provides common functionality for page interaction, element location,
     waiting, and logging.
+
+    A page is ready when its tracked requests are quiet (see
+    ``NetworkTracker``) and every condition from ``ready_conditions`` holds.
+    Once ready, the document's web vitals are attributed to the page object
+    (see ``WebVitals``).
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Overrides such as wait_for_page_load get their own action spans
+        ActionTrace.register(cls)
+
     def __init__(self, page: Page) -> None:
         """Initialize BasePage.
 
@@ -26,7 +44,8 @@ class BasePage:
         self.page = page
         self.wait = WaitHandler(page)
         self.screenshot = ScreenshotHandler(page)
-        logger.debug(f"Initializing page: {self.__class__.__name__}")
+        self.network = NetworkTracker.for_page(page)
+        logger.debug("Initializing page: %s", self.__class__.__name__)
 
     def find_element(self, selector: str) -> Locator:
         """Find element by selector.
@@ -37,7 +56,7 @@ class BasePage:
         Returns:
             Locator instance.
         """
-        logger.debug(f"Finding element: {selector}")
+        logger.debug("Finding element: %s", selector)
         return self.page.locator(selector)
 
     async def click(self, selector: str) -> None:
@@ -46,7 +65,7 @@ class BasePage:
         Args:
             selector: CSS selector or XPath.
         """
-        logger.info(f"Clicking element: {selector}")
+        logger.info("Clicking element: %s", selector)
         await self.page.click(selector)
 
     async def fill(self, selector: str, text: str) -> None:
@@ -56,7 +75,7 @@ class BasePage:
             selector: CSS selector or XPath.
             text: Text to fill.
         """
-        logger.info(f"Filling text in {selector}: {text}")
+        logger.info("Filling text in %s: %s", selector, text)
         await self.page.fill(selector, text)
 
     async def get_text(self, selector: str) -> str:
@@ -68,9 +87,9 @@ class BasePage:
         Returns:
             Text content of element.
         """
-        logger.info(f"Getting text from element: {selector}")
+        logger.info("Getting text from element: %s", selector)
         text = await self.page.text_content(selector)
-        logger.debug(f"Element text: {text}")
+        logger.debug("Element text: %s", text)
         return text or ""
 
     async def is_element_visible(self, selector: str) -> bool:
@@ -84,10 +103,10 @@ class BasePage:
         """
         try:
             is_visible = await self.page.is_visible(selector)
-            logger.debug(f"Element {selector} visible: {is_visible}")
+            logger.debug("Element %s visible: %s", selector, is_visible)
             return is_visible
         except Exception as e:
-            logger.debug(f"Element {selector} not visible: {str(e)}")
+            logger.debug("Element %s not visible: %s", selector, e)
             return False
 
     async def is_element_enabled(self, selector: str) -> bool:
@@ -101,10 +120,10 @@ class BasePage:
         """
         try:
             is_enabled = await self.page.is_enabled(selector)
-            logger.debug(f"Element {selector} enabled: {is_enabled}")
+            logger.debug("Element %s enabled: %s", selector, is_enabled)
             return is_enabled
         except Exception as e:
-            logger.debug(f"Element {selector} not enabled: {str(e)}")
+            logger.debug("Element %s not enabled: %s", selector, e)
             return False
 
     async def scroll_to_element(self, selector: str) -> None:
@@ -113,7 +132,7 @@ class BasePage:
         Args:
             selector: CSS selector or XPath.
         """
-        logger.info(f"Scrolling to element: {selector}")
+        logger.info("Scrolling to element: %s", selector)
         await self.page.locator(selector).scroll_into_view_if_needed()
 
     async def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
@@ -126,14 +145,59 @@ class BasePage:
         Returns:
             Attribute value or None.
         """
-        logger.debug(f"Getting attribute '{attribute}' from element {selector}")
+        logger.debug("Getting attribute '%s' from element %s", attribute, selector)
         return await self.page.get_attribute(selector, attribute)
 
+    def ready_conditions(self) -> List[Awaitable[Any]]:
+        """Declare what makes the page usable. Override in subclasses.
+
+        Example:
+            return [
+                self.wait.wait_for_selector_hidden(self.LOADING_SPINNER),
+                self.wait.wait_for_selector_visible(self.PRODUCTS_GRID),
+            ]
+
+        Returns:
+            Awaitables that must all complete; none by default.
+        """
+        return []
+
+    async def wait_until_ready(self, timeout: Optional[int] = None) -> float:
+        """Wait for network quiet and the page's ready conditions, concurrently.
+
+        The latency is added to the session readiness report, and the
+        document's web vitals so far are read.
+
+        Args:
+            timeout: Optional timeout override in milliseconds.
+
+        Returns:
+            Seconds until the page was ready.
+        """
+        started = time.perf_counter()
+        await self.wait.wait_all(
+            self.network.wait_for_quiet(timeout=timeout),
+            *self.ready_conditions(),
+        )
+        seconds = time.perf_counter() - started
+        NetworkTracker.record(self.__class__.__name__, seconds)
+        if WebVitals.enabled():
+            await WebVitals.collect(self.page, self.__class__.__name__)
+        return seconds
+
+    async def get_web_vitals(self) -> Optional[PageVitals]:
+        """Read the current document's web vitals, attributed to this page object.
+
+        Returns:
+            Vitals of the document, or None if ``WEB_VITALS`` is off.
+        """
+        return await WebVitals.collect(self.page, self.__class__.__name__)
+
     async def wait_for_page_load(self) -> None:
-        """Wait for page to load. Override in subclasses.
+        """Wait for page to load.
 
-        This method should be overridden in page object subclasses
-        to verify page-specific elements are visible.
+        Page objects declare their ready state in ``ready_conditions``
+        rather than overriding this method.
         """
-        logger.debug(f"Waiting for {self.__class__.__name__} to load")
-        await self.page.wait_for_load_state("networkidle")
+        logger.debug("Waiting for %s to load", self.__class__.__name__)
+        await self.wait_until_ready()
@@ -1,12 +1,22 @@
 """Base Test class for all PWA tests."""
 
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional
+
 import pytest
-from playwright.async_api import Page
 
 from pwa.src.browser.browser_manager import BrowserManager
+from pwa.src.browser.web_vitals import PageVitals, WebVitals
+from pwa.src.utils.artifact_writer import ArtifactWriter
+from pwa.src.utils.failure_capture import FailureCapture
 from pwa.src.utils.logger import get_logger
 from pwa.src.utils.screenshot import ScreenshotHandler
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 logger = get_logger(__name__)
 
 
@@ -17,31 +27,88 @@ class BaseTest:
     """
 
     @pytest.fixture(autouse=True)
-    async def setup_and_teardown(self) -> None:
-        """Setup and teardown for each test."""
-        # Setup
+    async def setup_and_teardown(self, request: pytest.FixtureRequest) -> None:
+        """Setup and teardown for each test.
+
+        Tests marked ``@pytest.mark.storage_state("name")`` start in the
+        named pre-seeded state instead of a blank context;
+        ``@pytest.mark.blocking_policy("name")`` overrides ``BLOCKING_POLICY``
+        (``"none"`` opts out of blocking, e.g. for visual checks).
+        """
+        await self.async_setup(**self.marker_options(request.node))
+        yield
+        await self.async_teardown()
+
+    @staticmethod
+    def marker_options(item: pytest.Item) -> Dict[str, Optional[str]]:
+        """Read browser options from a test's markers.
+
+        Args:
+            item: Test item.
+
+        Returns:
+            Keyword arguments for ``async_setup``.
+        """
+        options: Dict[str, Optional[str]] = {}
+        for name in ("storage_state", "blocking_policy"):
+            marker = item.get_closest_marker(name)
+            options[name] = marker.args[0] if marker else None
+        return options
+
+    async def async_setup(
+        self, storage_state: Optional[str] = None, blocking_policy: Optional[str] = None
+    ) -> None:
+        """Open the test's page.
+
+        Called by the autouse fixture, or directly by the concurrent
+        scheduler, which runs tests outside pytest's fixture machinery.
+
+        Args:
+            storage_state: Optional name of a registered storage state.
+            blocking_policy: Optional name of a request-blocking policy.
+        """
         logger.info(f"\n{'='*60}")
         logger.info(f"Starting test: {self.__class__.__name__}")
         logger.info(f"{'='*60}")
 
         self.browser_manager = BrowserManager()
-        self.page: Page = await self.browser_manager.init_browser()
+        self.page: Page = await self.browser_manager.init_browser(storage_state, blocking_policy)
         self.screenshot = ScreenshotHandler(self.page)
+        self.failure_capture = FailureCapture(self.page)
+        self.web_vitals: List[PageVitals] = []
+        await self.failure_capture.start()
 
-        yield
+    async def async_teardown(self) -> None:
+        """Close the test's page (and browser, unless it is reused).
 
-        # Teardown
+        A failed test's buffered frames and screenshots are written first,
+        and the final web vitals of the test's page loads are read (the
+        ``WebVitalsPlugin`` attaches them to the report); queued artifacts
+        are flushed while the page closes.
+        """
         logger.info(f"\n{'='*60}")
         logger.info(f"Finishing test: {self.__class__.__name__}")
         logger.info(f"{'='*60}\n")
 
-        await self.browser_manager.close_browser()
+        await self.failure_capture.finish()
+        if WebVitals.enabled():
+            self.web_vitals = await WebVitals.finish(self.page)
+        await asyncio.gather(
+            self.browser_manager.close_browser(),
+            asyncio.to_thread(ArtifactWriter.flush),
+        )
 
     async def take_screenshot(self, name: str = "screenshot") -> None:
         """Take screenshot during test.
 
+        With ``SCREENSHOT_ON_FAILURE`` the image is kept in memory and only
+        written if the test fails.
+
         Args:
             name: Name for screenshot file.
         """
         logger.info(f"Taking screenshot: {name}")
-        await self.screenshot.take_screenshot(name)
+        if self.failure_capture.enabled:
+            self.failure_capture.add_screenshot(name, await self.page.screenshot())
+        else:
+            await self.screenshot.take_screenshot(name)
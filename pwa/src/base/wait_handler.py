@@ -1,15 +1,55 @@
 """Wait strategies and handlers for PWA element interactions."""
 
-from typing import Callable, TypeVar, Optional
-from playwright.async_api import Page, Locator
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Literal, Optional, Tuple, TypeVar
 
 from pwa.config.settings import settings
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Locator
+
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Resolves once a named predicate holds for the element, re-checking on every
+# DOM mutation instead of polling. Selector and arguments are passed as data,
+# never interpolated into the script. Returns "met", "timeout", or "detached"
+# when the element left the document (the caller then re-resolves it).
+_OBSERVE_SCRIPT = """
+(element, [name, arg, timeout]) => {
+  const predicates = {
+    textContains: (el, text) => (el.textContent || "").includes(text),
+    textEquals: (el, text) => (el.textContent || "").trim() === text,
+    attributeEquals: (el, [attr, value]) => el.getAttribute(attr) === value,
+    childCountAtLeast: (el, count) => el.childElementCount >= count,
+  };
+  const check = () => predicates[name](element, arg);
+  if (check()) return "met";
+  return new Promise((resolve) => {
+    const finish = (result) => {
+      observer.disconnect();
+      clearTimeout(timer);
+      resolve(result);
+    };
+    const observer = new MutationObserver(() => {
+      if (!element.isConnected) finish("detached");
+      else if (check()) finish("met");
+    });
+    observer.observe(element.ownerDocument, {
+      subtree: true, childList: true, characterData: true, attributes: true,
+    });
+    const timer = setTimeout(() => finish("timeout"), timeout);
+  });
+}
+"""
+
+PREDICATES = ("textContains", "textEquals", "attributeEquals", "childCountAtLeast")
+
 
 class WaitHandler:
     """Handles wait strategies and synchronization for PWA tests."""
@@ -36,7 +76,7 @@ class WaitHandler:
             Locator when element becomes visible.
         """
         actual_timeout = timeout or self.timeout
-        logger.debug(f"Waiting for selector '{selector}' to be visible (timeout: {actual_timeout}ms)")
+        logger.debug("Waiting for selector '%s' to be visible (timeout: %sms)", selector, actual_timeout)
         await self.page.wait_for_selector(selector, state="visible", timeout=actual_timeout)
         return self.page.locator(selector)
 
@@ -50,7 +90,7 @@ class WaitHandler:
             timeout: Optional timeout override in milliseconds.
         """
         actual_timeout = timeout or self.timeout
-        logger.debug(f"Waiting for selector '{selector}' to be hidden (timeout: {actual_timeout}ms)")
+        logger.debug("Waiting for selector '%s' to be hidden (timeout: %sms)", selector, actual_timeout)
         await self.page.wait_for_selector(selector, state="hidden", timeout=actual_timeout)
 
     async def wait_for_text(
@@ -58,26 +98,152 @@ class WaitHandler:
     ) -> None:
         """Wait for text to appear in element.
 
+        Works with any Playwright selector (``:has-text``, ``>>`` chains) and
+        with text containing quotes.
+
         Args:
-            selector: CSS selector or XPath.
-            text: Text to wait for.
+            selector: CSS selector, XPath or Playwright selector.
+            text: Text to wait for (case-sensitive substring).
             timeout: Optional timeout override in milliseconds.
         """
+        logger.debug("Waiting for text '%s' in selector '%s'", text, selector)
+        await self.wait_for_condition(selector, "textContains", text, timeout, state="visible")
+
+    async def wait_for_attribute(
+        self, selector: str, name: str, value: str, timeout: Optional[int] = None
+    ) -> None:
+        """Wait for an element attribute to have a value.
+
+        Args:
+            selector: CSS selector, XPath or Playwright selector.
+            name: Attribute name.
+            value: Expected attribute value.
+            timeout: Optional timeout override in milliseconds.
+        """
+        logger.debug("Waiting for %s='%s' on selector '%s'", name, value, selector)
+        await self.wait_for_condition(selector, "attributeEquals", [name, value], timeout)
+
+    async def wait_for_condition(
+        self,
+        selector: str,
+        predicate: str,
+        arg: Any = None,
+        timeout: Optional[int] = None,
+        state: Literal["attached", "detached", "hidden", "visible"] = "attached",
+    ) -> None:
+        """Wait until a predicate holds for the first element matching a selector.
+
+        Playwright's locator auto-waiting resolves the element, then a
+        ``MutationObserver`` re-checks the predicate on every DOM change, so
+        the wait ends within one mutation of the condition becoming true.
+        If the element is replaced meanwhile, it is resolved again.
+
+        Args:
+            selector: CSS selector, XPath or Playwright selector.
+            predicate: One of ``PREDICATES``.
+            arg: Predicate argument.
+            timeout: Optional timeout override in milliseconds.
+            state: Element state to auto-wait for before observing
+                ("attached" or "visible").
+
+        Raises:
+            ValueError: If the predicate is unknown.
+            playwright.async_api.TimeoutError: If the condition is not met in time.
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        if predicate not in PREDICATES:
+            raise ValueError(f"Unknown predicate '{predicate}'. Available: {', '.join(PREDICATES)}")
         actual_timeout = timeout or self.timeout
-        logger.debug(f"Waiting for text '{text}' in selector '{selector}'")
-        locator = self.page.locator(selector)
-        await locator.wait_for(timeout=actual_timeout)
-        await self.page.wait_for_function(
-            f"() => document.querySelector('{selector}').textContent.includes('{text}')",
-            timeout=actual_timeout
-        )
+        deadline = time.monotonic() + actual_timeout / 1000
+        locator = self.page.locator(selector).first
+        while True:
+            remaining = max((deadline - time.monotonic()) * 1000, 1)
+            await locator.wait_for(state=state, timeout=remaining)
+            remaining = max((deadline - time.monotonic()) * 1000, 1)
+            result = await locator.evaluate(_OBSERVE_SCRIPT, [predicate, arg, remaining])
+            if result == "met":
+                return
+            if result == "timeout" or time.monotonic() >= deadline:
+                raise PlaywrightTimeoutError(
+                    f"Timeout {actual_timeout}ms exceeded waiting for {predicate}({arg!r}) on '{selector}'"
+                )
+
+    async def wait_all(self, *conditions: Awaitable[T]) -> List[T]:
+        """Wait for several conditions concurrently; all must succeed.
+
+        Example:
+            await wait.wait_all(
+                wait.wait_for_text("#status", "Saved"),
+                wait.wait_for_selector_hidden(".spinner"),
+            )
+
+        Args:
+            *conditions: Awaitables, typically other ``WaitHandler`` waits.
+
+        Returns:
+            Results in the order of the conditions.
+
+        Raises:
+            Exception: The first failure; the remaining waits are cancelled.
+        """
+        tasks = [asyncio.ensure_future(condition) for condition in conditions]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def wait_any(self, *conditions: Awaitable[T]) -> Tuple[int, T]:
+        """Wait for the first of several conditions to succeed.
+
+        Example:
+            index, _ = await wait.wait_any(
+                wait.wait_for_text("#status", "Saved"),
+                wait.wait_for_selector_visible(".error"),
+            )
+
+        Args:
+            *conditions: Awaitables, typically other ``WaitHandler`` waits.
+
+        Returns:
+            Index and result of the first condition that succeeded.
+
+        Raises:
+            ValueError: If no condition is given.
+            Exception: The first failure, if every condition failed.
+        """
+        if not conditions:
+            raise ValueError("wait_any needs at least one condition")
+        tasks = [asyncio.ensure_future(condition) for condition in conditions]
+        pending = set(tasks)
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.index):
+                    if task.exception() is None:
+                        return tasks.index(task), task.result()
+                    first_error = first_error or task.exception()
+            raise first_error or RuntimeError("wait_any: no condition succeeded")
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def wait_for_navigation(self, timeout: Optional[int] = None) -> None:
         """Wait for page navigation to complete.
 
+        Waits for the load event, then for the page's tracked requests to be
+        quiet (``NetworkTracker``) instead of ``networkidle``.
+
         Args:
             timeout: Optional timeout override in milliseconds.
         """
+        from pwa.src.browser.readiness import NetworkTracker
+
         actual_timeout = timeout or self.timeout
-        logger.debug(f"Waiting for navigation (timeout: {actual_timeout}ms)")
-        await self.page.wait_for_load_state("networkidle", timeout=actual_timeout)
+        logger.debug("Waiting for navigation (timeout: %sms)", actual_timeout)
+        started = time.monotonic()
+        await self.page.wait_for_load_state("load", timeout=actual_timeout)
+        remaining = max(actual_timeout - (time.monotonic() - started) * 1000, 1)
+        await NetworkTracker.for_page(self.page).wait_for_quiet(timeout=remaining)
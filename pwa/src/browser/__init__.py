@@ -1,5 +1,22 @@
 """Browser management module for Playwright."""
-from .browser_factory import BrowserFactory
-from .browser_manager import BrowserManager
 
-__all__ = ["BrowserFactory", "BrowserManager"]
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .asset_cache import AssetCache
+    from .browser_factory import BrowserFactory
+    from .browser_manager import BrowserManager
+    from .context_pool import ContextPool
+    from .readiness import NetworkTracker
+    from .web_vitals import WebVitals
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "AssetCache": "asset_cache",
+    "BrowserFactory": "browser_factory",
+    "BrowserManager": "browser_manager",
+    "ContextPool": "context_pool",
+    "NetworkTracker": "readiness",
+    "WebVitals": "web_vitals",
+})
@@ -0,0 +1,194 @@
+"""Route-level disk cache for static assets of the PWA under test."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from pwa.config.settings import settings
+from pwa.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Route
+
+logger = get_logger(__name__)
+
+CACHEABLE_RESOURCE_TYPES = frozenset({"script", "stylesheet", "font", "image"})
+
+# Body is stored decoded, so encoding/length headers no longer describe it
+DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class AssetCacheStats:
+    """Hit/miss counters for one context (or the whole session)."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    bytes_fetched: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Number of cacheable requests seen."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of cacheable requests served from disk."""
+        return self.hits / self.requests if self.requests else 0.0
+
+    def add(self, other: "AssetCacheStats") -> None:
+        """Accumulate counters of another stats object."""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.bytes_saved += other.bytes_saved
+        self.bytes_fetched += other.bytes_fetched
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"Asset cache: {self.hits}/{self.requests} hits ({self.hit_ratio:.0%}), "
+            f"{self.bytes_saved / 1024:.1f} KB saved, {self.bytes_fetched / 1024:.1f} KB fetched"
+        )
+
+
+class AssetCache:
+    """Serves scripts, styles, fonts and images of fresh contexts from disk.
+
+    Every test starts in a new ``BrowserContext`` with a cold HTTP cache, and
+    Playwright disables the browser cache as soon as a context has routes.
+    With ``ASSET_CACHE=true`` each context gets a route that stores ``200``
+    GET responses of cacheable resource types on first fetch and fulfills
+    later requests for the same URL from disk. Disk reads and writes run on
+    a thread, off the event loop.
+
+    With ``PWA_APP_BUILD`` set, entries live under
+    ``REPORT_DIR/asset_cache/<key>`` where the key hashes the base URL and
+    the build id; they are shared by xdist workers and kept across sessions,
+    and a new build never sees old bundles. Without a build id the cache
+    cannot tell builds apart: entries are only shared by the contexts of one
+    process, in a per-process directory that is removed at shutdown.
+    """
+
+    _stats: "weakref.WeakKeyDictionary[BrowserContext, AssetCacheStats]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _directory: Optional[Path] = None
+    totals = AssetCacheStats()
+
+    @classmethod
+    def cache_dir(cls) -> Path:
+        """Directory for entries of the current base URL and app build."""
+        if cls._directory is None:
+            root = Path(settings.report_dir) / "asset_cache"
+            if settings.pwa_app_build:
+                key = f"{settings.pwa_base_url}|{settings.pwa_app_build}"
+                cls._directory = root / hashlib.sha256(key.encode()).hexdigest()[:16]
+            else:
+                cls._directory = root / f"process-{os.getpid()}"
+        return cls._directory
+
+    @classmethod
+    async def install(cls, context: BrowserContext) -> None:
+        """Route cacheable requests of a context through the cache.
+
+        Args:
+            context: Freshly created browser context.
+        """
+        stats = AssetCacheStats()
+        cls._stats[context] = stats
+
+        async def handle(route: Route) -> None:
+            await cls._handle(route, stats)
+
+        await context.route("**/*", handle)
+
+    @classmethod
+    def report(cls, context: BrowserContext) -> Optional[AssetCacheStats]:
+        """Log and return the stats of a context about to be closed.
+
+        Args:
+            context: Context previously passed to ``install``.
+
+        Returns:
+            Stats of the context, or None if it was not routed.
+        """
+        stats = cls._stats.pop(context, None)
+        if stats is not None and stats.requests:
+            cls.totals.add(stats)
+            logger.info(stats.summary())
+        return stats
+
+    @classmethod
+    def close(cls) -> None:
+        """Log session totals and drop entries that are not keyed by a build."""
+        if cls.totals.requests:
+            logger.info(f"Session {cls.totals.summary()}")
+        if cls._directory is not None and not settings.pwa_app_build:
+            shutil.rmtree(cls._directory, ignore_errors=True)
+        cls._directory = None
+        cls.totals = AssetCacheStats()
+
+    @classmethod
+    async def _handle(cls, route: Route, stats: AssetCacheStats) -> None:
+        """Fulfill a request from disk or fetch, store and forward it."""
+        request = route.request
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            await route.fallback()
+            return
+
+        body_path = cls.cache_dir() / hashlib.sha256(request.url.encode()).hexdigest()
+        meta_path = body_path.with_suffix(".json")
+        entry = await asyncio.to_thread(cls._load, body_path, meta_path)
+        if entry is not None:
+            meta, body = entry
+            stats.hits += 1
+            stats.bytes_saved += len(body)
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            logger.debug(f"Asset cache fetch failed for {request.url}: {str(e)}")
+            await route.fallback()
+            return
+        stats.misses += 1
+        stats.bytes_fetched += len(body)
+        if response.status == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            headers = {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in DROPPED_HEADERS
+            }
+            await asyncio.to_thread(cls._store, body_path, meta_path, {"status": 200, "headers": headers}, body)
+        await route.fulfill(response=response, body=body)
+
+    @staticmethod
+    def _load(body_path: Path, meta_path: Path) -> Optional[Tuple[dict, bytes]]:
+        """Read a complete entry, or None if it is not cached."""
+        if not (meta_path.exists() and body_path.exists()):
+            return None
+        return json.loads(meta_path.read_text()), body_path.read_bytes()
+
+    @staticmethod
+    def _store(body_path: Path, meta_path: Path, meta: dict, body: bytes) -> None:
+        """Write an entry atomically; workers may race on the same URL."""
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{uuid.uuid4().hex}.tmp"
+        tmp_body = body_path.with_name(body_path.name + suffix)
+        tmp_body.write_bytes(body)
+        tmp_body.replace(body_path)
+        # Metadata last: its presence marks the entry complete
+        tmp_meta = meta_path.with_name(meta_path.name + suffix)
+        tmp_meta.write_text(json.dumps(meta))
+        tmp_meta.replace(meta_path)
@@ -1,46 +1,92 @@
 """Factory for creating and managing Playwright browser instances."""
 
-from typing import Optional
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
 
 from pwa.config.browser_config import BrowserConfig
 from pwa.config.settings import settings
+from pwa.src.browser.asset_cache import AssetCache
+from pwa.src.browser.browser_server import BrowserServer
+from pwa.src.browser.har_archive import HarArchive
+from pwa.src.browser.request_blocker import RequestBlocker
+from pwa.src.browser.storage_state import StorageStateCache
+from pwa.src.browser.web_vitals import WebVitals
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
 logger = get_logger(__name__)
 
+# Per-test context/page are context-local so concurrent tests do not clobber each other
+_current_context: ContextVar[Optional[BrowserContext]] = ContextVar("current_context", default=None)
+_current_page: ContextVar[Optional[Page]] = ContextVar("current_page", default=None)
+
 
 class BrowserFactory:
-    """Factory class for creating Playwright browser instances."""
+    """Factory class for creating Playwright browser instances.
+
+    The Playwright driver and browser are process-wide; the current context
+    and page are tracked per execution context (see ``contextvars``), so
+    tests running concurrently in one event loop each see their own.
+    """
 
     _browser: Optional[Browser] = None
-    _context: Optional[BrowserContext] = None
-    _page: Optional[Page] = None
     _playwright = None
+    _launch_lock: Optional[asyncio.Lock] = None
 
     @classmethod
     async def create_browser(cls) -> Browser:
         """Create and return Playwright browser.
 
+        Concurrent callers in one event loop wait for a single launch.
+
         Returns:
             Playwright Browser instance.
 
         Raises:
             Exception: If browser creation fails.
         """
+        if cls._launch_lock is None:
+            cls._launch_lock = asyncio.Lock()
+        async with cls._launch_lock:
+            return await cls._create_browser()
+
+    @classmethod
+    async def _create_browser(cls) -> Browser:
+        """Launch or connect to the browser unless a connected one exists."""
         if cls._browser is not None:
-            logger.warning("Browser already exists, returning existing instance")
-            return cls._browser
+            if cls._browser.is_connected():
+                logger.debug("Browser already exists, returning existing instance")
+                return cls._browser
+            logger.warning("Browser is disconnected, launching a new instance")
+            cls._browser = None
+            _current_context.set(None)
+            _current_page.set(None)
 
         try:
             logger.info(f"Creating {settings.browser_type} browser")
 
-            cls._playwright = await async_playwright().start()
-            browser_launcher = getattr(cls._playwright, settings.browser_type)
-            options = BrowserConfig.get_browser_options()
-            logger.debug(f"Browser options: {options}")
+            if cls._playwright is None:
+                # Deferred so importing the framework does not load Playwright
+                from playwright.async_api import async_playwright
 
-            cls._browser = await browser_launcher.launch(**options)
+                cls._playwright = await async_playwright().start()
+            browser_launcher = getattr(cls._playwright, settings.browser_type)
+            ws_endpoint = cls._get_ws_endpoint()
+            if ws_endpoint:
+                logger.info(f"Connecting to browser server at {ws_endpoint}")
+                cls._browser = await browser_launcher.connect(
+                    ws_endpoint, slow_mo=settings.browser_slowmo
+                )
+            else:
+                options = BrowserConfig.get_browser_options()
+                logger.debug(f"Browser options: {options}")
+                cls._browser = await browser_launcher.launch(**options)
+            cls._browser.on("disconnected", cls._on_browser_disconnected)
             logger.info(f"{settings.browser_type} browser created successfully")
             return cls._browser
 
@@ -48,12 +94,35 @@ class BrowserFactory:
             logger.error(f"Failed to create browser: {str(e)}")
             raise
 
+    @staticmethod
+    def _get_ws_endpoint() -> Optional[str]:
+        """Resolve the websocket endpoint of a shared browser server, if any.
+
+        Returns:
+            Explicit ``BROWSER_WS_ENDPOINT``, the endpoint published by the
+            shared server when ``BROWSER_SHARED_SERVER`` is on, or None.
+        """
+        if settings.browser_ws_endpoint:
+            return settings.browser_ws_endpoint
+        if settings.browser_shared_server:
+            return BrowserServer.wait_for_endpoint(BrowserServer.default_endpoint_file())
+        return None
+
     @classmethod
-    async def create_context(cls, browser: Browser) -> BrowserContext:
+    async def create_context(
+        cls,
+        browser: Browser,
+        storage_state: Optional[str] = None,
+        blocking_policy: Optional[str] = None,
+    ) -> BrowserContext:
         """Create browser context.
 
         Args:
             browser: Browser instance.
+            storage_state: Optional name of a state registered with
+                ``StorageStateCache`` to start the context in.
+            blocking_policy: Optional name of a ``BrowserConfig`` blocking
+                policy, overriding ``BLOCKING_POLICY``.
 
         Returns:
             Browser context.
@@ -61,9 +130,29 @@ class BrowserFactory:
         try:
             logger.info("Creating browser context")
             options = BrowserConfig.get_context_options()
-            cls._context = await browser.new_context(**options)
+            options.update(HarArchive.context_options())
+            init_script = None
+            if storage_state:
+                snapshot = await StorageStateCache.get(storage_state, browser)
+                options["storage_state"] = str(snapshot.path)
+                init_script = snapshot.indexed_db_init_script()
+                logger.info(f"Starting context from storage state '{storage_state}'")
+            context = await browser.new_context(**options)
+            if init_script:
+                await context.add_init_script(init_script)
+            if WebVitals.enabled():
+                await WebVitals.install(context)
+            await HarArchive.install(context)
+            # Cache misses fetch from the network, which would bypass the HAR
+            if settings.asset_cache and not HarArchive.enabled():
+                await AssetCache.install(context)
+            # Installed last so it runs first: blocked requests skip cache and HAR
+            await RequestBlocker.install(
+                context, BrowserConfig.get_blocking_policy(blocking_policy)
+            )
+            _current_context.set(context)
             logger.info("Browser context created successfully")
-            return cls._context
+            return context
         except Exception as e:
             logger.error(f"Failed to create context: {str(e)}")
             raise
@@ -81,6 +170,7 @@ class BrowserFactory:
         try:
             logger.info("Creating page")
             page = await context.new_page()
+            _current_page.set(page)
             logger.info("Page created successfully")
             return page
         except Exception as e:
@@ -88,32 +178,81 @@ class BrowserFactory:
             raise
 
     @classmethod
-    async def close_browser(cls) -> None:
-        """Close browser and cleanup resources."""
-        try:
-            if cls._page:
-                logger.info("Closing page")
-                await cls._page.close()
-                cls._page = None
+    async def close_context(cls, context: Optional[BrowserContext] = None) -> None:
+        """Close a single browser context, keeping the browser running.
+
+        Used when the browser is shared across tests: each test gets its own
+        context, and only that context is torn down afterwards.
 
-            if cls._context:
+        Args:
+            context: Context to close. Defaults to the current context.
+        """
+        context = context or _current_context.get()
+        try:
+            if context is not None:
+                AssetCache.report(context)
+                RequestBlocker.report(context)
                 logger.info("Closing context")
-                await cls._context.close()
-                cls._context = None
+                await context.close()
+        except Exception as e:
+            logger.error(f"Error closing context: {str(e)}")
+        finally:
+            if context is _current_context.get():
+                _current_context.set(None)
+                _current_page.set(None)
 
+    @classmethod
+    def is_browser_running(cls) -> bool:
+        """Check whether a connected browser instance exists.
+
+        Returns:
+            True if browser is launched and connected.
+        """
+        return cls._browser is not None and cls._browser.is_connected()
+
+    @classmethod
+    def _on_browser_disconnected(cls, browser: Browser) -> None:
+        """Drop references to a browser that crashed or was closed.
+
+        Args:
+            browser: Browser instance that emitted the event.
+        """
+        if browser is cls._browser:
+            logger.warning("Browser disconnected")
+            cls._browser = None
+
+    @classmethod
+    async def close_browser(cls) -> None:
+        """Close browser and cleanup resources.
+
+        Every open context is closed first: Playwright writes a context's
+        recorded HAR only when the context itself is closed.
+        """
+        try:
             if cls._browser:
+                for context in list(cls._browser.contexts):
+                    await cls.close_context(context)
                 logger.info("Closing browser")
                 await cls._browser.close()
                 cls._browser = None
 
-            if cls._playwright:
-                logger.info("Stopping playwright")
-                await cls._playwright.stop()
-                cls._playwright = None
-
             logger.info("Browser closed successfully")
         except Exception as e:
             logger.error(f"Error closing browser: {str(e)}")
+        finally:
+            _current_page.set(None)
+            _current_context.set(None)
+            cls._browser = None
+            # The lock is bound to this session's event loop
+            cls._launch_lock = None
+            # Always stop the driver so a failed close does not leak the process
+            if cls._playwright:
+                logger.info("Stopping playwright")
+                try:
+                    await cls._playwright.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping playwright: {str(e)}")
+                cls._playwright = None
 
     @classmethod
     def get_page(cls) -> Optional[Page]:
@@ -122,7 +261,7 @@ class BrowserFactory:
         Returns:
             Current page instance or None.
         """
-        return cls._page
+        return _current_page.get()
 
     @classmethod
     async def set_page(cls, page: Page) -> None:
@@ -131,4 +270,4 @@ class BrowserFactory:
         Args:
             page: Page to set as current.
         """
-        cls._page = page
+        _current_page.set(page)
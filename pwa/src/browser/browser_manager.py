@@ -1,39 +1,104 @@
 """Manager for Playwright browser lifecycle."""
 
-from typing import Optional
-from playwright.async_api import Browser, BrowserContext, Page
+from __future__ import annotations
 
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+from pwa.src.browser.asset_cache import AssetCache
 from pwa.src.browser.browser_factory import BrowserFactory
+from pwa.src.browser.context_pool import ContextPool, PooledContext
+from pwa.src.browser.har_archive import HarArchive
+from pwa.src.browser.readiness import NetworkTracker
+from pwa.src.browser.request_blocker import RequestBlocker
 from pwa.config.settings import settings
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
 logger = get_logger(__name__)
 
+_current_manager: ContextVar[Optional["BrowserManager"]] = ContextVar(
+    "current_manager", default=None
+)
+
 
 class BrowserManager:
-    """Manager for browser lifecycle in PWA tests."""
+    """Manager for browser lifecycle in PWA tests.
+
+    ``BrowserManager()`` returns the process-wide singleton unless the current
+    execution context was bound to its own manager with ``isolate()``; tests
+    run concurrently in one event loop each get an isolated manager.
+    """
 
     _instance: Optional["BrowserManager"] = None
     _browser: Optional[Browser] = None
     _context: Optional[BrowserContext] = None
     _page: Optional[Page] = None
+    _pooled: Optional[PooledContext] = None
+    _context_pool: Optional[ContextPool] = None
 
     def __new__(cls) -> "BrowserManager":
         """Implement singleton pattern for browser management."""
+        current = _current_manager.get()
+        if current is not None:
+            return current
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    async def init_browser(self) -> Page:
+    @classmethod
+    def isolate(cls) -> "BrowserManager":
+        """Bind a fresh manager to the current execution context.
+
+        Call at the start of an asyncio task; ``BrowserManager()`` inside that
+        task (and tasks it spawns) then returns this manager.
+
+        Returns:
+            Manager bound to the current context.
+        """
+        manager = super().__new__(cls)
+        _current_manager.set(manager)
+        return manager
+
+    async def init_browser(
+        self, storage_state: Optional[str] = None, blocking_policy: Optional[str] = None
+    ) -> Page:
         """Initialize browser for test.
 
+        Args:
+            storage_state: Optional name of a registered storage state to
+                start the test in. Seeded contexts bypass the context pool.
+            blocking_policy: Optional blocking policy overriding
+                ``BLOCKING_POLICY``. Such contexts bypass the context pool.
+
         Returns:
             Page instance ready for testing.
         """
         logger.info("Initializing browser for test")
+        # Pooled contexts are created before the test is known, so per-test HARs bypass the pool
+        if (
+            settings.context_pool_size > 0
+            and not storage_state
+            and not blocking_policy
+            and not HarArchive.per_test()
+        ):
+            pool = await self.get_context_pool()
+            self._pooled = await pool.acquire()
+            self._browser = pool.browser
+            self._context = self._pooled.context
+            self._page = self._pooled.page
+            logger.info(f"Checked out pre-warmed context at {self._page.url}")
+            return self._page
+
         self._browser = await BrowserFactory.create_browser()
-        self._context = await BrowserFactory.create_context(self._browser)
+        self._context = await BrowserFactory.create_context(
+            self._browser, storage_state, blocking_policy
+        )
         self._page = await BrowserFactory.create_page(self._context)
+        # Track requests from the first navigation on, for readiness waits
+        NetworkTracker.for_page(self._page)
         await self._page.goto(settings.pwa_base_url)
         logger.info(f"Navigated to {settings.pwa_base_url}")
         return self._page
@@ -52,14 +117,65 @@ class BrowserManager:
         return self._page
 
     async def close_browser(self) -> None:
-        """Close browser after test."""
-        logger.info("Closing browser after test")
-        await BrowserFactory.close_browser()
+        """Close browser after test.
+
+        With ``BROWSER_REUSE`` enabled only the test's context is closed and the
+        browser stays up for the next test; call ``shutdown()`` at session end.
+        """
+        if self._pooled is not None and BrowserManager._context_pool is not None:
+            logger.info("Releasing pooled browser context after test")
+            await BrowserManager._context_pool.release(self._pooled)
+            self._pooled = None
+        elif settings.browser_reuse:
+            logger.info("Closing browser context after test")
+            await BrowserFactory.close_context(self._context)
+        else:
+            logger.info("Closing browser after test")
+            # Closed by handle: the factory's context-local current context was
+            # set in the setup task, which need not be the teardown task
+            await BrowserFactory.close_context(self._context)
+            await BrowserFactory.close_browser()
         self._page = None
         self._context = None
         self._browser = None
 
+    @classmethod
+    async def get_context_pool(cls) -> ContextPool:
+        """Get the session context pool, starting it on first use.
+
+        The pool is recreated if the shared browser was relaunched.
+
+        Returns:
+            Running context pool.
+        """
+        browser = await BrowserFactory.create_browser()
+        if cls._context_pool is not None and cls._context_pool.browser is not browser:
+            await cls._context_pool.close()
+            cls._context_pool = None
+        if cls._context_pool is None:
+            cls._context_pool = ContextPool(
+                browser,
+                url=settings.pwa_base_url,
+                size=settings.context_pool_size,
+                max_age=settings.context_pool_max_age,
+            )
+            cls._context_pool.start()
+        return cls._context_pool
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close shared browser and stop Playwright at the end of the session."""
+        logger.info("Shutting down browser session")
+        if cls._context_pool is not None:
+            await cls._context_pool.close()
+            cls._context_pool = None
+        await BrowserFactory.close_browser()
+        AssetCache.close()
+        RequestBlocker.close()
+        NetworkTracker.close()
+
     @classmethod
     def reset_singleton(cls) -> None:
         """Reset singleton instance (for testing purposes)."""
         cls._instance = None
+        _current_manager.set(None)
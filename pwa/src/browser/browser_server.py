@@ -0,0 +1,135 @@
+"""Shared Playwright browser server for pytest-xdist workers."""
+
+import atexit
+import json
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import IO, Optional
+
+from pwa.config.settings import settings
+from pwa.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BrowserServer:
+    """Runs one browser server process that every worker connects to.
+
+    The Python Playwright API has no ``launch_server``, so the server is
+    started through the bundled driver CLI (``playwright launch-server``),
+    which prints its websocket endpoint on startup. The endpoint is published
+    to a file that workers read before calling ``browser_type.connect``.
+    Each worker keeps only its own contexts on the shared browser.
+    """
+
+    STARTUP_TIMEOUT = 60
+
+    def __init__(self, browser_type: str, endpoint_file: Path) -> None:
+        """Initialize BrowserServer.
+
+        Args:
+            browser_type: chromium, firefox or webkit.
+            endpoint_file: File the websocket endpoint is published to.
+        """
+        self.browser_type = browser_type
+        self.endpoint_file = endpoint_file
+        self.ws_endpoint: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._config_file: Optional[Path] = None
+
+    @classmethod
+    def default_endpoint_file(cls) -> Path:
+        """Endpoint file location under the report directory."""
+        return Path(settings.report_dir) / "browser_server" / "ws_endpoint"
+
+    def start(self) -> "BrowserServer":
+        """Launch the server and publish its endpoint.
+
+        Returns:
+            Self, for chaining.
+
+        Raises:
+            RuntimeError: If the server does not report an endpoint in time.
+        """
+        logger.info(f"Starting shared {self.browser_type} browser server")
+        options = {"headless": settings.browser_headless}
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(options, f)
+            self._config_file = Path(f.name)
+
+        self._process = subprocess.Popen(
+            [
+                sys.executable, "-m", "playwright", "launch-server",
+                "--browser", self.browser_type,
+                "--config", str(self._config_file),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        atexit.register(self.stop)
+        # Set because of stdout=PIPE
+        assert self._process.stdout is not None
+
+        self.ws_endpoint = self._read_endpoint_line(self._process.stdout)
+        self.endpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.endpoint_file.with_suffix(".tmp")
+        tmp_file.write_text(self.ws_endpoint)
+        tmp_file.replace(self.endpoint_file)
+        logger.info(f"Browser server listening on {self.ws_endpoint}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and remove the published endpoint."""
+        if self._process is not None and self._process.poll() is None:
+            logger.info("Stopping shared browser server")
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        for path in (self.endpoint_file, self._config_file):
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def wait_for_endpoint(endpoint_file: Path, timeout: float = STARTUP_TIMEOUT) -> str:
+        """Block until an endpoint is published and return it.
+
+        Args:
+            endpoint_file: File written by the process running the server.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Websocket endpoint of the shared browser.
+
+        Raises:
+            TimeoutError: If the file does not appear in time.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if endpoint_file.exists():
+                endpoint = endpoint_file.read_text().strip()
+                if endpoint:
+                    return endpoint
+            time.sleep(0.1)
+        raise TimeoutError(f"No browser server endpoint published in {endpoint_file}")
+
+    def _read_endpoint_line(self, stdout: IO[str]) -> str:
+        """Read the first line the driver prints, with a timeout."""
+        lines: "queue.Queue[str]" = queue.Queue()
+        reader = threading.Thread(target=lambda: lines.put(stdout.readline()), daemon=True)
+        reader.start()
+        try:
+            line = lines.get(timeout=self.STARTUP_TIMEOUT).strip()
+        except queue.Empty:
+            line = ""
+        if not line.startswith("ws"):
+            self.stop()
+            raise RuntimeError(f"Browser server failed to start (output: {line!r})")
+        return line
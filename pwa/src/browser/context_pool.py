@@ -0,0 +1,244 @@
+"""Pool of pre-warmed browser contexts for PWA tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from pwa.src.browser.browser_factory import BrowserFactory
+from pwa.src.browser.readiness import NetworkTracker
+from pwa.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+logger = get_logger(__name__)
+
+# Retry delays of the refill task after failed creations, in seconds
+REFILL_BACKOFF_MIN = 1.0
+REFILL_BACKOFF_MAX = 30.0
+
+
+@dataclass
+class PooledContext:
+    """Browser context with a page already navigated to the base URL."""
+
+    context: BrowserContext
+    page: Page
+    created_at: float = field(default_factory=time.monotonic)
+    dirty: bool = False
+
+    @property
+    def age(self) -> float:
+        """Seconds since the context was created."""
+        return time.monotonic() - self.created_at
+
+    def mark_dirty(self, *_: object) -> None:
+        """Flag context as unusable (page crashed or closed while pooled)."""
+        self.dirty = True
+
+
+@dataclass
+class PoolMetrics:
+    """Checkout statistics for the context pool."""
+
+    hits: int = 0
+    misses: int = 0
+    created: int = 0
+    discarded: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def checkouts(self) -> int:
+        """Total number of checkouts."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of checkouts served from the pool."""
+        return self.hits / self.checkouts if self.checkouts else 0.0
+
+    def record_checkout(self, hit: bool, wait: float) -> None:
+        """Record a single checkout.
+
+        Args:
+            hit: Whether a ready context was available.
+            wait: Seconds spent in acquire().
+        """
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        avg_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+        return (
+            f"Context pool: {self.checkouts} checkouts, {self.hits} hits, "
+            f"{self.misses} misses ({self.hit_ratio:.0%} hit ratio), "
+            f"avg wait {avg_wait * 1000:.1f}ms, max wait {self.max_wait * 1000:.1f}ms, "
+            f"{self.created} created, {self.discarded} discarded"
+        )
+
+
+class ContextPool:
+    """Keeps N contexts created and navigated ahead of time.
+
+    A background task refills the pool while tests run, so checking out a
+    context normally costs nothing. Contexts are never returned to the pool
+    after use: a test may have changed cookies, storage or the page, so
+    released contexts are always closed. Pooled contexts whose page crashed
+    or closed, or that are older than ``max_age`` seconds, are discarded on
+    checkout and replaced.
+    """
+
+    def __init__(self, browser: Browser, url: str, size: int, max_age: float = 0) -> None:
+        """Initialize ContextPool.
+
+        Args:
+            browser: Browser to create contexts in.
+            url: URL each pooled page is navigated to.
+            size: Number of contexts to keep ready.
+            max_age: Discard contexts older than this many seconds (0 = never).
+        """
+        self.browser = browser
+        self.url = url
+        self.size = size
+        self.max_age = max_age
+        self.metrics = PoolMetrics()
+        self._ready: "asyncio.Queue[PooledContext]" = asyncio.Queue()
+        self._creating = 0
+        self._wakeup = asyncio.Event()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def start(self) -> None:
+        """Start background refill task."""
+        if self._refill_task is None:
+            logger.info(f"Starting context pool (size: {self.size}, max age: {self.max_age}s)")
+            self._refill_task = asyncio.get_running_loop().create_task(self._refill_loop())
+
+    async def acquire(self) -> PooledContext:
+        """Check out a ready context, creating one inline on a miss.
+
+        Returns:
+            Pooled context ready for the test.
+        """
+        started = time.perf_counter()
+        hit = True
+        entry = None
+        while entry is None:
+            try:
+                candidate = self._ready.get_nowait()
+            except asyncio.QueueEmpty:
+                hit = False
+                entry = await self._create()
+                break
+            if self._is_usable(candidate):
+                entry = candidate
+            else:
+                hit = False
+                await self._discard(candidate)
+
+        self._wakeup.set()
+        wait = time.perf_counter() - started
+        self.metrics.record_checkout(hit, wait)
+        logger.debug(f"Context checkout ({'hit' if hit else 'miss'}) in {wait * 1000:.1f}ms")
+        return entry
+
+    async def release(self, entry: PooledContext) -> None:
+        """Close a context after the test used it.
+
+        Args:
+            entry: Context previously returned by acquire().
+        """
+        entry.mark_dirty()
+        await BrowserFactory.close_context(entry.context)
+
+    async def close(self) -> None:
+        """Stop refilling and close all pooled contexts."""
+        self._closed = True
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._refill_task = None
+        while not self._ready.empty():
+            await self._discard(self._ready.get_nowait(), count=False)
+        logger.info(self.metrics.summary())
+
+    def _is_usable(self, entry: PooledContext) -> bool:
+        """Check that a pooled context is clean and fresh enough to hand out."""
+        if entry.dirty or entry.page.is_closed():
+            return False
+        return not (self.max_age and entry.age > self.max_age)
+
+    async def _create(self) -> PooledContext:
+        """Create a context and navigate its page to the base URL."""
+        self._creating += 1
+        try:
+            context = await BrowserFactory.create_context(self.browser)
+            try:
+                page = await BrowserFactory.create_page(context)
+                entry = PooledContext(context=context, page=page)
+                page.on("crash", entry.mark_dirty)
+                page.on("close", entry.mark_dirty)
+                # Track requests from the first navigation on, for readiness waits
+                NetworkTracker.for_page(page)
+                await page.goto(self.url)
+            except BaseException:
+                # Base URL down or slow: do not leave the context open
+                await BrowserFactory.close_context(context)
+                raise
+            self.metrics.created += 1
+            return entry
+        finally:
+            self._creating -= 1
+
+    async def _discard(self, entry: PooledContext, count: bool = True) -> None:
+        """Close an unused pooled context."""
+        if count:
+            self.metrics.discarded += 1
+        await BrowserFactory.close_context(entry.context)
+
+    async def _expire_stale(self) -> None:
+        """Drop pooled contexts that became dirty or too old while waiting."""
+        for _ in range(self._ready.qsize()):
+            entry = self._ready.get_nowait()
+            if self._is_usable(entry):
+                self._ready.put_nowait(entry)
+            else:
+                await self._discard(entry)
+
+    async def _refill_loop(self) -> None:
+        """Keep the pool topped up until closed.
+
+        Failed creations are retried with exponential backoff, so an outage
+        of the base URL does not turn into a context every second.
+        """
+        backoff = REFILL_BACKOFF_MIN
+        while not self._closed:
+            await self._expire_stale()
+            while not self._closed and self._ready.qsize() + self._creating < self.size:
+                try:
+                    entry = await self._create()
+                except Exception as e:
+                    logger.warning(f"Failed to pre-warm context, retrying in {backoff:.0f}s: {str(e)}")
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, REFILL_BACKOFF_MAX)
+                    continue
+                backoff = REFILL_BACKOFF_MIN
+                self._ready.put_nowait(entry)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.max_age or None)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,169 @@
+"""HAR record/replay for offline, deterministic PWA runs."""
+
+from __future__ import annotations
+
+import json
+import re
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+
+from pwa.config.browser_config import BrowserConfig
+from pwa.config.settings import settings
+from pwa.src.utils.logger import current_test_id, get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext
+
+logger = get_logger(__name__)
+
+SUITE_HAR = "suite.har"
+PARTS_DIR = ".parts"
+
+
+class HarArchive:
+    """Records traffic of every context into HAR files and replays it.
+
+    ``HAR_MODE=record`` (``--har-record``) records each context with
+    Playwright's ``record_har_path``. With ``HAR_SCOPE=suite`` every context
+    writes a part file and the parts are merged into ``HAR_DIR/suite.har``
+    when the session ends; with ``HAR_SCOPE=test`` each test gets
+    ``HAR_DIR/<test id>.har``.
+
+    ``HAR_MODE=replay`` (``--har-replay``) serves responses with
+    ``context.route_from_har``. Requests missing from the archive are
+    aborted, or sent to the network with ``HAR_NOT_FOUND=fallback``. A test
+    without its own HAR falls back to the suite archive.
+    """
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether contexts are recorded or replayed."""
+        return settings.har_mode in ("record", "replay")
+
+    @staticmethod
+    def per_test() -> bool:
+        """Whether each test has its own HAR file."""
+        return HarArchive.enabled() and settings.har_scope == "test"
+
+    @staticmethod
+    def har_dir() -> Path:
+        """Directory HAR files are recorded to and replayed from."""
+        return Path(settings.har_dir)
+
+    @classmethod
+    def test_har_path(cls, test_id: str) -> Path:
+        """HAR file of a single test.
+
+        Args:
+            test_id: Pytest node id.
+
+        Returns:
+            Path under ``HAR_DIR`` derived from the node id.
+        """
+        return cls.har_dir() / (re.sub(r"[^\w.-]+", "_", test_id).strip("_") + ".har")
+
+    @classmethod
+    def context_options(cls) -> Dict[str, Any]:
+        """Extra ``new_context`` options for record mode.
+
+        Returns:
+            HAR recording options, or an empty dict outside record mode.
+        """
+        if settings.har_mode != "record":
+            return {}
+        test_id = current_test_id.get()
+        if settings.har_scope == "test" and test_id != "-":
+            path = cls.test_har_path(test_id)
+        else:
+            path = cls.har_dir() / PARTS_DIR / f"{uuid.uuid4().hex}.har"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Recording HAR to {path}")
+        return BrowserConfig.get_har_record_options(str(path))
+
+    @classmethod
+    async def install(cls, context: BrowserContext) -> None:
+        """Serve a context's requests from the recorded archive (replay mode).
+
+        Args:
+            context: Freshly created browser context.
+
+        Raises:
+            FileNotFoundError: If no archive was recorded.
+            ValueError: If HAR_NOT_FOUND is neither "abort" nor "fallback".
+        """
+        if settings.har_mode != "replay":
+            return
+        not_found: Literal["abort", "fallback"]
+        if settings.har_not_found == "abort":
+            not_found = "abort"
+        elif settings.har_not_found == "fallback":
+            not_found = "fallback"
+        else:
+            raise ValueError(f"Unknown HAR_NOT_FOUND '{settings.har_not_found}', expected 'abort' or 'fallback'")
+        path = cls._replay_path()
+        await context.route_from_har(path, not_found=not_found)
+        logger.debug(f"Replaying HAR from {path}")
+
+    @classmethod
+    def _replay_path(cls) -> Path:
+        """Pick the test's own archive if it has one, else the suite archive."""
+        test_id = current_test_id.get()
+        if settings.har_scope == "test" and test_id != "-":
+            path = cls.test_har_path(test_id)
+            if path.exists():
+                return path
+            logger.warning(f"No HAR recorded for {test_id}, using {SUITE_HAR}")
+        path = cls.har_dir() / SUITE_HAR
+        if not path.exists():
+            raise FileNotFoundError(f"No HAR archive at {path}. Record one with --har-record.")
+        return path
+
+    @classmethod
+    def merge_parts(cls) -> Optional[Path]:
+        """Merge part files recorded by all contexts into the suite archive.
+
+        Entries are deduplicated by method, URL and request body, keeping the
+        first recorded response. Part files are removed afterwards.
+
+        Returns:
+            Path of the suite archive, or None if nothing was recorded.
+        """
+        parts = sorted((cls.har_dir() / PARTS_DIR).glob("*.har"))
+        if not parts:
+            return None
+
+        merged: Optional[Dict[str, Any]] = None
+        entries: List[Dict[str, Any]] = []
+        seen = set()
+        for part in parts:
+            try:
+                har = json.loads(part.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable HAR part {part}: {str(e)}")
+                continue
+            if merged is None:
+                merged = har
+            for entry in har["log"].get("entries", []):
+                request = entry["request"]
+                key = (
+                    request["method"],
+                    request["url"],
+                    (request.get("postData") or {}).get("text"),
+                )
+                if key not in seen:
+                    seen.add(key)
+                    entries.append(entry)
+
+        if merged is None:
+            return None
+        merged["log"]["entries"] = entries
+        merged["log"]["pages"] = []
+        path = cls.har_dir() / SUITE_HAR
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(merged))
+        tmp_path.replace(path)
+        for part in parts:
+            part.unlink(missing_ok=True)
+        logger.info(f"Merged {len(parts)} HAR parts ({len(entries)} entries) into {path}")
+        return path
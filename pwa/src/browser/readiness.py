@@ -0,0 +1,194 @@
+"""App-aware page readiness: in-flight request tracking and latency reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from pwa.config.browser_config import ANALYTICS_URL_GLOBS
+from pwa.config.settings import settings
+from pwa.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Request
+
+logger = get_logger(__name__)
+
+# Long-lived connections that never "finish" and would keep a page busy forever
+IGNORED_RESOURCE_TYPES = frozenset({"eventsource", "websocket"})
+
+# playwright's networkidle waits for 500ms without requests
+NETWORKIDLE_QUIET_MS = 500
+
+
+@dataclass
+class ReadinessStats:
+    """Readiness latencies per page object, for the session."""
+
+    waits: Dict[str, List[float]] = field(default_factory=dict)
+    timeouts: int = 0
+
+    def record(self, page_name: str, seconds: float) -> None:
+        """Add one readiness wait.
+
+        Args:
+            page_name: Page object class name.
+            seconds: Time until the page was ready.
+        """
+        self.waits.setdefault(page_name, []).append(seconds)
+
+    def summary(self) -> str:
+        """Human-readable summary, one line per page object."""
+        lines = [f"Page readiness ({self.timeouts} timed out):" if self.timeouts else "Page readiness:"]
+        for page_name, seconds in sorted(self.waits.items()):
+            mean = sum(seconds) / len(seconds)
+            lines.append(
+                f"  {page_name}: {len(seconds)} waits, mean {mean * 1000:.0f}ms, "
+                f"max {max(seconds) * 1000:.0f}ms "
+                f"(networkidle adds >= {NETWORKIDLE_QUIET_MS}ms quiet time to each)"
+            )
+        return "\n".join(lines)
+
+
+class NetworkTracker:
+    """Counts a page's in-flight requests to tell when its network is quiet.
+
+    Replaces ``wait_for_load_state("networkidle")``, which always adds 500ms
+    of quiet time and never settles on pages that poll or send analytics.
+    Requests to ``ANALYTICS_URL_GLOBS``, to ``READINESS_IGNORE_URLS`` and
+    long-lived connections (EventSource, WebSocket) are not tracked; the
+    network is quiet once no tracked request has been in flight for
+    ``READINESS_QUIET_MS``.
+
+    One tracker is attached per page (``for_page``), as early as possible
+    so it sees the requests of the first navigation.
+    """
+
+    _trackers: "weakref.WeakKeyDictionary[Page, NetworkTracker]" = weakref.WeakKeyDictionary()
+    totals = ReadinessStats()
+
+    def __init__(self, page: Page, ignore_globs: Tuple[str, ...] = ()) -> None:
+        """Initialize NetworkTracker and subscribe to the page's request events.
+
+        Args:
+            page: Playwright Page instance.
+            ignore_globs: fnmatch-style URL patterns that are not tracked.
+        """
+        self.page = page
+        self.ignore_globs = ignore_globs
+        self._in_flight: Set[Request] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._generation = 0
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "NetworkTracker":
+        """Get the page's tracker, attaching one on first use.
+
+        Args:
+            page: Playwright Page instance.
+
+        Returns:
+            Tracker of the page.
+        """
+        tracker = cls._trackers.get(page)
+        if tracker is None:
+            ignore = tuple(
+                pattern.strip() for pattern in settings.readiness_ignore_urls.split(",") if pattern.strip()
+            )
+            tracker = cls(page, ANALYTICS_URL_GLOBS + ignore)
+            cls._trackers[page] = tracker
+        return tracker
+
+    @property
+    def in_flight(self) -> List[str]:
+        """URLs of tracked requests still in flight."""
+        return [request.url for request in self._in_flight]
+
+    def tracks(self, request: Request) -> bool:
+        """Check whether a request counts towards readiness.
+
+        Args:
+            request: Playwright request.
+
+        Returns:
+            True unless the request is ignored.
+        """
+        if request.resource_type in IGNORED_RESOURCE_TYPES:
+            return False
+        return not any(fnmatch(request.url, pattern) for pattern in self.ignore_globs)
+
+    def _on_request(self, request: Request) -> None:
+        if not self.tracks(request):
+            return
+        self._in_flight.add(request)
+        self._generation += 1
+        self._idle.clear()
+
+    def _on_done(self, request: Request) -> None:
+        if request not in self._in_flight:
+            return
+        self._in_flight.discard(request)
+        if not self._in_flight:
+            self._idle.set()
+
+    async def wait_for_quiet(
+        self, quiet_ms: Optional[int] = None, timeout: Optional[float] = None
+    ) -> None:
+        """Wait until no tracked request has been in flight for ``quiet_ms``.
+
+        Args:
+            quiet_ms: Quiet window in milliseconds. Defaults to ``READINESS_QUIET_MS``.
+            timeout: Timeout in milliseconds. Defaults to ``PLAYWRIGHT_TIMEOUT``.
+
+        Raises:
+            playwright.async_api.TimeoutError: If the network does not settle
+                in time; the message lists the requests still in flight.
+        """
+        quiet = (settings.readiness_quiet_ms if quiet_ms is None else quiet_ms) / 1000
+        actual_timeout = timeout or settings.playwright_timeout
+        deadline = time.monotonic() + actual_timeout / 1000
+        while True:
+            try:
+                await asyncio.wait_for(self._idle.wait(), max(deadline - time.monotonic(), 0))
+                generation = self._generation
+                await asyncio.sleep(min(quiet, max(deadline - time.monotonic(), 0)))
+            except asyncio.TimeoutError:
+                pass
+            else:
+                # Quiet if nothing new started during the window
+                if generation == self._generation and self._idle.is_set():
+                    return
+            if time.monotonic() >= deadline:
+                from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+                NetworkTracker.totals.timeouts += 1
+                pending = ", ".join(self.in_flight[:5]) or "requests kept starting"
+                raise PlaywrightTimeoutError(
+                    f"Timeout {actual_timeout}ms exceeded waiting for network quiet: {pending}"
+                )
+
+    @classmethod
+    def record(cls, page_name: str, seconds: float) -> None:
+        """Add a readiness wait to the session totals.
+
+        Args:
+            page_name: Page object class name.
+            seconds: Time until the page was ready.
+        """
+        cls.totals.record(page_name, seconds)
+        logger.debug("%s ready in %.0fms", page_name, seconds * 1000)
+
+    @classmethod
+    def close(cls) -> None:
+        """Log session readiness latencies and reset them."""
+        if cls.totals.waits or cls.totals.timeouts:
+            logger.info(cls.totals.summary())
+        cls.totals = ReadinessStats()
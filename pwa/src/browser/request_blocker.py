@@ -0,0 +1,114 @@
+"""Context-level request blocking driven by BrowserConfig policies."""
+
+from __future__ import annotations
+
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional
+
+from pwa.config.browser_config import BlockingPolicy
+from pwa.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Response, Route
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BlockingStats:
+    """Blocked-request counters for one context (or the whole session)."""
+
+    requests: int = 0
+    bytes: int = 0
+    by_type: Counter = field(default_factory=Counter)
+
+    def add(self, other: "BlockingStats") -> None:
+        """Accumulate counters of another stats object."""
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.by_type.update(other.by_type)
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        types = ", ".join(f"{name}: {count}" for name, count in self.by_type.most_common())
+        return (
+            f"Blocked {self.requests} requests (~{self.bytes / 1024:.1f} KB known size)"
+            + (f" [{types}]" if types else "")
+        )
+
+
+class RequestBlocker:
+    """Aborts requests matched by a ``BlockingPolicy`` before they are sent.
+
+    The route is installed after the HAR and asset-cache routes, so it runs
+    first and blocked requests never reach them. Requests that are not
+    blocked fall back to the other routes or the network.
+
+    Blocked bytes cannot be measured (the response is never fetched), so
+    they are estimated from the ``Content-Length`` each URL had when a
+    context without that block loaded it earlier in the session.
+    """
+
+    _stats: "weakref.WeakKeyDictionary[BrowserContext, BlockingStats]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _known_sizes: Dict[str, int] = {}
+    totals = BlockingStats()
+
+    @classmethod
+    async def install(cls, context: BrowserContext, policy: Optional[BlockingPolicy]) -> None:
+        """Observe response sizes and, if a policy is given, block its requests.
+
+        Args:
+            context: Freshly created browser context.
+            policy: Policy to enforce, or None to only observe sizes.
+        """
+        context.on("response", cls._observe)
+        if policy is None:
+            return
+        stats = BlockingStats()
+        cls._stats[context] = stats
+
+        async def handle(route: Route) -> None:
+            request = route.request
+            if policy.blocks(request.url, request.resource_type):
+                stats.requests += 1
+                stats.bytes += cls._known_sizes.get(request.url, 0)
+                stats.by_type[request.resource_type] += 1
+                await route.abort("blockedbyclient")
+            else:
+                await route.fallback()
+
+        await context.route("**/*", handle)
+
+    @classmethod
+    def report(cls, context: BrowserContext) -> Optional[BlockingStats]:
+        """Log and return the stats of a context about to be closed.
+
+        Args:
+            context: Context previously passed to ``install``.
+
+        Returns:
+            Stats of the context, or None if it had no policy.
+        """
+        stats = cls._stats.pop(context, None)
+        if stats is not None and stats.requests:
+            cls.totals.add(stats)
+            logger.info(stats.summary())
+        return stats
+
+    @classmethod
+    def close(cls) -> None:
+        """Log session totals."""
+        if cls.totals.requests:
+            logger.info(f"Session total: {cls.totals.summary()}")
+        cls.totals = BlockingStats()
+
+    @classmethod
+    def _observe(cls, response: Response) -> None:
+        """Remember the size of a response for blocked-bytes estimates."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            cls._known_sizes[response.url] = int(length)
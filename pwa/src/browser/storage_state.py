@@ -0,0 +1,241 @@
+"""Named storage-state snapshots for starting tests in a pre-seeded app state."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Tuple
+
+from pwa.config.browser_config import BrowserConfig
+from pwa.config.settings import settings
+from pwa.src.browser.har_archive import HarArchive
+from pwa.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
+logger = get_logger(__name__)
+
+StateBuilder = Callable[["Page"], Awaitable[None]]
+
+# Dumps object stores of every IndexedDB database visible to the page's origin.
+DUMP_INDEXED_DB_JS = """
+async () => {
+  if (!window.indexedDB || !indexedDB.databases) return [];
+  const request = (req) => new Promise((resolve, reject) => {
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => reject(req.error);
+  });
+  const result = [];
+  for (const info of await indexedDB.databases()) {
+    const db = await request(indexedDB.open(info.name));
+    const stores = [];
+    for (const name of Array.from(db.objectStoreNames)) {
+      const store = db.transaction(name, "readonly").objectStore(name);
+      const records = await new Promise((resolve, reject) => {
+        const out = [];
+        const cursor = store.openCursor();
+        cursor.onsuccess = () => {
+          const c = cursor.result;
+          if (!c) return resolve(out);
+          out.push({ key: c.primaryKey, value: c.value });
+          c.continue();
+        };
+        cursor.onerror = () => reject(cursor.error);
+      });
+      stores.push({ name, keyPath: store.keyPath, autoIncrement: store.autoIncrement, records });
+    }
+    result.push({ name: db.name, version: db.version, stores });
+    db.close();
+  }
+  return result;
+}
+"""
+
+# Re-creates dumped object stores once per context, before app scripts run.
+RESTORE_INDEXED_DB_JS = """
+(function (origin, databases) {
+  if (location.origin !== origin || localStorage.getItem("__qaIdbRestored")) return;
+  localStorage.setItem("__qaIdbRestored", "1");
+  databases.forEach(function (db) {
+    const req = indexedDB.open(db.name, db.version);
+    req.onupgradeneeded = function () {
+      db.stores.forEach(function (store) {
+        if (!req.result.objectStoreNames.contains(store.name)) {
+          req.result.createObjectStore(store.name, {
+            keyPath: store.keyPath === null ? undefined : store.keyPath,
+            autoIncrement: store.autoIncrement,
+          });
+        }
+      });
+    };
+    req.onsuccess = function () {
+      const handle = req.result;
+      const names = db.stores.map(function (s) { return s.name; })
+        .filter(function (n) { return handle.objectStoreNames.contains(n); });
+      if (!names.length) return handle.close();
+      const tx = handle.transaction(names, "readwrite");
+      db.stores.forEach(function (store) {
+        if (names.indexOf(store.name) === -1) return;
+        const target = tx.objectStore(store.name);
+        store.records.forEach(function (r) {
+          if (target.keyPath === null) target.put(r.value, r.key);
+          else target.put(r.value);
+        });
+      });
+      tx.oncomplete = function () { handle.close(); };
+    };
+  });
+})(%s, %s);
+"""
+
+
+def _write_json(path: Path, data: object) -> None:
+    """Write JSON through a temp file so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+@dataclass
+class StorageSnapshot:
+    """Storage state captured on disk for one named app state."""
+
+    name: str
+    path: Path
+    indexed_db_path: Path
+
+    def indexed_db_init_script(self) -> Optional[str]:
+        """Build init script that restores IndexedDB, if any was captured.
+
+        Returns:
+            JavaScript source for ``context.add_init_script`` or None.
+        """
+        if not self.indexed_db_path.exists():
+            return None
+        dump = json.loads(self.indexed_db_path.read_text())
+        if not dump.get("databases"):
+            return None
+        return RESTORE_INDEXED_DB_JS % (json.dumps(dump["origin"]), json.dumps(dump["databases"]))
+
+
+class StorageStateCache:
+    """Builds named app states once and caches them on disk.
+
+    A state is produced by a registered builder that drives the UI (e.g. adds
+    a product to the cart). Cookies and localStorage are captured with
+    Playwright's ``storage_state``; IndexedDB object stores are dumped
+    separately and restored through an init script (indexes are not
+    recreated). Snapshots live under ``REPORT_DIR/storage_state/<key>`` where
+    the key hashes the base URL and ``PWA_APP_BUILD``. With a build id set,
+    snapshots are reused across sessions; otherwise they are rebuilt once
+    per session.
+
+    Example:
+        @StorageStateCache.register("cart_with_1_item")
+        async def cart_with_1_item(page: Page) -> None:
+            await HomePage(page).add_first_product_to_cart()
+    """
+
+    _builders: Dict[str, StateBuilder] = {}
+    _snapshots: Dict[str, StorageSnapshot] = {}
+    _locks: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Lock] = {}
+
+    @classmethod
+    def register(cls, name: str) -> Callable[[StateBuilder], StateBuilder]:
+        """Register a builder for a named state.
+
+        Args:
+            name: State name used in ``@pytest.mark.storage_state(name)``.
+
+        Returns:
+            Decorator registering the builder.
+        """
+        def decorator(builder: StateBuilder) -> StateBuilder:
+            cls._builders[name] = builder
+            return builder
+
+        return decorator
+
+    @staticmethod
+    def cache_dir() -> Path:
+        """Directory for snapshots of the current base URL and app build."""
+        key = f"{settings.pwa_base_url}|{settings.pwa_app_build}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return Path(settings.report_dir) / "storage_state" / digest
+
+    @classmethod
+    async def get(cls, name: str, browser: Browser) -> StorageSnapshot:
+        """Get snapshot for a named state, building it if needed.
+
+        Args:
+            name: Registered state name.
+            browser: Browser used to build the state.
+
+        Returns:
+            Snapshot with paths to the captured state.
+
+        Raises:
+            KeyError: If no builder is registered under ``name``.
+        """
+        if name in cls._snapshots:
+            return cls._snapshots[name]
+        if name not in cls._builders:
+            raise KeyError(f"Unknown storage state '{name}'. Registered: {sorted(cls._builders)}")
+
+        # Locks are bound to an event loop and a session may run more than one
+        lock = cls._locks.setdefault((asyncio.get_running_loop(), name), asyncio.Lock())
+        async with lock:
+            if name in cls._snapshots:
+                return cls._snapshots[name]
+
+            directory = cls.cache_dir()
+            snapshot = StorageSnapshot(
+                name=name,
+                path=directory / f"{name}.json",
+                indexed_db_path=directory / f"{name}.indexeddb.json",
+            )
+            if settings.pwa_app_build and snapshot.path.exists():
+                logger.info(f"Using cached storage state '{name}' from {snapshot.path}")
+            else:
+                await cls._build(name, browser, snapshot)
+            cls._snapshots[name] = snapshot
+            return snapshot
+
+    @classmethod
+    async def _build(cls, name: str, browser: Browser, snapshot: StorageSnapshot) -> None:
+        """Run builder in a scratch context and capture its storage."""
+        logger.info(f"Building storage state '{name}'")
+        snapshot.path.parent.mkdir(parents=True, exist_ok=True)
+        options = BrowserConfig.get_context_options()
+        options.update(HarArchive.context_options())
+        context = await browser.new_context(**options)
+        try:
+            await HarArchive.install(context)
+            page = await context.new_page()
+            await page.goto(settings.pwa_base_url)
+            await cls._builders[name](page)
+            state = await context.storage_state()
+            try:
+                databases = await page.evaluate(DUMP_INDEXED_DB_JS)
+                origin = await page.evaluate("location.origin")
+            except Exception as e:
+                logger.warning(f"Could not capture IndexedDB for '{name}': {str(e)}")
+                databases, origin = [], ""
+            # Other xdist workers check snapshot.path, so it is replaced last
+            _write_json(snapshot.indexed_db_path, {"origin": origin, "databases": databases})
+            _write_json(snapshot.path, state)
+            logger.info(f"Storage state '{name}' saved to {snapshot.path}")
+        finally:
+            await context.close()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget snapshots built in this session (files stay on disk)."""
+        cls._snapshots.clear()
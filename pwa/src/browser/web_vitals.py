@@ -0,0 +1,471 @@
+"""Web vitals and navigation timing of the app, with per-page percentiles and budgets."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from pwa.config.settings import settings
+from pwa.src.utils.logger import current_test_id, get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+logger = get_logger(__name__)
+
+# Installed in every context; keeps one state object per top-level document
+VITALS_INIT_SCRIPT = r"""
+(() => {
+  if (window.__pwaVitals || window !== window.top || typeof PerformanceObserver === "undefined") return;
+  const vitals = window.__pwaVitals = {
+    doc: Math.random().toString(36).slice(2),
+    url: location.href,
+    lcp: null,
+    cls: 0,
+    longTasks: [],
+    interactions: {},
+    observers: [],
+  };
+  let sessionValue = 0, sessionFirst = 0, sessionLast = 0;
+  const handlers = {
+    "largest-contentful-paint": entry => { vitals.lcp = entry.startTime; },
+    // CLS: largest burst of shifts less than 1s apart, at most 5s long
+    "layout-shift": entry => {
+      if (entry.hadRecentInput) return;
+      if (sessionValue && entry.startTime - sessionLast < 1000 && entry.startTime - sessionFirst < 5000) {
+        sessionValue += entry.value;
+      } else {
+        sessionValue = entry.value;
+        sessionFirst = entry.startTime;
+      }
+      sessionLast = entry.startTime;
+      vitals.cls = Math.max(vitals.cls, sessionValue);
+    },
+    "longtask": entry => { vitals.longTasks.push([entry.startTime, entry.duration]); },
+    "event": entry => {
+      if (!entry.interactionId) return;
+      const id = entry.interactionId;
+      vitals.interactions[id] = Math.max(vitals.interactions[id] || 0, entry.duration);
+    },
+  };
+  const supported = PerformanceObserver.supportedEntryTypes || [];
+  vitals.supported = Object.keys(handlers).filter(type => supported.includes(type));
+  for (const type of vitals.supported) {
+    const handle = handlers[type];
+    const observer = new PerformanceObserver(list => list.getEntries().forEach(handle));
+    observer.observe(type === "event" ? {type, buffered: true, durationThreshold: 16} : {type, buffered: true});
+    vitals.observers.push([observer, handle]);
+  }
+  // Entries are delivered asynchronously; take the pending ones before reading
+  vitals.flush = () => vitals.observers.forEach(([observer, handle]) => observer.takeRecords().forEach(handle));
+  if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(1000);
+})();
+"""
+
+_SNAPSHOT_JS = """() => {
+  const v = window.__pwaVitals;
+  if (!v) return null;
+  v.flush();
+  const nav = performance.getEntriesByType("navigation")[0];
+  const resources = performance.getEntriesByType("resource");
+  let slowest = null;
+  for (const r of resources) if (!slowest || r.duration > slowest.duration) slowest = r;
+  // INP: worst interaction, ignoring one outlier per 50 interactions
+  const durations = Object.values(v.interactions).sort((a, b) => b - a);
+  return {
+    doc: v.doc,
+    url: v.url,
+    lcp: v.lcp,
+    cls: v.supported.includes("layout-shift") ? v.cls : null,
+    inp: durations.length ? durations[Math.min(Math.floor(durations.length / 50), durations.length - 1)] : null,
+    interactions: durations.length,
+    longTasks: v.longTasks,
+    ttfb: nav ? nav.responseStart : null,
+    domContentLoaded: nav && nav.domContentLoadedEventEnd ? nav.domContentLoadedEventEnd : null,
+    load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+    resources: resources.length,
+    transferBytes: resources.reduce((total, r) => total + (r.transferSize || 0), 0),
+    slowestResource: slowest ? [slowest.name, slowest.duration] : null,
+  };
+}"""
+
+_MARK_JS = "() => window.__pwaVitals ? [window.__pwaVitals.doc, performance.now()] : null"
+
+_LONG_TASKS_SINCE_JS = """([doc, since]) => {
+  const v = window.__pwaVitals;
+  if (!v) return null;
+  v.flush();
+  // After a navigation the window covers the new document from its start
+  const from = v.doc === doc ? since : 0;
+  return v.longTasks.filter(([start, duration]) => start + duration > from);
+}"""
+
+# Aggregated and budgeted metrics of a page load
+METRICS: Tuple[str, ...] = (
+    "lcp_ms", "cls", "inp_ms", "ttfb_ms", "dom_content_loaded_ms", "load_ms",
+    "max_long_task_ms", "total_blocking_ms", "transfer_kb",
+)
+
+# Long tasks block input for the time beyond this
+LONG_TASK_BLOCKING_MS = 50
+
+
+@dataclass
+class PageVitals:
+    """Web vitals and navigation timing of one document, attributed to a page object."""
+
+    page_name: str
+    url: str
+    document: str
+    test_id: str = "-"
+    lcp_ms: Optional[float] = None
+    cls: Optional[float] = None
+    inp_ms: Optional[float] = None
+    interactions: int = 0
+    ttfb_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_ms: Optional[float] = None
+    long_tasks: List[Tuple[float, float]] = field(default_factory=list)
+    resources: int = 0
+    transfer_bytes: int = 0
+    slowest_resource: Optional[Tuple[str, float]] = None
+    # False while the document is only known by its URL path
+    named: bool = False
+
+    @property
+    def max_long_task_ms(self) -> float:
+        """Longest long task, 0 if there was none."""
+        return max((duration for _, duration in self.long_tasks), default=0.0)
+
+    @property
+    def total_blocking_ms(self) -> float:
+        """Sum of the long tasks' time beyond 50ms."""
+        return sum(max(duration - LONG_TASK_BLOCKING_MS, 0.0) for _, duration in self.long_tasks)
+
+    @property
+    def transfer_kb(self) -> float:
+        """Bytes transferred for subresources, in KB."""
+        return self.transfer_bytes / 1024
+
+    def update(self, snapshot: Dict[str, Any]) -> None:
+        """Take the latest values read from the document.
+
+        Args:
+            snapshot: Result of the in-page snapshot script.
+        """
+        self.lcp_ms = snapshot["lcp"]
+        self.cls = snapshot["cls"]
+        self.inp_ms = snapshot["inp"]
+        self.interactions = snapshot["interactions"]
+        self.ttfb_ms = snapshot["ttfb"]
+        self.dom_content_loaded_ms = snapshot["domContentLoaded"]
+        self.load_ms = snapshot["load"]
+        self.long_tasks = [(start, duration) for start, duration in snapshot["longTasks"]]
+        self.resources = snapshot["resources"]
+        self.transfer_bytes = snapshot["transferBytes"]
+        slowest = snapshot["slowestResource"]
+        self.slowest_resource = (slowest[0], slowest[1]) if slowest else None
+
+    def metric(self, name: str) -> Optional[float]:
+        """Value of one of ``METRICS``.
+
+        Args:
+            name: Metric name, e.g. ``"lcp_ms"``.
+
+        Returns:
+            The value, or None if it is not measured (LCP, CLS and INP
+            need Chromium, INP an interaction, load times a finished load).
+
+        Raises:
+            ValueError: If the metric is unknown.
+        """
+        if name not in METRICS:
+            raise ValueError(f"Unknown web vitals metric '{name}', expected one of {', '.join(METRICS)}")
+        value: Optional[float] = getattr(self, name)
+        return value
+
+    def metrics(self) -> Dict[str, Optional[float]]:
+        """All ``METRICS`` by name."""
+        return {name: getattr(self, name) for name in METRICS}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Compact form for test reports."""
+        values = {name: round(value, 3) for name, value in self.metrics().items() if value is not None}
+        return {"page": self.page_name, "url": self.url, "interactions": self.interactions,
+                "long_tasks": len(self.long_tasks), "resources": self.resources, **values}
+
+
+@dataclass
+class ActionWindow:
+    """Long tasks of the app while one test action ran (see ``WebVitals.measure``)."""
+
+    name: str
+    seconds: float = 0.0
+    measured: bool = False
+    long_tasks: List[Tuple[float, float]] = field(default_factory=list)
+
+    @property
+    def max_long_task_ms(self) -> float:
+        """Longest long task during the action, 0 if there was none."""
+        return max((duration for _, duration in self.long_tasks), default=0.0)
+
+
+@dataclass
+class VitalsStats:
+    """Metric samples per page object (or measured action), for the session."""
+
+    samples: Dict[str, Dict[str, List[float]]] = field(default_factory=dict)
+
+    def record(self, name: str, metrics: Dict[str, Optional[float]]) -> None:
+        """Add one page load or action.
+
+        Args:
+            name: Page object class name or action name.
+            metrics: Values by metric name; None values are skipped.
+        """
+        samples = self.samples.setdefault(name, {})
+        for metric, value in metrics.items():
+            if value is not None:
+                samples.setdefault(metric, []).append(value)
+
+    def merge(self, samples: Dict[str, Dict[str, List[float]]]) -> None:
+        """Add the samples of another worker.
+
+        Args:
+            samples: ``samples`` of another ``VitalsStats``.
+        """
+        for name, metrics in samples.items():
+            mine = self.samples.setdefault(name, {})
+            for metric, values in metrics.items():
+                mine.setdefault(metric, []).extend(values)
+
+    @staticmethod
+    def percentile(values: List[float], percent: float) -> float:
+        """Nearest-rank percentile.
+
+        Args:
+            values: Samples, in any order.
+            percent: Percentile, e.g. 75.
+
+        Returns:
+            The smallest sample not exceeded by ``percent`` % of the samples.
+        """
+        ordered = sorted(values)
+        return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+    def summary(self, budgets: Optional[Dict[str, float]] = None) -> str:
+        """Percentile table per page object; p75 values over budget are marked.
+
+        Args:
+            budgets: Limits by metric name.
+        """
+        budgets = budgets or {}
+        lines = ["Web vitals (p50 / p75 / p95):"]
+        for name, metrics in sorted(self.samples.items()):
+            count = max(len(values) for values in metrics.values())
+            lines.append(f"  {name} (n={count})")
+            for metric, values in sorted(metrics.items(), key=lambda item: _metric_order(item[0])):
+                p50, p75, p95 = (self.percentile(values, percent) for percent in (50, 75, 95))
+                decimals = 3 if metric == "cls" else 0
+                row = f"    {metric:<22} {p50:9.{decimals}f} / {p75:9.{decimals}f} / {p95:9.{decimals}f}"
+                budget = budgets.get(metric)
+                if budget is not None and p75 > budget:
+                    row += f"   p75 over budget {budget:g}"
+                lines.append(row)
+        return "\n".join(lines)
+
+
+def _metric_order(metric: str) -> int:
+    return METRICS.index(metric) if metric in METRICS else len(METRICS)
+
+
+class WebVitals:
+    """Collects the app's web vitals in every context, per document and page object.
+
+    ``BrowserFactory.create_context`` installs ``VITALS_INIT_SCRIPT``:
+    PerformanceObservers for LCP, layout shifts (CLS), event timing (INP)
+    and long tasks in each top-level document, next to the navigation and
+    resource timing the browser keeps anyway. Nothing leaves the page until
+    it is read: ``BasePage.wait_until_ready`` reads the values of the
+    current document once the page object is ready (one ``evaluate``) and
+    attributes the document to that page object; ``finish`` reads them
+    again at test teardown, when CLS and INP are final.
+
+    Finished page loads are added to per-page percentile tables
+    (``totals``); ``measure`` times a single action and the long tasks it
+    caused. ``WEB_VITALS_BUDGETS`` holds the default limits used by
+    ``CustomAssertions.assert_vital_within_budget``. LCP, CLS, INP and long
+    tasks are only reported by Chromium; elsewhere the first three stay
+    None and no long tasks are seen.
+    """
+
+    _documents: "weakref.WeakKeyDictionary[Page, List[PageVitals]]" = weakref.WeakKeyDictionary()
+    totals = VitalsStats()
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether ``WEB_VITALS`` is on."""
+        return settings.web_vitals
+
+    @staticmethod
+    def budgets() -> Dict[str, float]:
+        """Default budgets parsed from ``WEB_VITALS_BUDGETS`` (``metric=limit`` pairs)."""
+        budgets: Dict[str, float] = {}
+        for pair in settings.web_vitals_budgets.split(","):
+            if "=" in pair:
+                metric, limit = pair.split("=", 1)
+                budgets[metric.strip()] = float(limit)
+        return budgets
+
+    @staticmethod
+    async def install(context: BrowserContext) -> None:
+        """Add the observers to every document of a context.
+
+        Args:
+            context: Browser context, before its first page is opened.
+        """
+        await context.add_init_script(VITALS_INIT_SCRIPT)
+
+    @classmethod
+    async def collect(cls, page: Page, page_name: Optional[str] = None) -> Optional[PageVitals]:
+        """Read the current document's values.
+
+        The first page object naming a document owns it; until one does, it
+        is attributed to its URL path.
+
+        Args:
+            page: Playwright Page instance.
+            page_name: Page object class name.
+
+        Returns:
+            The document's vitals, or None if the page has no observers (or
+            could not be read).
+        """
+        try:
+            snapshot = await page.evaluate(_SNAPSHOT_JS)
+        except Exception as e:
+            # Closed, crashed or mid-navigation
+            logger.debug("Could not read web vitals: %s", e)
+            return None
+        if snapshot is None:
+            return None
+        documents = cls._documents.setdefault(page, [])
+        vitals = next((v for v in reversed(documents) if v.document == snapshot["doc"]), None)
+        if vitals is None:
+            vitals = PageVitals(
+                urlparse(snapshot["url"]).path or "/",
+                snapshot["url"],
+                snapshot["doc"],
+                test_id=current_test_id.get(),
+            )
+            documents.append(vitals)
+        if page_name and not vitals.named:
+            vitals.page_name, vitals.named = page_name, True
+        vitals.update(snapshot)
+        return vitals
+
+    @classmethod
+    @asynccontextmanager
+    async def measure(cls, page: Page, name: str) -> AsyncIterator[ActionWindow]:
+        """Record the long tasks the app ran during an action.
+
+        Example:
+            async with WebVitals.measure(page, "ProductsPage.sort_by") as window:
+                await products_page.sort_by("price")
+            CustomAssertions.assert_no_long_task(window, max_ms=200)
+
+        Args:
+            page: Playwright Page instance.
+            name: Action name, a row of the session table.
+
+        Yields:
+            The window; filled in when the block exits without an error.
+        """
+        window = ActionWindow(name)
+        mark = await page.evaluate(_MARK_JS)
+        started = time.perf_counter()
+        yield window
+        window.seconds = time.perf_counter() - started
+        long_tasks = await page.evaluate(_LONG_TASKS_SINCE_JS, mark or [None, 0])
+        if long_tasks is None:
+            return
+        window.measured = True
+        window.long_tasks = [(start, duration) for start, duration in long_tasks]
+        cls.totals.record(name, {
+            "duration_ms": window.seconds * 1000,
+            "max_long_task_ms": window.max_long_task_ms,
+        })
+
+    @classmethod
+    async def finish(cls, page: Page) -> List[PageVitals]:
+        """Read the final values and add the page's documents to the session tables.
+
+        Call it at test teardown, before the page closes.
+
+        Args:
+            page: Playwright Page instance of the test.
+
+        Returns:
+            Vitals of every document the test loaded and read, in order.
+        """
+        await cls.collect(page)
+        documents = cls._documents.pop(page, [])
+        for vitals in documents:
+            cls.totals.record(vitals.page_name, vitals.metrics())
+        return documents
+
+    @staticmethod
+    def report_file() -> Path:
+        """Session report: ``REPORT_DIR/web_vitals.json``, or a per-worker part under xdist."""
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        name = f"web_vitals.{worker}.json" if worker else "web_vitals.json"
+        return Path(settings.report_dir) / name
+
+    @classmethod
+    def close(cls) -> Optional[Path]:
+        """Write the session's samples and log the percentile tables (workers leave that to the controller).
+
+        Returns:
+            The file written, or None if nothing was recorded.
+        """
+        stats, cls.totals = cls.totals, VitalsStats()
+        if not stats.samples:
+            return None
+        path = cls.report_file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"samples": stats.samples}, f)
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            logger.info(stats.summary(cls.budgets()))
+        return path
+
+    @classmethod
+    def merge_worker_reports(cls) -> Optional[Path]:
+        """Merge the xdist workers' samples into one report and log its tables.
+
+        Call it on the controller after all workers have finished.
+
+        Returns:
+            The merged file, or None if no worker reports were found.
+        """
+        path = Path(settings.report_dir) / "web_vitals.json"
+        parts = sorted(path.parent.glob("web_vitals.gw*.json"))
+        if not parts:
+            return None
+        stats = VitalsStats()
+        for part in parts:
+            stats.merge(json.loads(part.read_text())["samples"])
+        with open(path, "w") as f:
+            json.dump({"samples": stats.samples}, f)
+        for part in parts:
+            part.unlink()
+        logger.info(stats.summary(cls.budgets()))
+        return path
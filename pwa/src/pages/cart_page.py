@@ -1,10 +1,15 @@
 """Cart page object for PWA demo."""
 
-from playwright.async_api import Page
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Awaitable, List
 
 from pwa.src.base.base_page import BasePage
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 logger = get_logger(__name__)
 
 
@@ -22,10 +27,19 @@ class CartPage(BasePage):
     QUANTITY_INCREASE = "button[data-action='increase']"
     QUANTITY_DECREASE = "button[data-action='decrease']"
 
+    def ready_conditions(self) -> List[Awaitable[Any]]:
+        """Cart is ready once it shows items or the empty-cart message."""
+        return [
+            self.wait.wait_any(
+                self.wait.wait_for_selector_visible(self.CART_ITEMS),
+                self.wait.wait_for_selector_visible(self.EMPTY_CART_MESSAGE),
+            )
+        ]
+
     async def wait_for_page_load(self) -> None:
         """Wait for cart page to load."""
         logger.info("Waiting for cart page to load")
-        await self.page.wait_for_load_state("networkidle")
+        await self.wait_until_ready()
         logger.info("Cart page loaded")
 
     async def get_cart_items_count(self) -> int:
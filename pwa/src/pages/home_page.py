@@ -1,10 +1,15 @@
 """Home page object for Swapy PWA demo."""
 
-from playwright.async_api import Page
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from pwa.src.base.base_page import BasePage
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 logger = get_logger(__name__)
 
 
@@ -1,10 +1,15 @@
 """Products page object for PWA demo."""
 
-from playwright.async_api import Page
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Awaitable, List
 
 from pwa.src.base.base_page import BasePage
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 logger = get_logger(__name__)
 
 
@@ -22,11 +27,17 @@ class ProductsPage(BasePage):
     SORT_DROPDOWN = "select[name='sort']"
     LOADING_SPINNER = ".spinner"
 
+    def ready_conditions(self) -> List[Awaitable[Any]]:
+        """Products are ready once the spinner is gone and the grid is shown."""
+        return [
+            self.wait.wait_for_selector_hidden(self.LOADING_SPINNER, timeout=30000),
+            self.wait.wait_for_selector_visible(self.PRODUCTS_GRID, timeout=10000),
+        ]
+
     async def wait_for_page_load(self) -> None:
         """Wait for products page to load."""
         logger.info("Waiting for products page to load")
-        await self.wait.wait_for_selector_hidden(self.LOADING_SPINNER, timeout=30000)
-        await self.wait.wait_for_selector_visible(self.PRODUCTS_GRID, timeout=10000)
+        await self.wait_until_ready(timeout=30000)
         logger.info("Products page loaded")
 
     async def get_product_count(self) -> int:
@@ -70,5 +81,5 @@ class ProductsPage(BasePage):
         """
         logger.info(f"Sorting products by {sort_option}")
         await self.page.select_option(self.SORT_DROPDOWN, sort_option)
-        await self.wait.wait_for_navigation(timeout=30000)
+        await self.wait_until_ready(timeout=30000)
         logger.info("Products sorted")
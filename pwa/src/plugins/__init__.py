@@ -0,0 +1,16 @@
+"""Pytest plugins for PWA testing framework."""
+
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .concurrent import ConcurrentScheduler
+    from .failure_capture import FailureCapturePlugin
+    from .web_vitals import WebVitalsPlugin
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "ConcurrentScheduler": "concurrent",
+    "FailureCapturePlugin": "failure_capture",
+    "WebVitalsPlugin": "web_vitals",
+})
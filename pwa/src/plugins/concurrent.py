@@ -0,0 +1,219 @@
+"""Pytest plugin running marked async PWA tests concurrently in one event loop."""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Literal, Optional
+
+import pytest
+
+from pwa.src.base.base_test import BaseTest
+from pwa.src.browser.browser_manager import BrowserManager
+from pwa.src.utils.logger import current_test_id, get_logger
+
+logger = get_logger(__name__)
+
+# Markers that need pytest's own runtest protocol to be honoured
+SEQUENTIAL_MARKERS = ("skip", "skipif", "xfail", "usefixtures")
+
+
+class _TestLogCollector(logging.Handler):
+    """Collects log lines per test for the report's captured-log sections."""
+
+    def __init__(self) -> None:
+        """Initialize _TestLogCollector."""
+        super().__init__(logging.DEBUG)
+        self.setFormatter(
+            logging.Formatter("%(levelname)-8s %(name)s:%(filename)s:%(lineno)d %(message)s")
+        )
+        self.lines: Dict[str, List[str]] = defaultdict(list)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store record under the test running in the emitting context."""
+        test_id = current_test_id.get()
+        if test_id != "-":
+            self.lines[test_id].append(self.format(record))
+
+    def pop(self, test_id: str) -> str:
+        """Return and forget the lines collected for a test."""
+        return "\n".join(self.lines.pop(test_id, []))
+
+
+class ConcurrentScheduler:
+    """Runs tests marked ``@pytest.mark.concurrent`` N at a time.
+
+    All PWA page objects are async, so tests spend most of their time waiting
+    on the browser. With ``--concurrency N`` (or ``TEST_CONCURRENCY``) marked
+    tests run as asyncio tasks in one event loop, limited by a semaphore, each
+    in its own context of one shared browser. Every task gets its own
+    ``BrowserManager`` (``BrowserManager.isolate()``) and test id, which
+    tags its log records and screenshot directory.
+
+    Concurrent tests bypass pytest fixtures: ``BaseTest.async_setup`` and
+    ``async_teardown`` are called directly. Tests that are not eligible
+    (sync, outside ``BaseTest``, requesting fixtures, marked skip/xfail) run
+    afterwards through the normal sequential loop. The scheduler is disabled
+    under pytest-xdist, which already owns the run loop in its workers.
+    """
+
+    def __init__(self, concurrency: int) -> None:
+        """Initialize ConcurrentScheduler.
+
+        Args:
+            concurrency: Maximum number of tests running at once.
+        """
+        self.concurrency = concurrency
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: Optional[pytest.Item]):
+        """Tag logs and screenshots of sequentially run tests with their id."""
+        token = current_test_id.set(item.nodeid)
+        try:
+            yield
+        finally:
+            current_test_id.reset(token)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> Optional[bool]:
+        """Run eligible tests concurrently, then the rest one by one."""
+        config = session.config
+        if (
+            self.concurrency <= 1
+            or config.option.collectonly
+            or hasattr(config, "workerinput")
+            or getattr(config.option, "dist", "no") != "no"
+            or session.testsfailed
+        ):
+            return None
+
+        batch = [
+            item for item in session.items if isinstance(item, pytest.Function) and self.is_eligible(item)
+        ]
+        if not batch:
+            return None
+
+        logger.info(f"Running {len(batch)} tests with concurrency {self.concurrency}")
+        started = time.perf_counter()
+        asyncio.run(self._run_batch(session, batch))
+        logger.info(f"Concurrent batch finished in {time.perf_counter() - started:.1f}s")
+
+        self._check_stop(session)
+
+        # Same as pytest's default loop, for whatever could not be scheduled
+        scheduled = set(batch)
+        rest = [item for item in session.items if item not in scheduled]
+        for i, item in enumerate(rest):
+            nextitem = rest[i + 1] if i + 1 < len(rest) else None
+            item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+            self._check_stop(session)
+        return True
+
+    @staticmethod
+    def _check_stop(session: pytest.Session) -> None:
+        """Honour ``--maxfail`` / ``-x`` between tests."""
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+
+    @staticmethod
+    def is_eligible(item: pytest.Item) -> bool:
+        """Check whether a test can run outside pytest's runtest protocol.
+
+        Args:
+            item: Collected test item.
+
+        Returns:
+            True for marked async ``BaseTest`` methods without fixture arguments.
+        """
+        if not isinstance(item, pytest.Function) or item.get_closest_marker("concurrent") is None:
+            return False
+        if not isinstance(item.instance, BaseTest) or not inspect.iscoroutinefunction(item.obj):
+            return False
+        if any(item.get_closest_marker(name) for name in SEQUENTIAL_MARKERS):
+            return False
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        return all(name in params for name in inspect.signature(item.obj).parameters)
+
+    async def _run_batch(self, session: pytest.Session, items: List[pytest.Function]) -> None:
+        """Run items as tasks sharing one browser, then shut the browser down."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        collector = _TestLogCollector()
+        root_logger = logging.getLogger()
+        root_logger.addHandler(collector)
+        try:
+            await asyncio.gather(
+                *(self._run_item(session, item, semaphore, collector) for item in items)
+            )
+        finally:
+            root_logger.removeHandler(collector)
+            # Playwright objects are bound to this loop; pytest's loop starts fresh
+            await BrowserManager.shutdown()
+
+    async def _run_item(
+        self,
+        session: pytest.Session,
+        item: pytest.Function,
+        semaphore: asyncio.Semaphore,
+        collector: _TestLogCollector,
+    ) -> None:
+        """Run setup, call and teardown of one test in its own task context."""
+        async with semaphore:
+            if session.shouldfail or session.shouldstop:
+                return
+
+            BrowserManager.isolate()
+            current_test_id.set(item.nodeid)
+            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+
+            instance: BaseTest = item.instance
+            options = BaseTest.marker_options(item)
+            setup = await self._call_and_report(
+                item, "setup", lambda: instance.async_setup(**options), collector
+            )
+            if setup.excinfo is None:
+                params = item.callspec.params if hasattr(item, "callspec") else {}
+                kwargs = {name: params[name] for name in inspect.signature(item.obj).parameters}
+                await self._call_and_report(item, "call", lambda: item.obj(**kwargs), collector)
+                await self._call_and_report(item, "teardown", instance.async_teardown, collector)
+            else:
+                # Like a fixture that failed before yielding: nothing to tear down
+                await self._call_and_report(item, "teardown", lambda: asyncio.sleep(0), collector)
+
+            item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+    @staticmethod
+    async def _call_and_report(
+        item: pytest.Function,
+        when: Literal["setup", "call", "teardown"],
+        func: Callable[[], Awaitable[object]],
+        collector: _TestLogCollector,
+    ) -> pytest.CallInfo:
+        """Await one test phase and send its report through pytest's hooks."""
+        start = time.time()
+        precise_start = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            await func()
+        except (KeyboardInterrupt, asyncio.CancelledError, pytest.exit.Exception):
+            raise
+        except BaseException as e:
+            error = e
+        duration = time.perf_counter() - precise_start
+
+        def outcome() -> None:
+            if error is not None:
+                raise error
+
+        # Build CallInfo through the public constructor, then fix up timing
+        call = pytest.CallInfo.from_call(outcome, when)
+        call.start, call.stop, call.duration = start, start + duration, duration
+
+        report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+        log_text = collector.pop(item.nodeid)
+        if log_text:
+            report.sections.append((f"Captured log {when}", log_text))
+        item.ihook.pytest_runtest_logreport(report=report)
+        return call
@@ -0,0 +1,24 @@
+"""Pytest plugin telling a test's FailureCapture that the test failed."""
+
+import pytest
+
+
+class FailureCapturePlugin:
+    """Marks the ``failure_capture`` of a ``BaseTest`` when its test fails.
+
+    The report hook runs before teardown, so ``BaseTest.async_teardown``
+    knows the outcome and ``FailureCapture.finish`` writes the buffered
+    frames and screenshots only for failed tests. Works for sequential and
+    concurrently scheduled tests alike, as both report through
+    ``pytest_runtest_makereport``.
+    """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        """Forward setup/call failures to the test's capture."""
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed and report.when in ("setup", "call"):
+            capture = getattr(getattr(item, "instance", None), "failure_capture", None)
+            if capture is not None:
+                capture.mark_failed(report.when, item.nodeid)
@@ -0,0 +1,33 @@
+"""Pytest plugin attaching a test's web vitals to its report."""
+
+import json
+
+import pytest
+
+
+class WebVitalsPlugin:
+    """Adds the page loads of a ``BaseTest`` to its teardown report.
+
+    ``BaseTest.async_teardown`` reads the final vitals into
+    ``self.web_vitals``. The teardown report then carries them as the
+    ``web_vitals`` user property (written to JUnit XML with
+    ``--junitxml``) and as a "web vitals" section with one line per page
+    load. Works for sequential and concurrently scheduled tests alike, as
+    both report through ``pytest_runtest_makereport``.
+    """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo):
+        """Attach the test's vitals once its teardown has run."""
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "teardown":
+            return
+        vitals = getattr(getattr(item, "instance", None), "web_vitals", None)
+        if not vitals:
+            return
+        loads = [page_vitals.as_dict() for page_vitals in vitals]
+        report.user_properties.append(("web_vitals", json.dumps(loads)))
+        report.sections.append(("web vitals", "\n".join(
+            " ".join(f"{key}={value}" for key, value in load.items()) for load in loads
+        )))
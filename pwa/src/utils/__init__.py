@@ -1,7 +1,20 @@
 """Utilities module for PWA testing framework."""
-from .logger import get_logger
-from .assertions import CustomAssertions
-from .screenshot import ScreenshotHandler
-from .decorators import retry
 
-__all__ = ["get_logger", "CustomAssertions", "ScreenshotHandler", "retry"]
+from typing import TYPE_CHECKING
+
+from common.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .logger import get_logger
+    from .assertions import CustomAssertions
+    from .screenshot import ScreenshotHandler
+    from .artifact_writer import ArtifactWriter
+    from .decorators import retry
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "get_logger": "logger",
+    "CustomAssertions": "assertions",
+    "ScreenshotHandler": "screenshot",
+    "ArtifactWriter": "artifact_writer",
+    "retry": "decorators",
+})
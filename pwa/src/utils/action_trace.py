@@ -0,0 +1,238 @@
+"""Timed spans of PWA page-object actions and waits, exported as Chrome trace-event JSON."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pwa.config.settings import settings
+from pwa.src.utils.logger import current_test_id, get_logger
+
+logger = get_logger(__name__)
+
+# Methods wrapped by default: (module, class, method names). Overrides of the
+# BasePage methods in page-object subclasses are wrapped as well.
+TRACED_METHODS: Sequence[Tuple[str, str, Tuple[str, ...]]] = (
+    (
+        "pwa.src.base.base_page",
+        "BasePage",
+        (
+            "find_element", "click", "fill", "get_text", "is_element_visible",
+            "is_element_enabled", "scroll_to_element", "get_attribute",
+            "wait_until_ready", "wait_for_page_load",
+        ),
+    ),
+    (
+        "pwa.src.base.wait_handler",
+        "WaitHandler",
+        (
+            "wait_for_selector_visible", "wait_for_selector_hidden", "wait_for_text",
+            "wait_for_attribute", "wait_for_condition", "wait_all", "wait_any",
+            "wait_for_navigation",
+        ),
+    ),
+)
+
+# start ns, duration ns, span name, test id, page class, selector, outcome
+Span = Tuple[int, int, str, str, str, str, str]
+
+
+class ActionTrace:
+    """Records every page-object action and wait as a span of the running test.
+
+    With ``ACTION_TRACE_FILE`` set, ``install`` replaces the methods in
+    ``TRACED_METHODS`` with timing wrappers, in the base classes and in
+    every ``BasePage`` subclass that overrides them (subclasses register
+    through ``BasePage.__init_subclass__``; those defined after ``install``
+    are wrapped when they are created). Without it nothing is wrapped, so
+    tracing costs nothing. A span is one tuple appended to a
+    list (about a microsecond); the JSON is only built by ``close``.
+
+    The file is Chrome trace-event JSON, which Perfetto
+    (https://ui.perfetto.dev) and ``chrome://tracing`` open: one row per
+    test (``current_test_id``, so concurrent tests get their own rows),
+    and waits nest under the action that triggered them. Each span carries
+    the test id, page class, selector and outcome (``ok`` or the exception
+    name). xdist workers write ``<file>.<worker>.json``, and the
+    controller merges them with ``merge_worker_traces``.
+    """
+
+    spans: List[Span] = []
+    _originals: List[Tuple[type, str, Callable[..., Any]]] = []
+    _installed = False
+    # BasePage subclasses, in definition order
+    _page_classes: List[type] = []
+    # Wall clock minus perf_counter, so spans of different workers line up
+    _epoch_offset_ns = 0
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether ``ACTION_TRACE_FILE`` is set."""
+        return bool(settings.action_trace_file)
+
+    @classmethod
+    def install(cls) -> None:
+        """Wrap the ``TRACED_METHODS`` with span recording (once)."""
+        if cls._installed:
+            return
+        import importlib
+
+        cls._installed = True
+        cls._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        for module, class_name, methods in TRACED_METHODS:
+            cls._wrap_class(getattr(importlib.import_module(module), class_name), methods)
+        for page_class in cls._page_classes:
+            cls._wrap_class(page_class, TRACED_METHODS[0][2])
+        logger.info("Action tracing enabled, writing %s", cls.worker_file())
+
+    @classmethod
+    def register(cls, page_class: type) -> None:
+        """Trace a ``BasePage`` subclass's overrides of the traced methods.
+
+        Called by ``BasePage.__init_subclass__``.
+
+        Args:
+            page_class: The new page-object class.
+        """
+        cls._page_classes.append(page_class)
+        if cls._installed:
+            cls._wrap_class(page_class, TRACED_METHODS[0][2])
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """Restore the original methods."""
+        for owner, method, original in reversed(cls._originals):
+            setattr(owner, method, original)
+        cls._originals = []
+        cls._installed = False
+
+    @classmethod
+    def _wrap_class(cls, owner: type, methods: Sequence[str]) -> None:
+        """Wrap the methods a class defines itself; inherited ones are wrapped where defined."""
+        for method in methods:
+            original = owner.__dict__.get(method)
+            if original is None:
+                continue
+            setattr(owner, method, cls._wrap(original, f"{owner.__name__}.{method}"))
+            cls._originals.append((owner, method, original))
+
+    @classmethod
+    def _wrap(cls, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        spans = cls.spans
+        clock = time.perf_counter_ns
+        test_id = current_test_id.get
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def traced_async(self: Any, *args: Any, **kwargs: Any) -> Any:
+                start = clock()
+                outcome = "ok"
+                try:
+                    return await func(self, *args, **kwargs)
+                except BaseException as e:
+                    outcome = type(e).__name__
+                    raise
+                finally:
+                    selector = args[0] if args and isinstance(args[0], str) else ""
+                    spans.append(
+                        (start, clock() - start, name, test_id(), type(self).__name__, selector, outcome)
+                    )
+
+            return traced_async
+
+        @functools.wraps(func)
+        def traced(self: Any, *args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            outcome = "ok"
+            try:
+                return func(self, *args, **kwargs)
+            except BaseException as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                selector = args[0] if args and isinstance(args[0], str) else ""
+                spans.append((start, clock() - start, name, test_id(), type(self).__name__, selector, outcome))
+
+        return traced
+
+    @staticmethod
+    def worker_file() -> Path:
+        """This process's trace file: ``ACTION_TRACE_FILE``, or a per-worker part under xdist."""
+        path = Path(settings.action_trace_file)
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        return path.with_name(f"{path.stem}.{worker}{path.suffix}") if worker else path
+
+    @classmethod
+    def events(cls) -> List[Dict[str, Any]]:
+        """The recorded spans as trace events, one thread row per test."""
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": f"pwa {worker}"}}
+        ]
+        lanes: Dict[str, int] = {}
+        for start, duration, name, test, page, selector, outcome in cls.spans:
+            lane = lanes.get(test)
+            if lane is None:
+                lane = lanes[test] = len(lanes) + 1
+                events.append(
+                    {"ph": "M", "name": "thread_name", "pid": pid, "tid": lane, "args": {"name": test}}
+                )
+            args = {"test": test, "page": page, "outcome": outcome}
+            if selector:
+                args["selector"] = selector
+            events.append({
+                "ph": "X", "cat": "wait" if name.startswith("WaitHandler") else "action",
+                "name": name, "pid": pid, "tid": lane,
+                "ts": (start + cls._epoch_offset_ns) / 1000, "dur": duration / 1000, "args": args,
+            })
+        return events
+
+    @classmethod
+    def close(cls) -> Optional[Path]:
+        """Write this process's spans, then forget them and restore the methods.
+
+        Returns:
+            The file written, or None if nothing was recorded.
+        """
+        cls.uninstall()
+        if not cls.spans:
+            return None
+        path = cls.worker_file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        events = cls.events()
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, separators=(",", ":"))
+        logger.info("Wrote %d action spans to %s", len(cls.spans), path)
+        cls.spans.clear()
+        return path
+
+    @staticmethod
+    def merge_worker_traces() -> Optional[Path]:
+        """Merge the xdist workers' trace files into ``ACTION_TRACE_FILE``.
+
+        Call it on the controller after all workers have finished.
+
+        Returns:
+            The merged file, or None if no worker traces were found.
+        """
+        if not settings.action_trace_file:
+            return None
+        path = Path(settings.action_trace_file)
+        parts = sorted(path.parent.glob(f"{path.stem}.gw*{path.suffix}"))
+        if not parts:
+            return None
+        events: List[Dict[str, Any]] = []
+        for part in parts:
+            events.extend(json.loads(part.read_text())["traceEvents"])
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, separators=(",", ":"))
+        for part in parts:
+            part.unlink()
+        return path
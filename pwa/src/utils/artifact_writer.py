@@ -0,0 +1,239 @@
+"""Background writer for test artifacts (screenshots) of PWA tests."""
+
+import asyncio
+import base64
+import importlib.util
+import io
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Set, Tuple, Union
+
+from pwa.config.settings import settings
+from pwa.src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+IMAGE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+
+@dataclass
+class ArtifactStats:
+    """Counters of written artifacts and of the time the tests spent waiting."""
+
+    files: int = 0
+    bytes_written: int = 0
+    errors: int = 0
+    write_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Writer time that did not hold up a test."""
+        return max(self.write_seconds - self.blocked_seconds, 0.0)
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"Artifact writer: {self.files} files ({self.bytes_written / 1024:.1f} KB), "
+            f"{self.write_seconds:.2f}s written off-thread, {self.blocked_seconds:.2f}s waited, "
+            f"~{self.saved_seconds:.2f}s test time saved"
+            + (f", {self.errors} failed" if self.errors else "")
+        )
+
+
+class ArtifactWriter:
+    """Encodes and writes artifacts on a bounded thread pool.
+
+    Tests capture raw bytes (``page.screenshot()`` without a path) and hand
+    them over; decoding, optional re-compression to JPEG/WebP
+    (``SCREENSHOT_FORMAT``, needs Pillow) and the disk write run on
+    ``ARTIFACT_WRITER_THREADS`` threads. At most
+    ``ARTIFACT_WRITER_MAX_PENDING`` artifacts are in flight; further submits
+    wait for a slot, which bounds memory held by queued images. The wait
+    runs on a thread, so other tests on the event loop keep going.
+
+    ``flush`` waits for everything submitted so far (called at test
+    teardown), ``close`` flushes, stops the threads and logs how much test
+    time the writer saved.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _slots: Optional[threading.BoundedSemaphore] = None
+    _pending: Set[Future] = set()
+    _lock = threading.Lock()
+    totals = ArtifactStats()
+
+    @staticmethod
+    def unique_name(name: str, extension: str) -> str:
+        """Build a file name that cannot collide across tests, threads or workers.
+
+        Args:
+            name: Base name chosen by the caller.
+            extension: File extension including the dot.
+
+        Returns:
+            ``<name>_<timestamp with microseconds>_<random suffix><extension>``.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return f"{name}_{timestamp}_{uuid.uuid4().hex[:8]}{extension}"
+
+    @classmethod
+    def image_format(cls) -> str:
+        """Format screenshots are stored in; PNG if Pillow is missing."""
+        image_format = settings.screenshot_format
+        if image_format not in IMAGE_EXTENSIONS:
+            raise ValueError(
+                f"Unknown SCREENSHOT_FORMAT '{image_format}'. Available: {', '.join(IMAGE_EXTENSIONS)}"
+            )
+        if image_format != "png" and importlib.util.find_spec("PIL") is None:
+            logger.warning("Pillow is not installed, saving %s screenshots as PNG", image_format)
+            settings.screenshot_format = image_format = "png"
+        return image_format
+
+    @classmethod
+    async def submit_image(cls, data: Union[bytes, str], directory: Path, name: str) -> Path:
+        """Queue a PNG screenshot for writing.
+
+        Args:
+            data: PNG bytes, or base64-encoded PNG (decoded on the writer thread).
+            directory: Directory to write to.
+            name: Base file name without extension.
+
+        Returns:
+            Path the image will be written to; it exists after ``flush``.
+        """
+        image_format = cls.image_format()
+        path = directory / cls.unique_name(name, IMAGE_EXTENSIONS[image_format])
+        await cls._submit(cls._write, data, path, None if image_format == "png" else image_format)
+        return path
+
+    @classmethod
+    async def submit_file(cls, data: Union[bytes, str], directory: Path, name: str, extension: str) -> Path:
+        """Queue an artifact that is written as it is (e.g. a video or JPEG frame).
+
+        Args:
+            data: Raw bytes, or base64-encoded bytes (decoded on the writer thread).
+            directory: Directory to write to.
+            name: Base file name without extension.
+            extension: File extension including the dot.
+
+        Returns:
+            Path the artifact will be written to; it exists after ``flush``.
+        """
+        path = directory / cls.unique_name(name, extension)
+        await cls._submit(cls._write, data, path, None)
+        return path
+
+    @classmethod
+    def flush(cls, timeout: Optional[float] = None) -> None:
+        """Wait until all submitted artifacts are written.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+        """
+        with cls._lock:
+            pending = list(cls._pending)
+        if not pending:
+            return
+        started = time.perf_counter()
+        _, not_done = wait(pending, timeout=timeout)
+        cls.totals.blocked_seconds += time.perf_counter() - started
+        if not_done:
+            logger.warning("%d artifacts still being written after %ss", len(not_done), timeout)
+
+    @classmethod
+    def close(cls) -> ArtifactStats:
+        """Flush, stop the writer threads and log session totals.
+
+        Returns:
+            Session totals.
+        """
+        cls.flush()
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+        totals = cls.totals
+        if totals.files or totals.errors:
+            logger.info(totals.summary())
+        cls._executor = None
+        cls._slots = None
+        cls.totals = ArtifactStats()
+        return totals
+
+    @classmethod
+    async def _submit(cls, func, *args) -> Future:
+        """Run ``func`` on the pool once a pending slot is free."""
+        with cls._lock:
+            if cls._executor is None or cls._slots is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.artifact_writer_threads,
+                    thread_name_prefix="artifact-writer",
+                )
+                cls._slots = threading.BoundedSemaphore(settings.artifact_writer_max_pending)
+            executor, slots = cls._executor, cls._slots
+
+        if not slots.acquire(blocking=False):
+            started = time.perf_counter()
+            acquire = asyncio.ensure_future(asyncio.to_thread(slots.acquire))
+            try:
+                await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                # The thread still takes the slot; hand it back when it does
+                acquire.add_done_callback(lambda _: slots.release())
+                raise
+            cls.totals.blocked_seconds += time.perf_counter() - started
+        future = executor.submit(func, *args)
+        with cls._lock:
+            cls._pending.add(future)
+        future.add_done_callback(lambda done: cls._finished(done, slots))
+        return future
+
+    @classmethod
+    def _finished(cls, future: Future, slots: threading.BoundedSemaphore) -> None:
+        """Record the outcome of a write and free its slot."""
+        with cls._lock:
+            cls._pending.discard(future)
+            error = future.exception()
+            if error is None:
+                size, seconds = future.result()
+                cls.totals.files += 1
+                cls.totals.bytes_written += size
+                cls.totals.write_seconds += seconds
+            else:
+                cls.totals.errors += 1
+        slots.release()
+        if error is not None:
+            logger.error("Failed to write artifact: %s", error)
+
+    @staticmethod
+    def _write(data: Union[bytes, str], path: Path, image_format: Optional[str]) -> Tuple[int, float]:
+        """Decode, re-compress and write one artifact (runs on a writer thread).
+
+        Args:
+            data: Raw or base64-encoded bytes.
+            path: Destination file.
+            image_format: "jpeg" or "webp" to re-compress an image, None to write as is.
+
+        Returns:
+            Bytes written and seconds spent.
+        """
+        started = time.perf_counter()
+        if isinstance(data, str):
+            data = base64.b64decode(data)
+        if image_format is not None:
+            from PIL import Image
+
+            with Image.open(io.BytesIO(data)) as image:
+                if image_format == "jpeg":
+                    image = image.convert("RGB")
+                output = io.BytesIO()
+                image.save(output, format=image_format.upper(), quality=settings.screenshot_quality)
+            data = output.getvalue()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        logger.debug("Artifact written: %s", path)
+        return len(data), time.perf_counter() - started
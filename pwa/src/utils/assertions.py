@@ -1,9 +1,14 @@
 """Custom assertions for PWA tests."""
 
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
 
 from pwa.src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from pwa.src.browser.web_vitals import ActionWindow, PageVitals
+
 logger = get_logger(__name__)
 
 
@@ -96,3 +101,77 @@ class CustomAssertions:
             assert_message = f"{message}: {assert_message}"
         logger.info(f"Asserting: {assert_message}")
         assert value is not None, assert_message
+
+    @staticmethod
+    def assert_vital_within_budget(
+        vitals: Optional[PageVitals], metric: str, budget: Optional[float] = None, message: str = ""
+    ) -> None:
+        """Assert that a web vitals metric of a page load is within budget.
+
+        Example:
+            vitals = await home_page.get_web_vitals()
+            CustomAssertions.assert_vital_within_budget(vitals, "lcp_ms", 2500)
+
+        Args:
+            vitals: Page load, from ``BasePage.get_web_vitals``.
+            metric: One of ``web_vitals.METRICS``, e.g. ``"lcp_ms"`` or ``"cls"``.
+            budget: Upper limit. Defaults to the metric's ``WEB_VITALS_BUDGETS`` entry.
+            message: Optional assertion message.
+
+        Raises:
+            AssertionError: If the metric is over budget or was not measured.
+            ValueError: If the metric is unknown or has no default budget.
+        """
+        from pwa.src.browser.web_vitals import WebVitals
+
+        if budget is None:
+            budget = WebVitals.budgets().get(metric)
+            if budget is None:
+                raise ValueError(f"No budget given and none set for '{metric}' in WEB_VITALS_BUDGETS")
+        if vitals is None:
+            assert_message = f"Expected {metric} <= {budget:g}, but no web vitals were recorded"
+            actual = None
+        else:
+            actual = vitals.metric(metric)
+            if actual is None:
+                assert_message = f"Expected {metric} <= {budget:g} on {vitals.page_name}, but it was not measured"
+            else:
+                assert_message = f"Expected {metric} <= {budget:g} on {vitals.page_name}, but got {actual:g}"
+        if message:
+            assert_message = f"{message}: {assert_message}"
+        logger.info("Asserting: %s", assert_message)
+        assert actual is not None and actual <= budget, assert_message
+
+    @staticmethod
+    def assert_no_long_task(window: ActionWindow, max_ms: Optional[float] = None, message: str = "") -> None:
+        """Assert that the app ran no long task over ``max_ms`` during an action.
+
+        Example:
+            async with WebVitals.measure(page, "ProductsPage.sort_by") as window:
+                await products_page.sort_by("price")
+            CustomAssertions.assert_no_long_task(window, max_ms=200)
+
+        Args:
+            window: Action measured with ``WebVitals.measure``.
+            max_ms: Longest allowed task. Defaults to the ``max_long_task_ms``
+                entry of ``WEB_VITALS_BUDGETS``.
+            message: Optional assertion message.
+
+        Raises:
+            AssertionError: If a longer task ran or the action was not measured.
+        """
+        from pwa.src.browser.web_vitals import WebVitals
+
+        if max_ms is None:
+            max_ms = WebVitals.budgets().get("max_long_task_ms", 200.0)
+        if not window.measured:
+            assert_message = f"Expected no long task over {max_ms:g}ms during {window.name}, but it was not measured"
+        else:
+            assert_message = (
+                f"Expected no long task over {max_ms:g}ms during {window.name}, "
+                f"but the longest took {window.max_long_task_ms:.0f}ms"
+            )
+        if message:
+            assert_message = f"{message}: {assert_message}"
+        logger.info("Asserting: %s", assert_message)
+        assert window.measured and window.max_long_task_ms <= max_ms, assert_message
@@ -0,0 +1,183 @@
+"""In-memory capture of a test's last frames, written only if the test fails."""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple, Union
+
+from pwa.config.settings import settings
+from pwa.src.utils.artifact_writer import ArtifactWriter
+from pwa.src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import CDPSession, Page
+
+logger = get_logger(__name__)
+
+
+class CaptureBuffer:
+    """Ring buffer of named binary items, capped by count and total size.
+
+    Appending beyond either cap evicts the oldest items.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int) -> None:
+        """Initialize CaptureBuffer.
+
+        Args:
+            max_items: Maximum number of items kept.
+            max_bytes: Maximum total size of the kept items.
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evicted = 0
+        self._items: Deque[Tuple[str, Union[bytes, str]]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, name: str, data: Union[bytes, str]) -> None:
+        """Add an item, evicting the oldest ones to stay within the caps.
+
+        Args:
+            name: Item name, used for the file name when written.
+            data: Raw or base64-encoded bytes.
+        """
+        if self.max_items <= 0 or len(data) > self.max_bytes:
+            self.evicted += 1
+            return
+        self._items.append((name, data))
+        self.size += len(data)
+        while len(self._items) > self.max_items or self.size > self.max_bytes:
+            _, dropped = self._items.popleft()
+            self.size -= len(dropped)
+            self.evicted += 1
+
+    def drain(self) -> Tuple[Tuple[str, Union[bytes, str]], ...]:
+        """Return all items, oldest first, and empty the buffer."""
+        items = tuple(self._items)
+        self._items.clear()
+        self.size = 0
+        return items
+
+
+class FailureCapture:
+    """Keeps a test's recent visual state in memory and writes it on failure.
+
+    With ``SCREENSHOT_ON_FAILURE=true``:
+
+    * ``take_screenshot`` images go to a ring buffer instead of disk;
+    * on Chromium, a CDP screencast (``Page.startScreencast``) feeds JPEG
+      frames into a second ring buffer (``FAILURE_SCREENCAST``, off by
+      default: encoding frames costs CPU in every test);
+    * when the test fails (reported by ``FailureCapturePlugin``),
+      ``finish`` takes a final screenshot and hands everything to the
+      ``ArtifactWriter``. Passing tests write nothing.
+
+    ``FAILURE_BUFFER_FRAMES``, ``FAILURE_BUFFER_SCREENSHOTS`` and
+    ``FAILURE_BUFFER_MB`` (per buffer) cap the memory held per test.
+    """
+
+    def __init__(self, page: Page) -> None:
+        """Initialize FailureCapture.
+
+        Args:
+            page: Playwright Page instance of the test.
+        """
+        self.page = page
+        self.enabled = settings.screenshot_on_failure
+        max_bytes = int(settings.failure_buffer_mb * 1024 * 1024)
+        self.frames = CaptureBuffer(settings.failure_buffer_frames, max_bytes)
+        self.screenshots = CaptureBuffer(settings.failure_buffer_screenshots, max_bytes)
+        self.failed_phase: Optional[str] = None
+        self.test_id = ""
+        self._cdp: Optional[CDPSession] = None
+
+    async def start(self) -> None:
+        """Start the screencast, if enabled and supported by the browser."""
+        if not (self.enabled and settings.failure_screencast and settings.browser_type == "chromium"):
+            return
+        try:
+            self._cdp = await self.page.context.new_cdp_session(self.page)
+            self._cdp.on("Page.screencastFrame", self._on_frame)
+            await self._cdp.send("Page.startScreencast", {
+                "format": "jpeg",
+                "quality": settings.failure_screencast_quality,
+                "maxWidth": settings.viewport_width,
+                "maxHeight": settings.viewport_height,
+            })
+        except Exception as e:
+            logger.warning("Screencast not available: %s", e)
+            self._cdp = None
+
+    async def _on_frame(self, params: Dict[str, Any]) -> None:
+        """Buffer a screencast frame (base64 JPEG, decoded only if written) and ack it."""
+        timestamp = params.get("metadata", {}).get("timestamp", 0)
+        self.frames.append(f"frame_{timestamp:.3f}", params["data"])
+        if self._cdp is None:
+            return
+        try:
+            await self._cdp.send("Page.screencastFrameAck", {"sessionId": params["sessionId"]})
+        except Exception:
+            # Session detached while the page closed
+            pass
+
+    def add_screenshot(self, name: str, data: bytes) -> None:
+        """Keep a screenshot in memory until the test's outcome is known.
+
+        Args:
+            name: Screenshot name.
+            data: PNG bytes.
+        """
+        self.screenshots.append(name, data)
+
+    def mark_failed(self, when: str, test_id: str) -> None:
+        """Record that a test phase failed.
+
+        Args:
+            when: Failed phase ("setup" or "call").
+            test_id: Pytest node id, names the artifact directory.
+        """
+        if self.failed_phase is None:
+            self.failed_phase = when
+            self.test_id = test_id
+
+    async def finish(self) -> Optional[Path]:
+        """Stop capturing; write the buffers if the test failed.
+
+        Returns:
+            Directory the artifacts were queued to, or None if nothing was written.
+        """
+        if self._cdp is not None:
+            try:
+                await self._cdp.send("Page.stopScreencast")
+                await self._cdp.detach()
+            except Exception as e:
+                logger.debug("Could not stop screencast: %s", e)
+            self._cdp = None
+
+        if self.failed_phase is None or not self.enabled:
+            self.frames.drain()
+            self.screenshots.drain()
+            return None
+
+        name = re.sub(r"[^\w.-]+", "_", self.test_id).strip("_")
+        directory = Path(settings.report_dir) / "failures" / name
+        try:
+            await ArtifactWriter.submit_image(await self.page.screenshot(), directory, "failure")
+        except Exception as e:
+            logger.warning("Failed to take failure screenshot: %s", e)
+        screenshots = self.screenshots.drain()
+        for name, data in screenshots:
+            await ArtifactWriter.submit_image(data, directory, name)
+        frames = self.frames.drain()
+        for name, data in frames:
+            await ArtifactWriter.submit_file(data, directory, name, ".jpg")
+        logger.info(
+            "Test failed in %s: failure screenshot, %d screenshots and %d frames queued to %s",
+            self.failed_phase, len(screenshots), len(frames), directory,
+        )
+        return directory
@@ -1,11 +1,18 @@
 """Screenshot capture and management utilities for PWA tests."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import re
 from pathlib import Path
-from datetime import datetime
-from playwright.async_api import Page
 
 from pwa.config.settings import settings
-from pwa.src.utils.logger import get_logger
+from pwa.src.utils.artifact_writer import ArtifactWriter
+from pwa.src.utils.logger import current_test_id, get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 logger = get_logger(__name__)
 
@@ -18,27 +25,34 @@ class ScreenshotHandler:
 
         Args:
             page: Playwright Page instance.
+
+        Screenshots taken inside a test go to a per-test subdirectory, so
+        tests running concurrently never overwrite each other's files.
         """
         self.page = page
         self.screenshot_dir = Path(settings.report_dir) / "screenshots"
+        test_id = current_test_id.get()
+        if test_id != "-":
+            self.screenshot_dir /= re.sub(r"[^\w.-]+", "_", test_id).strip("_")
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
 
     async def take_screenshot(self, name: str = "screenshot") -> str:
-        """Take and save screenshot.
+        """Capture a screenshot and queue it for writing.
+
+        Only the capture happens here; encoding and the disk write run on
+        the ``ArtifactWriter`` threads.
 
         Args:
             name: Name for screenshot file (without extension).
 
         Returns:
-            Path to saved screenshot file.
+            Path of the screenshot file, written by the time the test's
+            teardown has flushed the writer.
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = self.screenshot_dir / filename
-
-            await self.page.screenshot(path=str(filepath))
-            logger.info(f"Screenshot saved: {filepath}")
+            data = await self.page.screenshot()
+            filepath = await ArtifactWriter.submit_image(data, self.screenshot_dir, name)
+            logger.info("Screenshot queued: %s", filepath)
             return str(filepath)
         except Exception as e:
             logger.error(f"Failed to take screenshot: {str(e)}")
@@ -1,22 +1,134 @@
 """Pytest configuration and fixtures for PWA tests."""
 
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
 import pytest
 import yaml
 from pathlib import Path
 
 from pwa.src.browser.browser_factory import BrowserFactory
 from pwa.src.browser.browser_manager import BrowserManager
-from pwa.src.utils.logger import get_logger
+from pwa.src.browser.browser_server import BrowserServer
+from pwa.src.browser.har_archive import HarArchive
+from pwa.src.browser.storage_state import StorageStateCache
+from pwa.src.browser.web_vitals import WebVitals
+from pwa.src.pages.home_page import HomePage
+from pwa.src.plugins.concurrent import ConcurrentScheduler
+from pwa.src.plugins.failure_capture import FailureCapturePlugin
+from pwa.src.plugins.web_vitals import WebVitalsPlugin
+from pwa.config.settings import settings
+from pwa.src.utils.action_trace import ActionTrace
+from pwa.src.utils.artifact_writer import ArtifactWriter
+from pwa.src.utils.logger import get_logger, merge_worker_logs, shutdown_logging
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 logger = get_logger(__name__)
 
+browser_server_key = pytest.StashKey[BrowserServer]()
+
+
+def pytest_addoption(parser):
+    """Add PWA command line options."""
+    parser.addoption(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Run tests marked 'concurrent' N at a time in one event loop "
+        "(default: TEST_CONCURRENCY)",
+    )
+    har = parser.getgroup("har", "HAR record/replay (see HAR_SCOPE, HAR_DIR, HAR_NOT_FOUND)")
+    har.addoption(
+        "--har-record", action="store_true", help="record all traffic into HAR files"
+    )
+    har.addoption(
+        "--har-replay", action="store_true", help="serve traffic from recorded HAR files"
+    )
+
+
 # Register markers
 def pytest_configure(config):
-    """Register custom pytest markers."""
+    """Register custom pytest markers, plugins and the shared browser server."""
     config.addinivalue_line("markers", "smoke: smoke tests")
     config.addinivalue_line("markers", "regression: regression tests")
     config.addinivalue_line("markers", "integration: integration tests")
     config.addinivalue_line("markers", "slow: slow tests")
+    config.addinivalue_line(
+        "markers", "storage_state(name): start test in a named pre-seeded app state"
+    )
+    config.addinivalue_line(
+        "markers", "blocking_policy(name): override BLOCKING_POLICY ('none' disables blocking)"
+    )
+    config.addinivalue_line(
+        "markers", "concurrent: test may run concurrently with other tests in one event loop"
+    )
+    config.addinivalue_line(
+        "markers", "performance: web vitals budget tests, only run when selected with -m performance"
+    )
+
+    if config.getoption("har_record") and config.getoption("har_replay"):
+        raise pytest.UsageError("--har-record and --har-replay are mutually exclusive")
+    if config.getoption("har_record"):
+        settings.har_mode = "record"
+    elif config.getoption("har_replay"):
+        settings.har_mode = "replay"
+
+    concurrency = config.getoption("concurrency") or settings.test_concurrency
+    if concurrency > 1:
+        # Concurrent tests share one browser, so it must outlive each test
+        settings.browser_reuse = True
+    config.pluginmanager.register(ConcurrentScheduler(concurrency), "pwa-concurrent")
+    config.pluginmanager.register(FailureCapturePlugin(), "pwa-failure-capture")
+    if WebVitals.enabled():
+        config.pluginmanager.register(WebVitalsPlugin(), "pwa-web-vitals")
+    if ActionTrace.enabled():
+        ActionTrace.install()
+
+    # Only the controller (or a non-xdist run) owns the shared browser server
+    if settings.browser_shared_server and not hasattr(config, "workerinput"):
+        server = BrowserServer(settings.browser_type, BrowserServer.default_endpoint_file())
+        config.stash[browser_server_key] = server.start()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Leave performance tests out of the functional run unless ``-m`` names them."""
+    if "performance" in (config.getoption("markexpr") or ""):
+        return
+    deselected = [item for item in items if item.get_closest_marker("performance")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("performance")]
+
+
+def pytest_unconfigure(config):
+    """Stop the shared browser server, report web vitals, write traces and artifacts, then merge parts and logs."""
+    server = config.stash.get(browser_server_key, None)
+    if server is not None:
+        server.stop()
+    if settings.har_mode == "record" and not hasattr(config, "workerinput"):
+        HarArchive.merge_parts()
+    # Logged tables need the log pipeline, so before shutdown_logging
+    WebVitals.close()
+    if not hasattr(config, "workerinput"):
+        WebVitals.merge_worker_reports()
+    ActionTrace.close()
+    ArtifactWriter.close()
+    shutdown_logging()
+    if not hasattr(config, "workerinput"):
+        ActionTrace.merge_worker_traces()
+        merge_worker_logs()
+
+
+@StorageStateCache.register("cart_with_1_item")
+async def cart_with_1_item(page: Page) -> None:
+    """Build app state with the first product in the cart."""
+    home_page = HomePage(page)
+    await home_page.wait_for_page_load()
+    await home_page.add_first_product_to_cart()
 
 
 @pytest.fixture(scope="session")
@@ -35,6 +147,32 @@ def test_data():
     return {}
 
 
+@pytest.fixture(scope="session")
+def event_loop():
+    """Provide one event loop for the whole session.
+
+    Playwright objects are bound to the loop they were created in, so a browser
+    shared between tests (``BROWSER_REUSE=true``) needs a session-wide loop.
+
+    Yields:
+        Event loop instance.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def browser_session():
+    """Shut down the shared browser once the session (or xdist worker) ends.
+
+    Yields:
+        None.
+    """
+    yield
+    await BrowserManager.shutdown()
+
+
 @pytest.fixture
 async def browser_manager():
     """Provide BrowserManager instance.
@@ -53,6 +53,7 @@ class TestCart(BaseTest):
 
     @pytest.mark.regression
     @pytest.mark.asyncio
+    @pytest.mark.storage_state("cart_with_1_item")
     async def test_cart_total_price(self) -> None:
         """Test cart total price calculation.
 
@@ -63,9 +64,8 @@ class TestCart(BaseTest):
         """
         logger.info("Starting: test_cart_total_price")
 
-        await self._add_product_to_cart()
-
         home_page = HomePage(self.page)
+        await home_page.wait_for_page_load()
         await home_page.click_cart_button()
 
         cart_page = CartPage(self.page)
@@ -3,6 +3,7 @@
 import pytest
 
 from pwa.src.base.base_test import BaseTest
+from pwa.src.browser.web_vitals import WebVitals
 from pwa.src.pages.home_page import HomePage
 from pwa.src.utils.assertions import CustomAssertions
 from pwa.src.utils.logger import get_logger
@@ -10,6 +11,7 @@ from pwa.src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@pytest.mark.concurrent
 class TestNavigation(BaseTest):
     """Test cases for PWA navigation."""
 
@@ -58,3 +60,35 @@ class TestNavigation(BaseTest):
         CustomAssertions.assert_not_none(product_price)
         logger.info(f"Product: {product_name} - Price: {product_price}")
         await self.take_screenshot("product_info")
+
+
+class TestNavigationPerformance(BaseTest):
+    """Web vitals budgets of PWA navigation.
+
+    Not marked ``concurrent``: tests sharing the event loop and browser
+    would skew each other's timings. Only run with ``-m performance``.
+    """
+
+    @pytest.mark.performance
+    @pytest.mark.skipif(not WebVitals.enabled(), reason="WEB_VITALS is off")
+    @pytest.mark.asyncio
+    async def test_home_page_within_vitals_budget(self) -> None:
+        """Test that the home page loads within its web vitals budget.
+
+        Verifies that:
+        - LCP is under 2.5s
+        - Layout shift stays within WEB_VITALS_BUDGETS
+        - Adding to cart runs no long task over 200ms
+        """
+        logger.info("Starting: test_home_page_within_vitals_budget")
+
+        home_page = HomePage(self.page)
+        await home_page.wait_for_page_load()
+
+        vitals = await home_page.get_web_vitals()
+        CustomAssertions.assert_vital_within_budget(vitals, "lcp_ms", 2500)
+        CustomAssertions.assert_vital_within_budget(vitals, "cls")
+
+        async with WebVitals.measure(self.page, "HomePage.add_first_product_to_cart") as window:
+            await home_page.add_first_product_to_cart()
+        CustomAssertions.assert_no_long_task(window, max_ms=200)
@@ -11,6 +11,7 @@ from pwa.src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@pytest.mark.concurrent
 class TestProducts(BaseTest):
     """Test cases for products functionality."""
 
@@ -0,0 +1 @@
+"""Offline unit tests: no browser needed."""
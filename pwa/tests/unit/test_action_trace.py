@@ -0,0 +1,51 @@
+"""Unit tests for action spans of page-object subclasses."""
+
+import pytest
+
+from pwa.config.settings import settings
+from pwa.src.base.base_page import BasePage
+from pwa.src.utils.action_trace import ActionTrace
+
+
+class LoadedPage(BasePage):
+    """Defined before tracing is installed."""
+
+    async def wait_for_page_load(self) -> None:
+        pass
+
+
+ORIGINAL = LoadedPage.__dict__["wait_for_page_load"]
+
+
+@pytest.fixture
+def trace(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "action_trace_file", str(tmp_path / "action_trace.json"))
+    ActionTrace.install()
+    yield ActionTrace.spans
+    ActionTrace.uninstall()
+    ActionTrace.spans.clear()
+
+
+async def test_overrides_are_traced(trace):
+    class LatePage(BasePage):
+        """Defined after tracing is installed."""
+
+        async def wait_for_page_load(self) -> None:
+            pass
+
+    for page_class in (LoadedPage, LatePage):
+        await page_class.__new__(page_class).wait_for_page_load()
+
+    assert [(span[2], span[4]) for span in trace] == [
+        ("LoadedPage.wait_for_page_load", "LoadedPage"),
+        ("LatePage.wait_for_page_load", "LatePage"),
+    ]
+
+
+def test_uninstall_restores_overrides(trace):
+    assert LoadedPage.wait_for_page_load is not ORIGINAL
+
+    ActionTrace.uninstall()
+
+    assert LoadedPage.wait_for_page_load is ORIGINAL
+    assert "wait_for_page_load" not in vars(type("Plain", (BasePage,), {}))
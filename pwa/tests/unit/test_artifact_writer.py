@@ -0,0 +1,33 @@
+"""Unit tests for ArtifactWriter back-pressure."""
+
+import asyncio
+import threading
+
+from pwa.config.settings import settings
+from pwa.src.utils.artifact_writer import ArtifactWriter
+
+
+async def test_full_writer_does_not_block_event_loop(monkeypatch):
+    monkeypatch.setattr(settings, "artifact_writer_threads", 1)
+    monkeypatch.setattr(settings, "artifact_writer_max_pending", 1)
+    gate = threading.Event()
+
+    def write():
+        gate.wait(5)
+        return 0, 0.0
+
+    try:
+        await ArtifactWriter._submit(write)
+        second = asyncio.ensure_future(ArtifactWriter._submit(write))
+        # The loop keeps running while the second submit waits for a slot
+        await asyncio.sleep(0.05)
+        assert not second.done()
+
+        gate.set()
+        await asyncio.wait_for(second, timeout=5)
+    finally:
+        gate.set()
+        totals = ArtifactWriter.close()
+
+    assert totals.files == 2
+    assert totals.blocked_seconds > 0
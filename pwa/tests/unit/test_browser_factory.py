@@ -0,0 +1,30 @@
+"""Unit tests for BrowserFactory page tracking."""
+
+import asyncio
+
+from pwa.src.browser.browser_factory import BrowserFactory
+
+
+class FakeContext:
+    """Context that hands out plain objects as pages."""
+
+    async def new_page(self) -> object:
+        return object()
+
+
+async def test_create_page_becomes_current_page():
+    page = await BrowserFactory.create_page(FakeContext())
+
+    assert BrowserFactory.get_page() is page
+
+
+async def test_current_page_is_per_task():
+    async def create() -> object:
+        page = await BrowserFactory.create_page(FakeContext())
+        await asyncio.sleep(0)
+        assert BrowserFactory.get_page() is page
+        return page
+
+    first, second = await asyncio.gather(create(), create())
+
+    assert first is not second
@@ -0,0 +1,123 @@
+"""Unit tests for BrowserManager teardown."""
+
+import asyncio
+
+import pytest
+
+from pwa.config.settings import settings
+from pwa.src.browser.browser_factory import BrowserFactory
+from pwa.src.browser.browser_manager import BrowserManager
+from pwa.src.browser.har_archive import PARTS_DIR, SUITE_HAR, HarArchive
+
+
+class FakePage:
+    """Page that navigates nowhere."""
+
+    url = "about:blank"
+
+    def on(self, event, handler) -> None:
+        pass
+
+    async def goto(self, url: str) -> None:
+        self.url = url
+
+
+class FakeContext:
+    """Context that, like Playwright's, writes its HAR only when closed."""
+
+    def __init__(self, browser: "FakeBrowser", options: dict) -> None:
+        self.browser = browser
+        self.har_path = options.get("record_har_path")
+
+    def on(self, event, handler) -> None:
+        pass
+
+    async def route(self, url, handler) -> None:
+        pass
+
+    async def new_page(self) -> FakePage:
+        return FakePage()
+
+    async def close(self) -> None:
+        if self.har_path:
+            with open(self.har_path, "w") as f:
+                f.write('{"log": {"entries": [], "pages": []}}')
+        self.browser.contexts.remove(self)
+        self.browser.events.append("context closed")
+
+
+class FakeBrowser:
+    """Browser whose close() discards its contexts without closing them."""
+
+    def __init__(self) -> None:
+        self.contexts = []
+        self.events = []
+
+    async def new_context(self, **options) -> FakeContext:
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.contexts.clear()
+        self.events.append("browser closed")
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    """Fake browser launched by BrowserFactory, one manager per test."""
+    fake = FakeBrowser()
+
+    async def create_browser():
+        BrowserFactory._browser = fake
+        return fake
+
+    monkeypatch.setattr(BrowserFactory, "_browser", None)
+    monkeypatch.setattr(BrowserFactory, "create_browser", create_browser)
+    monkeypatch.setattr(settings, "browser_reuse", False)
+    monkeypatch.setattr(settings, "context_pool_size", 0)
+    monkeypatch.setattr(settings, "web_vitals", False)
+    monkeypatch.setattr(settings, "asset_cache", False)
+    BrowserManager.reset_singleton()
+    yield fake
+    BrowserManager.reset_singleton()
+
+
+async def test_teardown_in_another_task_closes_the_context(browser):
+    manager = BrowserManager()
+
+    # pytest-asyncio runs a fixture's setup and teardown in separate tasks
+    await asyncio.create_task(manager.init_browser())
+    await asyncio.create_task(manager.close_browser())
+
+    assert browser.events == ["context closed", "browser closed"]
+
+
+@pytest.fixture
+def har_record(browser, monkeypatch, tmp_path):
+    """Record HAR parts under a temporary HAR_DIR."""
+    monkeypatch.setattr(settings, "har_mode", "record")
+    monkeypatch.setattr(settings, "har_scope", "suite")
+    monkeypatch.setattr(settings, "har_dir", str(tmp_path))
+    return tmp_path
+
+
+async def test_har_recorded_without_browser_reuse(browser, har_record):
+    manager = BrowserManager()
+
+    await asyncio.create_task(manager.init_browser())
+    await asyncio.create_task(manager.close_browser())
+
+    assert len(list((har_record / PARTS_DIR).glob("*.har"))) == 1
+    assert HarArchive.merge_parts() == har_record / SUITE_HAR
+    assert (har_record / SUITE_HAR).exists()
+
+
+async def test_close_browser_closes_open_contexts_first(browser, har_record):
+    await BrowserFactory.create_browser()
+    await asyncio.create_task(BrowserFactory.create_context(browser))
+
+    await asyncio.create_task(BrowserFactory.close_browser())
+
+    assert browser.events == ["context closed", "browser closed"]
+    assert len(list((har_record / PARTS_DIR).glob("*.har"))) == 1
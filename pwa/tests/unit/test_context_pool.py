@@ -0,0 +1,80 @@
+"""Unit tests for ContextPool creation failures."""
+
+import asyncio
+
+import pytest
+
+from pwa.src.browser import context_pool
+from pwa.src.browser.browser_factory import BrowserFactory
+from pwa.src.browser.context_pool import ContextPool
+
+
+class FakePage:
+    """Page whose navigation fails while the base URL is down."""
+
+    def __init__(self, down: bool) -> None:
+        self.down = down
+
+    def on(self, event, handler) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def goto(self, url: str) -> None:
+        if self.down:
+            raise ConnectionError(f"{url} unreachable")
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    """Replace context creation with fakes; returns the open and closed context lists."""
+    state = {"down": True, "created": [], "closed": []}
+
+    async def create_context(browser):
+        context = object()
+        state["created"].append(context)
+        return context
+
+    async def create_page(context):
+        return FakePage(state["down"])
+
+    async def close_context(context=None):
+        state["closed"].append(context)
+
+    monkeypatch.setattr(BrowserFactory, "create_context", create_context)
+    monkeypatch.setattr(BrowserFactory, "create_page", create_page)
+    monkeypatch.setattr(BrowserFactory, "close_context", close_context)
+    return state
+
+
+async def test_failed_navigation_closes_context(factory):
+    pool = ContextPool(browser=None, url="http://down.invalid", size=1)
+
+    with pytest.raises(ConnectionError):
+        await pool._create()
+
+    assert factory["closed"] == factory["created"]
+    assert pool._creating == 0
+
+
+async def test_refill_backs_off_while_base_url_is_down(factory, monkeypatch):
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(seconds):
+        delays.append(seconds)
+        if len(delays) == 5:
+            factory["down"] = False
+        await real_sleep(0)
+
+    monkeypatch.setattr(context_pool.asyncio, "sleep", sleep)
+    pool = ContextPool(browser=None, url="http://down.invalid", size=1)
+    pool.start()
+    while pool._ready.empty():
+        await real_sleep(0)
+    await pool.close()
+
+    assert delays == [1, 2, 4, 8, 16]
+    # Every failed creation closed its context; the sixth was pooled
+    assert factory["closed"][:5] == factory["created"][:5]
@@ -0,0 +1,39 @@
+"""Unit tests for WaitHandler.wait_any."""
+
+import asyncio
+
+import pytest
+
+from pwa.src.base.wait_handler import WaitHandler
+
+
+async def succeed(value, delay=0.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def fail(message, delay=0.0):
+    await asyncio.sleep(delay)
+    raise TimeoutError(message)
+
+
+async def test_wait_any_returns_first_success():
+    wait = WaitHandler(page=None)
+
+    index, result = await wait.wait_any(fail("error banner"), succeed("Saved", 0.01))
+
+    assert (index, result) == (1, "Saved")
+
+
+async def test_wait_any_raises_first_failure_when_all_fail():
+    wait = WaitHandler(page=None)
+
+    with pytest.raises(TimeoutError, match="first"):
+        await wait.wait_any(fail("second", 0.01), fail("first"))
+
+
+async def test_wait_any_without_conditions():
+    wait = WaitHandler(page=None)
+
+    with pytest.raises(ValueError, match="at least one condition"):
+        await wait.wait_any()
@@ -0,0 +1,27 @@
+"""Unit tests for the web vitals percentile tables."""
+
+from pwa.src.browser.web_vitals import VitalsStats
+
+
+def test_nearest_rank_percentile():
+    values = [400.0, 100.0, 300.0, 200.0]
+
+    assert VitalsStats.percentile(values, 50) == 200
+    assert VitalsStats.percentile(values, 75) == 300
+    assert VitalsStats.percentile(values, 95) == 400
+    assert VitalsStats.percentile([7.0], 0) == 7
+
+
+def test_summary_marks_p75_over_budget():
+    stats = VitalsStats()
+    for lcp in (1800.0, 2100.0, 2600.0, 3000.0):
+        stats.record("HomePage", {"lcp": lcp, "cls": 0.01, "inp": None})
+    stats.merge({"HomePage": {"cls": [0.02]}})
+
+    summary = stats.summary({"lcp": 2500, "cls": 0.1})
+
+    assert "HomePage (n=5)" in summary
+    lines = {line.split()[0]: line for line in summary.splitlines()[2:]}
+    assert "over budget 2500" in lines["lcp"]
+    assert "over budget" not in lines["cls"]
+    assert "inp" not in lines